@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: bytes sent to OCR with and without ImagePreprocessor
+Usage: python3 scripts/testing/benchmark_image_preprocessing.py [uplink_mbps]
+
+Prepares every image in data/cv_examples/png_examples and jpeg_examples, plus
+phone-photo versions of the JPEG examples (upscaled to 12MP with sensor noise,
+saved sideways with an EXIF rotation at high quality), and compares upload bytes. OCR is
+stubbed: each call costs its upload time at the given uplink speed, so the
+latency figures are pre-processing time plus modeled transfer, not real
+Vision/Textract timings.
+"""
+
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from PIL import Image
+
+from src.core.local.image_preprocessor import image_preprocessor
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+TEXTRACT_SYNC_LIMIT = 5 * 1024 * 1024
+
+
+def example_images():
+    """(name, bytes) for the example PNG and JPEG files."""
+    paths = sorted((REPO_ROOT / "data/cv_examples/png_examples").rglob("*.png"))
+    paths += sorted((REPO_ROOT / "data/cv_examples/jpeg_examples").glob("*.jpg"))
+    return [(path.name, path.read_bytes()) for path in paths]
+
+
+def phone_photo(content: bytes) -> bytes:
+    """A noisy 3000x4000 sideways JPEG with an EXIF rotation, like a phone camera's."""
+    image = Image.open(io.BytesIO(content)).convert("RGB").resize((3000, 4000), Image.LANCZOS)
+    noise = Image.effect_noise(image.size, 40).convert("RGB")
+    image = Image.blend(image, noise, 0.15)
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    buffer = io.BytesIO()
+    image.transpose(Image.ROTATE_90).save(buffer, format="JPEG", quality=97, exif=exif)
+    return buffer.getvalue()
+
+
+def stub_ocr_seconds(parts, uplink_mbps: float) -> float:
+    """Modeled OCR latency: upload time of every part."""
+    return sum(len(part) for part in parts) * 8 / (uplink_mbps * 1e6)
+
+
+def report(label, images, uplink_mbps):
+    original = prepared_total = 0
+    raw_latency = prepared_latency = prep_seconds = 0.0
+    textract_before = textract_after = 0
+    for _, content in images:
+        start = time.perf_counter()
+        prepared = image_preprocessor.prepare(content)
+        prep = time.perf_counter() - start
+        original += len(content)
+        prepared_total += prepared.size_bytes
+        prep_seconds += prep
+        raw_latency += stub_ocr_seconds([content], uplink_mbps)
+        prepared_latency += prep + stub_ocr_seconds(prepared.parts, uplink_mbps)
+        textract_before += len(content) <= TEXTRACT_SYNC_LIMIT
+        textract_after += prepared.max_part_bytes <= TEXTRACT_SYNC_LIMIT
+
+    count = len(images)
+    print(f"\n{label} ({count} images)")
+    print(f"📄 Bytes:    {original / 1e6:7.1f}MB -> {prepared_total / 1e6:6.1f}MB "
+          f"({100 * (1 - prepared_total / original):.0f}% less)")
+    print(f"⏱️  Latency:  {raw_latency / count * 1000:7.0f}ms -> {prepared_latency / count * 1000:6.0f}ms per image "
+          f"(incl. {prep_seconds / count * 1000:.0f}ms pre-processing)")
+    print(f"🚀 Within Textract 5MB sync limit: {textract_before}/{count} -> {textract_after}/{count}")
+
+
+def main():
+    uplink_mbps = float(sys.argv[1]) if len(sys.argv) > 1 else 20.0
+    examples = example_images()
+    print(f"Stub OCR uplink: {uplink_mbps:g} Mbit/s")
+    report("Example screenshots and scans", examples, uplink_mbps)
+    photos = [(name, phone_photo(content)) for name, content in examples if name.endswith(".jpg")]
+    report("Phone photos (12MP JPEG, EXIF-rotated)", photos, uplink_mbps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Pydantic validation CPU per CV before and after section model reuse
+Usage: python3 scripts/testing/benchmark_section_validation.py [rounds]
+
+Runs the extracted example CVs through section validation, enhancement and
+CVData assembly. The baseline validates every section again in CVData(**data);
+the new path reuses the models of sections no enhancer declares. Only time
+spent validating (and dumping section models) is counted, and both paths must
+produce the same CVData.
+"""
+
+import copy
+import gc
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.cv_extraction.data_extractor import DataExtractor
+from src.core.cv_extraction.enhancement_processor import enhancement_engine, enhancement_processor
+from src.core.cv_extraction.validated_sections import ValidatedSection, assemble_cv_data
+from src.core.schemas.unified_nullable import CVData, HobbiesSection
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+
+def load_examples():
+    """(cv data, raw text) pairs from the extracted example CVs"""
+    raw_text = (REPO_ROOT / "data/cv_examples/text_examples/comprehensive_all_components_cv.txt").read_text()
+    examples = []
+    for path in sorted((REPO_ROOT / "tests/refactoring/baseline_results").glob("*_data.json")):
+        examples.append((json.loads(path.read_text()), raw_text))
+    lior = json.loads((REPO_ROOT / "data/cv_examples/cv_tests/lior_extracted_data.json").read_text())
+    examples.append((lior["cv_data"], (REPO_ROOT / "data/cv_examples/cv_tests/Lior_Naaman_text.txt").read_text()))
+    return examples
+
+
+def section_inputs(data):
+    return {name: value for name, value in data.items()
+            if name in DataExtractor.SECTION_SCHEMAS and isinstance(value, dict)}
+
+
+def validate_model(name, value):
+    """The model SectionExtractor.validate_section builds (without its logging)"""
+    if name == 'hobbies':
+        hobbies = value.get('hobbies', [])
+        return HobbiesSection(sectionTitle="Hobbies", hobbies=hobbies if isinstance(hobbies, list) else [])
+    return DataExtractor.SECTION_SCHEMAS[name].model_validate(value)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def validate_dicts(sections):
+    return {name: validate_model(name, value).model_dump() for name, value in sections.items()}
+
+
+def validate_keeping_models(sections):
+    return {name: ValidatedSection(validate_model(name, value)) for name, value in sections.items()}
+
+
+def run_stage(first, second):
+    """Time two (function, argument) pairs, alternating which runs first between calls"""
+    run_stage.flip = not getattr(run_stage, "flip", False)
+    if run_stage.flip:
+        (a, a_time), (b, b_time) = timed(*first), timed(*second)
+    else:
+        (b, b_time), (a, a_time) = timed(*second), timed(*first)
+    return a, b, a_time, b_time
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    examples = [(section_inputs(data), raw_text) for data, raw_text in load_examples()]
+    print(f"📄 {len(examples)} example CVs, {rounds} rounds each")
+
+    # Like timeit, keep garbage collection pauses out of the measured sections
+    gc.disable()
+    totals = {"baseline": 0.0, "reuse": 0.0}
+    for _ in range(rounds):
+        for sections, raw_text in examples:
+            # Baseline: validate each section to a dict, enhance, then validate
+            # everything again in CVData(**data). Reuse: keep the section models
+            # and let assemble_cv_data skip the sections no enhancer touches.
+            dicts, models, baseline_time, reuse_time = run_stage(
+                (validate_dicts, copy.deepcopy(sections)), (validate_keeping_models, copy.deepcopy(sections))
+            )
+            dicts = enhancement_processor.enhance_all(dicts, raw_text)
+            models = enhancement_processor.enhance_all(models, raw_text)
+            expected, actual, baseline_assembly, reuse_assembly = run_stage(
+                (lambda data: CVData(**data), dicts),
+                (lambda data: assemble_cv_data(data, enhancement_engine.touched_sections), models)
+            )
+            assert actual == expected, "Assembled CVData differs from CVData(**data)"
+            totals["baseline"] += baseline_time + baseline_assembly
+            totals["reuse"] += reuse_time + reuse_assembly
+    gc.enable()
+
+    runs = rounds * len(examples)
+    baseline_us = totals["baseline"] / runs * 1e6
+    reuse_us = totals["reuse"] / runs * 1e6
+    print(f"⏱️  Validate every section twice: {baseline_us:8.1f} µs per CV")
+    print(f"⏱️  Reuse untouched sections:     {reuse_us:8.1f} µs per CV")
+    print(f"🚀 Saved {baseline_us - reuse_us:.1f} µs per CV ({(1 - reuse_us / baseline_us) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
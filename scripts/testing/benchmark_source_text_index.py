@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: hallucination validation with and without SourceTextIndex
+Usage: python3 scripts/testing/benchmark_source_text_index.py [pages] [fields]
+
+Builds a synthetic multi-page CV, validates a few hundred extracted strings
+against it the old way (re-normalizing the whole CV and rebuilding the
+SequenceMatcher per field) and through a SourceTextIndex, and checks that
+both give the same answers.
+"""
+
+import random
+import re
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.cv_extraction.hallucination_validator import SourceTextIndex
+
+WORDS = ("led designed built migrated managed improved reduced delivered platform service "
+         "pipeline kubernetes python postgres latency revenue customers team engineers "
+         "billing analytics dashboard api cloud aws terraform reliability incident budget").split()
+
+
+def synthetic_cv(pages: int, rng: random.Random) -> str:
+    """Roughly 3,000 characters of bullet points per page."""
+    lines = ["Jane Doe - Senior Software Engineer", "jane@example.com | Tel Aviv"]
+    for page in range(pages):
+        lines.append(f"Company {page} (20{10 + page}-20{11 + page})")
+        for _ in range(25):
+            lines.append("- " + " ".join(rng.choice(WORDS) for _ in range(18)).capitalize() + ".")
+    return "\n".join(lines)
+
+
+def synthetic_fields(cv_text: str, count: int, rng: random.Random) -> list:
+    """Mix of verbatim snippets, reworded snippets and invented text."""
+    source_lines = [line.lstrip("- ") for line in cv_text.splitlines() if len(line) > 40]
+    fields = []
+    for i in range(count):
+        line = rng.choice(source_lines)
+        kind = i % 4
+        if kind == 0:
+            fields.append(line)
+        elif kind == 1:
+            fields.append(" ".join(line.split()[:3]))
+        elif kind == 2:
+            words = line.split()
+            rng.shuffle(words)
+            fields.append(" ".join(words))
+        else:
+            fields.append("Spearheaded a revolutionary, industry leading transformation of culture")
+    return fields
+
+
+def legacy_text_exists(extracted_text: str, original_text: str, threshold: float = 0.7) -> bool:
+    """The pre-index implementation, kept here as the baseline."""
+    if not extracted_text:
+        return True
+
+    def normalize(text):
+        text = re.sub(r'\s+', ' ', text.lower().strip())
+        return re.sub(r'[^\w\s]', '', text)
+
+    extracted_norm = normalize(extracted_text)
+    original_norm = normalize(original_text)
+    if len(extracted_norm) < 10:
+        return extracted_norm in original_norm
+    extracted_words = extracted_norm.split()
+    if len(extracted_words) <= 3:
+        return ' '.join(extracted_words) in original_norm
+    match = SequenceMatcher(None, extracted_norm, original_norm).find_longest_match(
+        0, len(extracted_norm), 0, len(original_norm))
+    if match.size >= len(extracted_norm) * threshold:
+        return True
+    words_found = sum(1 for word in extracted_words if word in original_norm)
+    return words_found / len(extracted_words) >= threshold
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    field_count = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    rng = random.Random(42)
+    cv_text = synthetic_cv(pages, rng)
+    fields = synthetic_fields(cv_text, field_count, rng)
+
+    print(f"📄 Synthetic CV: {pages} pages, {len(cv_text):,} characters, {len(fields)} fields")
+
+    start = time.perf_counter()
+    legacy = [legacy_text_exists(field, cv_text) for field in fields]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = SourceTextIndex(cv_text)
+    build_time = time.perf_counter() - start
+    indexed = [index.text_exists(field) for field in fields]
+    indexed_time = time.perf_counter() - start
+
+    assert legacy == indexed, "Indexed validation disagrees with the baseline"
+
+    print(f"⏱️  Per-field re-normalization: {legacy_time * 1000:8.1f} ms")
+    print(f"⏱️  SourceTextIndex:            {indexed_time * 1000:8.1f} ms "
+          f"(index build {build_time * 1000:.1f} ms)")
+    print(f"🚀 Speedup: {legacy_time / indexed_time:.1f}x - {sum(indexed)}/{len(fields)} fields found in source")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: TextExtractor._normalize_text throughput on large OCR-like text
+Usage: python3 scripts/testing/benchmark_text_normalization.py [pages]
+
+Builds OCR-style text from the example CVs (ligatures, curly quotes, dashes,
+non-breaking and zero-width spaces, ragged whitespace, "12 %") and normalizes
+it with the old replace/regex chain and with TextNormalizer, checking that
+both produce the same text. Plain ASCII text is measured separately since it
+skips Unicode normalization entirely.
+"""
+
+import random
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.local.text_normalizer import text_normalizer
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+OCR_ARTIFACTS = [
+    ("fi", "\uFB01"), ("fl", "\uFB02"), ("ff", "\uFB00"), ("'", "\u2019"), (" - ", " \u2014 "),
+    ("-", "\u2013"), (". ", ".  "), (", ", ",\u00A0"), ("%", " %"), (" ", "\t"), ("e", "e\u200B")
+]
+
+
+def legacy_normalize_text(text: str) -> str:
+    """The replace/regex chain TextNormalizer replaced, kept here as the baseline."""
+    if not text:
+        return text
+    for ligature, replacement in {'\uFB00': 'ff', '\uFB01': 'fi', '\uFB02': 'fl', '\uFB03': 'ffi',
+                                  '\uFB04': 'ffl', '\uFB05': 'st', '\uFB06': 'st'}.items():
+        text = text.replace(ligature, replacement)
+    text = unicodedata.normalize('NFKC', text)
+    for old_char, new_char in {'\u2019': "'", '\u2018': "'", '\u201C': '"', '\u201D': '"',
+                               '\u2013': '-', '\u2014': '-', '\u2026': '...', '\u00A0': ' ',
+                               '\u200B': '', '\u200C': '', '\u200D': '', '\uFEFF': ''}.items():
+        text = text.replace(old_char, new_char)
+    text = re.sub(r'(\d+)\s+%', r'\1%', text)
+    text = re.sub(r'\s+', ' ', text)
+    lines = text.split('\n')
+    return '\n'.join(line.strip() for line in lines if line.strip())
+
+
+def ocr_text(pages: int, rng: random.Random) -> str:
+    """Example CV lines with OCR artifacts sprinkled in, repeated to the requested size."""
+    source_lines = []
+    for path in sorted((REPO_ROOT / "data/cv_examples/text_examples").iterdir()):
+        source_lines.extend(path.read_text().splitlines())
+
+    lines = []
+    while sum(len(line) for line in lines) < pages * 3000:
+        line = rng.choice(source_lines)
+        for plain, artifact in rng.sample(OCR_ARTIFACTS, 3):
+            line = line.replace(plain, artifact, 2)
+        lines.append(line + " " * rng.randint(0, 3))
+    return "\n".join(lines)
+
+
+def throughput(normalize, text: str, rounds: int) -> float:
+    """Best MB/s over the rounds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        normalize(text)
+        best = min(best, time.perf_counter() - start)
+    return len(text.encode()) / best / 1e6
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(42)
+    unicode_text = ocr_text(pages, rng)
+    ascii_text = unicode_text.encode("ascii", "ignore").decode()
+    print(f"📄 {pages} pages of OCR-style text ({len(unicode_text):,} characters)")
+
+    for label, text in (("OCR text with Unicode artifacts", unicode_text), ("Plain ASCII text", ascii_text)):
+        assert text_normalizer.normalize(text) == legacy_normalize_text(text), "Normalized text differs"
+        legacy = throughput(legacy_normalize_text, text, 5)
+        engine = throughput(text_normalizer.normalize, text, 5)
+        lines = throughput(lambda t: text_normalizer.normalize(t, preserve_line_breaks=True), text, 5)
+        print(f"\n{label}")
+        print(f"⏱️  Replace/regex chain:           {legacy:7.1f} MB/s")
+        print(f"⏱️  TextNormalizer:                {engine:7.1f} MB/s ({engine / legacy:.1f}x)")
+        print(f"⏱️  TextNormalizer (keep lines):   {lines:7.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
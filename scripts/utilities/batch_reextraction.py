@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Bulk re-extraction of stored CVs through the message batch API.
+Cheaper and higher-throughput than force_reextraction.py for large backfills;
+interrupted runs resume from the checkpoint file.
+"""
+
+import asyncio
+import glob
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.api.db import get_db_connection
+from src.core.cv_extraction.batch_extractor import BatchExtractor, create_anthropic_batch_client
+from src.core.local.text_extractor import text_extractor
+import logging
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).parent.parent.parent
+DEFAULT_CHECKPOINT = BASE_DIR / "data" / "batch_reextraction_checkpoint.json"
+
+
+def find_upload_file(job_id: str):
+    """Locate the uploaded file for a job (same layouts the /extract route searches)"""
+    matches = glob.glob(str(BASE_DIR / "data" / "uploads" / "**" / f"{job_id}*"), recursive=True)
+    files = [m for m in matches if Path(m).is_file()]
+    return files[0] if files else None
+
+
+def load_jobs(job_ids=None, statuses=("completed",), limit=None):
+    """
+    Yield (job_id, raw_text, file_hash) for CV uploads to re-extract.
+
+    Args:
+        job_ids: Optional explicit list of job IDs
+        statuses: Upload statuses to include when job_ids is not given
+        limit: Optional maximum number of jobs
+    """
+    conn = get_db_connection()
+    try:
+        if job_ids:
+            placeholders = ",".join("?" * len(job_ids))
+            rows = conn.execute(
+                f"SELECT job_id, file_hash FROM cv_uploads WHERE job_id IN ({placeholders})",
+                list(job_ids)
+            ).fetchall()
+        else:
+            placeholders = ",".join("?" * len(statuses))
+            rows = conn.execute(
+                f"SELECT job_id, file_hash FROM cv_uploads WHERE status IN ({placeholders}) ORDER BY upload_date",
+                list(statuses)
+            ).fetchall()
+    finally:
+        conn.close()
+
+    if limit:
+        rows = rows[:limit]
+
+    for row in rows:
+        file_path = find_upload_file(row['job_id'])
+        if not file_path:
+            logger.warning(f"File not found for job {row['job_id']} - skipping")
+            continue
+        try:
+            text = text_extractor.extract_text(file_path)
+        except Exception as e:
+            logger.warning(f"Text extraction failed for job {row['job_id']}: {e}")
+            continue
+        yield row['job_id'], text, row['file_hash']
+
+
+async def run_batch_reextraction(checkpoint_path: str, job_ids=None, statuses=("completed",),
+                                 limit=None, poll_interval: float = 60.0):
+    """Queue jobs and drive the batch extraction to completion"""
+    extractor = BatchExtractor(
+        create_anthropic_batch_client(),
+        checkpoint_path=checkpoint_path,
+        poll_interval=poll_interval
+    )
+    added = extractor.add_jobs(load_jobs(job_ids, statuses, limit))
+    logger.info(f"Queued {added} new jobs ({len(extractor.checkpoint.jobs)} in checkpoint)")
+
+    summary = await extractor.run()
+    logger.info(
+        f"Batch re-extraction finished: {len(summary['completed'])} completed, "
+        f"{len(summary['failed'])} failed, {summary['batches']} batches"
+    )
+    return summary
+
+
+def main():
+    """Main function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Bulk re-extract CVs using the message batch API')
+    parser.add_argument('--job-id', action='append', dest='job_ids', help='Job ID to re-extract (repeatable)')
+    parser.add_argument('--status', action='append', dest='statuses',
+                        help='Upload status to include (repeatable, default: completed)')
+    parser.add_argument('--limit', type=int, help='Maximum number of CVs to queue')
+    parser.add_argument('--checkpoint', type=str, default=str(DEFAULT_CHECKPOINT),
+                        help='Checkpoint file used to resume interrupted runs')
+    parser.add_argument('--poll-interval', type=float, default=60.0, help='Seconds between batch status checks')
+
+    args = parser.parse_args()
+
+    asyncio.run(run_batch_reextraction(
+        checkpoint_path=args.checkpoint,
+        job_ids=args.job_ids,
+        statuses=tuple(args.statuses or ("completed",)),
+        limit=args.limit,
+        poll_interval=args.poll_interval
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Bulk extraction of partner CV batches (a directory or manifest of files).
+Runs text and LLM extraction concurrently and writes one JSONL record per
+file; re-running with the same output file resumes an interrupted run.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.api.db import init_db
+from src.core.cv_extraction.bulk_extractor import BulkExtractor, iter_bulk_items
+import logging
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).parent.parent.parent
+DEFAULT_OUTPUT_DIR = BASE_DIR / "data" / "bulk_extractions"
+
+
+async def run_bulk_extraction(source: str, output_path: str, concurrency: int = 4, text_concurrency: int = 2,
+                              use_cache: bool = True, retry_failed: bool = False):
+    """Extract every file of a directory or manifest into a JSONL file"""
+    init_db()  # Text and extraction caches
+    extractor = BulkExtractor(
+        output_path,
+        concurrency=concurrency,
+        text_concurrency=text_concurrency,
+        use_cache=use_cache,
+        retry_failed=retry_failed,
+        on_record=lambda record: logger.info(
+            f"{record['status']}: {record['id']} ({record['timings']['total']}s)"
+        )
+    )
+    summary = await extractor.run(iter_bulk_items(source))
+    logger.info(f"Results written to {output_path}")
+    return summary
+
+
+def main():
+    """Main function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Bulk extract a directory or manifest of CVs to JSONL')
+    parser.add_argument('source', help='Directory of CV files, or manifest (one path or {"path", "id"} JSON per line)')
+    parser.add_argument('--output', type=str,
+                        help='JSONL output, resumed if it exists (default: data/bulk_extractions/<source name>.jsonl)')
+    parser.add_argument('--concurrency', type=int, default=4, help='LLM extractions at once')
+    parser.add_argument('--text-concurrency', type=int, default=2, help='Text extractions (PDF parsing/OCR) at once')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or fill the text and extraction caches')
+    parser.add_argument('--retry-failed', action='store_true', help='Re-extract files recorded as failed')
+
+    args = parser.parse_args()
+    output = args.output or str(DEFAULT_OUTPUT_DIR / f"{Path(args.source).stem}.jsonl")
+
+    asyncio.run(run_bulk_extraction(
+        source=args.source,
+        output_path=output,
+        concurrency=args.concurrency,
+        text_concurrency=args.text_concurrency,
+        use_cache=not args.no_cache,
+        retry_failed=args.retry_failed
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -49,7 +49,7 @@ def force_reextraction_for_all():
         cursor.execute("""
             SELECT COUNT(*) as count 
             FROM cv_uploads 
-            WHERE status = 'completed' AND cv_data IS NOT NULL
+            WHERE status = 'completed' AND (cv_data IS NOT NULL OR cv_data_hash IS NOT NULL)
         """)
         completed_count = cursor.fetchone()[0]
         
@@ -57,7 +57,7 @@ def force_reextraction_for_all():
             # Reset status and clear cv_data for completed uploads
             cursor.execute("""
                 UPDATE cv_uploads 
-                SET status = 'uploaded', cv_data = NULL 
+                SET status = 'uploaded', cv_data = NULL, cv_data_hash = NULL 
                 WHERE status = 'completed'
             """)
             print(f"✅ Reset {completed_count} completed CV uploads for re-extraction")
@@ -122,7 +122,7 @@ def force_reextraction_for_job(job_id: str):
         # Reset the job for re-extraction
         cursor.execute("""
             UPDATE cv_uploads 
-            SET status = 'uploaded', cv_data = NULL 
+            SET status = 'uploaded', cv_data = NULL, cv_data_hash = NULL 
             WHERE job_id = ?
         """, (job_id,))
         
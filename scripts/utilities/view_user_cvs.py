@@ -4,7 +4,13 @@ View CV data associated with users in the RESUME2WEBSITE database
 """
 import sqlite3
 import json
+import sys
 from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.api.db import load_cv_data
 
 def view_user_cvs():
     """Display all users and their associated CVs"""
@@ -55,7 +61,7 @@ def view_user_cvs():
                     upload_date,
                     status,
                     CASE 
-                        WHEN cv_data IS NOT NULL THEN 'Yes'
+                        WHEN cv_data_hash IS NOT NULL THEN 'Yes'
                         ELSE 'No'
                     END as has_extracted_data
                 FROM cv_uploads
@@ -109,9 +115,10 @@ def view_cv_data(job_id=None):
         print(f"📅 Uploaded: {cv['upload_date']}")
         print(f"✅ Status: {cv['status']}")
         
-        if cv['cv_data']:
+        cv_json = load_cv_data(cv['cv_data_hash'])
+        if cv_json:
             try:
-                cv_data = json.loads(cv['cv_data'])
+                cv_data = json.loads(cv_json)
                 print(f"\n📊 Extracted Data Sections:")
                 
                 # Show which sections have data
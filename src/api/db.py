@@ -1,18 +1,35 @@
 """
 Database functions for RESUME2WEBSITE MVP
 """
+import json
+import hashlib
 import os
 import sqlite3
+import time
 import uuid
+import zlib
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 import logging
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Database configuration
 DB_PATH = os.getenv('DATABASE_URL', 'data/resume2website.db').replace('sqlite:///', '')
 
+# CV JSON is stored compressed in cv_data_blobs, keyed by its SHA-256
+CV_DATA_CODEC = "zstd" if ZSTD_AVAILABLE else "zlib"
+CV_DATA_COMPRESSION_LEVEL = 6
+
+# cv_uploads columns returned by metadata-only queries (no CV JSON)
+CV_UPLOAD_COLUMNS = "upload_id, user_id, job_id, filename, file_type, upload_date, status, file_hash, cv_data_hash"
+
 
 def get_db_connection():
     """Get database connection with row factory"""
@@ -134,20 +151,127 @@ def init_db():
             else:
                 logger.warning(f"Unexpected error adding file_hash column: {e}")
         
+        # Add cv_data_hash column if it doesn't exist (migration - CV JSON lives in cv_data_blobs)
+        try:
+            conn.execute('ALTER TABLE cv_uploads ADD COLUMN cv_data_hash TEXT')
+            logger.info("Added cv_data_hash column to cv_uploads table")
+        except sqlite3.OperationalError:
+            pass
+        
         # Create cv_extraction_cache table for deterministic caching
+        # (cv_data is legacy inline JSON, moved to cv_data_blobs by _migrate_inline_cv_data)
         conn.execute('''
             CREATE TABLE IF NOT EXISTS cv_extraction_cache (
                 file_hash TEXT PRIMARY KEY,
-                cv_data TEXT NOT NULL,
+                cv_data TEXT,
                 extraction_model TEXT NOT NULL,
                 temperature REAL NOT NULL,
                 created_at TEXT NOT NULL,
                 confidence_score REAL,
                 access_count INTEGER DEFAULT 1,
-                last_accessed TEXT NOT NULL
+                last_accessed TEXT NOT NULL,
+                cv_data_hash TEXT
+            )
+        ''')
+        
+        # Create cv_data_blobs table (compressed CV JSON shared by uploads and cache entries)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS cv_data_blobs (
+                blob_hash TEXT PRIMARY KEY,
+                codec TEXT NOT NULL,
+                data BLOB NOT NULL,
+                raw_size INTEGER NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        ''')
+        _migrate_inline_cv_data(conn)
+        
+        # Create cv_text_cache table (text extracted from a file, by file hash)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS cv_text_cache (
+                file_hash TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        ''')
+        
+        # Create job_queue table for background processing (see src/services/job_queue.py)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS job_queue (
+                job_id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                payload TEXT,
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                available_at REAL NOT NULL,
+                lease_owner TEXT,
+                lease_expires_at REAL,
+                last_error TEXT,
+                created_at TEXT NOT NULL
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_job_queue_status ON job_queue(status, available_at)')
+
+        # Create extraction_leases table for single-flight extraction across processes
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS extraction_leases (
+                file_hash TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                status TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                cv_data TEXT,
+                confidence_score REAL,
+                section_models TEXT
             )
         ''')
         
+        # Add section_models column to existing extraction_leases table if it doesn't exist
+        try:
+            conn.execute("ALTER TABLE extraction_leases ADD COLUMN section_models TEXT")
+            conn.commit()
+        except sqlite3.OperationalError:
+            # Column already exists, ignore
+            pass
+
+        # Create shared state tables for state shared by all worker processes
+        # (see src/services/shared_state.py)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS shared_counters (
+                key TEXT PRIMARY KEY,
+                value REAL NOT NULL
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS shared_window_hits (
+                key TEXT NOT NULL,
+                hit_at REAL NOT NULL
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_shared_window_hits_key ON shared_window_hits(key, hit_at)')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS shared_token_buckets (
+                key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS shared_values (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS shared_messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                channel TEXT NOT NULL,
+                message TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        ''')
+
         # Create indexes for performance (safe creation)
         try:
             conn.execute('CREATE INDEX IF NOT EXISTS idx_cv_uploads_file_hash ON cv_uploads(file_hash)')
@@ -176,6 +300,122 @@ def init_db():
             conn.close()
 
 
+def _migrate_inline_cv_data(conn: sqlite3.Connection) -> None:
+    """Move CV JSON stored inline by older versions into cv_data_blobs"""
+    columns = {row['name']: row for row in conn.execute("PRAGMA table_info(cv_extraction_cache)")}
+    if 'cv_data_hash' not in columns:
+        # Older cache table: cv_data was NOT NULL, so rebuild it rather than ALTER
+        conn.execute('''
+            CREATE TABLE cv_extraction_cache_new (
+                file_hash TEXT PRIMARY KEY,
+                cv_data TEXT,
+                extraction_model TEXT NOT NULL,
+                temperature REAL NOT NULL,
+                created_at TEXT NOT NULL,
+                confidence_score REAL,
+                access_count INTEGER DEFAULT 1,
+                last_accessed TEXT NOT NULL,
+                cv_data_hash TEXT
+            )
+        ''')
+        conn.execute('''
+            INSERT INTO cv_extraction_cache_new (file_hash, cv_data, extraction_model, temperature,
+                created_at, confidence_score, access_count, last_accessed)
+            SELECT file_hash, cv_data, extraction_model, temperature,
+                created_at, confidence_score, access_count, last_accessed
+            FROM cv_extraction_cache
+        ''')
+        conn.execute("DROP TABLE cv_extraction_cache")
+        conn.execute("ALTER TABLE cv_extraction_cache_new RENAME TO cv_extraction_cache")
+        logger.info("Rebuilt cv_extraction_cache table with cv_data_hash column")
+    
+    moved = 0
+    for table, key in (("cv_uploads", "job_id"), ("cv_extraction_cache", "file_hash")):
+        rows = conn.execute(f"SELECT {key}, cv_data FROM {table} WHERE cv_data IS NOT NULL").fetchall()
+        for row in rows:
+            conn.execute(
+                f"UPDATE {table} SET cv_data_hash = ?, cv_data = NULL WHERE {key} = ?",
+                (_store_cv_data(conn, row['cv_data']), row[key])
+            )
+        moved += len(rows)
+    if moved:
+        conn.commit()
+        logger.info(f"Moved {moved} inline CV JSON values to cv_data_blobs")
+
+
+def _compress_cv_data(cv_data: str) -> bytes:
+    raw = cv_data.encode('utf-8')
+    if CV_DATA_CODEC == "zstd":
+        return zstandard.ZstdCompressor(level=CV_DATA_COMPRESSION_LEVEL).compress(raw)
+    return zlib.compress(raw, CV_DATA_COMPRESSION_LEVEL)
+
+
+def _decompress_cv_data(codec: str, data: bytes) -> str:
+    if codec == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("CV data is zstd-compressed but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+    return zlib.decompress(data).decode('utf-8')
+
+
+def _store_cv_data(conn: sqlite3.Connection, cv_data: str) -> str:
+    """Store CV JSON in cv_data_blobs (once per distinct content) and return its hash"""
+    blob_hash = hashlib.sha256(cv_data.encode('utf-8')).hexdigest()
+    if conn.execute("SELECT 1 FROM cv_data_blobs WHERE blob_hash = ?", (blob_hash,)).fetchone() is None:
+        conn.execute(
+            "INSERT OR IGNORE INTO cv_data_blobs (blob_hash, codec, data, raw_size, created_at) VALUES (?, ?, ?, ?, ?)",
+            (blob_hash, CV_DATA_CODEC, _compress_cv_data(cv_data), len(cv_data), datetime.utcnow().isoformat())
+        )
+    return blob_hash
+
+
+def load_cv_data(cv_data_hash: Optional[str]) -> Optional[str]:
+    """Get CV JSON by the cv_data_hash of an upload or cache entry"""
+    if not cv_data_hash:
+        return None
+    return load_cv_data_many([cv_data_hash]).get(cv_data_hash)
+
+
+def load_cv_data_many(cv_data_hashes: Iterable[Optional[str]]) -> Dict[str, str]:
+    """Get the CV JSON of several cv_data_hash values in one query"""
+    hashes = list({h for h in cv_data_hashes if h})
+    if not hashes:
+        return {}
+    conn = get_db_connection()
+    try:
+        placeholders = ",".join("?" * len(hashes))
+        rows = conn.execute(
+            f"SELECT blob_hash, codec, data FROM cv_data_blobs WHERE blob_hash IN ({placeholders})", hashes
+        ).fetchall()
+        return {row['blob_hash']: _decompress_cv_data(row['codec'], row['data']) for row in rows}
+    finally:
+        conn.close()
+
+
+def _with_cv_data(rows: list) -> list:
+    """Add the cv_data JSON of each cv_uploads row (None if not extracted yet)"""
+    blobs = load_cv_data_many(row.get('cv_data_hash') for row in rows)
+    for row in rows:
+        row['cv_data'] = blobs.get(row.get('cv_data_hash'))
+    return rows
+
+
+def cleanup_cv_data_blobs() -> int:
+    """Delete CV JSON blobs no upload or cache entry refers to"""
+    conn = get_db_connection()
+    try:
+        cursor = conn.execute('''
+            DELETE FROM cv_data_blobs WHERE blob_hash NOT IN (
+                SELECT cv_data_hash FROM cv_uploads WHERE cv_data_hash IS NOT NULL
+                UNION SELECT cv_data_hash FROM cv_extraction_cache WHERE cv_data_hash IS NOT NULL
+            )
+        ''')
+        conn.commit()
+        return cursor.rowcount
+    finally:
+        conn.close()
+
+
 def create_user(email: str, password_hash: str, name: str = None, phone: str = None) -> str:
     """Create a new user in database"""
     conn = get_db_connection()
@@ -343,21 +583,48 @@ def create_cv_upload(user_id: str, job_id: str, filename: str, file_type: str, f
         conn.close()
 
 
-def get_user_cv_uploads(user_id: str) -> list:
-    """Get all CV uploads for a user, sorted by most recent first"""
+def get_user_cv_uploads(user_id: str, include_cv_data: bool = False) -> list:
+    """
+    Get all CV uploads for a user, sorted by most recent first.
+    
+    Metadata only unless include_cv_data is set, in which case every row also
+    gets its cv_data JSON (loaded in one query).
+    """
     conn = get_db_connection()
     try:
         cursor = conn.execute(
-            """SELECT upload_id, job_id, filename, file_type, upload_date, status, cv_data
+            f"""SELECT {CV_UPLOAD_COLUMNS}
             FROM cv_uploads 
             WHERE user_id = ? 
             ORDER BY upload_date DESC""",
             (user_id,)
         )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        rows = [dict(row) for row in cursor.fetchall()]
+    finally:
+        conn.close()
+    return _with_cv_data(rows) if include_cv_data else rows
+
+
+def get_cv_upload(job_id: str, user_id: Optional[str] = None, include_cv_data: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Get one CV upload by job ID (only if owned by user_id, when given).
+    
+    Metadata only unless include_cv_data is set; ownership checks never load
+    the CV JSON.
+    """
+    conn = get_db_connection()
+    try:
+        query = f"SELECT {CV_UPLOAD_COLUMNS} FROM cv_uploads WHERE job_id = ?"
+        params = [job_id]
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params.append(user_id)
+        row = conn.execute(query, params).fetchone()
     finally:
         conn.close()
+    if not row:
+        return None
+    return _with_cv_data([dict(row)])[0] if include_cv_data else dict(row)
 
 
 def get_user_cv_count(user_id: str) -> int:
@@ -376,13 +643,46 @@ def get_user_cv_count(user_id: str) -> int:
         conn.close()
 
 
+def count_file_hash_references(file_hash: str) -> int:
+    """Number of CV uploads whose file has this hash (the blob's reference count)"""
+    conn = get_db_connection()
+    try:
+        cursor = conn.execute("SELECT COUNT(*) as count FROM cv_uploads WHERE file_hash = ?", (file_hash,))
+        return cursor.fetchone()['count']
+    finally:
+        conn.close()
+
+
+def _delete_cv_files(cv_dict: dict) -> None:
+    """
+    Delete a removed CV's job files, then its stored blob if no other upload
+    references the same content. Sets file_deleted (and deleted_path) on cv_dict.
+    """
+    from src.utils.upload_store import upload_store
+    
+    # Extract file extension from filename
+    file_ext = ''
+    if '.' in cv_dict['filename']:
+        file_ext = '.' + cv_dict['filename'].split('.')[-1]
+    
+    removed = upload_store.remove_job_files(cv_dict['job_id'], file_ext)
+    cv_dict['file_deleted'] = bool(removed)
+    if removed:
+        cv_dict['deleted_path'] = str(removed[0])
+    
+    # The hash is internal, not part of the deleted CV info returned to clients
+    file_hash = cv_dict.pop('file_hash', None)
+    if file_hash and count_file_hash_references(file_hash) == 0:
+        upload_store.release(file_hash)
+
+
 def delete_oldest_cv(user_id: str) -> dict:
     """Delete the oldest CV upload for a user and return its info"""
     conn = get_db_connection()
     try:
         # First get the oldest CV info
         cursor = conn.execute(
-            """SELECT upload_id, job_id, filename, upload_date
+            """SELECT upload_id, job_id, filename, upload_date, file_hash
             FROM cv_uploads 
             WHERE user_id = ? 
             ORDER BY upload_date ASC
@@ -403,46 +703,7 @@ def delete_oldest_cv(user_id: str) -> dict:
             conn.commit()
             
             # Also delete the file from disk if it exists
-            import os
-            from pathlib import Path
-            BASE_DIR = Path(__file__).parent.parent.parent
-            upload_dir = BASE_DIR / "data" / "uploads"
-            
-            # Try different file path patterns
-            possible_paths = []
-            
-            # Extract file extension from filename
-            file_ext = ''
-            if '.' in oldest_cv_dict['filename']:
-                file_ext = '.' + oldest_cv_dict['filename'].split('.')[-1]
-            
-            # Check standard single file path
-            possible_paths.append(upload_dir / f"{oldest_cv_dict['job_id']}{file_ext}")
-            
-            # Check for multi-file upload directory
-            possible_paths.append(upload_dir / oldest_cv_dict['job_id'])
-            
-            file_deleted = False
-            for file_path in possible_paths:
-                if file_path.exists():
-                    try:
-                        if file_path.is_dir():
-                            # Multi-file upload - delete entire directory
-                            import shutil
-                            shutil.rmtree(file_path)
-                        else:
-                            # Single file - delete file
-                            os.remove(file_path)
-                        file_deleted = True
-                        oldest_cv_dict['file_deleted'] = True
-                        oldest_cv_dict['deleted_path'] = str(file_path)
-                        break
-                    except Exception as e:
-                        print(f"Failed to delete {file_path}: {e}")
-            
-            if not file_deleted:
-                oldest_cv_dict['file_deleted'] = False
-                
+            _delete_cv_files(oldest_cv_dict)
             return oldest_cv_dict
         
         return None
@@ -461,7 +722,7 @@ def enforce_cv_limit(user_id: str, max_cvs: int = 10) -> list:
     try:
         # Get all CVs sorted by date (oldest first)
         cursor = conn.execute(
-            """SELECT upload_id, job_id, filename, upload_date
+            """SELECT upload_id, job_id, filename, upload_date, file_hash
             FROM cv_uploads 
             WHERE user_id = ? 
             ORDER BY upload_date ASC""",
@@ -471,76 +732,52 @@ def enforce_cv_limit(user_id: str, max_cvs: int = 10) -> list:
         
         # If we have more than max_cvs, delete the oldest ones
         if len(all_cvs) > max_cvs:
-            cvs_to_delete = all_cvs[:len(all_cvs) - max_cvs]
-            
-            for cv in cvs_to_delete:
-                cv_dict = dict(cv)
-                
-                # Delete from database
-                conn.execute(
-                    """DELETE FROM cv_uploads 
-                    WHERE upload_id = ?""",
-                    (cv_dict['upload_id'],)
-                )
-                
-                # Try to delete the file
-                import os
-                from pathlib import Path
-                BASE_DIR = Path(__file__).parent.parent.parent
-                upload_dir = BASE_DIR / "data" / "uploads"
-                
-                # Try different file path patterns
-                possible_paths = []
-                
-                # Extract file extension from filename
-                file_ext = ''
-                if '.' in cv_dict['filename']:
-                    file_ext = '.' + cv_dict['filename'].split('.')[-1]
-                
-                # Check standard single file path
-                possible_paths.append(upload_dir / f"{cv_dict['job_id']}{file_ext}")
-                
-                # Check for multi-file upload directory
-                possible_paths.append(upload_dir / cv_dict['job_id'])
-                
-                file_deleted = False
-                for file_path in possible_paths:
-                    if file_path.exists():
-                        try:
-                            if file_path.is_dir():
-                                # Multi-file upload - delete entire directory
-                                import shutil
-                                shutil.rmtree(file_path)
-                            else:
-                                # Single file - delete file
-                                os.remove(file_path)
-                            file_deleted = True
-                            cv_dict['file_deleted'] = True
-                            cv_dict['deleted_path'] = str(file_path)
-                            break
-                        except Exception as e:
-                            print(f"Failed to delete {file_path}: {e}")
-                
-                if not file_deleted:
-                    cv_dict['file_deleted'] = False
-                    
-                deleted_cvs.append(cv_dict)
+            cvs_to_delete = [dict(cv) for cv in all_cvs[:len(all_cvs) - max_cvs]]
             
+            # Delete from database
+            conn.executemany(
+                """DELETE FROM cv_uploads 
+                WHERE upload_id = ?""",
+                [(cv_dict['upload_id'],) for cv_dict in cvs_to_delete]
+            )
             conn.commit()
+            
+            # Then delete the files, once no row references them
+            for cv_dict in cvs_to_delete:
+                _delete_cv_files(cv_dict)
+                deleted_cvs.append(cv_dict)
     finally:
         conn.close()
     
     return deleted_cvs
 
 
+def get_referenced_file_hashes() -> set:
+    """File hashes still referenced by CV uploads"""
+    conn = get_db_connection()
+    try:
+        cursor = conn.execute("SELECT DISTINCT file_hash FROM cv_uploads WHERE file_hash IS NOT NULL")
+        return {row['file_hash'] for row in cursor.fetchall()}
+    finally:
+        conn.close()
+
+
+def cleanup_upload_blobs() -> int:
+    """Delete stored upload blobs no CV upload or job file refers to"""
+    from src.utils.upload_store import upload_store
+    
+    referenced = get_referenced_file_hashes()
+    return upload_store.collect_garbage(referenced.__contains__)
+
+
 def update_cv_upload_status(job_id: str, status: str, cv_data: str = None) -> bool:
     """Update CV upload status and optionally CV data"""
     conn = get_db_connection()
     try:
         if cv_data:
             conn.execute(
-                "UPDATE cv_uploads SET status = ?, cv_data = ? WHERE job_id = ?",
-                (status, cv_data, job_id)
+                "UPDATE cv_uploads SET status = ?, cv_data_hash = ? WHERE job_id = ?",
+                (status, _store_cv_data(conn, cv_data), job_id)
             )
         else:
             conn.execute(
@@ -619,9 +856,10 @@ def get_cached_extraction(file_hash: str) -> Optional[dict]:
     conn = get_db_connection()
     try:
         cursor = conn.execute(
-            """SELECT cv_data, extraction_model, temperature, confidence_score, access_count
-            FROM cv_extraction_cache 
-            WHERE file_hash = ?""",
+            """SELECT c.extraction_model, c.temperature, c.confidence_score, c.access_count, b.codec, b.data
+            FROM cv_extraction_cache c
+            JOIN cv_data_blobs b ON b.blob_hash = c.cv_data_hash
+            WHERE c.file_hash = ?""",
             (file_hash,)
         )
         row = cursor.fetchone()
@@ -635,7 +873,7 @@ def get_cached_extraction(file_hash: str) -> Optional[dict]:
             conn.commit()
             
             return {
-                'cv_data': row['cv_data'],
+                'cv_data': _decompress_cv_data(row['codec'], row['data']),
                 'extraction_model': row['extraction_model'],
                 'temperature': row['temperature'],
                 'confidence_score': row['confidence_score'],
@@ -654,10 +892,10 @@ def cache_extraction_result(file_hash: str, cv_data: str, extraction_model: str,
         now = datetime.utcnow().isoformat()
         conn.execute(
             """INSERT OR REPLACE INTO cv_extraction_cache 
-            (file_hash, cv_data, extraction_model, temperature, created_at, 
+            (file_hash, cv_data_hash, extraction_model, temperature, created_at, 
              confidence_score, access_count, last_accessed) 
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (file_hash, cv_data, extraction_model, temperature, now, confidence_score, 1, now)
+            (file_hash, _store_cv_data(conn, cv_data), extraction_model, temperature, now, confidence_score, 1, now)
         )
         conn.commit()
         return True
@@ -668,6 +906,141 @@ def cache_extraction_result(file_hash: str, cv_data: str, extraction_model: str,
         conn.close()
 
 
+def get_cached_text(file_hash: str) -> Optional[str]:
+    """Get text previously extracted from a file by file hash"""
+    conn = get_db_connection()
+    try:
+        row = conn.execute("SELECT text FROM cv_text_cache WHERE file_hash = ?", (file_hash,)).fetchone()
+        return row['text'] if row else None
+    finally:
+        conn.close()
+
+
+def cache_extracted_text(file_hash: str, text: str) -> bool:
+    """Cache the text extracted from a file (saves OCR on re-extraction)"""
+    conn = get_db_connection()
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO cv_text_cache (file_hash, text, created_at) VALUES (?, ?, ?)",
+            (file_hash, text, datetime.utcnow().isoformat())
+        )
+        conn.commit()
+        return True
+    except Exception as e:
+        logger.error(f"Failed to cache extracted text: {e}")
+        return False
+    finally:
+        conn.close()
+
+
+def get_previous_extraction(user_id: str, job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a user's latest completed extraction other than job_id, with the text it
+    was extracted from (uploads whose text was never cached are skipped).
+
+    Returns:
+        Dict with job_id, cv_data (JSON) and text, or None
+    """
+    conn = get_db_connection()
+    try:
+        row = conn.execute(
+            """SELECT u.job_id, u.cv_data_hash, t.text FROM cv_uploads u
+            JOIN cv_text_cache t ON t.file_hash = u.file_hash
+            WHERE u.user_id = ? AND u.job_id != ? AND u.status = 'completed' AND u.cv_data_hash IS NOT NULL
+            ORDER BY u.upload_date DESC LIMIT 1""",
+            (user_id, job_id)
+        ).fetchone()
+    finally:
+        conn.close()
+    return _with_cv_data([dict(row)])[0] if row else None
+
+
+def acquire_extraction_lease(file_hash: str, owner: str, lease_seconds: float) -> bool:
+    """
+    Become the process extracting a file, unless another process already is
+    (or recently finished - its result is kept on the lease until it expires).
+    
+    Returns:
+        True if the lease was taken (free, or the previous one expired)
+    """
+    now = time.time()
+    conn = get_db_connection()
+    try:
+        cursor = conn.execute(
+            """INSERT INTO extraction_leases (file_hash, owner, status, expires_at)
+            VALUES (?, ?, 'running', ?)
+            ON CONFLICT(file_hash) DO UPDATE SET
+                owner = excluded.owner, status = 'running', expires_at = excluded.expires_at,
+                cv_data = NULL, confidence_score = NULL, section_models = NULL
+            WHERE extraction_leases.expires_at <= ?""",
+            (file_hash, owner, now + lease_seconds, now)
+        )
+        conn.commit()
+        return cursor.rowcount > 0
+    finally:
+        conn.close()
+
+
+def renew_extraction_lease(file_hash: str, owner: str, lease_seconds: float) -> bool:
+    """Extend a running extraction lease; False if owner no longer holds it"""
+    conn = get_db_connection()
+    try:
+        cursor = conn.execute(
+            "UPDATE extraction_leases SET expires_at = ? WHERE file_hash = ? AND owner = ? AND status = 'running'",
+            (time.time() + lease_seconds, file_hash, owner)
+        )
+        conn.commit()
+        return cursor.rowcount > 0
+    finally:
+        conn.close()
+
+
+def finish_extraction_lease(file_hash: str, owner: str, cv_data: str, confidence_score: float,
+                            result_ttl: float, section_models: Optional[Dict[str, str]] = None) -> bool:
+    """Publish the lease owner's result to waiting processes for result_ttl seconds"""
+    conn = get_db_connection()
+    try:
+        cursor = conn.execute(
+            """UPDATE extraction_leases SET status = 'done', cv_data = ?, confidence_score = ?,
+                section_models = ?, expires_at = ?
+            WHERE file_hash = ? AND owner = ?""",
+            (cv_data, confidence_score, json.dumps(section_models or {}), time.time() + result_ttl,
+             file_hash, owner)
+        )
+        conn.commit()
+        return cursor.rowcount > 0
+    finally:
+        conn.close()
+
+
+def release_extraction_lease(file_hash: str, owner: str) -> bool:
+    """Drop a lease without a result (the extraction failed or was cut short)"""
+    conn = get_db_connection()
+    try:
+        cursor = conn.execute(
+            "DELETE FROM extraction_leases WHERE file_hash = ? AND owner = ?",
+            (file_hash, owner)
+        )
+        conn.commit()
+        return cursor.rowcount > 0
+    finally:
+        conn.close()
+
+
+def get_extraction_lease(file_hash: str) -> Optional[dict]:
+    """Current lease for a file hash, or None if nobody holds one"""
+    conn = get_db_connection()
+    try:
+        cursor = conn.execute(
+            "SELECT * FROM extraction_leases WHERE file_hash = ? AND expires_at > ?",
+            (file_hash, time.time())
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
+    finally:
+        conn.close()
+
+
 def calculate_cache_hit_rate() -> float:
     """Calculate cache hit rate for monitoring"""
     conn = get_db_connection()
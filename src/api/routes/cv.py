@@ -3,15 +3,13 @@ CV processing endpoints - MVP version
 """
 # ========== IMPORTS ==========
 from fastapi import APIRouter, UploadFile, File, HTTPException, Header, Form, Depends, Request
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel, HttpUrl, EmailStr
 from typing import Dict, Any, Optional, List
 import uuid
 from pathlib import Path
 import logging
 from datetime import datetime, timedelta
-import aiofiles
-import hashlib  # For file hash calculation
 import os  # For environment variables
 import re  # For filename validation
 from dotenv import load_dotenv  # For loading .env file
@@ -37,6 +35,10 @@ logger.info(f"Running in {'DEVELOPMENT' if IS_DEVELOPMENT else 'PRODUCTION'} mod
 # Create router
 router = APIRouter()
 
+# Job queue kinds for CV extraction (see run_extraction_job and run_multi_file_extraction_job)
+EXTRACTION_JOB = "extract_cv"
+MULTI_FILE_EXTRACTION_JOB = "extract_cv_files"
+
 # ========== DATABASE IMPORTS ==========
 from src.api.db import (
     init_db,
@@ -47,14 +49,21 @@ from src.api.db import (
     create_session,
     get_user_id_from_session,
     cleanup_old_sessions as db_cleanup_old_sessions,
+    cleanup_upload_blobs,
+    cleanup_cv_data_blobs,
     create_cv_upload,
+    get_cv_upload,
     get_user_cv_uploads,
     update_cv_upload_status,
     transfer_cv_ownership,  # Add the new function
     # Caching functions
     get_cached_extraction,
     cache_extraction_result,
-    get_extraction_stats
+    get_extraction_stats,
+    get_cached_text,
+    cache_extracted_text,
+    get_previous_extraction,
+    load_cv_data
 )
 
 # Initialize database on startup
@@ -63,15 +72,29 @@ init_db()
 # ========== Service Imports ==========
 from src.core.local.text_extractor import text_extractor
 from src.core.cv_extraction.data_extractor import create_data_extractor
+from src.core.cv_extraction.client_registry import anthropic_client_registry
+from src.core.cv_extraction.extraction_config import extraction_config
+from src.core.cv_extraction.extraction_result import ExtractionResult
+from src.core.cv_extraction.multi_file_text import extract_file_texts, combine_file_texts, summarize_file_texts
 from src.core.schemas.unified_nullable import CVData
 from src.utils.enhanced_sse_logger import EnhancedSSELogger, WorkflowPhase
-from src.api.schemas import UserCreate, UserLogin, SessionResponse, UploadResponse, CleanupResponse, UserProfileUpdate
+from src.services.sse_service import sse_service, send_to_job, create_extraction_progress_callback
+from src.services.job_queue import job_queue, QueuedJob, JobFailed, FAILED
+from src.services.single_flight import extraction_single_flight
+from src.services.admission_control import extraction_admission, AdmissionRejected
+from src.services.shared_state import shared_state
+from src.api.schemas import (
+    UserCreate, UserLogin, SessionResponse, UploadResponse, CleanupResponse, UserProfileUpdate,
+    BulkExtractionRequest
+)
 
 # Import authentication dependency
-from src.api.routes.auth import get_current_user, get_current_user_optional
+from src.api.routes.auth import get_current_user, get_current_user_optional, require_admin
 
 # Import file validation
-from src.utils.file_validator import validate_uploaded_file, sanitize_filename, generate_safe_filename
+from src.utils.file_validator import sanitize_filename, generate_safe_filename
+from src.utils.upload_ingest import ingest_upload, UploadRejected, UploadTooLarge
+from src.utils.upload_store import upload_store
 
 # Import Resume Gate validator
 from src.utils.cv_resume_gate import is_likely_resume, get_rejection_reason
@@ -243,6 +266,80 @@ def get_mime_type(file_extension: str) -> str:
     return mime_map.get(ext, 'application/octet-stream')
 
 
+def save_extraction_result(job_id: str, result: ExtractionResult, file_hash: Optional[str] = None) -> None:
+    """
+    Store a finished extraction and cache it if confident enough.
+    
+    Uses the JSON and confidence already computed in the ExtractionResult, so
+    nothing is re-serialized or re-scored here. Partial results (cut off by a
+    deadline or disconnect) are stored with status 'partial' and never cached;
+    results that reuse sections of the user's previous extraction are stored
+    but not cached either (the cache is shared by everyone uploading the file).
+    
+    Args:
+        job_id: The job ID of the CV upload
+        result: The extraction result
+        file_hash: Optional file hash used as the extraction cache key
+    """
+    if result.is_partial:
+        update_cv_upload_status(job_id, 'partial', result.cv_data_json)
+        return
+    
+    update_cv_upload_status(job_id, 'completed', result.cv_data_json)
+    
+    if not file_hash or not result.is_shareable:
+        return
+    
+    # Cache extraction result if confidence is high enough
+    if result.confidence >= 0.75:  # Only cache high-confidence extractions
+        cache_success = cache_extraction_result(
+            file_hash=file_hash,
+            cv_data=result.cv_data_json,
+            extraction_model=result.extraction_model,
+            temperature=config.EXTRACTION_TEMPERATURE,  # 0.0
+            confidence_score=result.confidence
+        )
+        if cache_success:
+            logger.info(f"💾 High-confidence extraction cached for future use (score: {result.confidence:.2f})")
+        else:
+            logger.warning("❌ Failed to cache extraction result")
+    else:
+        logger.info(f"⚠️ Low confidence score ({result.confidence:.2f}) - not caching result")
+
+
+def get_cv_text(file_path: str, file_hash: Optional[str]) -> str:
+    """
+    Extract the text of an uploaded CV, reusing and filling the text cache.
+    
+    The text keeps its line breaks: the cached text is also what a later revision
+    of the CV is diffed line by line against (see get_prior_extraction). The data
+    extractor collapses it onto one line for the prompts.
+    """
+    text = get_cached_text(file_hash) if file_hash else None
+    if text is None:
+        text = text_extractor.extract_text(str(file_path), preserve_line_breaks=True)
+        if file_hash and text and len(text.strip()) >= 10:
+            cache_extracted_text(file_hash, text)
+    return text
+
+
+def get_prior_extraction(user_id: Optional[str], job_id: str) -> Dict[str, Any]:
+    """
+    Arguments for extract_cv_result that let a revised CV reuse the sections it
+    shares with the user's previous extraction (empty when there is none).
+    
+    Args:
+        user_id: Owner of the upload being extracted
+        job_id: The upload being extracted
+    """
+    import json
+    previous = get_previous_extraction(user_id, job_id) if user_id else None
+    if not previous:
+        return {}
+    logger.info(f"♻️ Diffing job {job_id} against previous extraction {previous['job_id']}")
+    return {"prior_cv_data": json.loads(previous['cv_data']), "prior_text": previous['text']}
+
+
 # ========== AUTHENTICATION ENDPOINTS ==========
 # 
 # IMPORTANT: Authentication routes have been moved to user_auth.py to avoid conflicts.
@@ -270,9 +367,10 @@ async def upload_cv(
     current_user_id: str = Depends(get_current_user)
 ) -> UploadResponse:
     """
-    Upload and process a CV file.
+    Upload a CV file and queue it for processing.
     
-    Authentication handled by Depends(get_current_user).
+    Authentication handled by Depends(get_current_user). Returns as soon as
+    the file is stored; extraction runs in a job queue worker.
     
     Args:
         file: The CV file (PDF, DOCX, TXT, images, etc.)
@@ -284,6 +382,11 @@ async def upload_cv(
     # === 1. USER IS ALREADY AUTHENTICATED ===
     logger.info(f"User {current_user_id} uploading file: {file.filename}")
     
+    # === 1.1 ADMISSION CONTROL ===
+    # Reject with 503 + Retry-After before reading anything if the extraction
+    # queue is full or jobs have been waiting longer than the target delay
+    extraction_admission.check(job_queue.backlog())
+    
     # === 1.5 CLEANUP OLD PORTFOLIOS AND CVS ===
     # When a user uploads a new CV, delete their old portfolios
     try:
@@ -314,14 +417,36 @@ async def upload_cv(
         # Don't fail the upload if cleanup fails
     
     # === 2. FILE VALIDATION (MUST BE DONE BEFORE CV LIMIT CHECK) ===
+    # Security check against path traversal
+    if not validate_filename(file.filename):
+        raise HTTPException(status_code=400, detail="Invalid filename")
+    
+    # Extension and content are checked against the allowed types while streaming
+    file_extension = get_file_extension(file.filename)
+    job_id = str(uuid.uuid4())
+    
+    # Uploads directory with absolute path
+    BASE_DIR = Path(__file__).parent.parent.parent.parent  # Go up to project root (4 levels: cv.py -> routes -> api -> src -> root)
+    upload_dir = BASE_DIR / "data" / "uploads"
+    file_path = upload_dir / f"{job_id}{file_extension}"
+    
+    # Stream the file to its final location: hashed, type-sniffed and
+    # size-checked chunk by chunk instead of read into memory
     # Add timeout protection
     import asyncio
     try:
-        file_content = await asyncio.wait_for(file.read(), timeout=config.UPLOAD_TIMEOUT)
+        upload = await asyncio.wait_for(
+            ingest_upload(file, file_path, max_size=config.MAX_UPLOAD_SIZE),
+            timeout=config.UPLOAD_TIMEOUT
+        )
     except asyncio.TimeoutError:
         raise HTTPException(status_code=408, detail="File upload timed out. Please check your connection and try again.")
-    if not file_content:
-        raise HTTPException(status_code=400, detail="File is empty")
+    except UploadRejected as e:
+        logger.warning(f"File validation failed for user {current_user_id}: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    
+    mime_type = upload.mime_type
+    logger.info(f"File validated and saved: {file_path} ({mime_type}, {upload.size} bytes)")
     
     # === 1.6 CHECK AND ENFORCE CV LIMIT (MAX 10 PER USER) ===
     from src.api.db import get_user_cv_count, enforce_cv_limit
@@ -342,45 +467,17 @@ async def upload_cv(
         else:
             logger.warning(f"No CVs were deleted despite user having {current_cv_count} CVs")
 
-    # Validate file content with magic bytes checking
-    is_valid, error_msg, mime_type = validate_uploaded_file(
-        file_content,
-        file.filename,
-        max_size=config.MAX_UPLOAD_SIZE
-    )
-    
-    if not is_valid:
-        logger.warning(f"File validation failed for user {current_user_id}: {error_msg}")
-        raise HTTPException(status_code=400, detail=error_msg)
-    
-    logger.info(f"File validated successfully: {mime_type}")
-    
     # Sanitize filename for security
     safe_filename = sanitize_filename(file.filename)
     
-    # === 2.5 GET FILE EXTENSION ===
-    file_extension = get_file_extension(file.filename)
-    
     # === 2.6 RESUME GATE VALIDATION ===
     if settings.cv_strict_cv_validation:
         # Extract text for Resume Gate validation
-        import tempfile
-        import os
         try:
-            # Save to temporary file for text extraction
-            with tempfile.NamedTemporaryFile(suffix=file_extension, delete=False) as tmp_file:
-                tmp_file.write(file_content)
-                tmp_file_path = tmp_file.name
-            
-            try:
-                # Extract text from the temporary file
-                extracted_text = text_extractor.extract_text(tmp_file_path)
-                # Limit text for performance
-                gate_text = extracted_text[:settings.cv_gate_max_chars] if extracted_text else ""
-            finally:
-                # Clean up temporary file
-                if os.path.exists(tmp_file_path):
-                    os.unlink(tmp_file_path)
+            # Extract text from the saved upload
+            extracted_text = text_extractor.extract_text(str(file_path))
+            # Limit text for performance
+            gate_text = extracted_text[:settings.cv_gate_max_chars] if extracted_text else ""
             
             # Check if this is an image file
             is_image_file = mime_type and mime_type.startswith('image/')
@@ -409,6 +506,7 @@ async def upload_cv(
                     error_response["signals"] = signals
                 
                 logger.warning(f"Resume Gate rejected file from user {current_user_id}: score={score}, reason={reason}")
+                file_path.unlink(missing_ok=True)
                 raise HTTPException(status_code=400, detail=error_response)
             
             logger.info(f"Resume Gate passed: score={score}")
@@ -420,17 +518,19 @@ async def upload_cv(
             # Don't block on Resume Gate errors - continue processing
             logger.warning("Resume Gate check failed, continuing with upload")
     
-    # === 2.6 CALCULATE FILE HASH FOR CACHING ===
-    file_hash = hashlib.sha256(file_content).hexdigest()
+    # === 2.6 FILE HASH FOR CACHING (computed while streaming) ===
+    file_hash = upload.file_hash
     logger.info(f"File hash calculated: {file_hash[:8]}...")
     
+    # Share storage with identical uploads (the job path becomes a hardlink)
+    upload_store.adopt(file_path, file_hash)
+    
     # Check if we have cached extraction result
     cached_result = get_cached_extraction(file_hash)
     if cached_result:
         logger.info(f"🎯 CACHE HIT! Using cached extraction for file hash {file_hash[:8]} (accessed {cached_result['access_count']} times)")
         
-        # Create new job_id but use cached CV data
-        job_id = str(uuid.uuid4())
+        # New job_id (the saved file's name) but cached CV data
         upload_id = create_cv_upload(
             user_id=current_user_id,
             job_id=job_id,
@@ -442,56 +542,16 @@ async def upload_cv(
         # Update status with cached data
         update_cv_upload_status(job_id, 'completed', cached_result['cv_data'])
         
-        # Still save the file for display purposes
-        BASE_DIR = Path(__file__).parent.parent.parent.parent
-        upload_dir = BASE_DIR / "data" / "uploads"
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        file_path = upload_dir / f"{job_id}{file_extension}"
-        
-        try:
-            async with aiofiles.open(file_path, "wb") as f:
-                await f.write(file_content)
-            logger.info(f"File saved for display: {file_path}")
-        except Exception as e:
-            logger.warning(f"Failed to save cached file for display: {e}")
-        
+        # The file is already saved for display purposes
         return UploadResponse(
             message=f"CV processed instantly (cached result, confidence: {cached_result.get('confidence_score', 'N/A')})",
             job_id=job_id
         )
 
-    # Check file extension against allowed types
-    if file_extension not in config.ALLOWED_EXTENSIONS:
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Invalid file type: {file_extension}. Allowed types: {', '.join(sorted(config.ALLOWED_EXTENSIONS))}"
-        )
-
     # === 3. FILE STORAGE ===
-    job_id = str(uuid.uuid4())
-    
-    # Security check against path traversal
-    if not validate_filename(file.filename):
-        raise HTTPException(status_code=400, detail="Invalid filename")
-    
-    # Create uploads directory with absolute path
-    BASE_DIR = Path(__file__).parent.parent.parent.parent  # Go up to project root (4 levels: cv.py -> routes -> api -> src -> root)
-    upload_dir = BASE_DIR / "data" / "uploads"
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Save with unique name
-    file_path = upload_dir / f"{job_id}{file_extension}"
-    
-    try:
-        # TODO: For large files, consider streaming instead of loading all in memory
-        # TODO: Add cleanup job to remove old files after processing
-        # TODO: Consider moving to cloud storage (S3) for production
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(file_content)
-        logger.info(f"File saved: {file_path}")
-    except Exception as e:
-        logger.error(f"Failed to save file: {e}")
-        raise HTTPException(status_code=500, detail="Failed to save file")
+    # The file was saved under its unique name while streaming
+    # TODO: Add cleanup job to remove old files after processing
+    # TODO: Consider moving to cloud storage (S3) for production
 
     # === 4. CREATE DATABASE RECORD ===
     upload_id = create_cv_upload(
@@ -503,104 +563,122 @@ async def upload_cv(
     )
     logger.info(f"Created CV upload record: {upload_id}")
 
-    # === 5. CV PROCESSING ===
+    # === 5. QUEUE CV PROCESSING ===
+    # Extraction runs in a job queue worker so the request returns right away;
+    # clients follow it through GET /cv/{job_id} and the job's SSE stream
     try:
-        # Determine if OCR is needed based on file extension
-        image_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.heic', '.heif', '.tiff', '.tif', '.bmp'}
-        needs_ocr = file_extension in image_extensions
-        
-        if needs_ocr:
-            logger.info(f"Image file detected, will use OCR for: {file.filename}")
-            text = text_extractor.extract_text(str(file_path))
-        else:
-            logger.info(f"Document file detected, using text extractor for: {file.filename}")
-            text = text_extractor.extract_text(str(file_path))
-        
-        # Extract structured data from text using Claude 4 Opus
-        logger.info(f"🤖 Extracting structured data using Claude 4 Opus from {len(text)} characters of text")
-        try:
-            # Create new extractor instance for this request
-            extractor = create_data_extractor()
-            cv_data = await extractor.extract_cv_data(text)
-            
-            if not cv_data:
-                logger.error("❌ CV data extraction returned None")
-                update_cv_upload_status(job_id, 'failed')
-                # Return success with job_id even if extraction failed
-                return UploadResponse(
-                    status="success",
-                    message="File uploaded but CV extraction failed. Please try again.",
-                    job_id=job_id
-                )
-            
-            sections_count = len([f for f in cv_data.model_dump_nullable() if cv_data.model_dump_nullable()[f]])
-            logger.info(f"✅ Successfully extracted CV data with {sections_count} sections")
-            
-            # Calculate confidence score
-            confidence_score = extractor.calculate_extraction_confidence(cv_data, text)
-            logger.info(f"📊 Extraction confidence score: {confidence_score:.2f}")
-            
-            # Save CV data to database
-            import json
-            cv_data_json = json.dumps(cv_data.model_dump_nullable())
-            update_cv_upload_status(job_id, 'completed', cv_data_json)
-            
-            # Cache extraction result if confidence is high enough
-            if confidence_score >= 0.75:  # Only cache high-confidence extractions
-                cache_success = cache_extraction_result(
-                    file_hash=file_hash,
-                    cv_data=cv_data_json,
-                    extraction_model=config.PRIMARY_MODEL,  # claude-4-opus
-                    temperature=config.EXTRACTION_TEMPERATURE,  # 0.0
-                    confidence_score=confidence_score
-                )
-                if cache_success:
-                    logger.info(f"💾 High-confidence extraction cached for future use (score: {confidence_score:.2f})")
-                else:
-                    logger.warning("❌ Failed to cache extraction result")
-            else:
-                logger.info(f"⚠️ Low confidence score ({confidence_score:.2f}) - not caching result")
-            
-        except Exception as e:
-            logger.error(f"Failed to extract CV data: {e}")
-            import traceback
-            logger.error(f"Full traceback:\n{traceback.format_exc()}")
-            # Mark as failed but still return job_id
-            update_cv_upload_status(job_id, 'failed')
-        
-        # === 5. KEEP ORIGINAL FILE ===
-        # Keep the original file for display purposes
-        logger.info(f"Keeping original file: {file_path}")
-        
-        # Log internal details for debugging
-        logger.info(f"Job {job_id} created for user {current_user_id}")
-        logger.info(f"File: {file.filename} ({len(file_content)} bytes)")
-        logger.info(f"Extension: {file_extension}, Needs OCR: {needs_ocr}")
-        logger.debug(f"Saved to: {file_path}")
-        
-        # Simple response for the user
-        response = UploadResponse(
-            message="CV uploaded successfully. Building your portfolio website...",
-            job_id=job_id
-        )
-        
-        # Add info about deleted CVs if applicable
-        if deleted_cvs:
-            response.deleted_cvs = deleted_cvs
-            # Also support legacy single deleted_cv field for backwards compatibility
-            if len(deleted_cvs) == 1:
-                response.deleted_cv = deleted_cvs[0]
-        
-        return response
-        
+        job_queue.enqueue(EXTRACTION_JOB, job_id, {
+            "file_path": str(file_path), "file_hash": file_hash, "user_id": current_user_id
+        })
     except Exception as e:
-        logger.error(f"Processing failed for job {job_id}: {e}")  # פרטים מלאים בלוג
+        logger.error(f"Queueing extraction failed for job {job_id}: {e}")  # פרטים מלאים בלוג
+        update_cv_upload_status(job_id, 'failed')
         
         # Clean up file if it exists
         if file_path.exists():
             file_path.unlink()
             
         raise HTTPException(status_code=500, detail="Processing failed. Please try again later")  # הודעה כללית למשתמש
+    
+    # Log internal details for debugging
+    logger.info(f"Job {job_id} created for user {current_user_id}")
+    logger.info(f"File: {file.filename} ({upload.size} bytes)")
+    logger.debug(f"Saved to: {file_path}")
+    
+    # Simple response for the user
+    response = UploadResponse(
+        message="CV uploaded successfully. Building your portfolio website...",
+        job_id=job_id
+    )
+    
+    # Add info about deleted CVs if applicable
+    if deleted_cvs:
+        response.deleted_cvs = deleted_cvs
+        # Also support legacy single deleted_cv field for backwards compatibility
+        if len(deleted_cvs) == 1:
+            response.deleted_cv = deleted_cvs[0]
+    
+    return response
+
+
+async def run_extraction_job(job: QueuedJob) -> None:
+    """
+    Extract a queued CV upload (job kind EXTRACTION_JOB).
+    
+    Runs in a job queue worker. Progress and the outcome are published to the
+    job's SSE stream and the result is stored on the cv_uploads row. Other
+    exceptions make the queue retry the job; JobFailed does not.
+    
+    Args:
+        job: The queued job; its payload holds file_path and file_hash
+    """
+    import asyncio
+    job_id = job.job_id
+    file_path = job.payload['file_path']
+    # Queueing delay drives admission of new uploads
+    extraction_admission.record_delay(job.waited_seconds)
+    
+    if not os.path.exists(file_path):
+        # Deleted since upload (e.g. by the CV limit) - nothing to retry
+        raise JobFailed(f"File no longer exists: {file_path}")
+    
+    file_hash = job.payload.get('file_hash')
+    
+    # An identical upload may have finished while this job was queued
+    cached_result = get_cached_extraction(file_hash) if file_hash else None
+    if cached_result:
+        logger.info(f"🎯 CACHE HIT! Using cached extraction for file hash {file_hash[:8]}")
+        update_cv_upload_status(job_id, 'completed', cached_result['cv_data'])
+        send_to_job(job_id, sse_service.create_complete_message({"job_id": job_id, "status": "completed"}))
+        return
+    
+    update_cv_upload_status(job_id, 'processing')
+    
+    async def extract():
+        # OCR and PDF parsing block - keep them off the event loop
+        text = await asyncio.to_thread(get_cv_text, file_path, file_hash)
+        if not text or len(text.strip()) < 10:
+            raise JobFailed("No text content found in file")
+        
+        # Extract structured data from text using Claude 4 Opus
+        logger.info(f"🤖 Extracting structured data for job {job_id} from {len(text)} characters of text")
+        extractor = create_data_extractor()
+        return await extractor.extract_cv_result(
+            text, progress_callback=create_extraction_progress_callback(job_id),
+            deadline_seconds=extraction_config.EXTRACTION_DEADLINE_SECONDS,
+            **get_prior_extraction(job.payload.get('user_id'), job_id)
+        )
+    
+    # Identical uploads being extracted at the same time share one extraction
+    result = await extraction_single_flight.run(file_hash, extract)
+    if not result:
+        raise RuntimeError("CV data extraction returned None")
+    
+    logger.info(f"✅ Successfully extracted CV data with {result.sections_count} sections")
+    logger.info(f"📊 Extraction confidence score: {result.confidence:.2f}")
+    
+    # Save CV data to database (and cache if confident enough)
+    save_extraction_result(job_id, result, file_hash)
+    send_to_job(job_id, sse_service.create_complete_message({
+        "job_id": job_id,
+        "status": "partial" if result.is_partial else "completed",
+        "confidence_score": result.confidence
+    }))
+
+
+def on_extraction_job_failed(job: QueuedJob, error: str) -> None:
+    """Mark an extraction failed once the queue gives up on it"""
+    logger.error(f"CV extraction failed for job {job.job_id}: {error}")
+    update_cv_upload_status(job.job_id, 'failed')
+    send_to_job(job.job_id, sse_service.create_error_message("CV extraction failed", "CV_EXTRACTION_ERROR"))
+
+
+job_queue.register(EXTRACTION_JOB, run_extraction_job, on_failure=on_extraction_job_failed)
+# Workers start with the app so jobs left by a previous process are recovered
+router.add_event_handler("startup", job_queue.start)
+router.add_event_handler("shutdown", job_queue.stop)
+# After the workers stop, so no extraction is still using the pooled connections
+router.add_event_handler("shutdown", anthropic_client_registry.aclose)
 
 
 # ========== MAINTENANCE ENDPOINTS ==========
@@ -613,7 +691,7 @@ async def get_my_cvs(current_user_id: str = Depends(get_current_user)):
     Returns:
         List of CV upload records with status
     """
-    uploads = get_user_cv_uploads(current_user_id)
+    uploads = get_user_cv_uploads(current_user_id, include_cv_data=True)
     logger.info(f"User {current_user_id} has {len(uploads)} CV uploads")
     
     # Calculate how many CVs will be deleted on next upload
@@ -656,6 +734,7 @@ async def get_extraction_statistics(current_user_id: str = Depends(get_current_u
         stats['extraction_model'] = config.PRIMARY_MODEL
         stats['extraction_temperature'] = config.EXTRACTION_TEMPERATURE
         stats['cache_threshold'] = 0.75
+        stats['single_flight'] = dict(extraction_single_flight.stats)
         
         return {
             "status": "success",
@@ -671,7 +750,8 @@ async def get_extraction_statistics(current_user_id: str = Depends(get_current_u
 @router.delete("/cleanup", response_model=CleanupResponse)
 async def cleanup_old_sessions() -> CleanupResponse:
     """
-    Delete sessions older than 7 days.
+    Delete sessions older than 7 days and stored upload files that no CV
+    references any more.
     Helps keep the database clean and improves security.
     
     In production: Run this as a scheduled job, not an endpoint.
@@ -684,11 +764,19 @@ async def cleanup_old_sessions() -> CleanupResponse:
         deleted_count = db_cleanup_old_sessions(days=7)
         logger.info(f"Cleaned up {deleted_count} old sessions")
         
+        deleted_blobs = cleanup_upload_blobs()
+        logger.info(f"Cleaned up {deleted_blobs} unreferenced upload blobs")
+        
+        deleted_cv_data_blobs = cleanup_cv_data_blobs()
+        logger.info(f"Cleaned up {deleted_cv_data_blobs} unreferenced CV data blobs")
+        
         cutoff = (datetime.now() - timedelta(days=7)).isoformat()
         
         return CleanupResponse(
             status="success",
             deleted_sessions=deleted_count,
+            deleted_upload_blobs=deleted_blobs,
+            deleted_cv_data_blobs=deleted_cv_data_blobs,
             cutoff_date=cutoff
         )
     except Exception as e:
@@ -696,6 +784,128 @@ async def cleanup_old_sessions() -> CleanupResponse:
         raise HTTPException(status_code=500, detail="Cleanup failed")
 
 
+# ========== BULK EXTRACTION (ADMIN) ==========
+
+BULK_EXTRACTIONS_DIR = Path("data/bulk_extractions")
+# Running bulk extractions in this worker (status is in shared state for all workers)
+BULK_EXTRACTION_TASKS: Dict[str, "asyncio.Task"] = {}
+# Seconds a run's lease lasts without renewal; a crashed run's lease expires
+# and the run can be resumed
+BULK_LEASE_SECONDS = 60.0
+
+
+def _bulk_status_key(run_id: str) -> str:
+    return f"bulk_extraction:{run_id}"
+
+
+def _bulk_lease_key(run_id: str) -> str:
+    return f"bulk_extraction_lease:{run_id}"
+
+
+@router.post("/admin/bulk-extractions", status_code=202)
+async def start_bulk_extraction(
+    request: BulkExtractionRequest,
+    admin_user: str = Depends(require_admin)
+):
+    """
+    Start extracting a directory or manifest of CVs in the background.
+    
+    Results are written as JSONL (one record per file, with per-stage timings)
+    and can be fetched while the run is going. Passing the run_id of an
+    interrupted run resumes it: files already in its output are skipped.
+    """
+    import asyncio
+    from src.core.cv_extraction.bulk_extractor import BulkExtractor, iter_bulk_items
+    
+    if not Path(request.source).exists():
+        raise HTTPException(status_code=400, detail=f"Source not found: {request.source}")
+    
+    run_id = request.run_id or str(uuid.uuid4())
+    if not re.fullmatch(r'[A-Za-z0-9_-]+', run_id):
+        raise HTTPException(status_code=400, detail="Invalid run_id")
+    lease_key = _bulk_lease_key(run_id)
+    owner = uuid.uuid4().hex
+    if not shared_state.add_value(lease_key, owner, ttl=BULK_LEASE_SECONDS):
+        raise HTTPException(status_code=409, detail=f"Bulk extraction {run_id} is already running")
+    
+    output_path = BULK_EXTRACTIONS_DIR / f"{run_id}.jsonl"
+    progress = {"completed": 0, "partial": 0, "failed": 0}
+    status = {
+        "run_id": run_id,
+        "status": "running",
+        "source": request.source,
+        "output": str(output_path),
+        "started_at": datetime.utcnow().isoformat(),
+        "started_by": admin_user,
+        "progress": progress
+    }
+    shared_state.set_value(_bulk_status_key(run_id), status)
+    
+    def on_record(record: Dict[str, Any]):
+        progress[record["status"]] += 1
+        shared_state.set_value(_bulk_status_key(run_id), status)
+    
+    try:
+        extractor = BulkExtractor(
+            str(output_path),
+            concurrency=request.concurrency,
+            text_concurrency=request.text_concurrency,
+            use_cache=request.use_cache,
+            retry_failed=request.retry_failed,
+            on_record=on_record
+        )
+    except Exception:
+        shared_state.delete_value(lease_key)
+        raise
+    
+    async def renew_lease():
+        while True:
+            await asyncio.sleep(BULK_LEASE_SECONDS / 3)
+            shared_state.set_value(lease_key, owner, ttl=BULK_LEASE_SECONDS)
+    
+    async def run():
+        renewer = asyncio.create_task(renew_lease())
+        try:
+            status["summary"] = await extractor.run(iter_bulk_items(request.source))
+            status["status"] = "completed"
+        except Exception as e:
+            logger.error(f"Bulk extraction {run_id} failed: {e}")
+            status.update(status="failed", error=str(e))
+        finally:
+            renewer.cancel()
+            status["finished_at"] = datetime.utcnow().isoformat()
+            shared_state.set_value(_bulk_status_key(run_id), status)
+            shared_state.delete_value(lease_key)
+            BULK_EXTRACTION_TASKS.pop(run_id, None)
+    
+    BULK_EXTRACTION_TASKS[run_id] = asyncio.create_task(run())
+    logger.info(f"Started bulk extraction {run_id} of {request.source}")
+    return status
+
+
+@router.get("/admin/bulk-extractions/{run_id}")
+async def get_bulk_extraction(run_id: str, admin_user: str = Depends(require_admin)):
+    """Get the status and progress of a bulk extraction"""
+    status = shared_state.get_value(_bulk_status_key(run_id))
+    if not status:
+        raise HTTPException(status_code=404, detail="Bulk extraction not found")
+    if status["status"] == "running" and shared_state.get_value(_bulk_lease_key(run_id)) is None:
+        # The worker running it stopped without finishing; it can be resumed
+        status["status"] = "interrupted"
+    return status
+
+
+@router.get("/admin/bulk-extractions/{run_id}/results")
+async def get_bulk_extraction_results(run_id: str, admin_user: str = Depends(require_admin)):
+    """Download a bulk extraction's JSONL results (complete so far while running)"""
+    if not re.fullmatch(r'[A-Za-z0-9_-]+', run_id):
+        raise HTTPException(status_code=400, detail="Invalid run_id")
+    output_path = BULK_EXTRACTIONS_DIR / f"{run_id}.jsonl"
+    if not output_path.exists():
+        raise HTTPException(status_code=404, detail="No results for this bulk extraction")
+    return FileResponse(output_path, media_type="application/x-ndjson", filename=f"{run_id}.jsonl")
+
+
 @router.get("/cv/{job_id}")
 async def get_cv_data(job_id: str, current_user_id: Optional[str] = Depends(get_current_user_optional)):
     """
@@ -706,25 +916,13 @@ async def get_cv_data(job_id: str, current_user_id: Optional[str] = Depends(get_
         current_user_id: Optional user ID
         
     Returns:
-        CV data in structured format
+        CV data in structured format, or status 202 with the job status
+        while extraction is queued or running
     """
-    # Query database directly to be more lenient
-    from src.api.db import get_db_connection
-    conn = get_db_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT job_id, filename, file_type, status, cv_data, user_id, upload_date FROM cv_uploads WHERE job_id = ?",
-            (job_id,)
-        )
-        result = cursor.fetchone()
-        
-        if not result:
-            raise HTTPException(status_code=404, detail="CV not found")
-        
-        cv_upload = dict(result)
-    finally:
-        conn.close()
+    # Look up by job ID only (no ownership check) to be more lenient
+    cv_upload = get_cv_upload(job_id, include_cv_data=True)
+    if not cv_upload:
+        raise HTTPException(status_code=404, detail="CV not found")
     
     # Parse and return CV data
     if cv_upload.get('cv_data'):
@@ -741,8 +939,20 @@ async def get_cv_data(job_id: str, current_user_id: Optional[str] = Depends(get_
         except json.JSONDecodeError:
             logger.error(f"Failed to parse CV data for job {job_id}")
             raise HTTPException(status_code=500, detail="Invalid CV data format")
-    else:
-        raise HTTPException(status_code=404, detail="CV data not available")
+    
+    # Still queued or being extracted by a worker
+    queued_job = job_queue.get(job_id)
+    if queued_job and queued_job.is_active:
+        return JSONResponse(status_code=202, content={
+            "job_id": job_id,
+            "cv_data": None,
+            "status": queued_job.status,
+            "queue_position": job_queue.position(job_id),
+            "attempts": queued_job.attempts,
+            "filename": cv_upload.get('filename', ''),
+            "upload_date": cv_upload.get('upload_date', '')
+        })
+    raise HTTPException(status_code=404, detail="CV data not available")
 
 
 @router.put("/cv/{job_id}")
@@ -762,15 +972,8 @@ async def update_cv_data(
     Returns:
         Success message
     """
-    # Get user's CV uploads to verify ownership
-    uploads = get_user_cv_uploads(current_user_id)
-    
-    # Verify ownership
-    cv_upload = None
-    for upload in uploads:
-        if upload['job_id'] == job_id:
-            cv_upload = upload
-            break
+    # Verify ownership (metadata only - the CV JSON is not needed here)
+    cv_upload = get_cv_upload(job_id, user_id=current_user_id)
     
     if not cv_upload:
         raise HTTPException(status_code=404, detail="CV not found")
@@ -805,15 +1008,8 @@ async def download_cv(job_id: str, current_user_id: str = Depends(get_current_us
     Returns:
         The original uploaded file with appropriate headers for preview/download
     """
-    # Get user's CV uploads to verify ownership
-    uploads = get_user_cv_uploads(current_user_id)
-    
-    # Find the specific upload
-    cv_upload = None
-    for upload in uploads:
-        if upload['job_id'] == job_id:
-            cv_upload = upload
-            break
+    # Verify ownership (metadata only - the CV JSON is not needed here)
+    cv_upload = get_cv_upload(job_id, user_id=current_user_id)
     
     if not cv_upload:
         raise HTTPException(status_code=404, detail="CV not found")
@@ -870,15 +1066,21 @@ async def download_cv(job_id: str, current_user_id: str = Depends(get_current_us
 @router.post("/extract/{job_id}")
 async def extract_cv_data_endpoint(
     job_id: str,
-    current_user_id: Optional[str] = Depends(get_current_user_optional)
+    current_user_id: Optional[str] = Depends(get_current_user_optional),
+    request: Request = None
 ) -> Dict[str, Any]:
     """
     Extract CV data from an uploaded file.
     Supports both authenticated and anonymous users.
     
+    Extraction is bounded by EXTRACTION_DEADLINE_SECONDS and stops early if the
+    client disconnects; sections cut off are reported in missing_sections and the
+    result is returned with status "partial" (and not cached).
+    
     Args:
         job_id: The job ID from the upload
         current_user_id: Optional user ID if authenticated
+        request: HTTP request, used to detect client disconnects (None for internal calls)
         
     Returns:
         Extraction status and result
@@ -895,7 +1097,7 @@ async def extract_cv_data_endpoint(
         try:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT job_id, filename, file_type, status, cv_data, user_id, file_hash FROM cv_uploads WHERE job_id = ?",
+                "SELECT job_id, filename, file_type, status, cv_data_hash, user_id, file_hash FROM cv_uploads WHERE job_id = ?",
                 (job_id,)
             )
             result = cursor.fetchone()
@@ -943,13 +1145,37 @@ async def extract_cv_data_endpoint(
                 cv_upload['file_path'] = matching_files[0]
         
         # Check if already extracted
-        if cv_upload['status'] == 'completed' and cv_upload.get('cv_data'):
+        if cv_upload['status'] == 'completed' and cv_upload.get('cv_data_hash'):
             import json
             return {
                 "status": "completed",
-                "cv_data": json.loads(cv_upload['cv_data'])
+                "cv_data": json.loads(load_cv_data(cv_upload['cv_data_hash']))
             }
         
+        # Already queued or being extracted by a worker - wait for it rather than
+        # extracting twice, so upload -> extract -> generate works back to back
+        queued_job = job_queue.get(job_id)
+        if queued_job and queued_job.is_active:
+            queued_job = await job_queue.wait(
+                job_id,
+                extraction_config.QUEUED_EXTRACTION_WAIT_SECONDS,
+                cancel_check=request.is_disconnected if request is not None else None
+            )
+            if queued_job.is_active:
+                return {
+                    "status": queued_job.status,
+                    "job_id": job_id
+                }
+            if queued_job.status == FAILED:
+                raise HTTPException(status_code=500, detail="CV extraction failed")
+            finished = get_cv_upload(job_id, include_cv_data=True)
+            if finished and finished.get('cv_data'):
+                import json
+                return {
+                    "status": finished['status'],
+                    "cv_data": json.loads(finished['cv_data'])
+                }
+        
         # Extract text from file
         file_path = cv_upload.get('file_path')
         if not file_path:
@@ -996,61 +1222,84 @@ async def extract_cv_data_endpoint(
         # Update status to processing
         update_cv_upload_status(job_id, 'processing')
         
-        # Extract text
-        text = text_extractor.extract_text(str(file_path))
+        async def extract():
+            # Extract text
+            text = get_cv_text(file_path, cv_upload.get('file_hash'))
+            
+            if not text or len(text.strip()) < 10:
+                raise HTTPException(status_code=400, detail="No text content found in file")
+            
+            # Extract structured data using Claude 4 Opus
+            logger.info(f"🤖 Extracting CV data for job {job_id} using Claude 4 Opus from {len(text)} characters of text")
+            # Create new extractor instance for this request
+            extractor = create_data_extractor()
+            
+            async def leader_gone() -> bool:
+                # The caller going away only stops an extraction nobody else is waiting for
+                if extraction_single_flight.has_followers(cv_upload.get('file_hash')):
+                    return False
+                return await request.is_disconnected()
+            
+            # Bounded concurrency; sheds with 503 when extractions queue too long
+            async with extraction_admission.admit():
+                # Stream section progress and partial items to /sse/cv/extract-streaming/{job_id}
+                return await extractor.extract_cv_result(
+                    text,
+                    progress_callback=create_extraction_progress_callback(job_id),
+                    deadline_seconds=extraction_config.EXTRACTION_DEADLINE_SECONDS,
+                    cancel_check=leader_gone if request is not None else None,
+                    **get_prior_extraction(cv_upload.get('user_id'), job_id)
+                )
         
-        if not text or len(text.strip()) < 10:
+        # Identical files being extracted at the same time share one extraction
+        try:
+            result = await extraction_single_flight.run(cv_upload.get('file_hash'), extract)
+        except AdmissionRejected:
+            # Shed before extracting - put the upload back as it was for a retry
+            update_cv_upload_status(job_id, cv_upload['status'])
+            raise
+        except HTTPException:
             update_cv_upload_status(job_id, 'failed')
-            raise HTTPException(status_code=400, detail="No text content found in file")
-        
-        # Extract structured data using Claude 4 Opus
-        logger.info(f"🤖 Extracting CV data for job {job_id} using Claude 4 Opus from {len(text)} characters of text")
-        # Create new extractor instance for this request
-        extractor = create_data_extractor()
-        cv_data = await extractor.extract_cv_data(text)
+            raise
         
-        if not cv_data:
+        if not result:
             logger.error("❌ CV data extraction returned None")
             update_cv_upload_status(job_id, 'failed')
             raise HTTPException(status_code=500, detail="Failed to extract CV data")
         
-        sections_count = len([f for f in cv_data.model_dump_nullable() if cv_data.model_dump_nullable()[f]])
-        logger.info(f"✅ Successfully extracted CV data with {sections_count} sections")
-        
-        # Calculate confidence score
-        confidence_score = extractor.calculate_extraction_confidence(cv_data, text)
-        logger.info(f"📊 Extraction confidence score: {confidence_score:.2f}")
+        logger.info(f"✅ Successfully extracted CV data with {result.sections_count} sections")
+        logger.info(f"📊 Extraction confidence score: {result.confidence:.2f}")
         
-        # Save CV data to database
-        import json
-        cv_data_json = json.dumps(cv_data.model_dump_nullable())
-        update_cv_upload_status(job_id, 'completed', cv_data_json)
+        # Save CV data to database (partial results are stored but never cached)
+        save_extraction_result(job_id, result, cv_upload.get('file_hash'))
         
-        # Get file hash for caching (if available)
-        if cv_upload.get('file_hash'):
-            file_hash = cv_upload['file_hash']
-            # Cache extraction result if confidence is high enough
-            if confidence_score >= 0.75:  # Only cache high-confidence extractions
-                cache_success = cache_extraction_result(
-                    file_hash=file_hash,
-                    cv_data=cv_data_json,
-                    extraction_model=config.PRIMARY_MODEL,  # claude-4-opus
-                    temperature=config.EXTRACTION_TEMPERATURE,  # 0.0
-                    confidence_score=confidence_score
-                )
-                if cache_success:
-                    logger.info(f"💾 High-confidence extraction cached for future use (score: {confidence_score:.2f})")
-                else:
-                    logger.warning("❌ Failed to cache extraction result")
-            else:
-                logger.info(f"⚠️ Low confidence score ({confidence_score:.2f}) - not caching result")
+        if result.is_partial:
+            # Cut off by the deadline or a client disconnect
+            logger.warning(f"⏱️ Partial extraction for job {job_id} - missing sections: {list(result.missing_sections)}")
+            send_to_job(job_id, sse_service.create_complete_message({
+                "job_id": job_id,
+                "status": "partial",
+                "missing_sections": list(result.missing_sections),
+                "confidence_score": result.confidence
+            }))
+            return {
+                "status": "partial",
+                "cv_data": result.to_response(),
+                "missing_sections": list(result.missing_sections),
+                "confidence_score": result.confidence
+            }
         
         logger.info(f"✅ CV extraction completed for job {job_id}")
+        send_to_job(job_id, sse_service.create_complete_message({
+            "job_id": job_id,
+            "status": "completed",
+            "confidence_score": result.confidence
+        }))
         
         return {
             "status": "completed",
-            "cv_data": cv_data.model_dump_nullable(),
-            "confidence_score": confidence_score
+            "cv_data": result.to_response(),
+            "confidence_score": result.confidence
         }
             
     except HTTPException:
@@ -1060,6 +1309,7 @@ async def extract_cv_data_endpoint(
         logger.error(f"CV extraction error for job {job_id}: {e}")
         logger.error(f"Full traceback:\n{traceback.format_exc()}")
         update_cv_upload_status(job_id, 'failed')
+        send_to_job(job_id, sse_service.create_error_message("CV extraction failed", "CV_EXTRACTION_ERROR"))
         raise HTTPException(status_code=500, detail=f"Extraction failed: {str(e)}")
 
 @router.post("/upload-anonymous", response_model=UploadResponse)
@@ -1112,55 +1362,42 @@ async def upload_cv_anonymous(
         logger.info(f"Authenticated user {current_user_id} uploading file: {file.filename}")
     
     # === FILE VALIDATION ===
+    # Sanitize filename for security
+    safe_filename = sanitize_filename(file.filename)
+    
+    # Get file extension
+    file_extension = get_file_extension(safe_filename)
+    
+    # Build file path - use consistent naming scheme
+    job_id = str(uuid.uuid4())
+    file_path = Path(config.UPLOAD_DIR) / current_user_id / f"{job_id}{file_extension}"
+    
+    # Stream the file to its final location: hashed, type-sniffed and
+    # size-checked chunk by chunk instead of read into memory
     # Add timeout protection
     import asyncio
     try:
-        file_content = await asyncio.wait_for(file.read(), timeout=config.UPLOAD_TIMEOUT)
+        upload = await asyncio.wait_for(
+            ingest_upload(file, file_path, max_size=config.MAX_UPLOAD_SIZE),
+            timeout=config.UPLOAD_TIMEOUT
+        )
     except asyncio.TimeoutError:
         raise HTTPException(status_code=408, detail="File upload timed out. Please check your connection and try again.")
+    except UploadRejected as e:
+        logger.warning(f"File validation failed for anonymous user: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     
-    if not file_content:
-        raise HTTPException(status_code=400, detail="File is empty")
-    
-    # Validate file content with magic bytes checking
-    is_valid, error_msg, mime_type = validate_uploaded_file(
-        file_content,
-        file.filename,
-        max_size=config.MAX_UPLOAD_SIZE
-    )
-    
-    if not is_valid:
-        logger.warning(f"File validation failed for anonymous user: {error_msg}")
-        raise HTTPException(status_code=400, detail=error_msg)
-    
+    mime_type = upload.mime_type
     logger.info(f"File validated successfully: {mime_type}")
     
-    # Sanitize filename for security
-    safe_filename = sanitize_filename(file.filename)
-    
-    # Get file extension
-    file_extension = get_file_extension(safe_filename)
-    
     # === RESUME GATE VALIDATION ===
     if settings.cv_strict_cv_validation:
         # Extract text for Resume Gate validation
-        import tempfile
-        import os
         try:
-            # Save to temporary file for text extraction
-            with tempfile.NamedTemporaryFile(suffix=file_extension, delete=False) as tmp_file:
-                tmp_file.write(file_content)
-                tmp_file_path = tmp_file.name
-            
-            try:
-                # Extract text from the temporary file
-                extracted_text = text_extractor.extract_text(tmp_file_path)
-                # Limit text for performance
-                gate_text = extracted_text[:settings.cv_gate_max_chars] if extracted_text else ""
-            finally:
-                # Clean up temporary file
-                if os.path.exists(tmp_file_path):
-                    os.unlink(tmp_file_path)
+            # Extract text from the saved upload
+            extracted_text = text_extractor.extract_text(str(file_path))
+            # Limit text for performance
+            gate_text = extracted_text[:settings.cv_gate_max_chars] if extracted_text else ""
             
             # Check if this is an image file
             is_image_file = mime_type and mime_type.startswith('image/')
@@ -1189,6 +1426,7 @@ async def upload_cv_anonymous(
                     error_response["signals"] = signals
                 
                 logger.warning(f"Resume Gate rejected anonymous upload: score={score}, reason={reason}")
+                file_path.unlink(missing_ok=True)
                 raise HTTPException(status_code=400, detail=error_response)
             
             logger.info(f"Resume Gate passed for anonymous: score={score}")
@@ -1200,18 +1438,19 @@ async def upload_cv_anonymous(
             # Don't block on Resume Gate errors - continue processing
             logger.warning("Resume Gate check failed, continuing with upload")
     
-    # === CALCULATE FILE HASH FOR CACHING ===
-    import hashlib
-    file_hash = hashlib.sha256(file_content).hexdigest()
+    # === FILE HASH FOR CACHING (computed while streaming) ===
+    file_hash = upload.file_hash
     logger.info(f"File hash calculated: {file_hash[:8]}...")
     
+    # Share storage with identical uploads (the job path becomes a hardlink)
+    upload_store.adopt(file_path, file_hash)
+    
     # Check if we have cached extraction result
     cached_result = get_cached_extraction(file_hash)
     if cached_result:
         logger.info(f"🎯 CACHE HIT! Using cached extraction for anonymous upload (hash {file_hash[:8]})")
         
-        # Create new job_id but use cached CV data
-        job_id = str(uuid.uuid4())
+        # New job_id (the saved file's name) but cached CV data
         upload_id = create_cv_upload(
             user_id=current_user_id,
             job_id=job_id,
@@ -1223,13 +1462,7 @@ async def upload_cv_anonymous(
         # Update status with cached data
         update_cv_upload_status(job_id, 'completed', cached_result['cv_data'])
         
-        # Still save the file for display purposes
-        user_dir = os.path.join(config.UPLOAD_DIR, current_user_id)
-        os.makedirs(user_dir, exist_ok=True)
-        file_path = os.path.join(user_dir, f"{job_id}{file_extension}")
-        
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        # The file is already saved for display purposes
         logger.info(f"File saved for display: {file_path}")
         
         # Record successful upload for rate limiting (even cache hits count)
@@ -1243,20 +1476,7 @@ async def upload_cv_anonymous(
             job_id=job_id
         )
     
-    # === CREATE JOB ID & SAVE FILE (NO CACHE HIT) ===
-    job_id = str(uuid.uuid4())
-    
-    # Ensure user directory exists  
-    user_dir = os.path.join(config.UPLOAD_DIR, current_user_id)
-    os.makedirs(user_dir, exist_ok=True)
-    
-    # Build file path - use consistent naming scheme
-    file_path = os.path.join(user_dir, f"{job_id}{file_extension}")
-    
-    # Save file
-    with open(file_path, "wb") as f:
-        f.write(file_content)
-    
+    # === FILE SAVED WHILE STREAMING (NO CACHE HIT) ===
     logger.info(f"File saved for job {job_id}: {file_path}")
     
     # === CREATE CV UPLOAD RECORD ===
@@ -1307,81 +1527,69 @@ async def upload_multiple_files(
     """
     logger.info(f"User {current_user_id} uploading {len(files)} files")
     
-    # Validate all files first
-    allowed_files = []
-    total_size = 0
-    
-    for file in files:
-        # Basic validation
-        if not file.filename:
-            continue
-            
-        # Read file content
-        file_content = await file.read()
-        file_size = len(file_content)
-        total_size += file_size
-        
-        # Size check
-        if total_size > config.MAX_UPLOAD_SIZE * 3:  # Allow 3x size for multiple files
-            raise HTTPException(
-                status_code=413,
-                detail=f"Total file size exceeds limit of {config.MAX_UPLOAD_SIZE * 3 / 1024 / 1024:.1f}MB"
-            )
-        
-        # Validate file content with magic bytes checking
-        is_valid, error_msg, mime_type = validate_uploaded_file(
-            file_content,
-            file.filename,
-            max_size=config.MAX_UPLOAD_SIZE * 3  # Per-file limit within total
-        )
-        
-        if not is_valid:
-            logger.warning(f"Skipping file {file.filename} - validation failed: {error_msg}")
-            continue
-        
-        # Sanitize filename
-        safe_filename = sanitize_filename(file.filename)
-        file_extension = get_file_extension(safe_filename)
-        
-        allowed_files.append({
-            'filename': safe_filename,
-            'extension': file_extension,
-            'content': file_content,
-            'size': file_size,
-            'mime_type': mime_type
-        })
-        
-        # Reset file position
-        await file.seek(0)
-    
-    if not allowed_files:
-        raise HTTPException(status_code=400, detail="No valid files provided")
+    # Same admission control as single uploads - both share the extraction queue
+    extraction_admission.check(job_queue.backlog())
     
     # Generate single job ID for all files
     job_id = str(uuid.uuid4())
     
-    # Create upload directory
+    # Upload directory for this job
     BASE_DIR = Path(__file__).parent.parent.parent.parent
     upload_dir = BASE_DIR / "data" / "uploads" / job_id
-    upload_dir.mkdir(parents=True, exist_ok=True)
     
-    # Save all files
+    # Stream each file into the job directory, validating it on the way
+    allowed_files = []
     saved_files = []
+    file_hashes = []
+    total_size = 0
+    max_total_size = config.MAX_UPLOAD_SIZE * 3  # Allow 3x size for multiple files
+    
     try:
-        for idx, file_data in enumerate(allowed_files):
+        for file in files:
+            # Basic validation
+            if not file.filename:
+                continue
+            
+            # Sanitize filename
+            safe_filename = sanitize_filename(file.filename)
+            file_extension = get_file_extension(safe_filename)
+            
             # Save each file with index prefix
-            file_path = upload_dir / f"{idx:02d}_{file_data['filename']}"
-            async with aiofiles.open(file_path, "wb") as f:
-                await f.write(file_data['content'])
+            file_path = upload_dir / f"{len(saved_files):02d}_{safe_filename}"
+            try:
+                upload = await ingest_upload(file, file_path, max_size=max_total_size - total_size)
+            except UploadTooLarge:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Total file size exceeds limit of {max_total_size / 1024 / 1024:.1f}MB"
+                )
+            except UploadRejected as e:
+                logger.warning(f"Skipping file {file.filename} - validation failed: {e.detail}")
+                continue
+            
+            total_size += upload.size
+            upload_store.adopt(file_path, upload.file_hash)
+            allowed_files.append({
+                'filename': safe_filename,
+                'extension': file_extension,
+                'size': upload.size,
+                'mime_type': upload.mime_type
+            })
             saved_files.append(str(file_path))
-            logger.info(f"Saved file {idx + 1}/{len(allowed_files)}: {file_path}")
-    except Exception as e:
-        logger.error(f"Failed to save files: {e}")
+            file_hashes.append(upload.file_hash)
+            logger.info(f"Saved file {len(saved_files)}/{len(files)}: {file_path}")
+        
+        if not allowed_files:
+            raise HTTPException(status_code=400, detail="No valid files provided")
+    except BaseException as e:
         # Clean up on failure
         import shutil
         if upload_dir.exists():
             shutil.rmtree(upload_dir)
-        raise HTTPException(status_code=500, detail="Failed to save uploaded files")
+        if isinstance(e, OSError):
+            logger.error(f"Failed to save files: {e}")
+            raise HTTPException(status_code=500, detail="Failed to save uploaded files")
+        raise
     
     # Create database record with actual filenames
     filenames = [f['filename'] for f in allowed_files]
@@ -1398,9 +1606,15 @@ async def upload_multiple_files(
         file_hash=None  # No single hash for multiple files
     )
     
-    # Process files asynchronously
-    import asyncio
-    asyncio.create_task(process_multiple_files(job_id, saved_files, current_user_id))
+    # Extract in a job queue worker, like single uploads
+    try:
+        job_queue.enqueue(MULTI_FILE_EXTRACTION_JOB, job_id, {
+            "file_paths": saved_files, "file_hashes": file_hashes, "user_id": current_user_id
+        })
+    except Exception as e:
+        logger.error(f"Queueing multi-file extraction failed for job {job_id}: {e}")
+        update_cv_upload_status(job_id, 'failed')
+        raise HTTPException(status_code=500, detail="Processing failed. Please try again later")
     
     return UploadResponse(
         message=f"Processing {len(allowed_files)} files as single CV",
@@ -1408,47 +1622,71 @@ async def upload_multiple_files(
     )
 
 
-async def process_multiple_files(job_id: str, file_paths: List[str], user_id: str):
+async def run_multi_file_extraction_job(job: QueuedJob) -> None:
     """
-    Process multiple files as a single CV.
-    Combines text from all files before extraction.
+    Extract a queued multi-file upload as a single CV (job kind MULTI_FILE_EXTRACTION_JOB).
+    
+    The files' texts are extracted concurrently through the text cache, once per
+    distinct content, and combined within MAX_COMBINED_TEXT_CHARS (see
+    multi_file_text). Per-file timings and dedupe counts are logged and sent
+    with the completion message.
+    
+    Args:
+        job: The queued job; its payload holds file_paths, file_hashes and user_id
     """
-    try:
-        logger.info(f"Starting multi-file processing for job {job_id}")
-        
-        # Extract text from all files
-        combined_text = ""
-        for file_path in file_paths:
-            try:
-                text = text_extractor.extract_text(file_path)
-                if text and text.strip():
-                    combined_text += f"\n\n--- File: {Path(file_path).name} ---\n\n{text}"
-            except Exception as e:
-                logger.error(f"Failed to extract text from {file_path}: {e}")
-        
-        if not combined_text.strip():
-            update_cv_upload_status(job_id, 'failed')
-            return
-        
-        # Extract CV data from combined text
-        logger.info(f"Extracting CV data from combined text ({len(combined_text)} chars)")
-        # Create new extractor instance for this request
-        extractor = create_data_extractor()
-        cv_data = await extractor.extract_cv_data(combined_text)
-        
-        if cv_data:
-            # Store extraction result
-            import json
-            cv_data_json = json.dumps(cv_data.model_dump_nullable())
-            update_cv_upload_status(job_id, 'completed', cv_data_json)
-            logger.info(f"✅ Multi-file CV extraction completed for job {job_id}")
-        else:
-            update_cv_upload_status(job_id, 'failed')
-            logger.error(f"Failed to extract CV data for job {job_id}")
-            
-    except Exception as e:
-        logger.error(f"Multi-file processing error for job {job_id}: {e}")
-        update_cv_upload_status(job_id, 'failed')
+    import time
+    job_id = job.job_id
+    extraction_admission.record_delay(job.waited_seconds)
+    
+    file_hashes = job.payload.get('file_hashes') or [None] * len(job.payload['file_paths'])
+    files = [(path, file_hash) for path, file_hash in zip(job.payload['file_paths'], file_hashes)
+             if os.path.exists(path)]
+    if not files:
+        raise JobFailed("Files no longer exist")
+    
+    logger.info(f"Starting multi-file processing for job {job_id}")
+    update_cv_upload_status(job_id, 'processing')
+    
+    started = time.perf_counter()
+    file_texts = await extract_file_texts(
+        [path for path, _ in files], [file_hash for _, file_hash in files],
+        get_cv_text, concurrency=extraction_config.MULTI_FILE_TEXT_CONCURRENCY
+    )
+    combined_text = combine_file_texts(file_texts, extraction_config.MAX_COMBINED_TEXT_CHARS)
+    files_summary = summarize_file_texts(file_texts)
+    files_summary['text_seconds'] = round(time.perf_counter() - started, 3)
+    logger.info(f"📑 Job {job_id}: text of {files_summary['files_total']} files in {files_summary['text_seconds']}s "
+                f"({files_summary['duplicates']} duplicates, {files_summary['failed']} failed, "
+                f"{files_summary['truncated']} truncated)")
+    for report in files_summary['files']:
+        logger.debug(f"  {report}")
+    
+    if not combined_text.strip():
+        raise JobFailed("No text content found in files")
+    
+    # Extract CV data from combined text
+    logger.info(f"Extracting CV data from combined text ({len(combined_text)} chars)")
+    extractor = create_data_extractor()
+    result = await extractor.extract_cv_result(
+        combined_text, progress_callback=create_extraction_progress_callback(job_id),
+        deadline_seconds=extraction_config.EXTRACTION_DEADLINE_SECONDS,
+        **get_prior_extraction(job.payload.get('user_id'), job_id)
+    )
+    if not result:
+        raise RuntimeError("CV data extraction returned None")
+    
+    # Store extraction result
+    save_extraction_result(job_id, result)
+    logger.info(f"✅ Multi-file CV extraction completed for job {job_id}")
+    send_to_job(job_id, sse_service.create_complete_message({
+        "job_id": job_id,
+        "status": "partial" if result.is_partial else "completed",
+        "confidence_score": result.confidence,
+        "files": files_summary
+    }))
+
+
+job_queue.register(MULTI_FILE_EXTRACTION_JOB, run_multi_file_extraction_job, on_failure=on_extraction_job_failed)
 
 
 @router.get("/download/{job_id}/all")
@@ -1463,15 +1701,8 @@ async def get_all_files(job_id: str, current_user_id: str = Depends(get_current_
     Returns:
         List of files with their details
     """
-    # Get user's CV uploads to verify ownership
-    uploads = get_user_cv_uploads(current_user_id)
-    
-    # Find the specific upload
-    cv_upload = None
-    for upload in uploads:
-        if upload['job_id'] == job_id:
-            cv_upload = upload
-            break
+    # Verify ownership (metadata only - the CV JSON is not needed here)
+    cv_upload = get_cv_upload(job_id, user_id=current_user_id)
     
     if not cv_upload:
         raise HTTPException(status_code=404, detail="CV not found")
@@ -1528,15 +1759,8 @@ async def download_specific_file(
     Returns:
         The requested file
     """
-    # Get user's CV uploads to verify ownership
-    uploads = get_user_cv_uploads(current_user_id)
-    
-    # Find the specific upload
-    cv_upload = None
-    for upload in uploads:
-        if upload['job_id'] == job_id:
-            cv_upload = upload
-            break
+    # Verify ownership (metadata only - the CV JSON is not needed here)
+    cv_upload = get_cv_upload(job_id, user_id=current_user_id)
     
     if not cv_upload:
         raise HTTPException(status_code=404, detail="CV not found")
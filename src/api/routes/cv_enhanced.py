@@ -135,12 +135,12 @@ async def upload_cv_with_tracking(
         
         # Create new extractor instance for this request
         extractor = create_data_extractor()
-        cv_data = await extractor.extract_cv_data(text)
+        result = await extractor.extract_cv_result(text)
         
         ai_time = sse_logger.end_timer("ai_extraction")
         
         # Count extracted sections
-        sections_found = len([f for f in cv_data.model_dump_nullable() if cv_data.model_dump_nullable()[f]])
+        sections_found = result.sections_count
         sse_logger.increment_counter("sections_found", sections_found)
         
         sse_logger.step_complete(f"AI extraction complete in {ai_time:.2f}s - Found {sections_found} sections")
@@ -150,7 +150,7 @@ async def upload_cv_with_tracking(
         
         # Check key fields - using the new CV data structure
         validation_score = 0
-        cv_dict = cv_data.model_dump_nullable()
+        cv_dict = result.cv_data_dict
         
         if cv_dict.get('hero') and cv_dict['hero'].get('fullName'):
             validation_score += 0.3
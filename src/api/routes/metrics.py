@@ -7,6 +7,10 @@ from datetime import datetime, timedelta
 
 from src.core.cv_extraction.metrics import metrics_collector
 from src.core.cv_extraction.circuit_breaker import llm_circuit_breaker
+from src.core.cv_extraction.client_registry import anthropic_client_registry
+from src.core.cv_extraction.parse_cache import get_parse_cache_stats
+from src.services.admission_control import extraction_admission, portfolio_admission
+from src.services.job_queue import job_queue
 from src.api.routes.auth import get_current_user_optional, require_admin
 
 import logging
@@ -189,6 +193,45 @@ async def get_circuit_breaker_status():
     }
 
 
+@router.get("/llm-connections")
+async def get_llm_connection_stats():
+    """
+    Get connection pool reuse statistics for the shared Anthropic clients.
+    Public endpoint for monitoring TLS handshake and socket usage.
+    """
+    return {
+        "connections": anthropic_client_registry.get_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@router.get("/parse-caches")
+async def get_parse_caches():
+    """
+    Get hit rates of the memoized location and date parsers.
+    Public endpoint for checking whether the parse caches pay off.
+    """
+    return {
+        "caches": get_parse_cache_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@router.get("/admission")
+async def get_admission_status():
+    """
+    Get admission control state for extraction and portfolio generation.
+    Public endpoint for monitoring load shedding (503 responses).
+    """
+    extraction = extraction_admission.get_status()
+    extraction["queued_jobs"] = job_queue.backlog()
+    
+    return {
+        "controllers": [extraction, portfolio_admission.get_status()],
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 @router.post("/circuit-breaker/reset")
 async def reset_circuit_breaker(
     admin: bool = Depends(require_admin)
@@ -218,13 +261,7 @@ async def reset_metrics(
     Admin only - use with caution!
     """
     # Reset the metrics collector
-    metrics_collector.metrics_history.clear()
-    metrics_collector.current_metrics.clear()
-    metrics_collector.total_extractions = 0
-    metrics_collector.successful_extractions = 0
-    metrics_collector.failed_extractions = 0
-    metrics_collector.total_processing_time = 0.0
-    metrics_collector.average_processing_time = 0.0
+    metrics_collector.reset()
     
     logger.warning("Metrics have been reset by admin")
     
@@ -33,10 +33,12 @@ except ImportError:
 from src.api.routes.auth import get_current_user, get_current_user_optional
 from src.api.db import get_user_cv_uploads, update_user_portfolio
 from src.services.vercel_deployer import VercelDeployer
+from src.services.admission_control import portfolio_admission
+from src.services.shared_state import shared_state
 
 logger = logging.getLogger(__name__)
 
-# Global dictionary to track portfolio processes
+# Global dictionary to track portfolio processes (this worker's server processes)
 PORTFOLIO_PROCESSES = {}
 
 # Configuration for portfolio management
@@ -44,19 +46,67 @@ PORTFOLIO_MAX_AGE_HOURS = 24  # Portfolios older than this will be cleaned up
 PORTFOLIO_CLEANUP_INTERVAL = 300  # Check every 5 minutes
 MAX_ACTIVE_PORTFOLIOS = 20  # Maximum number of active portfolios
 
-# Portfolio metrics tracking
+# Shared state key prefix for the portfolio registry seen by every worker
+PORTFOLIO_KEY_PREFIX = "portfolio:"
+
+
+def _track_portfolio(portfolio_id: str, info: Dict[str, Any]):
+    """Register a portfolio started by this worker, locally and in the shared registry"""
+    PORTFOLIO_PROCESSES[portfolio_id] = info
+    _publish_portfolio(portfolio_id, info)
+
+
+def _publish_portfolio(portfolio_id: str, info: Dict[str, Any]):
+    """Store a portfolio's (updated) info in the shared registry"""
+    shared_info = {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in info.items() if key != 'process'
+    }
+    shared_state.set_value(f"{PORTFOLIO_KEY_PREFIX}{portfolio_id}", shared_info, ttl=PORTFOLIO_MAX_AGE_HOURS * 3600)
+
+
+def _untrack_portfolio(portfolio_id: str):
+    """Remove a portfolio locally and from the shared registry"""
+    PORTFOLIO_PROCESSES.pop(portfolio_id, None)
+    shared_state.delete_value(f"{PORTFOLIO_KEY_PREFIX}{portfolio_id}")
+
+
+def _get_portfolio(portfolio_id: str) -> Optional[Dict[str, Any]]:
+    """Get a portfolio's info, from this worker or the shared registry"""
+    return PORTFOLIO_PROCESSES.get(portfolio_id) or shared_state.get_value(f"{PORTFOLIO_KEY_PREFIX}{portfolio_id}")
+
+
+def _all_portfolios() -> Dict[str, Dict[str, Any]]:
+    """Get every tracked portfolio across workers"""
+    return {
+        key[len(PORTFOLIO_KEY_PREFIX):]: info
+        for key, info in shared_state.values(PORTFOLIO_KEY_PREFIX).items()
+    }
+
+# Portfolio metrics tracking (totals are shared state counters, summed across workers)
 class PortfolioMetrics:
     def __init__(self):
-        self.total_created = 0
-        self.total_failed = 0
-        self.active_count = 0
-        self.cleanup_count = 0
         self.startup_times = []
         self.last_cleanup = datetime.now()
     
+    @property
+    def total_created(self) -> int:
+        return int(shared_state.get_counter("portfolios:created"))
+    
+    @property
+    def total_failed(self) -> int:
+        return int(shared_state.get_counter("portfolios:failed"))
+    
+    @property
+    def cleanup_count(self) -> int:
+        return int(shared_state.get_counter("portfolios:cleaned"))
+    
+    @property
+    def active_count(self) -> int:
+        return len(_all_portfolios())
+    
     def record_creation(self, portfolio_id: str, startup_time: float = None):
-        self.total_created += 1
-        self.active_count += 1
+        shared_state.incr("portfolios:created")
         if startup_time:
             self.startup_times.append(startup_time)
             # Keep only last 100 startup times
@@ -64,11 +114,10 @@ class PortfolioMetrics:
                 self.startup_times = self.startup_times[-100:]
     
     def record_failure(self):
-        self.total_failed += 1
+        shared_state.incr("portfolios:failed")
     
     def record_cleanup(self, portfolio_id: str):
-        self.cleanup_count += 1
-        self.active_count = max(0, self.active_count - 1)
+        shared_state.incr("portfolios:cleaned")
     
     def get_stats(self):
         avg_startup = sum(self.startup_times) / len(self.startup_times) if self.startup_times else 0
@@ -121,7 +170,7 @@ async def portfolio_cleanup_task():
                         logger.error(f"Error cleaning directory for {portfolio_id}: {e}")
                     
                     # Remove from tracking
-                    del PORTFOLIO_PROCESSES[portfolio_id]
+                    _untrack_portfolio(portfolio_id)
                     portfolio_metrics.record_cleanup(portfolio_id)
                     cleaned_count += 1
             
@@ -514,6 +563,9 @@ async def generate_portfolio(
     """
     Generate a portfolio website from CV data
     
+    Generations run a few at a time; when they queue for too long new requests
+    get 503 with Retry-After instead of slowing every generation down.
+    
     Args:
         job_id: The CV job ID to generate portfolio from
         current_user_id: Optional user ID if authenticated
@@ -521,12 +573,22 @@ async def generate_portfolio(
     Returns:
         Portfolio generation result with URL and status
     """
+    async with portfolio_admission.admit():
+        return await _generate_portfolio(job_id, request, current_user_id)
+
+
+async def _generate_portfolio(
+    job_id: str,
+    request: GeneratePortfolioRequest,
+    current_user_id: Optional[str]
+):
+    """Generate a portfolio once admitted (see generate_portfolio)"""
     try:
         # Ensure cleanup task is running
         ensure_cleanup_task()
         
         # Check if we've reached the maximum number of active portfolios
-        active_count = len([p for p in PORTFOLIO_PROCESSES.values() if p.get('status') != 'stopped'])
+        active_count = len([p for p in _all_portfolios().values() if p.get('status') != 'stopped'])
         if active_count >= MAX_ACTIVE_PORTFOLIOS:
             logger.warning(f"⚠️ Maximum active portfolios reached ({MAX_ACTIVE_PORTFOLIOS})")
             raise HTTPException(
@@ -578,39 +640,30 @@ async def generate_portfolio(
             logger.info(f"📊 Checking database for CV data for job_id: {job_id}")
             
             # Try to get CV data from the upload status
-            from src.api.db import get_db_connection
-            conn = get_db_connection()
-            try:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT cv_data, status FROM cv_uploads WHERE job_id = ?",
-                    (job_id,)
-                )
-                result = cursor.fetchone()
+            from src.api.db import get_cv_upload
+            result = get_cv_upload(job_id, include_cv_data=True)
+            
+            if result and result['status'] == 'completed' and result['cv_data']:
+                cv_data = json.loads(result['cv_data'])
+                logger.info(f"✅ Found CV data in database for job {job_id}")
                 
-                if result and result['status'] == 'completed' and result['cv_data']:
-                    cv_data = json.loads(result['cv_data'])
-                    logger.info(f"✅ Found CV data in database for job {job_id}")
-                    
-                    # Save to JSON file for future use
+                # Save to JSON file for future use
+                with open(json_file, 'w') as f:
+                    json.dump(cv_data, f, indent=2)
+            else:
+                # Only extract if really needed (shouldn't happen with new flow)
+                logger.warning(f"⚠️ CV data not found in DB, extracting now for job_id: {job_id}")
+                
+                from src.api.routes.cv import extract_cv_data_endpoint
+                extract_result = await extract_cv_data_endpoint(job_id, current_user_id)
+                
+                if extract_result['status'] in ('completed', 'partial'):
+                    cv_data = extract_result['cv_data']
                     with open(json_file, 'w') as f:
                         json.dump(cv_data, f, indent=2)
+                    logger.info(f"✅ CV data extracted and saved")
                 else:
-                    # Only extract if really needed (shouldn't happen with new flow)
-                    logger.warning(f"⚠️ CV data not found in DB, extracting now for job_id: {job_id}")
-                    
-                    from src.api.routes.cv import extract_cv_data_endpoint
-                    extract_result = await extract_cv_data_endpoint(job_id, current_user_id)
-                    
-                    if extract_result['status'] == 'completed':
-                        cv_data = extract_result['cv_data']
-                        with open(json_file, 'w') as f:
-                            json.dump(cv_data, f, indent=2)
-                        logger.info(f"✅ CV data extracted and saved")
-                    else:
-                        raise HTTPException(status_code=500, detail="Failed to extract CV data")
-            finally:
-                conn.close()
+                    raise HTTPException(status_code=500, detail="Failed to extract CV data")
         
         # === 2. SELECT TEMPLATE ===
         template_id = request.template or "official_template_v1"  # Default template
@@ -984,7 +1037,7 @@ export {{ extractedCVData }}
                 raise HTTPException(status_code=500, detail=f"Failed to start portfolio server: {str(e)}")
             
             # Store portfolio info for tracking (preview mode)
-            PORTFOLIO_PROCESSES[portfolio_id] = {
+            _track_portfolio(portfolio_id, {
                 "portfolio_id": portfolio_id,
                 "job_id": job_id,
                 "local_url": local_url,
@@ -997,7 +1050,7 @@ export {{ extractedCVData }}
                 "is_local": True,
                 "deployment_status": "preview",  # Not yet deployed to Vercel
                 "cv_data_name": cv_data.get('hero', {}).get('fullName', '')  # Store for later deployment
-            }
+            })
             
             # Update user's portfolio in database if authenticated
             if current_user_id and not current_user_id.startswith("anonymous_"):
@@ -1101,7 +1154,7 @@ export {{ extractedCVData }}
             logger.info(f"✅ Portfolio deployed to Vercel: {vercel_url}")
             
             # Store deployment info for tracking
-            PORTFOLIO_PROCESSES[portfolio_id] = {
+            _track_portfolio(portfolio_id, {
                 "portfolio_id": portfolio_id,
                 "job_id": job_id,
                 "vercel_url": vercel_url,
@@ -1113,7 +1166,7 @@ export {{ extractedCVData }}
                 "template": template_id,
                 "status": "deployed",
                 "is_local": False
-            }
+            })
             
             # Update user's portfolio in database if authenticated
             if current_user_id and not current_user_id.startswith("anonymous_"):
@@ -1162,8 +1215,8 @@ async def list_user_portfolios(current_user_id: str = Depends(get_current_user))
     try:
         portfolios = []
         
-        # Get portfolios from in-memory store (includes Vercel deployments)
-        for portfolio_id, info in PORTFOLIO_PROCESSES.items():
+        # Get portfolios from the shared registry (includes Vercel deployments)
+        for portfolio_id, info in _all_portfolios().items():
             if info.get('user_id') == current_user_id:
                 # Convert to frontend-friendly format
                 portfolio_data = {
@@ -1228,7 +1281,7 @@ async def deploy_portfolio_to_vercel(
     """
     try:
         # Check if portfolio exists and belongs to user
-        portfolio_info = PORTFOLIO_PROCESSES.get(portfolio_id)
+        portfolio_info = _get_portfolio(portfolio_id)
         if not portfolio_info:
             raise HTTPException(status_code=404, detail="Portfolio not found")
         
@@ -1322,6 +1375,7 @@ async def deploy_portfolio_to_vercel(
             "is_local": False,
             "deployed_at": datetime.now()
         })
+        _publish_portfolio(portfolio_id, portfolio_info)
         
         # Update user's portfolio in database
         update_user_portfolio(current_user_id, portfolio_id, custom_domain_url or vercel_url)
@@ -1356,8 +1410,8 @@ async def restart_portfolio_server(
     """
     try:
         # Check if this is a Vercel deployment
-        if portfolio_id in PORTFOLIO_PROCESSES:
-            portfolio_info = PORTFOLIO_PROCESSES[portfolio_id]
+        portfolio_info = _get_portfolio(portfolio_id)
+        if portfolio_info:
             if not portfolio_info.get('is_local', True):
                 # This is a Vercel deployment, no restart needed
                 return {
@@ -1664,9 +1718,8 @@ async def delete_portfolio(
     """
     try:
         # Check if this is a Vercel deployment
-        if portfolio_id in PORTFOLIO_PROCESSES:
-            portfolio_info = PORTFOLIO_PROCESSES[portfolio_id]
-            
+        portfolio_info = _get_portfolio(portfolio_id)
+        if portfolio_info:
             # Verify ownership
             if portfolio_info.get('user_id') != current_user_id:
                 raise HTTPException(status_code=403, detail="Not authorized to delete this portfolio")
@@ -1682,8 +1735,8 @@ async def delete_portfolio(
                     logger.error(f"Failed to delete Vercel deployment: {e}")
                     # Continue with local cleanup even if Vercel deletion fails
             
-            # Remove from in-memory store
-            del PORTFOLIO_PROCESSES[portfolio_id]
+            # Remove from tracking
+            _untrack_portfolio(portfolio_id)
         
         # Check for local portfolio directory
         portfolio_dir = PORTFOLIOS_DIR / f"{current_user_id}_{portfolio_id}"
@@ -1750,11 +1803,7 @@ async def setup_portfolio_custom_domain(
     """
     try:
         # Find the portfolio in our tracking
-        portfolio_info = None
-        for pid, info in PORTFOLIO_PROCESSES.items():
-            if pid == portfolio_id:
-                portfolio_info = info
-                break
+        portfolio_info = _get_portfolio(portfolio_id)
         
         if not portfolio_info or not portfolio_info.get('vercel_url'):
             raise HTTPException(status_code=404, detail="Portfolio not found or not deployed")
@@ -1783,6 +1832,7 @@ async def setup_portfolio_custom_domain(
             # Update portfolio info with custom domain
             portfolio_info['custom_domain'] = custom_domain
             portfolio_info['custom_url'] = custom_url
+            _publish_portfolio(portfolio_id, portfolio_info)
             
             logger.info(f"✅ Custom domain configured: {custom_domain} -> {portfolio_info['vercel_url']}")
             
@@ -3,6 +3,7 @@ Server-Sent Events (SSE) endpoints for real-time CV processing updates
 """
 
 import asyncio
+import time
 import uuid
 import logging
 from pathlib import Path
@@ -71,34 +72,24 @@ async def extract_cv_streaming(
     logger.info(f"Starting SSE CV extraction stream for job {job_id}, connection {connection_id}")
     
     async def event_generator():
-        """Generate SSE events for CV extraction process"""
-        live_logger = create_job_logger(job_id, "cv_extract", connection_id)
+        """Relay the job's extraction events (progress, partial items, sections) as they are published"""
+        initial_msg = sse_service.create_step_message(
+            "connection_established", 1, 5,
+            {"job_id": job_id, "user_id": current_user_id}
+        )
         
         try:
-            # Send initial connection message
-            initial_msg = sse_service.create_step_message(
-                "connection_established", 1, 5,
-                {"job_id": job_id, "user_id": current_user_id}
-            )
-            yield initial_msg.to_sse_format()
-            
-            # TODO: In real implementation, retrieve file path from job_id
-            # For now, this is a placeholder structure
-            
-            # Send completion for demonstration
-            complete_msg = sse_service.create_complete_message({
-                "job_id": job_id,
-                "status": "ready_for_extraction",
-                "message": "CV extraction endpoint ready for file processing"
-            })
-            yield complete_msg.to_sse_format()
-            
-            # Keep connection alive until client disconnects
-            while True:
+            # Subscribing to the job routes events published by the extraction
+            # pipeline (see create_extraction_progress_callback) to this stream
+            async for sse_message in sse_service.stream_generator(
+                connection_id,
+                initial_messages=[initial_msg],
+                job_id=job_id
+            ):
                 if await request.is_disconnected():
                     logger.info(f"Client disconnected from SSE stream: {connection_id}")
                     break
-                await asyncio.sleep(1)
+                yield sse_message
                 
         except asyncio.CancelledError:
             logger.info(f"SSE stream cancelled for connection: {connection_id}")
@@ -146,7 +137,7 @@ async def extract_cv_streaming_upload(
     connection_id = f"cv-upload-{job_id}-{uuid.uuid4().hex[:8]}"
     
     # Register connection with rate limiter
-    if not rate_limiter.add_connection(current_user_id):
+    if not rate_limiter.add_connection(current_user_id, connection_id):
         raise HTTPException(
             status_code=429,
             detail="Could not establish connection - rate limit exceeded"
@@ -157,9 +148,16 @@ async def extract_cv_streaming_upload(
     # Use the SSE service's streaming generator
     async def upload_and_extract_generator():
         """Process file upload and extraction with real-time updates"""
-        # Start SSE stream
-        async for sse_message in sse_service.stream_generator(connection_id):
-            yield sse_message
+        # Start SSE stream, renewing the connection's entry as messages flow
+        renewed_at = time.time()
+        try:
+            async for sse_message in sse_service.stream_generator(connection_id):
+                if time.time() - renewed_at >= rate_limiter.config.connection_ttl / 3:
+                    rate_limiter.renew_connection(current_user_id, connection_id)
+                    renewed_at = time.time()
+                yield sse_message
+        finally:
+            rate_limiter.remove_connection(current_user_id, connection_id)
             
         # This will not be reached as stream_generator runs indefinitely
         # The actual processing will be done in a background task
@@ -234,7 +232,7 @@ async def extract_cv_streaming_upload(
             
             # Create new extractor instance for this request
             extractor = create_data_extractor()
-            cv_data = await extractor.extract_cv_data(text)
+            result = await extractor.extract_cv_result(text)
             
             live_logger.step_complete("AI analysis complete")
             
@@ -252,11 +250,11 @@ async def extract_cv_streaming_upload(
             # Complete the process
             completion_result = {
                 "job_id": job_id,
-                "cv_data": cv_data.model_dump_nullable(),
+                "cv_data": result.to_response(),
                 "filename": file.filename,
                 "file_size": len(file_content),
                 "extraction_method": "OCR" if needs_ocr else "Text Extraction",
-                "extracted_sections": len([f for f in cv_data.model_dump_nullable() if cv_data.model_dump_nullable()[f]]),
+                "extracted_sections": result.sections_count,
                 "processing_time": live_logger.get_total_time()
             }
             
@@ -289,7 +287,7 @@ async def extract_cv_streaming_upload(
         
         finally:
             # Always clean up connection
-            rate_limiter.remove_connection(current_user_id)
+            rate_limiter.remove_connection(current_user_id, connection_id)
 
     return StreamingResponse(
         upload_and_extract_generator(),
@@ -629,15 +627,14 @@ async def get_admin_rate_limit_stats(
     global_stats = rate_limiter.get_global_stats()
     
     # Get stats for all active users
-    active_user_stats = []
-    for user_id, state in rate_limiter.user_states.items():
-        if state.active_connections > 0 or state.is_blocked:
-            active_user_stats.append(rate_limiter.get_user_limits_info(user_id))
+    active_user_stats = [
+        rate_limiter.get_user_limits_info(user_id) for user_id in rate_limiter.get_tracked_users()
+    ]
     
     return {
         "global_stats": global_stats,
         "active_users": active_user_stats,
-        "total_tracked_users": len(rate_limiter.user_states),
+        "total_tracked_users": global_stats["total_tracked_users"],
         "rate_limit_config": {
             "max_connections_per_user": rate_limiter.config.max_connections_per_user,
             "max_connections_global": rate_limiter.config.max_connections_global,
@@ -86,6 +86,8 @@ class CleanupResponse(BaseModel):
     """Response after cleanup operation"""
     status: str
     deleted_sessions: int
+    deleted_upload_blobs: int = 0
+    deleted_cv_data_blobs: int = 0
     cutoff_date: str
 
 
@@ -113,4 +115,24 @@ class PortfolioGenerationResponse(BaseModel):
     portfolio_id: str
     download_url: str
     preview_url: str
-    message: str
\ No newline at end of file
+    message: str
+
+# ========== BULK EXTRACTION MODELS ==========
+
+class BulkExtractionRequest(BaseModel):
+    """Request to extract a partner batch of CVs (admin)"""
+    source: str = Field(..., description="Server path of a directory of CVs or a manifest file")
+    run_id: Optional[str] = Field(default=None, description="Earlier run to resume (its output is reused)")
+    concurrency: int = Field(default=4, ge=1, le=32, description="LLM extractions at once")
+    text_concurrency: int = Field(default=2, ge=1, le=32, description="Text extractions (PDF parsing/OCR) at once")
+    use_cache: bool = Field(default=True, description="Read and fill the text and extraction caches")
+    retry_failed: bool = Field(default=False, description="Re-extract files recorded as failed")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "source": "/srv/partners/acme/manifest.jsonl",
+                "concurrency": 8,
+                "text_concurrency": 4
+            }
+        }
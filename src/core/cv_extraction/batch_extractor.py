@@ -0,0 +1,410 @@
+"""
+Batch Extraction for Bulk CV Re-extraction
+Packs section prompts for many CVs into provider batch submissions
+"""
+import asyncio
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .data_extractor import DataExtractor
+from .extraction_config import extraction_config
+from .extraction_result import ExtractionResult
+from .prompt_templates import prompt_registry
+from .section_extractor import SectionExtractor
+
+logger = logging.getLogger(__name__)
+
+# Provider limit is 100,000 requests per batch; stay well below to keep batches retryable
+MAX_REQUESTS_PER_BATCH = 5000
+# Same threshold as the interactive /extract route
+CACHE_MIN_CONFIDENCE = 0.75
+# Separator between job_id and section name in custom_id (custom_id allows [a-zA-Z0-9_-])
+CUSTOM_ID_SEPARATOR = "__"
+
+
+class BatchClient(ABC):
+    """
+    Minimal interface to a message batch API.
+
+    Requests use the Anthropic batch format:
+    {"custom_id": str, "params": {"model": ..., "max_tokens": ..., "messages": [...]}}
+    """
+
+    @abstractmethod
+    async def submit(self, requests: List[Dict[str, Any]]) -> str:
+        """Submit requests and return the batch id."""
+
+    @abstractmethod
+    async def is_ended(self, batch_id: str) -> bool:
+        """Whether the batch has finished processing."""
+
+    @abstractmethod
+    async def get_results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        """Map custom_id to response text (None for errored, canceled or expired requests)."""
+
+
+class AnthropicBatchClient(BatchClient):
+    """BatchClient backed by the Anthropic Message Batches API."""
+
+    def __init__(self, client):
+        """
+        Args:
+            client: AsyncAnthropic client
+        """
+        self.client = client
+
+    async def submit(self, requests: List[Dict[str, Any]]) -> str:
+        batch = await self.client.beta.messages.batches.create(requests=requests)
+        logger.info(f"Submitted message batch {batch.id} with {len(requests)} requests")
+        return batch.id
+
+    async def is_ended(self, batch_id: str) -> bool:
+        batch = await self.client.beta.messages.batches.retrieve(batch_id)
+        return batch.processing_status == "ended"
+
+    async def get_results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        results = {}
+        async for entry in await self.client.beta.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message.content[0].text
+            else:
+                logger.warning(f"Batch request {entry.custom_id} {entry.result.type}")
+                results[entry.custom_id] = None
+        return results
+
+
+class LocalBatchStub(BatchClient):
+    """
+    In-process BatchClient for tests and dry runs.
+
+    Responses come from a responder callable (custom_id, params) -> text. Returning
+    None marks the request as errored. Batches end after `polls_until_ended` status checks.
+    """
+
+    def __init__(self, responder: Callable[[str, Dict[str, Any]], Optional[str]],
+                 polls_until_ended: int = 0):
+        self.responder = responder
+        self.polls_until_ended = polls_until_ended
+        self.batches: Dict[str, List[Dict[str, Any]]] = {}
+        self._polls: Dict[str, int] = {}
+
+    async def submit(self, requests: List[Dict[str, Any]]) -> str:
+        batch_id = f"stub_batch_{len(self.batches) + 1}"
+        self.batches[batch_id] = list(requests)
+        self._polls[batch_id] = 0
+        return batch_id
+
+    async def is_ended(self, batch_id: str) -> bool:
+        self._polls[batch_id] += 1
+        return self._polls[batch_id] > self.polls_until_ended
+
+    async def get_results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        return {
+            request["custom_id"]: self.responder(request["custom_id"], request["params"])
+            for request in self.batches[batch_id]
+        }
+
+
+class BatchCheckpoint:
+    """
+    JSON checkpoint of a bulk extraction run.
+
+    Stores every job's text, per-section tier, status and data, and every submitted
+    batch, so an interrupted run resumes polling existing batches instead of
+    resubmitting (and paying for) work that is already in flight or done.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.jobs = state.get("jobs", {})
+            self.batches = state.get("batches", {})
+            logger.info(f"Resuming from checkpoint {self.path} ({len(self.jobs)} jobs, {len(self.batches)} batches)")
+
+    def save(self):
+        """Atomically write the checkpoint to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"jobs": self.jobs, "batches": self.batches}, f, default=str)
+        os.replace(tmp_path, self.path)
+
+
+class BatchExtractor:
+    """
+    Bulk CV extraction through a message batch API.
+
+    Section prompts for all jobs are submitted in batches. Once a job's responses are
+    in, they go through the same parse/validate stages as interactive extraction
+    (SectionExtractor), sections that fail checks on a cheaper tier are queued for
+    the escalation tier in the next round, and finished jobs are enhanced,
+    post-processed and stored in cv_uploads and cv_extraction_cache.
+    """
+
+    def __init__(self, batch_client: BatchClient, checkpoint_path: str,
+                 poll_interval: float = 60.0, max_request_retries: int = 1,
+                 store_results: bool = True):
+        """
+        Args:
+            batch_client: Batch API client (AnthropicBatchClient or LocalBatchStub)
+            checkpoint_path: JSON file used to resume interrupted runs
+            poll_interval: Seconds between batch status checks
+            max_request_retries: Resubmissions allowed for errored or expired requests
+            store_results: Write finished jobs to cv_uploads and cv_extraction_cache
+        """
+        self.batch_client = batch_client
+        self.checkpoint = BatchCheckpoint(checkpoint_path)
+        self.poll_interval = poll_interval
+        self.max_request_retries = max_request_retries
+        self.store_results = store_results
+        self.section_extractor = SectionExtractor(DataExtractor.SECTION_SCHEMAS)
+
+    def add_jobs(self, jobs: Iterable[Tuple[str, str, Optional[str]]]) -> int:
+        """
+        Queue jobs for extraction, skipping jobs already in the checkpoint.
+
+        Args:
+            jobs: Iterable of (job_id, raw_text, file_hash)
+
+        Returns:
+            Number of newly queued jobs
+        """
+        added = 0
+        for job_id, raw_text, file_hash in jobs:
+            if job_id in self.checkpoint.jobs:
+                continue
+            if not raw_text or not raw_text.strip():
+                logger.warning(f"Skipping job {job_id}: no text")
+                continue
+            self.checkpoint.jobs[job_id] = {
+                "raw_text": raw_text,
+                "file_hash": file_hash,
+                "status": "pending",
+                "sections": {
+                    section_name: {
+                        "tier": extraction_config.get_model_tier(section_name),
+                        "status": "pending",
+                        "data": None,
+                        "attempts": 0,
+                        "batch_id": None
+                    }
+                    for section_name in DataExtractor.SECTION_SCHEMAS
+                }
+            }
+            added += 1
+        self.checkpoint.save()
+        return added
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Drive all queued jobs to completion.
+
+        Returns:
+            Summary with completed/failed job ids and the number of batches used
+        """
+        while True:
+            await self._collect_finished_batches()
+            self._finalize_ready_jobs()
+
+            pending = self._pending_requests()
+            if pending:
+                await self._submit(pending)
+            elif not self._in_flight_batches():
+                break
+            else:
+                await asyncio.sleep(self.poll_interval)
+
+        jobs = self.checkpoint.jobs
+        return {
+            "completed": [job_id for job_id, job in jobs.items() if job["status"] == "completed"],
+            "failed": [job_id for job_id, job in jobs.items() if job["status"] == "failed"],
+            "batches": len(self.checkpoint.batches)
+        }
+
+    @staticmethod
+    def make_custom_id(job_id: str, section_name: str) -> str:
+        """Build the batch custom_id for a job section."""
+        return f"{job_id}{CUSTOM_ID_SEPARATOR}{section_name}"
+
+    @staticmethod
+    def parse_custom_id(custom_id: str) -> Tuple[str, str]:
+        """Split a custom_id back into (job_id, section_name)."""
+        job_id, _, section_name = custom_id.rpartition(CUSTOM_ID_SEPARATOR)
+        return job_id, section_name
+
+    def _pending_requests(self) -> List[Dict[str, Any]]:
+        """Build batch requests for every section waiting to be submitted."""
+        requests = []
+        for job_id, job in self.checkpoint.jobs.items():
+            if job["status"] != "pending":
+                continue
+            for section_name, section in job["sections"].items():
+                if section["status"] != "pending":
+                    continue
+                prompt = prompt_registry.create_prompt(
+                    section_name, DataExtractor.SECTION_SCHEMAS.get(section_name), job["raw_text"]
+                )
+                requests.append({
+                    "custom_id": self.make_custom_id(job_id, section_name),
+                    "params": {
+                        "model": extraction_config.get_tier_model(section["tier"]),
+                        "max_tokens": extraction_config.MAX_TOKENS,
+                        "temperature": extraction_config.TEMPERATURE,
+                        "top_p": extraction_config.TOP_P,
+                        "messages": [{"role": "user", "content": prompt}]
+                    }
+                })
+        return requests
+
+    def _in_flight_batches(self) -> List[str]:
+        return [batch_id for batch_id, batch in self.checkpoint.batches.items() if not batch["collected"]]
+
+    async def _submit(self, requests: List[Dict[str, Any]]):
+        """Submit requests in chunks, checkpointing after every batch."""
+        for start in range(0, len(requests), MAX_REQUESTS_PER_BATCH):
+            chunk = requests[start:start + MAX_REQUESTS_PER_BATCH]
+            batch_id = await self.batch_client.submit(chunk)
+
+            custom_ids = [request["custom_id"] for request in chunk]
+            self.checkpoint.batches[batch_id] = {
+                "custom_ids": custom_ids,
+                "submitted_at": datetime.utcnow().isoformat(),
+                "collected": False
+            }
+            for custom_id in custom_ids:
+                job_id, section_name = self.parse_custom_id(custom_id)
+                section = self.checkpoint.jobs[job_id]["sections"][section_name]
+                section["status"] = "submitted"
+                section["batch_id"] = batch_id
+                section["attempts"] += 1
+            self.checkpoint.save()
+
+    async def _collect_finished_batches(self):
+        """Download results of ended batches and apply section stages to them."""
+        for batch_id in self._in_flight_batches():
+            if not await self.batch_client.is_ended(batch_id):
+                continue
+
+            results = await self.batch_client.get_results(batch_id)
+            for custom_id in self.checkpoint.batches[batch_id]["custom_ids"]:
+                job_id, section_name = self.parse_custom_id(custom_id)
+                job = self.checkpoint.jobs.get(job_id)
+                if not job:
+                    continue
+                section = job["sections"][section_name]
+                if section["batch_id"] != batch_id or section["status"] != "submitted":
+                    continue  # Superseded by a later submission
+                await self._apply_section_result(job, section_name, section, results.get(custom_id))
+
+            self.checkpoint.batches[batch_id]["collected"] = True
+            self.checkpoint.save()
+            logger.info(f"Collected results for batch {batch_id}")
+
+    async def _apply_section_result(self, job: Dict[str, Any], section_name: str,
+                                    section: Dict[str, Any], response_text: Optional[str]):
+        """Record one section response, retrying or escalating when needed."""
+        escalation_tier = extraction_config.ESCALATION_TIER
+
+        if response_text is None:
+            if section["attempts"] <= self.max_request_retries:
+                section["status"] = "pending"
+            else:
+                section["status"] = "done"
+                section["data"] = None
+            return
+
+        model = extraction_config.get_tier_model(section["tier"])
+
+        async def stored_response(prompt: str, name: str) -> Tuple[str, str]:
+            return model, response_text
+
+        result = await self.section_extractor.extract(
+            section_name=section_name,
+            raw_text=job["raw_text"],
+            llm_caller=stored_response
+        )
+
+        if section["tier"] != escalation_tier and DataExtractor._needs_escalation(
+            section_name, result, job["raw_text"],
+            empty_response=SectionExtractor.is_empty_response(model, response_text, section_name)
+        ):
+            logger.info(f"Escalating section '{section_name}' from {section['tier']} to {escalation_tier} tier")
+            section["tier"] = escalation_tier
+            section["status"] = "pending"
+            section["attempts"] = 0  # The escalated request gets its own retry budget
+            return
+
+        section["status"] = "done"
+        section["data"] = result.get(section_name) if result else None
+
+    def _finalize_ready_jobs(self):
+        """Enhance, post-process and store every job whose sections are all done."""
+        for job_id, job in self.checkpoint.jobs.items():
+            if job["status"] != "pending":
+                continue
+            if any(section["status"] != "done" for section in job["sections"].values()):
+                continue
+
+            try:
+                sections = {
+                    name: section["data"] for name, section in job["sections"].items()
+                    if section["data"] is not None
+                }
+                if not sections:
+                    raise ValueError("no sections could be extracted")
+                section_models = {
+                    name: extraction_config.get_tier_model(job["sections"][name]["tier"]) for name in sections
+                }
+                result = DataExtractor.finalize_sections(sections, job["raw_text"], section_models)
+
+                if self.store_results:
+                    self._store_result(job_id, job.get("file_hash"), result)
+
+                job["status"] = "completed"
+                job["confidence_score"] = result.confidence
+                logger.info(f"Batch extraction completed for job {job_id} (confidence: {result.confidence:.2f})")
+            except Exception as e:
+                logger.error(f"Batch extraction failed for job {job_id}: {e}")
+                job["status"] = "failed"
+                job["error"] = str(e)
+
+            # Raw text and section data are no longer needed once the job is final
+            job.pop("raw_text", None)
+            for section in job["sections"].values():
+                section.pop("data", None)
+            self.checkpoint.save()
+
+    @staticmethod
+    def _store_result(job_id: str, file_hash: Optional[str], result: ExtractionResult):
+        """Write a finished extraction to cv_uploads and, if confident enough, the cache."""
+        from src.api.db import update_cv_upload_status, cache_extraction_result
+
+        update_cv_upload_status(job_id, 'completed', result.cv_data_json)
+        if file_hash and result.confidence >= CACHE_MIN_CONFIDENCE:
+            cache_extraction_result(
+                file_hash=file_hash,
+                cv_data=result.cv_data_json,
+                extraction_model=result.extraction_model,
+                temperature=extraction_config.TEMPERATURE,
+                confidence_score=result.confidence
+            )
+
+
+def create_anthropic_batch_client(api_key: Optional[str] = None) -> AnthropicBatchClient:
+    """
+    Create a batch client using the same API key resolution as LLMService.
+
+    Args:
+        api_key: Optional Anthropic API key (keychain and env vars are used otherwise)
+    """
+    from .llm_service import create_llm_service
+    return AnthropicBatchClient(create_llm_service(api_key).claude_client)
@@ -0,0 +1,347 @@
+"""
+Bulk Extraction for Partner CV Batches
+Extracts a directory or manifest of CV files with the interactive pipeline
+(text extraction, then LLM extraction) at a configurable concurrency, and
+streams one JSONL record per file with its result and per-stage timings.
+
+The JSONL output doubles as the checkpoint: files already recorded in it are
+skipped, so an interrupted run resumes where it stopped. Text and extraction
+results are cached by file hash, so re-runs and duplicate files are cheap.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from .batch_extractor import CACHE_MIN_CONFIDENCE
+from .extraction_config import extraction_config
+from .extraction_result import ExtractionResult
+
+# Import config from project root
+try:
+    import config
+except ImportError:
+    # Fallback if running from different context
+    from ....config import config
+
+logger = logging.getLogger(__name__)
+
+# Same minimum as the interactive routes
+MIN_TEXT_LENGTH = 10
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class BulkItem:
+    """One file to extract; item_id identifies it in the output and checkpoint"""
+    item_id: str
+    path: str
+
+
+def iter_bulk_items(source: str) -> Iterator[BulkItem]:
+    """
+    List the CV files of a bulk extraction.
+
+    Args:
+        source: A directory (searched recursively for supported file types) or a
+            manifest file with one entry per line: a path, or a JSON object with
+            "path" and optional "id". Relative paths are resolved against the
+            manifest's directory; blank lines and lines starting with # are skipped.
+
+    Raises:
+        FileNotFoundError: source does not exist
+        ValueError: a manifest line is not a path or a JSON object with "path"
+    """
+    source_path = Path(source)
+    if not source_path.exists():
+        raise FileNotFoundError(f"Bulk extraction source not found: {source}")
+
+    if source_path.is_dir():
+        for path in sorted(source_path.rglob("*")):
+            if path.is_file() and path.suffix.lower() in config.ALLOWED_EXTENSIONS:
+                yield BulkItem(path.relative_to(source_path).as_posix(), str(path))
+        return
+
+    with open(source_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                entry = json.loads(line)
+                if not entry.get("path"):
+                    raise ValueError(f"Manifest line {line_number} has no \"path\"")
+                entry_path, item_id = entry["path"], entry.get("id") or entry["path"]
+            else:
+                entry_path = item_id = line
+            yield BulkItem(str(item_id), str(source_path.parent / entry_path))
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 of a file's content (the cache key used for uploads)"""
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class BulkCheckpoint:
+    """
+    Append-only JSONL output of a bulk run, read back on start to resume.
+
+    Every record is flushed and synced as soon as its file finishes. A record
+    cut off by a crash is ignored; the file is re-extracted.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.path.exists():
+            with open(self.path, 'rb') as f:
+                content = f.read()
+            for line in content.decode('utf-8', errors='replace').splitlines():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self.records[record["id"]] = record  # Later records supersede earlier ones
+            if content and not content.endswith(b"\n"):
+                with open(self.path, 'ab') as f:
+                    f.write(b"\n")  # Keep the next record off the truncated line
+            logger.info(f"Resuming from {self.path} ({len(self.records)} files already recorded)")
+
+        self._file = None
+
+    def is_done(self, item_id: str, retry_failed: bool = False) -> bool:
+        """Whether a file is recorded (and, with retry_failed, completed)"""
+        record = self.records.get(item_id)
+        if record is None:
+            return False
+        return record["status"] == "completed" or not retry_failed
+
+    def append(self, record: Dict[str, Any]):
+        """Write a record durably"""
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.records[record["id"]] = record
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class BulkExtractor:
+    """
+    Extracts many CV files concurrently into a JSONL file.
+
+    Text extraction (PDF parsing, OCR) runs in threads, at most text_concurrency
+    at a time; LLM extraction runs at most concurrency at a time, each call in
+    a slot of the extraction admission controller shared with interactive
+    extractions. Workers move on to the next file's text while earlier files
+    wait for the LLM, so both stages stay busy. Identical files (same hash) are
+    extracted once.
+    """
+
+    def __init__(self, output_path: str, concurrency: int = 4, text_concurrency: int = 2,
+                 use_cache: bool = True, retry_failed: bool = False,
+                 extractor_factory: Optional[Callable[[], Any]] = None,
+                 text_extract: Optional[Callable[[str], str]] = None,
+                 on_record: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 admission: Optional[Any] = None):
+        """
+        Args:
+            output_path: JSONL file for results; an existing file is resumed
+            concurrency: Maximum LLM extractions at once
+            text_concurrency: Maximum text extractions (PDF parsing/OCR) at once
+            use_cache: Reuse and fill the text and extraction caches
+            retry_failed: Re-extract files recorded as failed in the output
+            extractor_factory: Creates a DataExtractor (default: create_data_extractor)
+            text_extract: Extracts text from a file path (default: text_extractor)
+            on_record: Called with every record written (progress reporting)
+            admission: AdmissionController for LLM calls (default: extraction_admission)
+        """
+        if extractor_factory is None:
+            from .data_extractor import create_data_extractor
+            extractor_factory = create_data_extractor
+        if text_extract is None:
+            from src.core.local.text_extractor import text_extractor
+            text_extract = text_extractor.extract_text
+        if admission is None:
+            from src.services.admission_control import extraction_admission
+            admission = extraction_admission
+
+        self.checkpoint = BulkCheckpoint(output_path)
+        self.concurrency = concurrency
+        self.text_concurrency = text_concurrency
+        self.use_cache = use_cache
+        self.retry_failed = retry_failed
+        self.extractor_factory = extractor_factory
+        self.text_extract = text_extract
+        self.on_record = on_record
+        self.admission = admission
+        self.stats = {"completed": 0, "partial": 0, "failed": 0, "skipped": 0, "cached": 0}
+
+    async def run(self, items: Iterable[BulkItem]) -> Dict[str, Any]:
+        """
+        Extract every item not already recorded in the output.
+
+        Returns:
+            Summary with completed/partial/failed/skipped/cached counts and elapsed seconds
+        """
+        started = time.perf_counter()
+        self._llm_slots = asyncio.Semaphore(self.concurrency)
+        self._text_slots = asyncio.Semaphore(self.text_concurrency)
+        workers = self.concurrency + self.text_concurrency
+        # Bounded so a manifest of thousands is read as workers free up
+        queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+
+        async def worker():
+            while True:
+                item = await queue.get()
+                try:
+                    if item is None:
+                        return
+                    self._record(await self._process(item))
+                finally:
+                    queue.task_done()
+
+        async def feed():
+            for item in items:
+                if self.checkpoint.is_done(item.item_id, self.retry_failed):
+                    self.stats["skipped"] += 1
+                    continue
+                await queue.put(item)
+            for _ in range(workers):
+                await queue.put(None)
+
+        tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+        tasks.append(asyncio.create_task(feed()))
+        try:
+            # A failing worker (e.g. the output disk is full) stops the run
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.checkpoint.close()
+
+        summary = dict(self.stats, elapsed=round(time.perf_counter() - started, 3))
+        logger.info(
+            f"Bulk extraction finished: {summary['completed']} completed ({summary['cached']} from cache), "
+            f"{summary['partial']} partial, {summary['failed']} failed, {summary['skipped']} already done, {summary['elapsed']}s"
+        )
+        return summary
+
+    def _record(self, record: Dict[str, Any]):
+        self.checkpoint.append(record)
+        self.stats[record["status"]] += 1
+        if record.get("source") == "cache":
+            self.stats["cached"] += 1
+        if self.on_record:
+            self.on_record(record)
+
+    async def _process(self, item: BulkItem) -> Dict[str, Any]:
+        """Extract one file, returning its output record (failures included)"""
+        from src.api.db import get_cached_extraction
+
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+        record: Dict[str, Any] = {"id": item.item_id, "path": item.path}
+
+        def lap(stage: str, since: float) -> float:
+            now = time.perf_counter()
+            timings[stage] = round(now - since, 3)
+            return now
+
+        try:
+            file_hash = await asyncio.to_thread(hash_file, item.path)
+            record["file_hash"] = file_hash
+            mark = lap("hash", started)
+
+            cached = get_cached_extraction(file_hash) if self.use_cache else None
+            if cached:
+                record.update(
+                    status="completed", source="cache",
+                    confidence=cached['confidence_score'], cv_data=json.loads(cached['cv_data'])
+                )
+            else:
+                text = await self._text(file_hash, item.path, record)
+                mark = lap("text", mark)
+                result = await self._extract(file_hash, text)
+                lap("llm", mark)
+                record.update(
+                    status="partial" if result.is_partial else "completed", source="extraction",
+                    confidence=result.confidence, cv_data=json.loads(result.cv_data_json)
+                )
+        except Exception as e:
+            logger.warning(f"Bulk extraction failed for {item.item_id}: {e}")
+            record.update(status="failed", error=str(e))
+
+        timings["total"] = round(time.perf_counter() - started, 3)
+        record["timings"] = timings
+        record["finished_at"] = datetime.utcnow().isoformat()
+        return record
+
+    async def _text(self, file_hash: str, path: str, record: Dict[str, Any]) -> str:
+        """Text of a file, from the text cache or extracted (and cached)"""
+        from src.api.db import get_cached_text, cache_extracted_text
+
+        text = get_cached_text(file_hash) if self.use_cache else None
+        record["text_source"] = "cache" if text is not None else "extraction"
+        if text is None:
+            async with self._text_slots:
+                # PDF parsing and OCR block - keep them off the event loop
+                text = await asyncio.to_thread(self.text_extract, path)
+            if self.use_cache and text and len(text.strip()) >= MIN_TEXT_LENGTH:
+                cache_extracted_text(file_hash, text)
+        if not text or len(text.strip()) < MIN_TEXT_LENGTH:
+            raise ValueError("No text content found in file")
+        return text
+
+    async def _extract(self, file_hash: str, text: str) -> ExtractionResult:
+        """LLM extraction; identical files extracting at once share one call"""
+        from src.api.db import cache_extraction_result
+        from src.services.single_flight import extraction_single_flight
+
+        async def extract():
+            async with self._llm_slots:
+                return await self._admitted(lambda: self.extractor_factory().extract_cv_result(text))
+
+        result = await extraction_single_flight.run(file_hash, extract)
+        if not result:
+            raise RuntimeError("CV data extraction returned None")
+
+        if self.use_cache and not result.is_partial and result.confidence >= CACHE_MIN_CONFIDENCE:
+            cache_extraction_result(
+                file_hash=file_hash,
+                cv_data=result.cv_data_json,
+                extraction_model=result.extraction_model,
+                temperature=extraction_config.TEMPERATURE,
+                confidence_score=result.confidence
+            )
+        return result
+
+    async def _admitted(self, extract: Callable[[], Any]) -> ExtractionResult:
+        """Run an extraction in an admission slot, backing off while extractions are being shed"""
+        from src.services.admission_control import AdmissionRejected
+
+        while True:
+            try:
+                async with self.admission.admit():
+                    return await extract()
+            except AdmissionRejected as e:
+                retry_after = int(e.headers["Retry-After"])
+                logger.info(f"Bulk extraction backing off {retry_after}s ({e.reason})")
+                await asyncio.sleep(retry_after)
@@ -13,6 +13,8 @@ from enum import Enum
 import asyncio
 from functools import wraps
 
+from .deadline import DeadlineExceededError
+
 logger = logging.getLogger(__name__)
 
 
@@ -93,6 +95,9 @@ class CircuitBreaker:
         """Async context manager exit"""
         if exc_type is None:
             await self._on_success()
+        elif issubclass(exc_type, (asyncio.CancelledError, DeadlineExceededError)):
+            # Caller gave up (disconnect or deadline) - says nothing about service health
+            pass
         else:
             await self._on_failure(exc_val)
         return False  # Don't suppress exceptions
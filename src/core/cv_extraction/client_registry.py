@@ -0,0 +1,204 @@
+"""
+Process-wide Anthropic client registry
+Shares one connection-pooled AsyncAnthropic client per API key so HTTP/TLS
+connections are reused across requests instead of re-established per upload
+"""
+import asyncio
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set
+
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional 'h2' package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@dataclass
+class ClientPoolConfig:
+    """Connection pool settings for shared Anthropic clients"""
+    max_connections: int = 50            # Hard cap on sockets per API key (fd pressure)
+    max_keepalive_connections: int = 20  # Idle connections kept warm between requests
+    keepalive_expiry: float = 60.0       # Seconds an idle connection stays reusable
+    connect_timeout: float = 10.0        # TCP + TLS handshake timeout
+    read_timeout: float = 600.0          # Long completions can take minutes
+    http2: bool = HTTP2_AVAILABLE        # Multiplex requests when h2 is installed
+
+
+@dataclass
+class ClientPoolStats:
+    """Connection reuse statistics for one shared client"""
+    requests: int = 0
+    new_connections: int = 0
+    tls_handshakes: int = 0
+    handles_issued: int = 0
+    clients_created: int = 0
+
+    @property
+    def reused_requests(self) -> int:
+        """Requests served on an already open connection"""
+        return max(self.requests - self.new_connections, 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        reuse_rate = self.reused_requests / self.requests if self.requests else 0.0
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "tls_handshakes": self.tls_handshakes,
+            "reused_requests": self.reused_requests,
+            "connection_reuse_rate": round(reuse_rate, 3),
+            "handles_issued": self.handles_issued,
+            "clients_created": self.clients_created
+        }
+
+
+@dataclass
+class _RegistryEntry:
+    client: AsyncAnthropic
+    loop: Optional[asyncio.AbstractEventLoop]
+    stats: ClientPoolStats = field(default_factory=ClientPoolStats)
+
+
+class AnthropicClientRegistry:
+    """
+    One shared AsyncAnthropic client per API key.
+
+    Clients are bound to the event loop they are first used on; if a caller runs on
+    a different loop (e.g. a script calling asyncio.run twice) a fresh client is
+    created, since pooled connections cannot move between loops. The replaced
+    client is closed so its connection pool does not leak.
+    """
+
+    def __init__(self, config: Optional[ClientPoolConfig] = None):
+        self.config = config or ClientPoolConfig()
+        self._entries: Dict[str, _RegistryEntry] = {}
+        self._lock = threading.Lock()
+        self._closing: Set[asyncio.Task] = set()  # Keeps close tasks of replaced clients alive
+
+    @staticmethod
+    def _key_id(api_key: str) -> str:
+        """Stable, non-reversible identifier for an API key"""
+        return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+    @staticmethod
+    def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def get_client(self, api_key: str) -> AsyncAnthropic:
+        """
+        Get the shared client for an API key, creating it on first use.
+
+        Args:
+            api_key: Anthropic API key
+
+        Returns:
+            Shared AsyncAnthropic client
+        """
+        if not api_key:
+            raise ValueError("API key required for Anthropic client")
+
+        key_id = self._key_id(api_key)
+        loop = self._running_loop()
+        replaced = None
+
+        with self._lock:
+            entry = self._entries.get(key_id)
+            if entry and entry.loop is None and loop is not None:
+                entry.loop = loop  # First use inside an event loop binds the client
+            if entry is None or (loop is not None and entry.loop is not loop):
+                replaced = entry
+                stats = entry.stats if entry else ClientPoolStats()
+                entry = _RegistryEntry(client=self._create_client(api_key, stats), loop=loop, stats=stats)
+                entry.stats.clients_created += 1
+                self._entries[key_id] = entry
+                logger.info(
+                    f"Created shared Anthropic client {key_id[:8]} "
+                    f"(max_connections={self.config.max_connections}, http2={self.config.http2})"
+                )
+            entry.stats.handles_issued += 1
+            client = entry.client
+
+        if replaced is not None:
+            self._close_replaced(replaced, loop)
+        return client
+
+    def _close_replaced(self, entry: _RegistryEntry, loop: asyncio.AbstractEventLoop):
+        """Close a client replaced for another event loop, on its own loop while that still runs"""
+        if entry.loop.is_running() and not entry.loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._close_client(entry.client), entry.loop)
+            return
+        task = loop.create_task(self._close_client(entry.client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_client(client: AsyncAnthropic):
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close Anthropic client: {e}")
+
+    def _create_client(self, api_key: str, stats: ClientPoolStats) -> AsyncAnthropic:
+        """Build a client whose httpx pool reports connection events into stats"""
+
+        async def trace(event_name: str, info: Dict[str, Any]):
+            if event_name == "connection.connect_tcp.complete":
+                stats.new_connections += 1
+            elif event_name == "connection.start_tls.complete":
+                stats.tls_handshakes += 1
+
+        async def on_request(request: httpx.Request):
+            stats.requests += 1
+            request.extensions["trace"] = trace
+
+        http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry
+            ),
+            timeout=httpx.Timeout(self.config.read_timeout, connect=self.config.connect_timeout),
+            http2=self.config.http2,
+            event_hooks={"request": [on_request]}
+        )
+        return AsyncAnthropic(api_key=api_key, http_client=http_client)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Connection reuse statistics per API key identifier"""
+        with self._lock:
+            clients = {key_id[:8]: entry.stats.to_dict() for key_id, entry in self._entries.items()}
+        return {
+            "http2": self.config.http2,
+            "max_connections": self.config.max_connections,
+            "max_keepalive_connections": self.config.max_keepalive_connections,
+            "clients": clients
+        }
+
+    async def aclose(self):
+        """Close all pooled connections (call on application shutdown)"""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            await self._close_client(entry.client)
+
+
+# Global registry instance
+anthropic_client_registry = AnthropicClientRegistry()
+
+
+def get_anthropic_client(api_key: str) -> AsyncAnthropic:
+    """Get the process-wide shared Anthropic client for an API key"""
+    return anthropic_client_registry.get_client(api_key)
@@ -3,19 +3,28 @@ Data Extraction Coordinator for RESUME2WEBSITE MVP
 Orchestrates CV extraction using specialized services
 """
 import asyncio
+import copy
 import logging
 import time
 import uuid
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Callable, Union
 
 from pydantic import ValidationError
 
 # Import all services
 from .llm_service import get_llm_service
 from .section_extractor import SectionExtractor
-from .enhancement_processor import enhancement_processor
+from .enhancement_processor import enhancement_processor, enhancement_engine
 from .post_processor import post_processor
+from .hallucination_validator import HallucinationValidator, SourceTextIndex
+from .extraction_config import extraction_config
 from .metrics import ExtractionMetrics, metrics_collector, Timer, SectionTimer, estimate_tokens
+from .streaming_parser import IncrementalJSONParser
+from .deadline import ExtractionDeadline, CancelCheck
+from .extraction_result import ExtractionResult
+from .revision_diff import diff_revision
+from .validated_sections import assemble_cv_data
+from src.core.local.text_normalizer import text_normalizer
 
 # Import schemas
 from src.core.schemas.unified_nullable import (
@@ -29,6 +38,12 @@ from src.core.schemas.unified_nullable import (
 
 logger = logging.getLogger(__name__)
 
+# Receives extraction progress events such as
+# {"event": "partial_item", "section": "experience", "key": "experienceItems", "item": {...}}
+# Partial items are provisional: a "section_reset" event retracts those already sent for a
+# section before it is retried or escalated, and its final section event replaces them.
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
 
 class DataExtractor:
     """
@@ -67,16 +82,49 @@ class DataExtractor:
         model_info = self.llm_service.get_model_info()
         logger.info(f"DataExtractor initialized - Model: {model_info['model']}, Deterministic: {model_info['deterministic']}")
     
-    async def extract_cv_data(self, raw_text: str) -> CVData:
+    async def extract_cv_data(self, raw_text: str,
+                              progress_callback: Optional[ProgressCallback] = None,
+                              deadline_seconds: Optional[float] = None,
+                              cancel_check: Optional[CancelCheck] = None) -> CVData:
+        """
+        Extract CV data, returning only the CVData object.
+        
+        Callers that also need confidence, validation issues or the serialized
+        data should use extract_cv_result instead of recomputing them.
+        """
+        result = await self.extract_cv_result(raw_text, progress_callback, deadline_seconds, cancel_check)
+        return result.cv_data
+    
+    async def extract_cv_result(self, raw_text: str,
+                                progress_callback: Optional[ProgressCallback] = None,
+                                deadline_seconds: Optional[float] = None,
+                                cancel_check: Optional[CancelCheck] = None,
+                                prior_cv_data: Optional[Dict[str, Any]] = None,
+                                prior_text: Optional[str] = None) -> ExtractionResult:
         """
         Main extraction pipeline - coordinates all services to extract CV data.
         Now with comprehensive performance metrics!
         
         Args:
-            raw_text: The raw CV text to extract from
+            raw_text: The raw CV text to extract from. It may keep its line breaks
+                (text_extractor's preserve_line_breaks); prompts get it collapsed onto
+                one line and the line structure is only used to diff against prior_text.
+            progress_callback: Optional callback for streaming mode. When given, section
+                responses are streamed and section_started / partial_item /
+                section_completed / section_failed events are reported as they happen.
+            deadline_seconds: Optional overall time budget. Every section call and retry is
+                bounded by it; sections still running when it expires are cancelled.
+            cancel_check: Optional async predicate (e.g. request.is_disconnected); once it
+                returns True all in-flight section calls are cancelled.
+            prior_cv_data: Optional previous extraction of an earlier version of this CV
+                (model_dump_nullable form). With prior_text, only the sections the
+                revision changed are re-extracted; the rest are taken from it.
+            prior_text: Text prior_cv_data was extracted from (line-preserving, like raw_text)
             
         Returns:
-            CVData object with all extracted information
+            ExtractionResult with the CVData, its serialized form, confidence, validation
+            issues and metrics. If the deadline expired or the caller went away, the result
+            is partial and missing_sections lists what was cut off.
         """
         # Start metrics collection (use sync version since we're already in async context)
         extraction_id = str(uuid.uuid4())[:8]
@@ -87,12 +135,16 @@ class DataExtractor:
         start_time = time.time()
         
         try:
+            # Lines only matter for diffing revisions - prompts get the collapsed text
+            revision_text = raw_text
+            raw_text = text_normalizer.normalize(raw_text)
+            
             # Validate input
             if not raw_text or not raw_text.strip():
                 logger.warning("Empty text provided for extraction")
                 metrics.errors.append({"type": "empty_input", "message": "Empty text provided"})
                 metrics_collector.end_extraction_sync(extraction_id, success=False)
-                return CVData()
+                return ExtractionResult.build(CVData(), 0.0, metrics=metrics)
             
             # Track input size
             metrics.input_text_length = len(raw_text)
@@ -100,30 +152,44 @@ class DataExtractor:
             
             logger.info(f"Starting CV extraction pipeline - {len(raw_text)} characters")
             
-            # Step 1: Extract sections in parallel (with timing)
+            deadline = None
+            if deadline_seconds is not None or cancel_check is not None:
+                deadline = ExtractionDeadline(deadline_seconds, cancel_check)
+            
+            # Sections a revised CV shares with its previous extraction are not re-extracted
+            reused_sections = self._reusable_sections(revision_text, prior_cv_data, prior_text)
+            metrics.sections_reused = len(reused_sections)
+            
+            # Step 1: Extract sections in parallel (with timing). The source text is
+            # indexed once here for every section's escalation check.
             extraction_start = time.time()
-            extracted_sections = await self._extract_all_sections_with_metrics(raw_text, metrics)
+            extracted_sections = await self._extract_all_sections_with_metrics(
+                raw_text, metrics, progress_callback, deadline,
+                [name for name in self.SECTION_SCHEMAS if name not in reused_sections],
+                source_index=SourceTextIndex(raw_text)
+            )
             metrics.text_extraction_time = time.time() - extraction_start
             
-            # Step 2: Apply enhancements (with timing)
+            # Step 2: Apply enhancements (with timing) - reused sections were enhanced last time
             with Timer(metrics, 'post_processing_time'):
-                enhanced_data = self._apply_enhancements(extracted_sections, raw_text)
+                enhanced_data = self._apply_enhancements(extracted_sections, raw_text, metrics)
             
             # Step 3: Create CV object and apply post-processing (with timing)
             validation_start = time.time()
-            cv_data = self._create_and_process_cv_data(enhanced_data, raw_text)
+            result = self._create_and_process_cv_data(
+                enhanced_data, raw_text, metrics,
+                reused={name: data for name, data in reused_sections.items() if data is not None}
+            )
             metrics.validation_time = time.time() - validation_start
             
             # Calculate total time
             metrics.total_time = time.time() - start_time
-            
-            # Calculate extraction confidence
-            metrics.extraction_confidence = self.calculate_extraction_confidence(cv_data, raw_text)
+            metrics.extraction_confidence = result.confidence
             
             # Mark as successful
             metrics_collector.end_extraction_sync(extraction_id, success=True)
             
-            return cv_data
+            return result
             
         except Exception as e:
             # Track error
@@ -133,7 +199,11 @@ class DataExtractor:
             metrics_collector.end_extraction_sync(extraction_id, success=False)
             raise
     
-    async def _extract_all_sections_with_metrics(self, raw_text: str, metrics: ExtractionMetrics) -> Dict[str, Any]:
+    async def _extract_all_sections_with_metrics(self, raw_text: str, metrics: ExtractionMetrics,
+                                                 progress_callback: Optional[ProgressCallback] = None,
+                                                 deadline: Optional[ExtractionDeadline] = None,
+                                                 section_names: Optional[List[str]] = None,
+                                                 source_index: Optional[SourceTextIndex] = None) -> Dict[str, Any]:
         """
         Extract all CV sections in parallel with metrics tracking.
         Now with concurrency limiting to prevent API overload.
@@ -141,11 +211,21 @@ class DataExtractor:
         Args:
             raw_text: The raw CV text
             metrics: Metrics object to track performance
+            progress_callback: Optional callback for streaming progress events
+            deadline: Optional deadline; sections unfinished at expiry or cancellation
+                are cancelled and recorded in metrics.missing_sections
+            section_names: Sections to extract (default: all of SECTION_SCHEMAS)
+            source_index: Index of raw_text shared by the sections' escalation checks
+                (built here when not given)
             
         Returns:
             Dictionary of extracted sections
         """
-        metrics.sections_requested = len(self.SECTION_SCHEMAS)
+        if section_names is None:
+            section_names = list(self.SECTION_SCHEMAS)
+        if source_index is None:
+            source_index = SourceTextIndex(raw_text)
+        metrics.sections_requested = len(section_names)
         
         # Limit concurrent API calls to prevent overload
         MAX_CONCURRENT_CALLS = 4  # Process 4 sections at a time
@@ -156,43 +236,311 @@ class DataExtractor:
             async with semaphore:  # Acquire semaphore before making API call
                 with SectionTimer(metrics, section_name):
                     logger.debug(f"Starting extraction for section: {section_name}")
-                    result = await self.section_extractor.extract(
-                        section_name=section_name,
-                        raw_text=raw_text,
-                        llm_caller=self.llm_service.call_llm
+                    self._notify(progress_callback, {"event": "section_started", "section": section_name})
+                    result = await self._extract_section_tiered(
+                        section_name, raw_text, metrics, progress_callback, deadline, source_index
                     )
                     if result and result.get(section_name) is not None:
                         metrics.sections_extracted += 1
                         logger.debug(f"Successfully extracted section: {section_name}")
+                        event = {"event": "section_completed", "section": section_name,
+                                 "data": result[section_name]}
                     else:
                         metrics.sections_failed += 1
                         logger.debug(f"Failed to extract section: {section_name}")
+                        event = {"event": "section_failed", "section": section_name}
+                        if deadline is not None and deadline.expired:
+                            # Cut off by the deadline rather than absent from the CV
+                            metrics.missing_sections.append(section_name)
+                            event["reason"] = "deadline"
+                    event["completed"] = metrics.sections_extracted + metrics.sections_failed
+                    event["total"] = metrics.sections_requested
+                    self._notify(progress_callback, event)
                     return result
         
-        tasks = [extract_with_timing(section_name) for section_name in self.SECTION_SCHEMAS.keys()]
+        tasks = {
+            asyncio.create_task(extract_with_timing(section_name)): section_name
+            for section_name in section_names
+        }
         
         # Execute all tasks with controlled concurrency
         logger.info(f"Starting extraction of {len(tasks)} sections with max {MAX_CONCURRENT_CALLS} concurrent calls")
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            if deadline is not None:
+                await self._wait_until_deadline(set(tasks), deadline)
+            elif tasks:  # Empty when a revised CV changed no section
+                await asyncio.wait(tasks)
+        finally:
+            # Cancel stragglers (deadline, disconnect, or this coroutine being cancelled)
+            stragglers = [task for task in tasks if not task.done()]
+            for task in stragglers:
+                task.cancel()
+            if stragglers:
+                await asyncio.gather(*stragglers, return_exceptions=True)
+        
+        if stragglers:
+            reason = "cancelled" if deadline.cancelled else "deadline"
+            metrics.cancelled = deadline.cancelled
+            metrics.errors.append({"type": f"extraction_{reason}",
+                                   "message": f"{len(stragglers)} sections cut off"})
+            for task in stragglers:
+                section_name = tasks[task]
+                metrics.sections_failed += 1
+                metrics.missing_sections.append(section_name)
+                self._notify(progress_callback, {
+                    "event": "section_failed", "section": section_name, "reason": reason,
+                    "completed": metrics.sections_extracted + metrics.sections_failed,
+                    "total": metrics.sections_requested
+                })
         
         # Combine results
         combined_data = {}
-        for result in results:
-            if isinstance(result, dict):
-                combined_data.update(result)
-            elif isinstance(result, Exception):
-                logger.error(f"Section extraction error: {result}")
-                metrics.errors.append({"type": "section_error", "message": str(result)})
+        for task in tasks:
+            if task.cancelled():
+                continue
+            if task.exception() is not None:
+                logger.error(f"Section extraction error: {task.exception()}")
+                metrics.errors.append({"type": "section_error", "message": str(task.exception())})
+            elif isinstance(task.result(), dict):
+                combined_data.update(task.result())
         
         logger.info(f"Extracted {metrics.sections_extracted}/{metrics.sections_requested} sections")
         return combined_data
     
-    async def _extract_all_sections(self, raw_text: str) -> Dict[str, Any]:
+    def _reusable_sections(self, raw_text: str, prior_cv_data: Optional[Dict[str, Any]],
+                           prior_text: Optional[str]) -> Dict[str, Any]:
+        """
+        Sections of a previous extraction that a revised CV left unchanged.
+        
+        The two texts are diffed line by line and changed lines are mapped to
+        sections by their headings (see revision_diff). Edits too large to
+        localize reuse nothing, so the CV is extracted in full; added lines
+        under a heading we don't recognize also re-extract every section the
+        previous extraction did not find.
+        
+        Args:
+            raw_text: Text of the revised CV
+            prior_cv_data: Previous extraction (model_dump_nullable form), or None
+            prior_text: Text the previous extraction was made from, or None
+            
+        Returns:
+            Copies of the reusable sections keyed by section name (None for
+            sections the previous extraction did not find)
+        """
+        if not prior_cv_data or not prior_text or not extraction_config.ENABLE_INCREMENTAL_EXTRACTION:
+            return {}
+        
+        diff = diff_revision(
+            prior_text, raw_text, [name for name in self.SECTION_SCHEMAS if prior_cv_data.get(name)]
+        )
+        if diff.full:
+            logger.info(f"Revision changed {diff.changed_lines}/{diff.total_lines} lines - extracting in full")
+            return {}
+        
+        redo = set(diff.sections)
+        if diff.unlocated_additions:
+            # New lines may hold a section the prior extraction did not find
+            redo.update(name for name in self.SECTION_SCHEMAS if not prior_cv_data.get(name))
+        reused = {
+            name: copy.deepcopy(prior_cv_data.get(name))
+            for name in self.SECTION_SCHEMAS if name not in redo
+        }
+        logger.info(f"Revision changed {diff.changed_lines}/{diff.total_lines} lines - re-extracting "
+                    f"{sorted(set(self.SECTION_SCHEMAS) - set(reused))}, reusing {len(reused)} sections")
+        return reused
+    
+    @staticmethod
+    async def _wait_until_deadline(pending: set, deadline: ExtractionDeadline):
+        """
+        Wait for section tasks until all finish, the deadline passes or the caller goes away.
+        
+        Args:
+            pending: Section extraction tasks
+            deadline: Deadline to enforce (cancel_check is polled between waits)
+        """
+        while pending:
+            if deadline.expired or await deadline.is_cancelled():
+                logger.warning(f"Stopping extraction with {len(pending)} sections in flight "
+                               f"({'caller disconnected' if deadline.cancelled else 'deadline exceeded'})")
+                return
+            remaining = deadline.remaining()
+            timeout = extraction_config.DEADLINE_POLL_INTERVAL
+            if remaining is not None:
+                timeout = min(timeout, remaining)
+            _, pending = await asyncio.wait(pending, timeout=timeout)
+    
+    async def _extract_section_tiered(self, section_name: str, raw_text: str,
+                                      metrics: ExtractionMetrics,
+                                      progress_callback: Optional[ProgressCallback] = None,
+                                      deadline: Optional[ExtractionDeadline] = None,
+                                      source_index: Optional[SourceTextIndex] = None) -> Dict[str, Any]:
+        """
+        Extract a section on its routed model tier, escalating when the result fails checks.
+        
+        Sections are routed through extraction_config.SECTION_MODEL_TIERS. A result from a
+        cheaper tier that fails schema validation or the hallucination checks is
+        re-extracted once on the escalation tier.
+        
+        Args:
+            section_name: Section to extract
+            raw_text: The raw CV text
+            metrics: Metrics object to record per-tier calls and escalations
+            progress_callback: Optional callback for streaming progress events
+            deadline: Optional deadline; no escalation is attempted once it has expired
+            source_index: Index of raw_text for the hallucination checks (default: index raw_text)
+            
+        Returns:
+            Dictionary with section_name as key and extracted data as value
+        """
+        tier = extraction_config.get_model_tier(section_name)
+        result, empty = await self._extract_on_tier(section_name, raw_text, tier, metrics, progress_callback, deadline)
+        
+        escalation_tier = extraction_config.ESCALATION_TIER
+        if (tier != escalation_tier and not (deadline is not None and deadline.expired)
+                and self._needs_escalation(section_name, result, source_index or raw_text, empty_response=empty)):
+            logger.info(f"Escalating section '{section_name}' from {tier} to {escalation_tier} tier")
+            metrics.record_escalation(section_name, tier)
+            # Items streamed by the cheaper tier may not survive re-extraction
+            self._notify(progress_callback, {
+                "event": "section_reset", "section": section_name, "reason": "escalation"
+            })
+            result, _ = await self._extract_on_tier(
+                section_name, raw_text, escalation_tier, metrics, progress_callback, deadline
+            )
+        
+        return result
+    
+    async def _extract_on_tier(self, section_name: str, raw_text: str, tier: str,
+                               metrics: ExtractionMetrics,
+                               progress_callback: Optional[ProgressCallback] = None,
+                               deadline: Optional[ExtractionDeadline] = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        Run one section extraction on a model tier, recording latency and estimated cost.
+        
+        Returns:
+            The section result, and whether the model answered that the section is absent
+        """
+        llm_caller = self._get_llm_caller(
+            section_name, progress_callback, model=extraction_config.get_tier_model(tier), deadline=deadline
+        )
+        
+        responses = []
+        
+        async def tracked_caller(prompt: str, name: str) -> Tuple[str, str]:
+            start = time.time()
+            response_text = ""
+            try:
+                model_used, response_text = await llm_caller(prompt, name)
+                responses.append((model_used, response_text))
+                return model_used, response_text
+            finally:
+                cost = extraction_config.estimate_tier_cost(
+                    tier, estimate_tokens(prompt), estimate_tokens(response_text)
+                )
+                metrics.record_llm_call(tier, time.time() - start, cost)
+        
+        result = await self.section_extractor.extract(
+            section_name=section_name,
+            raw_text=raw_text,
+            llm_caller=tracked_caller
+        )
+        empty = bool(responses) and SectionExtractor.is_empty_response(*responses[-1], section_name)
+        if responses and result and result.get(section_name) is not None:
+            metrics.section_models[section_name] = responses[-1][0]
+        return result, empty
+    
+    @staticmethod
+    def _needs_escalation(section_name: str, result: Optional[Dict[str, Any]],
+                          source: Union[str, SourceTextIndex], empty_response: bool = False) -> bool:
+        """
+        Check whether a section result should be re-extracted on the escalation tier.
+        
+        A section escalates when parsing or schema validation failed (no data) or when
+        HallucinationValidator reports issues for any of its item lists. A section the
+        model correctly reported as absent (empty_response) is not escalated.
+        source is the raw CV text or the extraction's SourceTextIndex of it.
+        """
+        data = result.get(section_name) if result else None
+        if data is None:
+            return not empty_response
+        
+        # The validator cleans data in place, so check a copy. Only item lists are
+        # checked here; titles and free text are handled by the post-processor.
+        checked = copy.deepcopy(data)
+        values = [v for v in checked.values() if isinstance(v, list)] if isinstance(checked, dict) else [checked]
+        source_index = SourceTextIndex.of(source)
+        for value in values:
+            _, issues = HallucinationValidator.validate_section(value, source_index, section_name)
+            if issues:
+                logger.debug(f"Section '{section_name}' failed hallucination checks: {issues[:3]}")
+                return True
+        return False
+    
+    def _get_llm_caller(self, section_name: str,
+                        progress_callback: Optional[ProgressCallback] = None,
+                        model: Optional[str] = None,
+                        deadline: Optional[ExtractionDeadline] = None) -> Callable:
+        """
+        Choose the LLM caller for a section.
+        
+        Without a progress callback the regular blocking call is used. With one, the
+        response is streamed through an IncrementalJSONParser and every completed
+        array item is reported as a partial_item event. When a failed call is retried
+        after items were reported, a section_reset event retracts them first.
+        
+        Args:
+            section_name: Section being extracted
+            progress_callback: Optional callback for streaming progress events
+            model: Optional model override from tiered routing
+            deadline: Optional deadline bounding the call and its retries
+            
+        Returns:
+            Async callable with the call_llm signature
+        """
+        if progress_callback is None:
+            async def caller(prompt: str, name: str) -> Tuple[str, str]:
+                return await self.llm_service.call_llm(prompt, name, model=model, deadline=deadline)
+            
+            return caller
+        
+        def on_item(key: Optional[str], item: Any):
+            self._notify(progress_callback, {
+                "event": "partial_item",
+                "section": section_name,
+                "key": key,
+                "item": item
+            })
+        
+        def on_reset():
+            self._notify(progress_callback, {"event": "section_reset", "section": section_name, "reason": "retry"})
+        
+        parser = IncrementalJSONParser(on_item=on_item, on_reset=on_reset)
+        
+        async def streaming_caller(prompt: str, name: str) -> Tuple[str, str]:
+            return await self.llm_service.call_llm_streaming(
+                prompt, name, parser=parser, model=model, deadline=deadline
+            )
+        
+        return streaming_caller
+    
+    @staticmethod
+    def _notify(progress_callback: Optional[ProgressCallback], event: Dict[str, Any]):
+        """Deliver a progress event, never letting a consumer failure break extraction."""
+        if progress_callback is None:
+            return
+        try:
+            progress_callback(event)
+        except Exception as e:
+            logger.warning(f"Progress callback failed for {event.get('event')}: {e}")
+    
+    async def _extract_all_sections(self, raw_text: str,
+                                    deadline: Optional[ExtractionDeadline] = None) -> Dict[str, Any]:
         """
         Extract all CV sections in parallel with concurrency limiting.
         
         Args:
             raw_text: The raw CV text
+            deadline: Optional deadline bounding the calls and the sequential retries
             
         Returns:
             Dictionary of extracted sections
@@ -206,7 +554,7 @@ class DataExtractor:
                 return await self.section_extractor.extract(
                     section_name=section_name,
                     raw_text=raw_text,
-                    llm_caller=self.llm_service.call_llm
+                    llm_caller=self._get_llm_caller(section_name, deadline=deadline)
                 )
         
         # Create extraction tasks for all sections
@@ -232,12 +580,13 @@ class DataExtractor:
         
         # Retry failed sections sequentially
         if failed_sections:
-            extracted_data = await self._retry_failed_sections(failed_sections, raw_text, extracted_data)
+            extracted_data = await self._retry_failed_sections(failed_sections, raw_text, extracted_data, deadline)
         
         return extracted_data
     
     async def _retry_failed_sections(self, failed_sections: list, raw_text: str, 
-                                    extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+                                    extracted_data: Dict[str, Any],
+                                    deadline: Optional[ExtractionDeadline] = None) -> Dict[str, Any]:
         """
         Retry extraction for failed sections sequentially.
         
@@ -245,18 +594,22 @@ class DataExtractor:
             failed_sections: List of section names that failed
             raw_text: The raw CV text
             extracted_data: Already extracted data
+            deadline: Optional deadline; remaining retries are skipped once it expires
             
         Returns:
             Updated extracted data dictionary
         """
         logger.warning(f"Retrying {len(failed_sections)} failed sections")
         
-        for section_name in failed_sections:
+        for i, section_name in enumerate(failed_sections):
+            if deadline is not None and (deadline.expired or await deadline.is_cancelled()):
+                logger.warning(f"Deadline reached - skipping retries for {failed_sections[i:]}")
+                break
             try:
                 result = await self.section_extractor.extract(
                     section_name=section_name,
                     raw_text=raw_text,
-                    llm_caller=self.llm_service.call_llm
+                    llm_caller=self._get_llm_caller(section_name, deadline=deadline)
                 )
                 if result:
                     extracted_data.update(result)
@@ -266,39 +619,50 @@ class DataExtractor:
         
         return extracted_data
     
-    def _apply_enhancements(self, data: Dict[str, Any], raw_text: str) -> Dict[str, Any]:
+    @staticmethod
+    def _apply_enhancements(data: Dict[str, Any], raw_text: str,
+                            metrics: Optional[ExtractionMetrics] = None) -> Dict[str, Any]:
         """
         Apply all enhancement processing to extracted data.
         
         Args:
             data: Extracted section data
             raw_text: Original CV text
+            metrics: Optional metrics to record per-enhancer timings into
             
         Returns:
             Enhanced data dictionary
         """
         try:
-            enhanced = enhancement_processor.enhance_all(data, raw_text)
+            enhanced = enhancement_processor.enhance_all(data, raw_text, metrics)
             logger.info("Enhancement processing completed successfully")
             return enhanced
         except Exception as e:
             logger.error(f"Enhancement processing failed: {e}")
             return data  # Return unenhanced data
     
-    def _create_and_process_cv_data(self, data: Dict[str, Any], raw_text: str) -> CVData:
+    @staticmethod
+    def _create_and_process_cv_data(data: Dict[str, Any], raw_text: str,
+                                    metrics: Optional[ExtractionMetrics] = None,
+                                    reused: Optional[Dict[str, Any]] = None,
+                                    section_models: Optional[Dict[str, str]] = None) -> ExtractionResult:
         """
-        Create CVData object and apply post-processing.
+        Create CVData object, apply post-processing and build the extraction result.
         
         Args:
             data: Enhanced section data
             raw_text: Original CV text
+            metrics: Optional metrics for this extraction (missing_sections are flagged on the CVData)
+            reused: Final sections of a previous extraction to add after
+                post-processing (they were post-processed when first extracted)
+            section_models: Model that produced each section (default: metrics.section_models)
             
         Returns:
-            Final processed CVData object
+            ExtractionResult for the final processed CVData object
         """
         try:
-            # Create CVData object
-            cv_data = CVData(**data)
+            # Create CVData object (sections no enhancer touches are not revalidated)
+            cv_data = assemble_cv_data(data, enhancement_engine.touched_sections)
             
             # Apply post-processing
             cv_data, confidence, validation_issues = post_processor.process_all(cv_data, raw_text)
@@ -308,14 +672,50 @@ class DataExtractor:
                 logger.info(f"Extraction had {len(validation_issues)} validation issues (logged separately)")
             
             logger.info(f"CV extraction complete - Confidence: {confidence:.2f}")
-            return cv_data
             
         except ValidationError as e:
             logger.error(f"Failed to create CVData object: {e}")
             # Return partial data that validates
-            return CVData(**{k: v for k, v in data.items() if k in CVData.model_fields})
+            cv_data = CVData(**{k: v for k, v in data.items() if k in CVData.model_fields})
+            confidence = post_processor.calculate_extraction_confidence(cv_data, raw_text)
+            validation_issues = [f"CVData validation failed: {e}"]
+        
+        if reused:
+            cv_data = CVData(**{**cv_data.model_dump(), **reused})
+            confidence = post_processor.calculate_extraction_confidence(cv_data, raw_text)
+        
+        if metrics is not None and metrics.missing_sections:
+            cv_data.flag_missing_sections(metrics.missing_sections)
+            logger.warning(f"Returning partial CV data - missing sections: {metrics.missing_sections}")
+        
+        if section_models is None and metrics is not None:
+            section_models = metrics.section_models
+        return ExtractionResult.build(
+            cv_data, confidence, validation_issues, metrics,
+            reused_sections=list(reused or ()), section_models=section_models
+        )
+    
+    @staticmethod
+    def finalize_sections(sections: Dict[str, Any], raw_text: str,
+                          section_models: Optional[Dict[str, str]] = None) -> ExtractionResult:
+        """
+        Run the enhancement and post-processing stages on already extracted sections.
+        
+        Used by callers that obtain section data outside extract_cv_result (e.g. batch mode).
+        
+        Args:
+            sections: Validated section data keyed by section name
+            raw_text: Original CV text
+            section_models: Model that produced each section
+            
+        Returns:
+            ExtractionResult for the final processed CVData object
+        """
+        enhanced_data = DataExtractor._apply_enhancements(sections, raw_text)
+        return DataExtractor._create_and_process_cv_data(enhanced_data, raw_text, section_models=section_models)
     
-    def calculate_extraction_confidence(self, cv_data: Any, raw_text: str) -> float:
+    @staticmethod
+    def calculate_extraction_confidence(cv_data: Any, raw_text: str) -> float:
         """
         Calculate confidence score for extraction quality.
         
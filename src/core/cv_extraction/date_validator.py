@@ -7,6 +7,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import re
 from .text_parsing import safe_iter_dicts
+from .parse_cache import parse_cache
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,25 @@ class DateValidator:
         re.compile(r'^(and|or|with)$', re.IGNORECASE)
     ]
     
+    # Words meaning "up to now" in end dates
+    CURRENT_DATE_WORDS = frozenset({'present', 'current', 'now', 'ongoing'})
+    
+    # Month names and abbreviations
+    MONTHS = {
+        'january': 1, 'jan': 1,
+        'february': 2, 'feb': 2,
+        'march': 3, 'mar': 3,
+        'april': 4, 'apr': 4,
+        'may': 5,
+        'june': 6, 'jun': 6,
+        'july': 7, 'jul': 7,
+        'august': 8, 'aug': 8,
+        'september': 9, 'sep': 9, 'sept': 9,
+        'october': 10, 'oct': 10,
+        'november': 11, 'nov': 11,
+        'december': 12, 'dec': 12
+    }
+    
     def __init__(self):
         self.current_year = datetime.now().year
         self.current_month = datetime.now().month
@@ -44,17 +64,23 @@ class DateValidator:
             
         # Strip whitespace and punctuation, then check for current date indicators
         cleaned = date_str.strip().rstrip('.,;:').lower()
-        if cleaned in ['present', 'current', 'now', 'ongoing']:
+        if cleaned in self.CURRENT_DATE_WORDS:
             return (self.current_year, self.current_month)
         
+        return DateValidator._parse_explicit_date(date_str)
+    
+    @staticmethod
+    @parse_cache('date')
+    def _parse_explicit_date(date_str: str) -> Optional[Tuple[int, int]]:
+        """Parse a date that is not a current date indicator (memoized - it does not depend on today)"""
         # Try precompiled date patterns (use class-level constants)
-        for pattern, pattern_type in self.DATE_PATTERNS:
+        for pattern, pattern_type in DateValidator.DATE_PATTERNS:
             match = pattern.search(date_str)
             if match:
                 if pattern_type == 'month-year':
                     # Month name format
                     month_str, year = match.groups()
-                    month = self._parse_month(month_str)
+                    month = DateValidator._parse_month(month_str)
                     if month:
                         return (int(year), month)
                 elif pattern_type == 'year-only':
@@ -71,46 +97,32 @@ class DateValidator:
         
         return None
     
-    def _parse_month(self, month_str: str) -> Optional[int]:
+    @staticmethod
+    def _parse_month(month_str: str) -> Optional[int]:
         """Parse month name to number"""
         # Remove dots and clean up
-        cleaned_month = month_str.rstrip('.').lower()
-        
-        months = {
-            'january': 1, 'jan': 1,
-            'february': 2, 'feb': 2,
-            'march': 3, 'mar': 3,
-            'april': 4, 'apr': 4,
-            'may': 5,
-            'june': 6, 'jun': 6,
-            'july': 7, 'jul': 7,
-            'august': 8, 'aug': 8,
-            'september': 9, 'sep': 9, 'sept': 9,
-            'october': 10, 'oct': 10,
-            'november': 11, 'nov': 11,
-            'december': 12, 'dec': 12
-        }
-        return months.get(cleaned_month)
+        return DateValidator.MONTHS.get(month_str.rstrip('.').lower())
     
-    def check_date_overlap(self, item1: Dict[str, Any], item2: Dict[str, Any]) -> Optional[str]:
-        """Check if two date ranges overlap"""
-        # Extract dates from dateRange
-        start1 = item1.get('dateRange', {}).get('startDate')
-        end1 = item1.get('dateRange', {}).get('endDate')
-        start2 = item2.get('dateRange', {}).get('startDate')
-        end2 = item2.get('dateRange', {}).get('endDate')
-        
-        if not all([start1, start2]):
+    def _date_span(self, item: Dict[str, Any]) -> Optional[Tuple[str, Optional[str], Tuple[int, int], Optional[Tuple[int, int]]]]:
+        """(start text, end text, parsed start, parsed end) of an item's dateRange, None without a parseable start"""
+        date_range = item.get('dateRange') or {}
+        start = date_range.get('startDate')
+        end = date_range.get('endDate')
+        if not start:
             return None
         
-        # Parse dates
-        start1_parsed = self.parse_date(start1)
-        end1_parsed = self.parse_date(end1) if end1 else (self.current_year, self.current_month)
-        start2_parsed = self.parse_date(start2)
-        end2_parsed = self.parse_date(end2) if end2 else (self.current_year, self.current_month)
-        
-        if not all([start1_parsed, start2_parsed]):
+        start_parsed = self.parse_date(start)
+        if not start_parsed:
+            return None
+        end_parsed = self.parse_date(end) if end else (self.current_year, self.current_month)
+        return start, end, start_parsed, end_parsed
+    
+    def _span_overlap(self, span1, span2) -> Optional[str]:
+        """Overlap message for two date spans from _date_span"""
+        if not span1 or not span2:
             return None
+        start1, end1, start1_parsed, end1_parsed = span1
+        start2, end2, start2_parsed, end2_parsed = span2
         
         # Check for overlap
         if (start1_parsed <= end2_parsed and start2_parsed <= end1_parsed):
@@ -125,6 +137,10 @@ class DateValidator:
         
         return None
     
+    def check_date_overlap(self, item1: Dict[str, Any], item2: Dict[str, Any]) -> Optional[str]:
+        """Check if two date ranges overlap"""
+        return self._span_overlap(self._date_span(item1), self._date_span(item2))
+    
     def validate_experience_dates(self, cv_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Validate experience dates for overlaps"""
         issues = []
@@ -134,10 +150,12 @@ class DateValidator:
         
         # Use safe_iter_dicts to handle None/non-dict items
         experiences = list(safe_iter_dicts(cv_data['experience']['experienceItems']))
+        # Parse each item's dates once rather than once per pair
+        spans = [self._date_span(exp) for exp in experiences]
         
         for i, exp1 in enumerate(experiences):
             for j, exp2 in enumerate(experiences[i+1:], i+1):
-                overlap = self.check_date_overlap(exp1, exp2)
+                overlap = self._span_overlap(spans[i], spans[j])
                 if overlap:
                     issue = {
                         'type': 'experience_overlap',
@@ -0,0 +1,124 @@
+"""
+Deadline and Cancellation Support for CV Extraction
+Bounds total extraction time and lets retries and in-flight calls stop early
+"""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from tenacity import RetryCallState
+from tenacity.retry import retry_if_exception
+from tenacity.stop import stop_base
+from tenacity.wait import wait_base
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Async predicate that reports whether the caller has gone away (e.g. request.is_disconnected)
+CancelCheck = Callable[[], Awaitable[bool]]
+
+
+class DeadlineExceededError(Exception):
+    """Raised when an extraction step cannot finish before the deadline"""
+    pass
+
+
+class ExtractionDeadline:
+    """
+    Overall time budget for one extraction, shared by every section call.
+
+    A deadline without a timeout is unbounded but can still be cancelled
+    through cancel_check.
+    """
+
+    def __init__(self, timeout_seconds: Optional[float] = None,
+                 cancel_check: Optional[CancelCheck] = None):
+        """
+        Args:
+            timeout_seconds: Seconds from now until the deadline (None = no limit)
+            cancel_check: Optional async predicate returning True once the caller is gone
+        """
+        self.expires_at = time.monotonic() + timeout_seconds if timeout_seconds is not None else None
+        self.cancel_check = cancel_check
+        self.cancelled = False
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None when unbounded)"""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        """True once the deadline has passed or the extraction was cancelled"""
+        return self.cancelled or (self.expires_at is not None and time.monotonic() >= self.expires_at)
+
+    def can_afford(self, seconds: float) -> bool:
+        """Whether at least `seconds` remain before the deadline"""
+        remaining = self.remaining()
+        return not self.cancelled and (remaining is None or remaining >= seconds)
+
+    async def is_cancelled(self) -> bool:
+        """Poll cancel_check, latching the result once the caller is gone"""
+        if not self.cancelled and self.cancel_check is not None:
+            try:
+                self.cancelled = bool(await self.cancel_check())
+            except Exception as e:
+                logger.warning(f"Cancellation check failed: {e}")
+        return self.cancelled
+
+    def check(self, what: str = "extraction"):
+        """Raise DeadlineExceededError if no time is left"""
+        if self.expired:
+            raise DeadlineExceededError(f"Deadline exceeded before {what}")
+
+    async def run(self, awaitable: Awaitable[T], what: str = "call") -> T:
+        """Await within the remaining budget, raising DeadlineExceededError on expiry"""
+        self.check(what)
+        try:
+            return await asyncio.wait_for(awaitable, timeout=self.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(f"Deadline exceeded during {what}")
+
+
+def _deadline_of(retry_state: RetryCallState) -> Optional[ExtractionDeadline]:
+    """Find the deadline passed to a retried call (as the `deadline` keyword argument)"""
+    return retry_state.kwargs.get("deadline")
+
+
+class retry_unless_deadline_exceeded(retry_if_exception):
+    """
+    Tenacity retry condition: retry errors, but not DeadlineExceededError or cancellation.
+
+    asyncio.CancelledError is not an Exception, so a cancelled call (section straggler,
+    job timeout, worker shutdown) propagates at once instead of starting another attempt.
+    """
+
+    def __init__(self):
+        super().__init__(lambda e: isinstance(e, Exception) and not isinstance(e, DeadlineExceededError))
+
+
+class stop_when_deadline_exhausted(stop_base):
+    """Tenacity stop condition: stop retrying when the next wait would not fit in the deadline"""
+
+    def __init__(self, min_wait: float):
+        self.min_wait = min_wait
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        deadline = _deadline_of(retry_state)
+        return deadline is not None and not deadline.can_afford(self.min_wait)
+
+
+class wait_within_deadline(wait_base):
+    """Tenacity wait strategy: cap another wait strategy at the remaining deadline"""
+
+    def __init__(self, wait: wait_base):
+        self.wait = wait
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        seconds = self.wait(retry_state)
+        deadline = _deadline_of(retry_state)
+        remaining = deadline.remaining() if deadline is not None else None
+        return seconds if remaining is None else min(seconds, remaining)
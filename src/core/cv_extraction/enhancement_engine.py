@@ -0,0 +1,163 @@
+"""
+Enhancement Engine for CV Data
+Runs registered enhancers over the CV dict, fusing item-level enhancers into a
+single walk instead of one pass over the data per enhancer
+"""
+import logging
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+from .metrics import ExtractionMetrics
+
+logger = logging.getLogger(__name__)
+
+# (section name, item list field) - an item field of None addresses the section dict itself
+NodePath = Tuple[str, Optional[str]]
+
+
+class EnhancementContext:
+    """State shared by all enhancers during one run: the raw text (lowercased once) and timings"""
+
+    def __init__(self, raw_text: str):
+        self.raw_text = raw_text or ""
+        self.timings: Dict[str, float] = {}
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercased raw text, computed on first use"""
+        return self.raw_text.lower()
+
+    def add_time(self, enhancer_name: str, elapsed: float):
+        self.timings[enhancer_name] = self.timings.get(enhancer_name, 0.0) + elapsed
+
+
+@dataclass(frozen=True)
+class DocumentEnhancer:
+    """
+    Enhancer that needs the whole CV dict (cross-section moves, deduplication,
+    raw text lookups). apply(data, context) returns the enhanced dict.
+
+    sections lists every section it may modify; sections no enhancer declares
+    are left untouched, so their validated models are reused for CVData.
+    """
+    name: str
+    sections: Tuple[str, ...]
+    apply: Callable[[Dict[str, Any], EnhancementContext], Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class NodeEnhancer:
+    """
+    Enhancer applied to every node under the paths it declares.
+    visit(node, section_name) mutates the node in place.
+    """
+    name: str
+    paths: Tuple[NodePath, ...]
+    visit: Callable[[Any, str], Any]
+
+
+Enhancer = Union[DocumentEnhancer, NodeEnhancer]
+
+
+class _FusedWalk:
+    """Consecutive node enhancers merged into one walk over the paths they touch"""
+
+    def __init__(self):
+        self.visitors: Dict[NodePath, List[NodeEnhancer]] = {}
+
+    def add(self, enhancer: NodeEnhancer):
+        for path in enhancer.paths:
+            self.visitors.setdefault(path, []).append(enhancer)
+
+    def walk(self, data: Dict[str, Any], context: EnhancementContext):
+        for (section_name, items_field), enhancers in self.visitors.items():
+            section = data.get(section_name)
+            if not isinstance(section, dict):
+                continue
+            if items_field is None:
+                nodes = (section,)
+            else:
+                nodes = section.get(items_field)
+                if not isinstance(nodes, list):
+                    continue
+
+            # Each node gets every enhancer in registration order before moving on,
+            # which matches running the enhancers as separate passes since nodes are independent
+            for node in nodes:
+                for enhancer in enhancers:
+                    start = time.perf_counter()
+                    enhancer.visit(node, section_name)
+                    context.add_time(enhancer.name, time.perf_counter() - start)
+
+
+class EnhancementEngine:
+    """
+    Applies an ordered list of enhancers to CV data.
+
+    Document enhancers run one at a time and act as barriers; runs of node
+    enhancers between them are fused so each section's items are walked once.
+    """
+
+    def __init__(self, enhancers: Sequence[Enhancer]):
+        self.enhancers = tuple(enhancers)
+        self._stages = self._plan(self.enhancers)
+
+    @staticmethod
+    def _plan(enhancers: Sequence[Enhancer]) -> Tuple[Union[DocumentEnhancer, _FusedWalk], ...]:
+        stages: List[Union[DocumentEnhancer, _FusedWalk]] = []
+        for enhancer in enhancers:
+            if isinstance(enhancer, NodeEnhancer):
+                if not stages or not isinstance(stages[-1], _FusedWalk):
+                    stages.append(_FusedWalk())
+                stages[-1].add(enhancer)
+            else:
+                stages.append(enhancer)
+        return tuple(stages)
+
+    @cached_property
+    def touched_sections(self) -> FrozenSet[str]:
+        """Sections any enhancer may modify (document enhancer sections and node paths)"""
+        touched = set()
+        for enhancer in self.enhancers:
+            if isinstance(enhancer, NodeEnhancer):
+                touched.update(section_name for section_name, _ in enhancer.paths)
+            else:
+                touched.update(enhancer.sections)
+        return frozenset(touched)
+
+    @property
+    def pass_count(self) -> int:
+        """Number of passes over the data per run (document enhancers + fused walks)"""
+        return len(self._stages)
+
+    def run(self, data: Dict[str, Any], raw_text: str,
+            metrics: Optional[ExtractionMetrics] = None) -> Dict[str, Any]:
+        """
+        Run every enhancer over a shallow copy of data.
+
+        Args:
+            data: The extracted CV data
+            raw_text: The original CV text
+            metrics: Optional metrics to record per-enhancer timings into
+
+        Returns:
+            Enhanced CV data
+        """
+        context = EnhancementContext(raw_text)
+        enhanced = data.copy()
+
+        for stage in self._stages:
+            if isinstance(stage, _FusedWalk):
+                stage.walk(enhanced, context)
+            else:
+                start = time.perf_counter()
+                enhanced = stage.apply(enhanced, context)
+                context.add_time(stage.name, time.perf_counter() - start)
+
+        if metrics is not None:
+            for name, elapsed in context.timings.items():
+                metrics.record_enhancer_time(name, elapsed)
+
+        return enhanced
@@ -4,11 +4,16 @@ Handles post-extraction data enhancement and enrichment
 """
 import re
 import logging
+from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+from dateutil import parser
+
 from .extraction_config import extraction_config
 from .text_parsing import parse_year_range
 from .demographic_extractor import demographic_extractor
+from .enhancement_engine import DocumentEnhancer, EnhancementContext, EnhancementEngine, NodeEnhancer
+from .metrics import ExtractionMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +29,38 @@ URL_PATTERNS = {
     'video': r'\.(mp4|webm|ogg|mov|avi)(?:\?.*)?$'
 }
 
+# Generic terms filtered out of experience technologiesUsed
+EXCLUDED_TECH_TERMS = frozenset({
+    'teams', 'team', 'office', 'computer', 'software', 'systems', 
+    'system', 'data', 'management', 'project', 'process', 'business',
+    'communication', 'collaboration', 'leadership', 'analysis',
+    'documentation', 'requirements', 'testing', 'development',
+    'implementation', 'design', 'architecture', 'infrastructure'
+})
+
+# Common tech terms that should be preserved even if they contain excluded words
+TECH_WHITELIST = (
+    'microsoft teams', 'ms teams', 'team foundation server', 'tfs',
+    'systems manager', 'aws systems manager', 'office 365', 'ms office',
+    'data science', 'data engineering', 'database', 'data warehouse',
+    'project server', 'software engineering', 'system design',
+    'test automation', 'infrastructure as code'
+)
+
+# Sections rendered as smart cards and their item list fields
+SMART_CARD_SECTIONS = {
+    'experience': 'experienceItems',
+    'education': 'educationItems',
+    'projects': 'projectItems',
+    'achievements': 'achievements',
+    'certifications': 'certificationItems',
+    'volunteer': 'volunteerItems',
+    'courses': 'courseItems',
+    'publications': 'publications',
+    'speaking': 'speakingEngagements',
+    'hobbies': 'hobbyItems'
+}
+
 
 class EnhancementProcessor:
     """Processes and enhances extracted CV data with additional intelligence."""
@@ -293,64 +330,65 @@ class EnhancementProcessor:
         experience_items = enhanced['experience'].get('experienceItems', [])
         if not isinstance(experience_items, list):
             return enhanced
-            
-        from datetime import datetime
-        from dateutil import parser
         
         for item in experience_items:
-            if not isinstance(item, dict) or not item.get('dateRange'):
-                continue
+            EnhancementProcessor.calculate_item_duration(item)
                 
-            date_range = item['dateRange']
-            if not isinstance(date_range, dict):
-                continue
+        return enhanced
+    
+    @staticmethod
+    def calculate_item_duration(item: Any) -> None:
+        """Set 'duration' on one experience item from its dateRange (in place)."""
+        if not isinstance(item, dict) or not item.get('dateRange'):
+            return
+            
+        date_range = item['dateRange']
+        if not isinstance(date_range, dict):
+            return
+            
+        try:
+            start_date_str = date_range.get('startDate')
+            end_date_str = date_range.get('endDate')
+            is_current = date_range.get('isCurrent', False)
+            
+            if not start_date_str:
+                return
                 
-            try:
-                start_date_str = date_range.get('startDate')
-                end_date_str = date_range.get('endDate')
-                is_current = date_range.get('isCurrent', False)
+            # Parse start date
+            start_date = parser.parse(start_date_str, fuzzy=True)
+            
+            # Parse end date or use current date
+            if is_current or end_date_str in ['Present', 'Current', 'Now']:
+                end_date = datetime.now()
+            elif end_date_str:
+                end_date = parser.parse(end_date_str, fuzzy=True)
+            else:
+                return
                 
-                if not start_date_str:
-                    continue
-                    
-                # Parse start date
-                start_date = parser.parse(start_date_str, fuzzy=True)
+            # Calculate duration
+            delta = end_date - start_date
+            years = delta.days // 365
+            months = (delta.days % 365) // 30
+            
+            # Format duration string
+            duration_parts = []
+            if years > 0:
+                duration_parts.append(f"{years} year{'s' if years != 1 else ''}")
+            if months > 0:
+                duration_parts.append(f"{months} month{'s' if months != 1 else ''}")
                 
-                # Parse end date or use current date
-                if is_current or end_date_str in ['Present', 'Current', 'Now']:
-                    end_date = datetime.now()
-                elif end_date_str:
-                    end_date = parser.parse(end_date_str, fuzzy=True)
+            if duration_parts:
+                item['duration'] = ', '.join(duration_parts)
+            elif delta.days > 0:
+                # Less than a month, show weeks or days
+                weeks = delta.days // 7
+                if weeks > 0:
+                    item['duration'] = f"{weeks} week{'s' if weeks != 1 else ''}"
                 else:
-                    continue
+                    item['duration'] = f"{delta.days} day{'s' if delta.days != 1 else ''}"
                     
-                # Calculate duration
-                delta = end_date - start_date
-                years = delta.days // 365
-                months = (delta.days % 365) // 30
-                
-                # Format duration string
-                duration_parts = []
-                if years > 0:
-                    duration_parts.append(f"{years} year{'s' if years != 1 else ''}")
-                if months > 0:
-                    duration_parts.append(f"{months} month{'s' if months != 1 else ''}")
-                    
-                if duration_parts:
-                    item['duration'] = ', '.join(duration_parts)
-                elif delta.days > 0:
-                    # Less than a month, show weeks or days
-                    weeks = delta.days // 7
-                    if weeks > 0:
-                        item['duration'] = f"{weeks} week{'s' if weeks != 1 else ''}"
-                    else:
-                        item['duration'] = f"{delta.days} day{'s' if delta.days != 1 else ''}"
-                        
-            except Exception as e:
-                logger.debug(f"Could not calculate duration for experience item: {e}")
-                continue
-                
-        return enhanced
+        except Exception as e:
+            logger.debug(f"Could not calculate duration for experience item: {e}")
     
     @staticmethod
     def filter_technologies_in_experience(enhanced: Dict[str, Any]) -> Dict[str, Any]:
@@ -358,24 +396,6 @@ class EnhancementProcessor:
         Filter and validate technologies in experience items.
         Remove generic terms and ensure only valid tech is included.
         """
-        # List of generic terms to exclude
-        EXCLUDED_TERMS = {
-            'teams', 'team', 'office', 'computer', 'software', 'systems', 
-            'system', 'data', 'management', 'project', 'process', 'business',
-            'communication', 'collaboration', 'leadership', 'analysis',
-            'documentation', 'requirements', 'testing', 'development',
-            'implementation', 'design', 'architecture', 'infrastructure'
-        }
-        
-        # Common tech terms that should be preserved even if they contain excluded words
-        TECH_WHITELIST = {
-            'microsoft teams', 'ms teams', 'team foundation server', 'tfs',
-            'systems manager', 'aws systems manager', 'office 365', 'ms office',
-            'data science', 'data engineering', 'database', 'data warehouse',
-            'project server', 'software engineering', 'system design',
-            'test automation', 'infrastructure as code'
-        }
-        
         if not enhanced.get('experience') or not isinstance(enhanced['experience'], dict):
             return enhanced
             
@@ -384,52 +404,59 @@ class EnhancementProcessor:
             return enhanced
             
         for item in experience_items:
-            if not isinstance(item, dict) or not item.get('technologiesUsed'):
+            EnhancementProcessor.filter_item_technologies(item)
+            
+        return enhanced
+    
+    @staticmethod
+    def filter_item_technologies(item: Any) -> None:
+        """Filter generic terms and duplicates out of one item's technologiesUsed (in place)."""
+        if not isinstance(item, dict) or not item.get('technologiesUsed'):
+            return
+            
+        if not isinstance(item['technologiesUsed'], list):
+            return
+            
+        # Filter technologies
+        filtered_techs = []
+        for tech in item['technologiesUsed']:
+            if not tech or not isinstance(tech, str):
                 continue
                 
-            if not isinstance(item['technologiesUsed'], list):
+            tech_lower = tech.lower().strip()
+            
+            # Skip if it's a single excluded word
+            if tech_lower in EXCLUDED_TECH_TERMS:
+                logger.debug(f"Filtering out generic term: {tech}")
                 continue
                 
-            # Filter technologies
-            filtered_techs = []
-            for tech in item['technologiesUsed']:
-                if not tech or not isinstance(tech, str):
-                    continue
-                    
-                tech_lower = tech.lower().strip()
-                
-                # Skip if it's a single excluded word
-                if tech_lower in EXCLUDED_TERMS:
-                    logger.debug(f"Filtering out generic term: {tech}")
-                    continue
-                    
-                # Check if it's in whitelist (preserve even if contains excluded words)
-                if any(whitelist_term in tech_lower for whitelist_term in TECH_WHITELIST):
-                    filtered_techs.append(tech)
-                    continue
-                    
-                # Check if all words in the tech are excluded terms
-                words = tech_lower.split()
-                if all(word in EXCLUDED_TERMS for word in words):
-                    logger.debug(f"Filtering out phrase with all generic terms: {tech}")
-                    continue
-                    
-                # Keep the technology
+            # Check if it's in whitelist (preserve even if contains excluded words)
+            if any(whitelist_term in tech_lower for whitelist_term in TECH_WHITELIST):
                 filtered_techs.append(tech)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_techs = []
-            for tech in filtered_techs:
-                tech_normalized = tech.lower().strip()
-                if tech_normalized not in seen:
-                    seen.add(tech_normalized)
-                    unique_techs.append(tech)
-            
-            # Update the technologies list
-            item['technologiesUsed'] = unique_techs if unique_techs else None
-            
-        return enhanced
+                continue
+                
+            # Check if all words in the tech are excluded terms
+            words = tech_lower.split()
+            if all(word in EXCLUDED_TECH_TERMS for word in words):
+                logger.debug(f"Filtering out phrase with all generic terms: {tech}")
+                continue
+                
+            # Keep the technology
+            filtered_techs.append(tech)
+        
+        # Remove duplicates while preserving order (known aliases such as
+        # "NodeJS" and "Node.js" count as the same technology)
+        tech_matcher = extraction_config.get_tech_matcher()
+        seen = set()
+        unique_techs = []
+        for tech in filtered_techs:
+            tech_normalized = (tech_matcher.canonical(tech) or tech).lower().strip()
+            if tech_normalized not in seen:
+                seen.add(tech_normalized)
+                unique_techs.append(tech)
+        
+        # Update the technologies list
+        item['technologiesUsed'] = unique_techs if unique_techs else None
     
     @staticmethod
     def classify_url(url: str) -> str:
@@ -587,163 +614,164 @@ class EnhancementProcessor:
         """
         # Summary section - move unused fields to additionalData
         if enhanced.get('summary'):
-            summary = enhanced['summary']
-            additional = {}
-            
-            # Move unused fields
-            if 'yearsOfExperience' in summary:
-                additional['yearsOfExperience'] = summary.pop('yearsOfExperience')
-            if 'yearsOfExperienceQualifier' in summary:
-                additional['yearsOfExperienceQualifier'] = summary.pop('yearsOfExperienceQualifier')
-            if 'keySpecializations' in summary:
-                additional['keySpecializations'] = summary.pop('keySpecializations')
-            if 'careerHighlights' in summary:
-                additional['careerHighlights'] = summary.pop('careerHighlights')
-            
-            if additional:
-                summary['additionalData'] = additional
+            EnhancementProcessor._reorganize_summary(enhanced['summary'])
         
         # Experience section - move unused fields to additionalData
         if enhanced.get('experience') and enhanced['experience'].get('experienceItems'):
             for item in enhanced['experience']['experienceItems']:
-                if not isinstance(item, dict):
-                    continue
-                    
-                additional = {}
-                
-                # Move unused fields
-                if 'teamSize' in item:
-                    additional['teamSize'] = item.pop('teamSize')
-                if 'reportingTo' in item:
-                    additional['reportingTo'] = item.pop('reportingTo')
-                if 'summary' in item:
-                    additional['summary'] = item.pop('summary')
-                
-                if additional:
-                    item['additionalData'] = additional
+                EnhancementProcessor._reorganize_experience_item(item)
         
         # Projects section - move unused fields to additionalData
         if enhanced.get('projects') and enhanced['projects'].get('projectItems'):
             for item in enhanced['projects']['projectItems']:
-                if not isinstance(item, dict):
-                    continue
-                    
-                additional = {}
-                
-                # Move unused fields
-                if 'role' in item:
-                    additional['role'] = item.pop('role')
-                if 'duration' in item:
-                    additional['duration'] = item.pop('duration')
-                if 'dateRange' in item:
-                    additional['dateRange'] = item.pop('dateRange')
-                if 'keyFeatures' in item:
-                    additional['keyFeatures'] = item.pop('keyFeatures')
-                # Keep technologiesUsed at top level for adapter compatibility
-                # Even though template doesn't display as tags yet
-                if 'projectMetrics' in item:
-                    additional['projectMetrics'] = item.pop('projectMetrics')
-                
-                if additional:
-                    item['additionalData'] = additional
+                EnhancementProcessor._reorganize_project_item(item)
         
         # Education section - create comprehensive description and organize fields
         if enhanced.get('education') and enhanced['education'].get('educationItems'):
             for item in enhanced['education']['educationItems']:
-                if not isinstance(item, dict):
-                    continue
-                    
-                additional = {}
-                
-                # Create comprehensive description from all available details
-                description_parts = []
-                
-                # Keep tag fields but also add them to description
-                if item.get('honors'):
-                    honors_text = "Honors: " + ", ".join(item['honors'])
-                    description_parts.append(honors_text)
-                    # Keep honors field for tags
-                
-                if item.get('relevantCoursework'):
-                    coursework_text = "Relevant coursework: " + ", ".join(item['relevantCoursework'])
-                    description_parts.append(coursework_text)
-                    # Keep relevantCoursework field for tags
-                
-                if item.get('gpa'):
-                    gpa_text = f"GPA: {item['gpa']}"
-                    description_parts.append(gpa_text)
-                    # Keep gpa field for tags
-                
-                if item.get('minors'):
-                    minors_text = "Minor(s): " + ", ".join(item['minors'])
-                    description_parts.append(minors_text)
-                    # Keep minors field for tags
-                
-                if item.get('exchangePrograms'):
-                    exchange_text = "Exchange: " + ", ".join(item['exchangePrograms'])
-                    description_parts.append(exchange_text)
-                    # Keep exchangePrograms field for tags
-                
-                # Add fieldOfStudy to description if different from degree
-                if item.get('fieldOfStudy') and item.get('fieldOfStudy') != item.get('degree'):
-                    field_text = f"Field of Study: {item['fieldOfStudy']}"
-                    description_parts.append(field_text)
-                    # Keep fieldOfStudy field for tags
-                
-                # Add location to description if present
-                if item.get('location'):
-                    loc = item['location']
-                    loc_parts = []
-                    if isinstance(loc, dict):
-                        if loc.get('city'):
-                            loc_parts.append(loc['city'])
-                        if loc.get('state'):
-                            loc_parts.append(loc['state'])
-                        if loc.get('country'):
-                            loc_parts.append(loc['country'])
-                        if loc_parts:
-                            location_text = f"Location: {', '.join(loc_parts)}"
-                            description_parts.append(location_text)
-                    # Keep location field for tags
-                
-                # Add any existing description that's not the degree name
-                existing_desc = item.get('description', '')
-                if existing_desc and item.get('degree') and existing_desc != item['degree']:
-                    description_parts.insert(0, existing_desc)
-                
-                # Set comprehensive description
-                if description_parts:
-                    item['description'] = ". ".join(description_parts)
-                elif item.get('description') == item.get('degree'):
-                    # If description is same as degree, clear it
-                    item['description'] = None
-                
-                # No fields moved to additionalData - all are kept for tags or display
-                if additional:
-                    item['additionalData'] = additional
+                EnhancementProcessor._reorganize_education_item(item)
         
         return enhanced
     
+    @staticmethod
+    def _reorganize_summary(summary: Dict[str, Any]) -> None:
+        additional = {}
+        
+        # Move unused fields
+        if 'yearsOfExperience' in summary:
+            additional['yearsOfExperience'] = summary.pop('yearsOfExperience')
+        if 'yearsOfExperienceQualifier' in summary:
+            additional['yearsOfExperienceQualifier'] = summary.pop('yearsOfExperienceQualifier')
+        if 'keySpecializations' in summary:
+            additional['keySpecializations'] = summary.pop('keySpecializations')
+        if 'careerHighlights' in summary:
+            additional['careerHighlights'] = summary.pop('careerHighlights')
+        
+        if additional:
+            summary['additionalData'] = additional
+    
+    @staticmethod
+    def _reorganize_experience_item(item: Any) -> None:
+        if not isinstance(item, dict):
+            return
+            
+        additional = {}
+        
+        # Move unused fields
+        if 'teamSize' in item:
+            additional['teamSize'] = item.pop('teamSize')
+        if 'reportingTo' in item:
+            additional['reportingTo'] = item.pop('reportingTo')
+        if 'summary' in item:
+            additional['summary'] = item.pop('summary')
+        
+        if additional:
+            item['additionalData'] = additional
+    
+    @staticmethod
+    def _reorganize_project_item(item: Any) -> None:
+        if not isinstance(item, dict):
+            return
+            
+        additional = {}
+        
+        # Move unused fields
+        if 'role' in item:
+            additional['role'] = item.pop('role')
+        if 'duration' in item:
+            additional['duration'] = item.pop('duration')
+        if 'dateRange' in item:
+            additional['dateRange'] = item.pop('dateRange')
+        if 'keyFeatures' in item:
+            additional['keyFeatures'] = item.pop('keyFeatures')
+        # Keep technologiesUsed at top level for adapter compatibility
+        # Even though template doesn't display as tags yet
+        if 'projectMetrics' in item:
+            additional['projectMetrics'] = item.pop('projectMetrics')
+        
+        if additional:
+            item['additionalData'] = additional
+    
+    @staticmethod
+    def _reorganize_education_item(item: Any) -> None:
+        if not isinstance(item, dict):
+            return
+            
+        additional = {}
+        
+        # Create comprehensive description from all available details
+        description_parts = []
+        
+        # Keep tag fields but also add them to description
+        if item.get('honors'):
+            honors_text = "Honors: " + ", ".join(item['honors'])
+            description_parts.append(honors_text)
+            # Keep honors field for tags
+        
+        if item.get('relevantCoursework'):
+            coursework_text = "Relevant coursework: " + ", ".join(item['relevantCoursework'])
+            description_parts.append(coursework_text)
+            # Keep relevantCoursework field for tags
+        
+        if item.get('gpa'):
+            gpa_text = f"GPA: {item['gpa']}"
+            description_parts.append(gpa_text)
+            # Keep gpa field for tags
+        
+        if item.get('minors'):
+            minors_text = "Minor(s): " + ", ".join(item['minors'])
+            description_parts.append(minors_text)
+            # Keep minors field for tags
+        
+        if item.get('exchangePrograms'):
+            exchange_text = "Exchange: " + ", ".join(item['exchangePrograms'])
+            description_parts.append(exchange_text)
+            # Keep exchangePrograms field for tags
+        
+        # Add fieldOfStudy to description if different from degree
+        if item.get('fieldOfStudy') and item.get('fieldOfStudy') != item.get('degree'):
+            field_text = f"Field of Study: {item['fieldOfStudy']}"
+            description_parts.append(field_text)
+            # Keep fieldOfStudy field for tags
+        
+        # Add location to description if present
+        if item.get('location'):
+            loc = item['location']
+            loc_parts = []
+            if isinstance(loc, dict):
+                if loc.get('city'):
+                    loc_parts.append(loc['city'])
+                if loc.get('state'):
+                    loc_parts.append(loc['state'])
+                if loc.get('country'):
+                    loc_parts.append(loc['country'])
+                if loc_parts:
+                    location_text = f"Location: {', '.join(loc_parts)}"
+                    description_parts.append(location_text)
+            # Keep location field for tags
+        
+        # Add any existing description that's not the degree name
+        existing_desc = item.get('description', '')
+        if existing_desc and item.get('degree') and existing_desc != item['degree']:
+            description_parts.insert(0, existing_desc)
+        
+        # Set comprehensive description
+        if description_parts:
+            item['description'] = ". ".join(description_parts)
+        elif item.get('description') == item.get('degree'):
+            # If description is same as degree, clear it
+            item['description'] = None
+        
+        # No fields moved to additionalData - all are kept for tags or display
+        if additional:
+            item['additionalData'] = additional
+    
     @staticmethod
     def enhance_all_smart_card_sections(enhanced: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process all sections that use smart cards to add URL metadata.
         """
-        # Define sections and their item field names
-        smart_card_sections = {
-            'experience': 'experienceItems',
-            'education': 'educationItems',
-            'projects': 'projectItems',
-            'achievements': 'achievements',
-            'certifications': 'certificationItems',
-            'volunteer': 'volunteerItems',
-            'courses': 'courseItems',
-            'publications': 'publications',
-            'speaking': 'speakingEngagements',
-            'hobbies': 'hobbyItems'
-        }
-        
-        for section_name, items_field in smart_card_sections.items():
+        for section_name, items_field in SMART_CARD_SECTIONS.items():
             section = enhanced.get(section_name)
             if section and isinstance(section, dict):
                 items = section.get(items_field)
@@ -755,13 +783,47 @@ class EnhancementProcessor:
         return enhanced
     
     @staticmethod
-    def enhance_all(data: Dict[str, Any], raw_text: str) -> Dict[str, Any]:
+    def enhance_contact_with_demographics(enhanced: Dict[str, Any], context: EnhancementContext) -> Dict[str, Any]:
+        """Apply demographic enhancements to the contact section."""
+        if enhanced.get('contact'):
+            logger.info(f"Contact before demographics: {enhanced['contact'].keys()}")
+            enhanced['contact'] = demographic_extractor.enhance_contact_with_demographics(
+                enhanced['contact'], context.raw_text
+            )
+            logger.info(f"Contact after demographics: {enhanced['contact'].keys()}")
+        return enhanced
+    
+    @staticmethod
+    def merge_externships_into_experience(enhanced: Dict[str, Any], context: EnhancementContext) -> Dict[str, Any]:
+        """Merge externships found in the raw text into experience."""
+        if 'experience' in enhanced or 'externship' in context.lower:
+            enhanced['experience'] = demographic_extractor.merge_externships_to_experience(
+                enhanced.get('experience', {}), context.raw_text
+            )
+        return enhanced
+    
+    @staticmethod
+    def add_activities_to_volunteer(enhanced: Dict[str, Any], context: EnhancementContext) -> Dict[str, Any]:
+        """Add extra-curricular activities to the volunteer section."""
+        if 'volunteer' in enhanced or 'extra' in context.lower or 'activities' in context.lower:
+            enhanced['volunteer'] = demographic_extractor.enhance_volunteer_with_activities(
+                enhanced.get('volunteer', {}), context.raw_text
+            )
+        return enhanced
+    
+    @staticmethod
+    def enhance_all(data: Dict[str, Any], raw_text: str,
+                    metrics: Optional[ExtractionMetrics] = None) -> Dict[str, Any]:
         """
         Apply all enhancement processors to the extracted data.
         
+        Runs ENHANCERS through the enhancement engine, which walks each
+        section's items once for all item-level enhancers.
+        
         Args:
             data: The extracted CV data
             raw_text: The original CV text
+            metrics: Optional metrics to record per-enhancer timings into
             
         Returns:
             Fully enhanced CV data
@@ -770,43 +832,7 @@ class EnhancementProcessor:
             logger.error("enhance_all received None data")
             return {}
         
-        enhanced = data.copy()
-        
-        # Apply all enhancement processors in sequence
-        enhanced = EnhancementProcessor.extract_dissertations_to_publications(enhanced)
-        enhanced = EnhancementProcessor.extract_availability_from_summary(enhanced)
-        enhanced = EnhancementProcessor.optimize_career_highlights(enhanced)
-        enhanced = EnhancementProcessor.apply_smart_deduplication(enhanced)
-        enhanced = EnhancementProcessor.extract_years_of_experience_from_summary(enhanced)
-        enhanced = EnhancementProcessor.ensure_achievements_structure(enhanced)
-        # Patents and memberships now extracted directly in achievements section
-        enhanced = EnhancementProcessor.create_hero_if_missing(enhanced, raw_text)
-        enhanced = EnhancementProcessor.calculate_experience_durations(enhanced)
-        enhanced = EnhancementProcessor.filter_technologies_in_experience(enhanced)
-        enhanced = EnhancementProcessor.enhance_all_smart_card_sections(enhanced)
-        
-        # Move unused fields to additionalData (must be last to catch all unused fields)
-        enhanced = EnhancementProcessor.reorganize_unused_fields_to_additional_data(enhanced)
-        
-        # Apply demographic enhancements
-        if enhanced.get('contact'):
-            logger.info(f"Contact before demographics: {enhanced['contact'].keys()}")
-            enhanced['contact'] = demographic_extractor.enhance_contact_with_demographics(
-                enhanced['contact'], raw_text
-            )
-            logger.info(f"Contact after demographics: {enhanced['contact'].keys()}")
-        
-        # Merge externships into experience
-        if 'experience' in enhanced or 'externship' in raw_text.lower():
-            enhanced['experience'] = demographic_extractor.merge_externships_to_experience(
-                enhanced.get('experience', {}), raw_text
-            )
-        
-        # Add extra-curricular activities to volunteer section
-        if 'volunteer' in enhanced or 'extra' in raw_text.lower() or 'activities' in raw_text.lower():
-            enhanced['volunteer'] = demographic_extractor.enhance_volunteer_with_activities(
-                enhanced.get('volunteer', {}), raw_text
-            )
+        enhanced = enhancement_engine.run(data, raw_text, metrics)
         
         # Clean up empty sections
         enhanced = {k: v for k, v in enhanced.items() if v}
@@ -814,5 +840,48 @@ class EnhancementProcessor:
         return enhanced
 
 
+# Enhancers in the order they apply. Document enhancers see the whole dict; node
+# enhancers declare the (section, items field) paths they visit and are fused
+# into one walk. Patents and memberships are extracted directly in the
+# achievements section; hero creation is disabled (no inference allowed).
+ENHANCERS = (
+    DocumentEnhancer('dissertations_to_publications', ('education', 'publications'),
+                     lambda data, ctx: EnhancementProcessor.extract_dissertations_to_publications(data)),
+    DocumentEnhancer('availability_from_summary', ('summary', 'contact'),
+                     lambda data, ctx: EnhancementProcessor.extract_availability_from_summary(data)),
+    DocumentEnhancer('career_highlights', ('summary', 'achievements'),
+                     lambda data, ctx: EnhancementProcessor.optimize_career_highlights(data)),
+    DocumentEnhancer('smart_deduplication', ('achievements', 'summary', 'experience', 'projects'),
+                     lambda data, ctx: EnhancementProcessor.apply_smart_deduplication(data)),
+    DocumentEnhancer('years_of_experience', ('summary',),
+                     lambda data, ctx: EnhancementProcessor.extract_years_of_experience_from_summary(data)),
+    DocumentEnhancer('achievements_structure', ('achievements',),
+                     lambda data, ctx: EnhancementProcessor.ensure_achievements_structure(data)),
+    NodeEnhancer('experience_durations', (('experience', 'experienceItems'),),
+                 lambda item, section: EnhancementProcessor.calculate_item_duration(item)),
+    NodeEnhancer('experience_technologies', (('experience', 'experienceItems'),),
+                 lambda item, section: EnhancementProcessor.filter_item_technologies(item)),
+    NodeEnhancer('smart_card_urls', tuple(SMART_CARD_SECTIONS.items()),
+                 lambda item, section: EnhancementProcessor.process_smart_card_urls(item, section)),
+    # Move unused fields to additionalData (must be last of the node enhancers to catch all unused fields)
+    NodeEnhancer('unused_fields_summary', (('summary', None),),
+                 lambda summary, section: EnhancementProcessor._reorganize_summary(summary)),
+    NodeEnhancer('unused_fields_experience', (('experience', 'experienceItems'),),
+                 lambda item, section: EnhancementProcessor._reorganize_experience_item(item)),
+    NodeEnhancer('unused_fields_projects', (('projects', 'projectItems'),),
+                 lambda item, section: EnhancementProcessor._reorganize_project_item(item)),
+    NodeEnhancer('education_descriptions', (('education', 'educationItems'),),
+                 lambda item, section: EnhancementProcessor._reorganize_education_item(item)),
+    DocumentEnhancer('contact_demographics', ('contact',),
+                     lambda data, ctx: EnhancementProcessor.enhance_contact_with_demographics(data, ctx)),
+    DocumentEnhancer('externships', ('experience',),
+                     lambda data, ctx: EnhancementProcessor.merge_externships_into_experience(data, ctx)),
+    DocumentEnhancer('extracurricular_activities', ('volunteer',),
+                     lambda data, ctx: EnhancementProcessor.add_activities_to_volunteer(data, ctx)),
+)
+
+enhancement_engine = EnhancementEngine(ENHANCERS)
+
+
 # Create singleton instance
 enhancement_processor = EnhancementProcessor()
\ No newline at end of file
@@ -4,7 +4,16 @@ Centralizes all hardcoded values and patterns
 """
 import re
 from dataclasses import dataclass, field
-from typing import List, Dict, Pattern
+from typing import List, Dict, Optional, Pattern, Tuple
+
+from .tech_matcher import TechnologyMatcher
+
+# Import config from project root
+try:
+    import config
+except ImportError:
+    # Fallback if running from different context
+    from ....config import config
 
 
 @dataclass
@@ -16,13 +25,98 @@ class ExtractionConfig:
     TEMPERATURE: float = 0.0  # Deterministic responses for consistency
     MAX_TOKENS: int = 4000  # Sufficient for CV sections without hitting limits
     TOP_P: float = 0.1  # Low diversity for predictable extraction
-    
+
+    # Tiered model routing - simple sections go to cheaper models
+    ENABLE_TIERED_ROUTING: bool = True  # When False, every section uses the premium tier
+    ESCALATION_TIER: str = "premium"  # Tier used to re-extract sections that fail checks
+    DEFAULT_MODEL_TIER: str = "premium"  # Tier for sections missing from the routing table
+
+    MODEL_TIERS: Dict[str, str] = field(default_factory=lambda: {
+        'fast': "claude-3-5-haiku-20241022",
+        'standard': "claude-sonnet-4-20250514",
+        'premium': config.PRIMARY_MODEL  # The configured primary extraction model
+    })
+
+    # USD per million tokens (input, output) - used for cost estimates in metrics
+    MODEL_TIER_PRICING: Dict[str, Tuple[float, float]] = field(default_factory=lambda: {
+        'fast': (0.80, 4.00),
+        'standard': (3.00, 15.00),
+        'premium': (15.00, 75.00)
+    })
+
+    SECTION_MODEL_TIERS: Dict[str, str] = field(default_factory=lambda: {
+        # Short, list-like sections with little structure
+        'hobbies': 'fast',
+        'languages': 'fast',
+        'contact': 'fast',
+        # Moderately structured sections
+        'courses': 'standard',
+        'certifications': 'standard',
+        'volunteer': 'standard',
+        'publications': 'standard',
+        'speaking': 'standard',
+        'achievements': 'standard',
+        # Core sections where accuracy matters most
+        'hero': 'premium',
+        'summary': 'premium',
+        'experience': 'premium',
+        'education': 'premium',
+        'skills': 'premium',
+        'projects': 'premium'
+    })
+
     # Retry configuration
     MAX_RETRIES: int = 3  # Balance between reliability and speed
     RETRY_MIN_WAIT: int = 4  # Minimum seconds between retries (rate limit safety)
     RETRY_MAX_WAIT: int = 10  # Cap retry wait to avoid long delays
     RETRY_MULTIPLIER: int = 1  # Linear backoff (not exponential) for predictability
     
+    # Deadline configuration
+    EXTRACTION_DEADLINE_SECONDS: float = 120.0  # Overall budget for an extraction (interactive and queued)
+    DEADLINE_POLL_INTERVAL: float = 0.5  # How often to check for deadline expiry / client disconnect
+    QUEUED_EXTRACTION_WAIT_SECONDS: float = 300.0  # How long /extract waits for a queued upload job
+
+    # Incremental re-extraction of revised CVs (see revision_diff)
+    ENABLE_INCREMENTAL_EXTRACTION: bool = True  # When False, revisions are extracted in full
+    INCREMENTAL_MAX_CHANGED_RATIO: float = 0.5  # Above this share of changed lines, extract in full
+
+    # Multi-file uploads (see multi_file_text)
+    MULTI_FILE_TEXT_CONCURRENCY: int = 4  # Files of one upload extracted at once
+    MAX_COMBINED_TEXT_CHARS: int = 40000  # Combined text budget before per-file truncation
+
+    # Section headings (lowercase, punctuation stripped) used to locate sections in CV text
+    SECTION_HEADINGS: Dict[str, List[str]] = field(default_factory=lambda: {
+        'summary': ["summary", "professional summary", "career summary", "profile", "professional profile",
+                    "about", "about me", "objective", "career objective", "overview"],
+        'experience': ["experience", "work experience", "professional experience", "relevant experience",
+                       "employment", "employment history", "work history", "career history"],
+        'education': ["education", "academic background", "education and training", "academic qualifications"],
+        'skills': ["skills", "technical skills", "key skills", "core skills", "core competencies",
+                   "competencies", "skills and competencies", "technologies"],
+        'projects': ["projects", "personal projects", "key projects", "selected projects"],
+        'certifications': ["certifications", "certificates", "licenses", "licenses and certifications",
+                           "certifications and licenses"],
+        'achievements': ["achievements", "accomplishments", "awards", "honors", "honours", "awards and honors",
+                         "patents", "memberships", "professional memberships"],
+        'volunteer': ["volunteer", "volunteering", "volunteer experience", "community service",
+                      "activities", "extracurricular activities"],
+        'languages': ["languages", "language skills"],
+        'contact': ["contact", "contact information", "contact details", "personal information",
+                    "personal details"],
+        'courses': ["courses", "coursework", "relevant coursework", "training", "professional development"],
+        'hobbies': ["hobbies", "interests", "hobbies and interests"],
+        'publications': ["publications", "research", "publications and research", "papers"],
+        'speaking': ["speaking", "speaking engagements", "talks", "presentations", "conferences"]
+    })
+
+    # Sections read from the lines above the first heading (name, title, contact details)
+    HEADER_SECTIONS: List[str] = field(default_factory=lambda: ["hero", "contact", "summary"])
+
+    # Sections that draw on another section's content and are re-extracted with it
+    SECTION_DEPENDENTS: Dict[str, List[str]] = field(default_factory=lambda: {
+        'experience': ["hero", "summary"]  # Current title, years of experience
+    })
+
     # Extraction configuration
     TOTAL_SECTIONS: int = 17  # Number of CV sections we attempt to extract
     CONFIDENCE_THRESHOLD: float = 0.8  # Minimum confidence for "good" extraction
@@ -32,16 +126,42 @@ class ExtractionConfig:
     ALLOW_DEFAULTS: bool = False   # When False, no default values for missing fields
     ALLOW_CONTEXTUAL_EXTRACTION: bool = False  # When False, only explicit mentions extracted
     
-    # Technology patterns for extraction
-    TECH_PATTERNS: List[str] = field(default_factory=lambda: [
-        r'\b(Excel|PowerPoint|Word|Outlook|Office|Teams|SharePoint|OneNote)\b',
-        r'\b(Python|Java|JavaScript|TypeScript|C\+\+|C#|Ruby|Go|Swift|Kotlin|Rust|PHP|Scala|R|MATLAB)\b',
-        r'\b(React|Angular|Vue|Svelte|Next\.js|Nuxt|Django|Flask|FastAPI|Spring|Node\.js|Express|Rails)\b',
-        r'\b(AWS|Azure|GCP|Docker|Kubernetes|Jenkins|CircleCI|GitLab CI|GitHub Actions|Terraform)\b',
-        r'\b(SQL|MySQL|PostgreSQL|MongoDB|Redis|Cassandra|DynamoDB|Firebase|Elasticsearch)\b',
-        r'\b(Git|GitHub|GitLab|Bitbucket|Jira|Confluence|Slack|Trello|Asana)\b',
-        r'\b(TensorFlow|PyTorch|Keras|scikit-learn|pandas|NumPy|Jupyter|Tableau|Power BI)\b'
-    ])
+    # Technology dictionary shared by every technology lookup (see tech_matcher).
+    # Canonical names keyed by category; matching is case-insensitive on whole words.
+    TECH_PATTERNS: Dict[str, List[str]] = field(default_factory=lambda: {
+        'office': ['Excel', 'PowerPoint', 'Word', 'Outlook', 'Office', 'Teams', 'SharePoint', 'OneNote'],
+        'languages': ['Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Ruby', 'Go', 'Swift',
+                      'Kotlin', 'Rust', 'PHP', 'Scala', 'R', 'MATLAB'],
+        'frontend': ['React', 'Angular', 'Vue', 'Svelte', 'Next.js', 'Nuxt'],
+        'backend': ['Django', 'Flask', 'FastAPI', 'Spring', 'Node.js', 'Express', 'Rails', 'GraphQL'],
+        'cloud': ['AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Terraform'],
+        'ci_cd': ['Jenkins', 'CircleCI', 'GitLab CI', 'GitHub Actions'],
+        'databases': ['SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Cassandra', 'DynamoDB', 'Firebase',
+                      'Elasticsearch'],
+        'tools': ['Git', 'GitHub', 'GitLab', 'Bitbucket', 'Jira', 'Confluence', 'Slack', 'Trello', 'Asana'],
+        'data_science': ['TensorFlow', 'PyTorch', 'Keras', 'scikit-learn', 'pandas', 'NumPy', 'Jupyter',
+                         'Tableau', 'Power BI'],
+        # General concepts - used to compare achievements, not reported as technologiesUsed
+        'concepts': ['API', 'REST', 'Microservices', 'Cloud', 'ML', 'AI']
+    })
+
+    # Alternative spellings mapped to their canonical TECH_PATTERNS name
+    TECH_ALIASES: Dict[str, str] = field(default_factory=lambda: {
+        'NodeJS': 'Node.js',
+        'RESTful': 'REST',
+        'Microservice': 'Microservices'
+    })
+
+    # TECH_PATTERNS categories left out of experience technologiesUsed
+    TECH_CONCEPT_CATEGORIES: Tuple[str, ...] = ('concepts',)
+
+    # The TECH_PATTERNS names looked for in free-text achievement key info. Left
+    # narrow on purpose: in prose, terms such as "Go", "Word" or "Teams" are far
+    # more often ordinary words than the technology.
+    KEY_INFO_TECH_TERMS: Tuple[str, ...] = (
+        'Python', 'JavaScript', 'React', 'Node.js', 'Django', 'AWS', 'Docker', 'Kubernetes', 'SQL',
+        'MongoDB', 'Redis', 'GraphQL', 'REST', 'API', 'ML', 'AI', 'Cloud', 'Microservices'
+    )
     
     # Availability patterns for extraction from summary
     AVAILABILITY_PATTERNS: List[str] = field(default_factory=lambda: [
@@ -87,6 +207,9 @@ class ExtractionConfig:
         "Educational degrees → These belong in Education section"
     ])
     
+    # Parse caches - LRU entries kept per memoized parser (locations, countries, dates)
+    PARSE_CACHE_SIZE: int = 4096
+    
     # Limits and thresholds
     MAX_CAREER_HIGHLIGHTS: int = 5  # Prevent duplication with achievements section
     MIN_ACHIEVEMENT_LENGTH: int = 10  # Filter out trivial achievements
@@ -117,14 +240,60 @@ class ExtractionConfig:
     
     # Compiled regex patterns (for performance)
     _compiled_patterns: Dict[str, List[Pattern]] = field(default_factory=dict)
+    _tech_matcher: Optional[TechnologyMatcher] = field(default=None, repr=False)
+    _key_info_tech_matcher: Optional[TechnologyMatcher] = field(default=None, repr=False)
     
+    def get_model_tier(self, section_name: str) -> str:
+        """Get the model tier a section should be extracted with."""
+        if not self.ENABLE_TIERED_ROUTING:
+            return self.ESCALATION_TIER
+        return self.SECTION_MODEL_TIERS.get(section_name, self.DEFAULT_MODEL_TIER)
+
+    def get_tier_model(self, tier: str) -> str:
+        """Get the model identifier for a tier."""
+        return self.MODEL_TIERS.get(tier, self.MODEL_TIERS[self.ESCALATION_TIER])
+
+    def estimate_tier_cost(self, tier: str, input_tokens: int, output_tokens: int) -> float:
+        """Estimate the USD cost of a call on the given tier."""
+        input_price, output_price = self.MODEL_TIER_PRICING.get(tier, (0.0, 0.0))
+        return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+    def get_tech_matcher(self) -> TechnologyMatcher:
+        """Get the technology matcher for TECH_PATTERNS, building it once for reuse."""
+        if self._tech_matcher is None:
+            self._tech_matcher = TechnologyMatcher(self.TECH_PATTERNS, self.TECH_ALIASES)
+        return self._tech_matcher
+
+    def get_key_info_tech_matcher(self) -> TechnologyMatcher:
+        """Get the matcher for the KEY_INFO_TECH_TERMS subset of TECH_PATTERNS, building it once for reuse."""
+        if self._key_info_tech_matcher is None:
+            keep = set(self.KEY_INFO_TECH_TERMS)
+            terms = {category: [name for name in names if name in keep]
+                     for category, names in self.TECH_PATTERNS.items()}
+            aliases = {alias: name for alias, name in self.TECH_ALIASES.items() if name in keep}
+            self._key_info_tech_matcher = TechnologyMatcher(terms, aliases)
+        return self._key_info_tech_matcher
+
     def get_compiled_tech_patterns(self) -> List[Pattern]:
-        """Get compiled technology patterns, caching for reuse."""
-        if 'tech' not in self._compiled_patterns:
-            self._compiled_patterns['tech'] = [
-                re.compile(pattern, re.IGNORECASE) for pattern in self.TECH_PATTERNS
-            ]
-        return self._compiled_patterns['tech']
+        """Get compiled technology patterns - the shared matcher's single alternation."""
+        pattern = self.get_tech_matcher().pattern
+        return [pattern] if pattern is not None else []
+
+    def add_tech_terms(self, category: str, names: List[str], aliases: Optional[Dict[str, str]] = None):
+        """
+        Extend the technology dictionary (and the shared matcher, if already built).
+
+        Args:
+            category: TECH_PATTERNS category to add the names to
+            names: Canonical technology names
+            aliases: Alternative spellings mapped to canonical names
+        """
+        self.TECH_PATTERNS.setdefault(category, []).extend(names)
+        self.TECH_ALIASES.update(aliases or {})
+        if self._tech_matcher is not None:
+            self._tech_matcher.add_terms({category: names})
+            if aliases:
+                self._tech_matcher.add_aliases(aliases)
     
     def get_compiled_availability_patterns(self) -> List[Pattern]:
         """Get compiled availability patterns, caching for reuse."""
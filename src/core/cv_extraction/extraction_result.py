@@ -0,0 +1,86 @@
+"""
+Extraction Result
+Everything produced for one extraction, computed once and handed to routes,
+caching and DB writes instead of being re-derived from CVData at each step
+"""
+import json
+from dataclasses import dataclass, field
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Sequence, Tuple
+
+from .metrics import ExtractionMetrics
+
+# Import schemas
+from src.core.schemas.unified_nullable import CVData
+
+
+@dataclass(frozen=True)
+class ExtractionResult:
+    """
+    Immutable report of one CV extraction.
+
+    cv_data is the final CVData object; cv_data_dict is its model_dump_nullable()
+    taken once when the result was built (read-only view). Treat cv_data as
+    read-only too - the other fields were derived from it.
+    """
+    cv_data: CVData
+    cv_data_dict: Mapping[str, Any]
+    confidence: float
+    validation_issues: Tuple[str, ...] = ()
+    missing_sections: Tuple[str, ...] = ()
+    reused_sections: Tuple[str, ...] = ()  # Taken from the user's previous extraction
+    section_models: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))  # Model of each section
+    metrics: Optional[ExtractionMetrics] = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def build(cls, cv_data: CVData, confidence: float,
+              validation_issues: Sequence[str] = (),
+              metrics: Optional[ExtractionMetrics] = None,
+              reused_sections: Sequence[str] = (),
+              section_models: Optional[Mapping[str, str]] = None) -> 'ExtractionResult':
+        """Serialize cv_data once and freeze everything alongside it."""
+        return cls(
+            cv_data=cv_data,
+            cv_data_dict=MappingProxyType(cv_data.model_dump_nullable()),
+            confidence=confidence,
+            validation_issues=tuple(validation_issues),
+            missing_sections=tuple(cv_data.missing_sections),
+            reused_sections=tuple(reused_sections),
+            section_models=MappingProxyType(dict(section_models or {})),
+            metrics=metrics
+        )
+
+    @property
+    def is_partial(self) -> bool:
+        """True when sections were cut off by a deadline or cancellation."""
+        return bool(self.missing_sections)
+
+    @property
+    def is_shareable(self) -> bool:
+        """
+        True when the result depends only on the file, so it may be cached or
+        handed to other uploads of the same file. Partial results and results
+        that reuse sections of a user's previous extraction (which may carry
+        manual edits) are not.
+        """
+        return not self.is_partial and not self.reused_sections
+
+    @property
+    def extraction_model(self) -> str:
+        """Models that produced the sections, for the extraction cache ("unknown" if not recorded)."""
+        return ",".join(sorted(set(self.section_models.values()))) or "unknown"
+
+    @cached_property
+    def sections_count(self) -> int:
+        """Number of non-empty top-level sections."""
+        return sum(1 for value in self.cv_data_dict.values() if value)
+
+    @cached_property
+    def cv_data_json(self) -> str:
+        """JSON for DB writes and the extraction cache (serialized on first use)."""
+        return json.dumps(dict(self.cv_data_dict))
+
+    def to_response(self) -> dict:
+        """Plain dict of the extracted data for API responses."""
+        return dict(self.cv_data_dict)
@@ -5,12 +5,103 @@ Prevents LLM from inventing or elaborating on data
 """
 import logging
 import re
-from typing import Dict, Any, List, Tuple, Optional, Set
+import threading
+from typing import Dict, Any, List, Tuple, Optional, Set, Union
 from difflib import SequenceMatcher
 
 logger = logging.getLogger(__name__)
 
 
+class SourceTextIndex:
+    """
+    Normalized view of one CV's source text, built once and queried per field.
+    
+    Holds the normalized text, its word set and a SequenceMatcher with the source
+    already loaded as the second sequence, so per-field checks no longer
+    re-normalize the whole CV or rebuild the matcher's lookup table. Substring
+    queries run on the pre-normalized text (C-level search) with a word-set fast
+    path and memoization; results are identical to the unindexed checks.
+    
+    An index lives for one validation run (build it once, pass it to every check
+    of the run). It is not cached beyond that, so a CV's text and query memos are
+    released when the run ends.
+    """
+    
+    def __init__(self, original_text: str):
+        self.original_text = original_text or ""
+        self.normalized = HallucinationValidator.normalize_text(self.original_text)
+        self.words: Set[str] = frozenset(self.normalized.split())
+        
+        # b2j for the source is computed on the first fuzzy query; set_seq1 is cheap per query
+        self._matcher: Optional[SequenceMatcher] = None
+        self._matcher_lock = threading.Lock()
+        
+        self._substring_cache: Dict[str, bool] = {}
+        self._exists_cache: Dict[Tuple[str, float], bool] = {}
+    
+    @staticmethod
+    def of(source: Union[str, 'SourceTextIndex']) -> 'SourceTextIndex':
+        """Accept either an existing index or raw text (indexed for this call only)."""
+        if isinstance(source, SourceTextIndex):
+            return source
+        return SourceTextIndex(source or "")
+    
+    @property
+    def source_length(self) -> int:
+        """Length of the original (un-normalized) text."""
+        return len(self.original_text)
+    
+    def contains(self, phrase: str) -> bool:
+        """Check whether an already-normalized phrase occurs in the normalized source."""
+        if phrase in self.words:
+            return True
+        cached = self._substring_cache.get(phrase)
+        if cached is None:
+            cached = self._substring_cache[phrase] = phrase in self.normalized
+        return cached
+    
+    def longest_match(self, normalized_text: str) -> int:
+        """Size of the longest block of normalized_text found in the source."""
+        with self._matcher_lock:
+            if self._matcher is None:
+                self._matcher = SequenceMatcher(None)
+                self._matcher.set_seq2(self.normalized)
+            self._matcher.set_seq1(normalized_text)
+            match = self._matcher.find_longest_match(0, len(normalized_text), 0, len(self.normalized))
+        return match.size
+    
+    def text_exists(self, extracted_text: str, threshold: float = 0.7) -> bool:
+        """See HallucinationValidator.text_exists_in_original."""
+        if not extracted_text:
+            return True  # Empty text is not hallucination
+        
+        key = (extracted_text, threshold)
+        cached = self._exists_cache.get(key)
+        if cached is None:
+            cached = self._exists_cache[key] = self._text_exists(extracted_text, threshold)
+        return cached
+    
+    def _text_exists(self, extracted_text: str, threshold: float) -> bool:
+        extracted_norm = HallucinationValidator.normalize_text(extracted_text)
+        
+        # Short strings (< 10 chars) should match exactly
+        if len(extracted_norm) < 10:
+            return self.contains(extracted_norm)
+        
+        # For short phrases, check if they appear contiguously
+        extracted_words = extracted_norm.split()
+        if len(extracted_words) <= 3:
+            return self.contains(' '.join(extracted_words))
+        
+        # For longer text, check if a similar sequence exists in the original
+        if self.longest_match(extracted_norm) >= len(extracted_norm) * threshold:
+            return True
+        
+        # Alternative check: How many words from extracted exist in original?
+        words_found = sum(1 for word in extracted_words if self.contains(word))
+        return words_found / len(extracted_words) >= threshold
+
+
 class HallucinationValidator:
     """Validates extracted CV data against original text to prevent hallucinations."""
     
@@ -55,53 +146,23 @@ class HallucinationValidator:
         return text
     
     @staticmethod
-    def text_exists_in_original(extracted_text: str, original_text: str, threshold: float = 0.7) -> bool:
+    def text_exists_in_original(extracted_text: str, original_text: Union[str, SourceTextIndex],
+                                threshold: float = 0.7) -> bool:
         """
         Check if extracted text substantially exists in original CV.
         
+        Short strings must match exactly, short phrases contiguously; longer text
+        passes if its longest match or its share of known words reaches threshold.
+        
         Args:
             extracted_text: Text extracted by LLM
-            original_text: Original CV text
+            original_text: Original CV text or its SourceTextIndex
             threshold: Similarity threshold (0.7 = 70% similar)
             
         Returns:
             True if text exists in original, False if likely hallucinated
         """
-        if not extracted_text:
-            return True  # Empty text is not hallucination
-            
-        extracted_norm = HallucinationValidator.normalize_text(extracted_text)
-        original_norm = HallucinationValidator.normalize_text(original_text)
-        
-        # Short strings (< 10 chars) should match exactly
-        if len(extracted_norm) < 10:
-            return extracted_norm in original_norm
-        
-        # For longer strings, check if substantial portion exists
-        # Split into words and check how many exist in original
-        extracted_words = extracted_norm.split()
-        if len(extracted_words) <= 3:
-            # For short phrases, check if they appear contiguously
-            # Join words back and check if the phrase exists as-is
-            phrase = ' '.join(extracted_words)
-            return phrase in original_norm
-        
-        # For longer text, use sequence matching
-        # Check if we can find a similar sequence in the original
-        matcher = SequenceMatcher(None, extracted_norm, original_norm)
-        
-        # Find longest matching subsequence
-        match = matcher.find_longest_match(0, len(extracted_norm), 0, len(original_norm))
-        
-        # If more than threshold of the text matches, it's likely real
-        if match.size >= len(extracted_norm) * threshold:
-            return True
-        
-        # Alternative check: How many words from extracted exist in original?
-        words_found = sum(1 for word in extracted_words if word in original_norm)
-        word_ratio = words_found / len(extracted_words)
-        
-        return word_ratio >= threshold
+        return SourceTextIndex.of(original_text).text_exists(extracted_text, threshold)
     
     @staticmethod
     def contains_hallucination_indicators(text: str) -> bool:
@@ -114,13 +175,14 @@ class HallucinationValidator:
         return any(indicator in text_normalized for indicator in HallucinationValidator.HALLUCINATION_INDICATORS)
     
     @staticmethod
-    def validate_section(section_data: Any, original_text: str, section_name: str) -> Tuple[Any, List[str]]:
+    def validate_section(section_data: Any, original_text: Union[str, SourceTextIndex],
+                         section_name: str) -> Tuple[Any, List[str]]:
         """
         Validate a section's data against original text.
         
         Args:
             section_data: The section data to validate
-            original_text: Original CV text
+            original_text: Original CV text or its SourceTextIndex
             section_name: Name of the section for logging
             
         Returns:
@@ -131,6 +193,8 @@ class HallucinationValidator:
         if not section_data:
             return section_data, issues
         
+        original_text = SourceTextIndex.of(original_text)
+        
         # Handle different data types
         if isinstance(section_data, str):
             if not HallucinationValidator.text_exists_in_original(section_data, original_text):
@@ -164,13 +228,14 @@ class HallucinationValidator:
         return section_data, issues
     
     @staticmethod
-    def validate_cv_data(cv_data: Dict[str, Any], original_text: str) -> Tuple[Dict[str, Any], List[str]]:
+    def validate_cv_data(cv_data: Dict[str, Any],
+                         original_text: Union[str, SourceTextIndex]) -> Tuple[Dict[str, Any], List[str]]:
         """
         Validate entire CV data against original text.
         
         Args:
             cv_data: Extracted CV data dictionary
-            original_text: Original CV text
+            original_text: Original CV text or its SourceTextIndex
             
         Returns:
             Tuple of (cleaned_cv_data, list_of_issues)
@@ -178,6 +243,7 @@ class HallucinationValidator:
         logger.info("Starting hallucination validation...")
         all_issues = []
         cleaned_data = cv_data.copy()
+        source_index = SourceTextIndex.of(original_text)
         
         # Validate each section
         sections_to_validate = [
@@ -188,7 +254,7 @@ class HallucinationValidator:
         for section in sections_to_validate:
             if section in cleaned_data and cleaned_data[section]:
                 section_data, issues = HallucinationValidator.validate_section(
-                    cleaned_data[section], original_text, section
+                    cleaned_data[section], source_index, section
                 )
                 cleaned_data[section] = section_data
                 all_issues.extend(issues)
@@ -199,7 +265,7 @@ class HallucinationValidator:
                 cleaned_data.get('achievements', {}),
                 cleaned_data.get('education', {}),
                 cleaned_data.get('volunteer', {}),
-                original_text
+                source_index
             )
             cleaned_data['achievements'] = cleaned_achievements
         
@@ -211,7 +277,8 @@ class HallucinationValidator:
         return cleaned_data, all_issues
     
     @staticmethod
-    def _deduplicate_achievements(achievements: Any, education: Any, volunteer: Any, original_text: str) -> Any:
+    def _deduplicate_achievements(achievements: Any, education: Any, volunteer: Any,
+                                  original_text: Union[str, SourceTextIndex]) -> Any:
         """Remove achievements that duplicate data from other sections."""
         if not achievements:
             return achievements
@@ -4,13 +4,20 @@ Handles all interactions with Claude 4 Opus API
 """
 import os
 import logging
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, Any, TYPE_CHECKING
 
-from anthropic import AsyncAnthropic
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .extraction_config import extraction_config
 from .circuit_breaker import llm_circuit_breaker, CircuitBreakerOpenError
+from .client_registry import anthropic_client_registry, get_anthropic_client
+from .deadline import (
+    ExtractionDeadline, DeadlineExceededError, retry_unless_deadline_exceeded,
+    stop_when_deadline_exhausted, wait_within_deadline
+)
+
+if TYPE_CHECKING:
+    from .streaming_parser import IncrementalJSONParser
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +61,8 @@ class LLMService:
         self.api_key = anthropic_api_key
                 
         try:
-            self.claude_client = AsyncAnthropic(api_key=anthropic_api_key)
+            # Shared, connection-pooled client - this service is a lightweight handle
+            self.claude_client = get_anthropic_client(anthropic_api_key)
             self.claude_available = True
             logger.info(f"Claude 4 Opus ({config.PRIMARY_MODEL}) initialized successfully")
         except Exception as e:
@@ -72,45 +80,132 @@ class LLMService:
         logger.info(f"LLMService initialized with Claude 4 Opus ({self.model_name}) - Maximum Determinism Mode")
     
     @retry(
-        stop=stop_after_attempt(extraction_config.MAX_RETRIES), 
-        wait=wait_exponential(
+        stop=(stop_after_attempt(extraction_config.MAX_RETRIES)
+              | stop_when_deadline_exhausted(extraction_config.RETRY_MIN_WAIT)),
+        wait=wait_within_deadline(wait_exponential(
             multiplier=extraction_config.RETRY_MULTIPLIER, 
             min=extraction_config.RETRY_MIN_WAIT, 
             max=extraction_config.RETRY_MAX_WAIT
-        )
+        )),
+        retry=retry_unless_deadline_exceeded()
     )
-    async def call_llm(self, prompt: str, section_name: str) -> Tuple[str, str]:
+    async def call_llm(self, prompt: str, section_name: str,
+                       model: Optional[str] = None,
+                       deadline: Optional[ExtractionDeadline] = None) -> Tuple[str, str]:
         """
         Call Claude 4 Opus with retry logic and circuit breaker protection.
         
         Args:
             prompt: The prompt to send to the LLM
             section_name: Name of the section being extracted (for logging)
+            model: Optional model override (tiered routing); defaults to the primary model
+            deadline: Optional extraction deadline; each attempt is bounded by the time
+                left and no retry is started that cannot fit before it
             
         Returns:
             Tuple of (model_used, response_text)
             
         Raises:
             CircuitBreakerOpenError: If the circuit breaker is open due to failures
+            DeadlineExceededError: If the deadline expires before a response arrives
         """
+        model_name = model or self.model_name
         try:
             # Use circuit breaker to protect against cascade failures
             async with llm_circuit_breaker:
-                logger.debug(f"Calling Claude 4 Opus for {section_name}")
-                response = await self.claude_client.messages.create(
-                    model=self.model_name,
+                logger.debug(f"Calling {model_name} for {section_name}")
+                request = self.claude_client.messages.create(
+                    model=model_name,
                     max_tokens=self.model_config["max_tokens"],
                     temperature=self.model_config["temperature"],
                     top_p=self.model_config["top_p"],
                     messages=[{"role": "user", "content": prompt}]
                 )
-                return (self.model_name, response.content[0].text)
+                if deadline is not None:
+                    response = await deadline.run(request, f"{section_name} LLM call")
+                else:
+                    response = await request
+                return (model_name, response.content[0].text)
+        except DeadlineExceededError:
+            logger.warning(f"Deadline exceeded for {section_name} - giving up on LLM call")
+            raise
         except CircuitBreakerOpenError:
             # Circuit is open, service is unavailable
             logger.error(f"Circuit breaker open for LLM service - {section_name} extraction blocked")
             raise
         except Exception as e:
-            logger.error(f"Claude 4 Opus failed for {section_name}: {e}")
+            logger.error(f"{model_name} failed for {section_name}: {e}")
+            raise
+    
+    @retry(
+        stop=(stop_after_attempt(extraction_config.MAX_RETRIES)
+              | stop_when_deadline_exhausted(extraction_config.RETRY_MIN_WAIT)),
+        wait=wait_within_deadline(wait_exponential(
+            multiplier=extraction_config.RETRY_MULTIPLIER, 
+            min=extraction_config.RETRY_MIN_WAIT, 
+            max=extraction_config.RETRY_MAX_WAIT
+        )),
+        retry=retry_unless_deadline_exceeded()
+    )
+    async def call_llm_streaming(self, prompt: str, section_name: str,
+                                 parser: Optional["IncrementalJSONParser"] = None,
+                                 model: Optional[str] = None,
+                                 deadline: Optional[ExtractionDeadline] = None) -> Tuple[str, str]:
+        """
+        Call Claude 4 Opus in streaming mode, feeding tokens to an incremental parser.
+        
+        Same contract as call_llm, but text deltas are pushed into the parser as they
+        arrive so partial items can be surfaced before the response is complete.
+        
+        Args:
+            prompt: The prompt to send to the LLM
+            section_name: Name of the section being extracted (for logging)
+            parser: Optional incremental parser; reset at the start of every attempt
+            model: Optional model override (tiered routing); defaults to the primary model
+            deadline: Optional extraction deadline bounding the whole stream
+            
+        Returns:
+            Tuple of (model_used, response_text)
+            
+        Raises:
+            CircuitBreakerOpenError: If the circuit breaker is open due to failures
+            DeadlineExceededError: If the deadline expires before the stream completes
+        """
+        if parser is not None:
+            parser.reset()
+        
+        model_name = model or self.model_name
+        try:
+            async with llm_circuit_breaker:
+                logger.debug(f"Streaming {model_name} response for {section_name}")
+                chunks = []
+                
+                async def consume_stream():
+                    async with self.claude_client.messages.stream(
+                        model=model_name,
+                        max_tokens=self.model_config["max_tokens"],
+                        temperature=self.model_config["temperature"],
+                        top_p=self.model_config["top_p"],
+                        messages=[{"role": "user", "content": prompt}]
+                    ) as stream:
+                        async for text in stream.text_stream:
+                            chunks.append(text)
+                            if parser is not None:
+                                parser.feed(text)
+                
+                if deadline is not None:
+                    await deadline.run(consume_stream(), f"{section_name} LLM stream")
+                else:
+                    await consume_stream()
+                return (model_name, "".join(chunks))
+        except DeadlineExceededError:
+            logger.warning(f"Deadline exceeded for {section_name} - abandoning LLM stream")
+            raise
+        except CircuitBreakerOpenError:
+            logger.error(f"Circuit breaker open for LLM service - {section_name} extraction blocked")
+            raise
+        except Exception as e:
+            logger.error(f"{model_name} streaming failed for {section_name}: {e}")
             raise
     
     def get_model_info(self) -> dict:
@@ -127,6 +222,15 @@ class LLMService:
             "deterministic": self.model_config["temperature"] == 0.0
         }
     
+    def get_connection_stats(self) -> dict:
+        """
+        Get connection pool reuse statistics for the shared Anthropic clients.
+        
+        Returns:
+            Dictionary with pool settings and per-key reuse counters
+        """
+        return anthropic_client_registry.get_stats()
+    
     async def health_check(self) -> bool:
         """
         Check if the LLM service is healthy and can make API calls.
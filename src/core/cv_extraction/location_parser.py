@@ -6,6 +6,8 @@ import re
 from typing import Optional, Dict, Tuple
 from src.core.schemas.unified_nullable import Location
 
+from .parse_cache import parse_cache
+
 # US state abbreviations
 US_STATES = {
     'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas', 'CA': 'California',
@@ -107,8 +109,9 @@ def is_us_state(text: str) -> bool:
     text = text.strip()
     return text in US_STATES or text in US_STATES.values()
 
+@parse_cache('country')
 def normalize_country(country_str: str) -> str:
-    """Normalize country name to standard format"""
+    """Normalize country name to standard format (memoized)"""
     if not country_str:
         return None
         
@@ -165,6 +168,22 @@ def parse_location_string(location_str: str) -> Location:
     if not location_str:
         return Location()
     
+    city, state, country = parse_location_fields(location_str)
+    return Location(city=city, state=state, country=country)
+
+@parse_cache('location')
+def parse_location_fields(location_str: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Parse a location string into (city, state, country) - memoized.
+    
+    Returns a tuple rather than a Location so cached results cannot be
+    modified by callers.
+    """
+    location = _parse_location(location_str)
+    return location.city, location.state, location.country
+
+def _parse_location(location_str: str) -> Location:
+    """Parse a non-empty location string (uncached - use parse_location_fields)"""
     # Clean up the string
     location_str = location_str.strip()
     
@@ -2,10 +2,10 @@
 Location Processing Service for CV Data Extraction
 Centralizes all location parsing and processing logic
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
-from .location_parser import parse_location_string
+from .location_parser import parse_location_fields
 
 logger = logging.getLogger(__name__)
 
@@ -14,49 +14,61 @@ class LocationProcessor:
     """Processes and standardizes location data across all CV sections."""
     
     @staticmethod
-    def process_location_field(location_data: Any) -> Dict[str, Optional[str]]:
+    def location_key(location_data: Any) -> Optional[str]:
         """
-        Process a single location field into standardized format.
+        The string a location field is parsed from, or None if there is nothing to parse.
         
         Args:
             location_data: Either a string or dict containing location info
             
         Returns:
-            Dict with city, state, country fields
+            Location string (dicts are joined as "city, state, country")
         """
         if not location_data:
-            return {'city': None, 'state': None, 'country': None}
+            return None
         
         if isinstance(location_data, str):
-            # Parse string location into structured format
-            parsed = parse_location_string(location_data)
+            return location_data
+        
+        if isinstance(location_data, dict):
+            # Reconstruct and reparse for consistency
+            location_parts = [location_data[key] for key in ('city', 'state', 'country') if location_data.get(key)]
+            return ', '.join(location_parts) if location_parts else None
+        
+        return None
+    
+    @staticmethod
+    def _apply_parsed(location_data: Any, parsed: Tuple[Optional[str], Optional[str], Optional[str]]) -> Dict[str, Optional[str]]:
+        """Build the standardized location from parse_location_fields output."""
+        city, state, country = parsed
+        if isinstance(location_data, dict):
+            # Keep the original values where parsing found nothing
             return {
-                'city': parsed.city,
-                'state': parsed.state,
-                'country': parsed.country
+                'city': city or location_data.get('city'),
+                'state': state or location_data.get('state'),
+                'country': country or location_data.get('country')
             }
+        return {'city': city, 'state': state, 'country': country}
+    
+    @staticmethod
+    def process_location_field(location_data: Any) -> Dict[str, Optional[str]]:
+        """
+        Process a single location field into standardized format.
         
-        elif isinstance(location_data, dict):
-            # Reconstruct and reparse for consistency
-            location_parts = []
-            if location_data.get('city'):
-                location_parts.append(location_data['city'])
-            if location_data.get('state'):
-                location_parts.append(location_data['state'])
-            if location_data.get('country'):
-                location_parts.append(location_data['country'])
-            
-            if location_parts:
-                parsed = parse_location_string(', '.join(location_parts))
-                return {
-                    'city': parsed.city or location_data.get('city'),
-                    'state': parsed.state or location_data.get('state'),
-                    'country': parsed.country or location_data.get('country')
-                }
+        Args:
+            location_data: Either a string or dict containing location info
             
-            return location_data
+        Returns:
+            Dict with city, state, country fields
+        """
+        key = LocationProcessor.location_key(location_data)
+        if key is None:
+            # Dicts without any location parts are kept as they are
+            if location_data and isinstance(location_data, dict):
+                return location_data
+            return {'city': None, 'state': None, 'country': None}
         
-        return {'city': None, 'state': None, 'country': None}
+        return LocationProcessor._apply_parsed(location_data, parse_location_fields(key))
     
     @staticmethod
     def process_items_with_location(items: List[Dict[str, Any]], 
@@ -64,6 +76,8 @@ class LocationProcessor:
         """
         Process a list of items that contain location fields.
         
+        Each distinct location string is parsed once for the whole list.
+        
         Args:
             items: List of dictionaries potentially containing 'location' field
             item_type: Type of item for logging (e.g., "experience", "education")
@@ -74,15 +88,22 @@ class LocationProcessor:
         if not items:
             return items
         
-        for item in items:
-            if 'location' in item:
-                original_location = item['location']
+        located = [item for item in items if 'location' in item]
+        keys = {LocationProcessor.location_key(item['location']) for item in located}
+        parsed = {key: parse_location_fields(key) for key in keys if key is not None}
+        
+        for item in located:
+            original_location = item['location']
+            key = LocationProcessor.location_key(original_location)
+            if key is None:
                 item['location'] = LocationProcessor.process_location_field(original_location)
-                
-                # Log if location was transformed
-                if original_location != item['location']:
-                    item_name = item.get('jobTitle') or item.get('institution') or item.get('title', 'Unknown')
-                    logger.debug(f"Processed location for {item_type} '{item_name}'")
+            else:
+                item['location'] = LocationProcessor._apply_parsed(original_location, parsed[key])
+            
+            # Log if location was transformed
+            if original_location != item['location']:
+                item_name = item.get('jobTitle') or item.get('institution') or item.get('title', 'Unknown')
+                logger.debug(f"Processed location for {item_type} '{item_name}'")
         
         return items
     
@@ -11,8 +11,13 @@ import json
 from collections import defaultdict
 import asyncio
 
+from src.services.shared_state import shared_state
+
 logger = logging.getLogger(__name__)
 
+# Shared state counter keys for the totals (summed across worker processes)
+COUNTER_PREFIX = "extraction_metrics:"
+
 
 # TypedDict definitions for better type safety
 class TimingMetrics(TypedDict):
@@ -22,6 +27,7 @@ class TimingMetrics(TypedDict):
     llm_total: float
     llm_by_section: Dict[str, float]
     post_processing: float
+    enhancers: Dict[str, float]
     validation: float
 
 
@@ -30,8 +36,10 @@ class CountMetrics(TypedDict):
     sections_requested: int
     sections_extracted: int
     sections_failed: int
+    sections_reused: int
     retry_count: int
     validation_issues: int
+    sections_missing: int
 
 
 class SizeMetrics(TypedDict):
@@ -51,6 +59,16 @@ class MetadataMetrics(TypedDict):
     model_used: str
 
 
+class TierMetrics(TypedDict):
+    """Type definition for per-model-tier metrics"""
+    calls: int
+    total_seconds: float
+    average_seconds: float
+    estimated_cost_usd: float
+    escalations: int
+    escalation_rate: float
+
+
 class ErrorInfo(TypedDict):
     """Type definition for error information"""
     type: str
@@ -66,6 +84,7 @@ class ExtractionMetricsDict(TypedDict):
     size: SizeMetrics
     quality: QualityMetrics
     metadata: MetadataMetrics
+    tiers: Dict[str, TierMetrics]
     errors: List[ErrorInfo]
 
 
@@ -91,12 +110,14 @@ class ExtractionMetrics:
     llm_total_time: float = 0.0
     llm_times_by_section: Dict[str, float] = field(default_factory=dict)
     post_processing_time: float = 0.0
+    enhancer_times: Dict[str, float] = field(default_factory=dict)
     validation_time: float = 0.0
     
     # Count metrics
     sections_requested: int = 0
     sections_extracted: int = 0
     sections_failed: int = 0
+    sections_reused: int = 0  # Taken from the previous extraction of a revised CV
     retry_count: int = 0
     validation_issues: int = 0
     
@@ -113,9 +134,57 @@ class ExtractionMetrics:
     api_key_hash: str = ""
     model_used: str = "claude-3-opus"
     
+    # Model tier metrics (tiered routing)
+    llm_calls_by_tier: Dict[str, int] = field(default_factory=dict)
+    llm_times_by_tier: Dict[str, float] = field(default_factory=dict)
+    llm_cost_by_tier: Dict[str, float] = field(default_factory=dict)
+    escalations_by_tier: Dict[str, int] = field(default_factory=dict)
+    escalated_sections: List[str] = field(default_factory=list)
+    section_models: Dict[str, str] = field(default_factory=dict)  # Model of each extracted section
+    
+    # Deadline / cancellation - sections cut off before they finished
+    missing_sections: List[str] = field(default_factory=list)
+    cancelled: bool = False
+    
     # Error tracking
     errors: List[Dict[str, Any]] = field(default_factory=list)
     
+    def record_llm_call(self, tier: str, elapsed: float, cost: float = 0.0):
+        """Record a single LLM call made on a model tier"""
+        self.llm_calls_by_tier[tier] = self.llm_calls_by_tier.get(tier, 0) + 1
+        self.llm_times_by_tier[tier] = self.llm_times_by_tier.get(tier, 0.0) + elapsed
+        self.llm_cost_by_tier[tier] = self.llm_cost_by_tier.get(tier, 0.0) + cost
+    
+    def record_enhancer_time(self, enhancer_name: str, elapsed: float):
+        """Record time spent in one enhancer during post-processing"""
+        self.enhancer_times[enhancer_name] = self.enhancer_times.get(enhancer_name, 0.0) + elapsed
+    
+    def record_escalation(self, section_name: str, from_tier: str):
+        """Record a section being re-extracted on a higher tier"""
+        self.escalations_by_tier[from_tier] = self.escalations_by_tier.get(from_tier, 0) + 1
+        self.escalated_sections.append(section_name)
+    
+    @property
+    def estimated_cost(self) -> float:
+        """Total estimated LLM cost in USD across all tiers"""
+        return sum(self.llm_cost_by_tier.values())
+    
+    def tier_summary(self) -> Dict[str, TierMetrics]:
+        """Per-tier latency, cost and escalation rate"""
+        summary = {}
+        for tier, calls in self.llm_calls_by_tier.items():
+            total = self.llm_times_by_tier.get(tier, 0.0)
+            escalations = self.escalations_by_tier.get(tier, 0)
+            summary[tier] = {
+                "calls": calls,
+                "total_seconds": round(total, 3),
+                "average_seconds": round(total / calls, 3) if calls else 0.0,
+                "estimated_cost_usd": round(self.llm_cost_by_tier.get(tier, 0.0), 6),
+                "escalations": escalations,
+                "escalation_rate": round(escalations / calls, 3) if calls else 0.0
+            }
+        return summary
+    
     def to_dict(self) -> ExtractionMetricsDict:
         """Convert metrics to dictionary for JSON serialization with type safety"""
         return {
@@ -127,14 +196,17 @@ class ExtractionMetrics:
                 "llm_total": round(self.llm_total_time, 3),
                 "llm_by_section": {k: round(v, 3) for k, v in self.llm_times_by_section.items()},
                 "post_processing": round(self.post_processing_time, 3),
+                "enhancers": {k: round(v, 4) for k, v in self.enhancer_times.items()},
                 "validation": round(self.validation_time, 3)
             },
             "counts": {
                 "sections_requested": self.sections_requested,
                 "sections_extracted": self.sections_extracted,
                 "sections_failed": self.sections_failed,
+                "sections_reused": self.sections_reused,
                 "retry_count": self.retry_count,
-                "validation_issues": self.validation_issues
+                "validation_issues": self.validation_issues,
+                "sections_missing": len(self.missing_sections)
             },
             "size": {
                 "input_text_length": self.input_text_length,
@@ -147,6 +219,7 @@ class ExtractionMetrics:
                 "api_key_hash": self.api_key_hash,
                 "model_used": self.model_used
             },
+            "tiers": self.tier_summary(),
             "errors": self.errors
         }
     
@@ -158,6 +231,9 @@ class ExtractionMetrics:
         logger.info(f"  ⏱️  Total time: {self.total_time:.2f}s")
         logger.info(f"  📝 Sections: {self.sections_extracted}/{self.sections_requested} ({success_rate:.1f}% success)")
         logger.info(f"  🤖 LLM time: {self.llm_total_time:.2f}s")
+        if self.llm_calls_by_tier:
+            tiers = ", ".join(f"{tier}={calls}" for tier, calls in sorted(self.llm_calls_by_tier.items()))
+            logger.info(f"  🧭 Tier calls: {tiers} (~${self.estimated_cost:.4f}, {len(self.escalated_sections)} escalated)")
         logger.info(f"  📏 Input size: {self.input_text_length:,} chars")
         logger.info(f"  ✅ Confidence: {self.extraction_confidence:.1%}")
         
@@ -166,7 +242,12 @@ class ExtractionMetrics:
 
 
 class MetricsCollector:
-    """Singleton metrics collector for aggregating metrics across all extractions"""
+    """
+    Singleton metrics collector for aggregating metrics across all extractions
+
+    The totals are counters in the shared state backend, so they cover every
+    worker process; per-extraction history stays in this process.
+    """
     
     _instance = None
     _lock = None  # Will be initialized as asyncio.Lock() when instance is created
@@ -191,20 +272,46 @@ class MetricsCollector:
         # Create asyncio lock for async operations
         self._async_lock = asyncio.Lock()
         
-        # Aggregate statistics
-        self.total_extractions = 0
-        self.successful_extractions = 0
-        self.failed_extractions = 0
-        self.total_processing_time = 0.0
-        self.average_processing_time = 0.0
+        self.state = shared_state
         
-        # Real-time counters
+        # Real-time counters (this process)
         self.active_extractions = 0
         self.extractions_per_minute = 0
         
         # Start cleanup task
         self._start_cleanup_task()
     
+    @property
+    def total_extractions(self) -> int:
+        return int(self.state.get_counter(f"{COUNTER_PREFIX}total"))
+    
+    @property
+    def successful_extractions(self) -> int:
+        return int(self.state.get_counter(f"{COUNTER_PREFIX}successful"))
+    
+    @property
+    def failed_extractions(self) -> int:
+        return int(self.state.get_counter(f"{COUNTER_PREFIX}failed"))
+    
+    @property
+    def total_processing_time(self) -> float:
+        return self.state.get_counter(f"{COUNTER_PREFIX}processing_time")
+    
+    @property
+    def average_processing_time(self) -> float:
+        total = self.total_extractions
+        return self.total_processing_time / total if total > 0 else 0.0
+    
+    def _count(self, name: str, amount: float = 1):
+        self.state.incr(f"{COUNTER_PREFIX}{name}", amount)
+    
+    def reset(self):
+        """Clear history and the shared totals"""
+        self.metrics_history.clear()
+        self.current_metrics.clear()
+        for name in ("total", "successful", "failed", "processing_time"):
+            self.state.reset_counter(f"{COUNTER_PREFIX}{name}")
+    
     async def start_extraction(self, extraction_id: str, api_key_hash: str = "") -> ExtractionMetrics:
         """Start tracking a new extraction (async-safe)"""
         async with self._async_lock:
@@ -215,7 +322,7 @@ class MetricsCollector:
             )
             self.current_metrics[extraction_id] = metrics
             self.active_extractions += 1
-            self.total_extractions += 1
+            self._count("total")
             return metrics
     
     def start_extraction_sync(self, extraction_id: str, api_key_hash: str = "") -> ExtractionMetrics:
@@ -227,7 +334,7 @@ class MetricsCollector:
         )
         self.current_metrics[extraction_id] = metrics
         self.active_extractions += 1
-        self.total_extractions += 1
+        self._count("total")
         return metrics
     
     async def end_extraction(self, extraction_id: str, success: bool = True):
@@ -239,14 +346,10 @@ class MetricsCollector:
             metrics = self.current_metrics[extraction_id]
             
             # Update counters
-            if success:
-                self.successful_extractions += 1
-            else:
-                self.failed_extractions += 1
+            self._count("successful" if success else "failed")
             
             # Update aggregate stats
-            self.total_processing_time += metrics.total_time
-            self.average_processing_time = self.total_processing_time / self.total_extractions
+            self._count("processing_time", metrics.total_time)
             
             # Store in history
             self.metrics_history.append(metrics)
@@ -266,14 +369,10 @@ class MetricsCollector:
         metrics = self.current_metrics[extraction_id]
         
         # Update counters
-        if success:
-            self.successful_extractions += 1
-        else:
-            self.failed_extractions += 1
+        self._count("successful" if success else "failed")
         
         # Update aggregate stats
-        self.total_processing_time += metrics.total_time
-        self.average_processing_time = self.total_processing_time / self.total_extractions
+        self._count("processing_time", metrics.total_time)
         
         # Store in history
         self.metrics_history.append(metrics)
@@ -291,7 +390,9 @@ class MetricsCollector:
     
     def get_aggregate_stats(self) -> AggregateStats:
         """Get aggregate statistics across all extractions with type safety"""
-        success_rate = (self.successful_extractions / self.total_extractions * 100) if self.total_extractions > 0 else 0
+        total_extractions = self.total_extractions
+        successful_extractions = self.successful_extractions
+        success_rate = (successful_extractions / total_extractions * 100) if total_extractions > 0 else 0
         
         # Calculate percentiles for processing time
         if self.metrics_history:
@@ -303,8 +404,8 @@ class MetricsCollector:
             p50 = p95 = p99 = 0
         
         return {
-            "total_extractions": self.total_extractions,
-            "successful_extractions": self.successful_extractions,
+            "total_extractions": total_extractions,
+            "successful_extractions": successful_extractions,
             "failed_extractions": self.failed_extractions,
             "success_rate": round(success_rate, 1),
             "active_extractions": self.active_extractions,
@@ -0,0 +1,175 @@
+"""
+Multi-File CV Text
+Builds the text of a CV uploaded as several files (e.g. one image per page):
+extracts the files concurrently, drops duplicates, and fits the combined text
+into a size budget so it does not blow up the section prompts
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .text_parsing import normalize_whitespace
+
+logger = logging.getLogger(__name__)
+
+TRUNCATION_MARKER = "\n[... truncated ...]"
+
+# Extracts a file's text from its path and content hash (e.g. through the text cache)
+TextExtract = Callable[[str, Optional[str]], str]
+
+
+@dataclass
+class FileText:
+    """Text of one file of a multi-file upload"""
+    path: str
+    file_hash: Optional[str] = None
+    text: str = ""
+    seconds: float = 0.0  # Text extraction time (0 for duplicates)
+    duplicate_of: Optional[str] = None  # Name of the earlier file with the same content
+    error: Optional[str] = None
+    truncated_chars: int = 0  # Characters cut to fit the combined text budget
+
+    @property
+    def name(self) -> str:
+        return Path(self.path).name
+
+    def report(self) -> Dict[str, Any]:
+        """Per-file summary for logs and the job's completion message"""
+        return {
+            "file": self.name,
+            "chars": len(self.text),
+            "seconds": self.seconds,
+            "duplicate_of": self.duplicate_of,
+            "truncated_chars": self.truncated_chars,
+            "error": self.error
+        }
+
+
+async def extract_file_texts(file_paths: List[str], file_hashes: List[Optional[str]],
+                             text_extract: TextExtract, concurrency: int = 4) -> List[FileText]:
+    """
+    Extract the text of every file concurrently, once per distinct content.
+
+    Files with the same hash as an earlier file are not extracted. Files whose
+    text turns out identical to an earlier file's (e.g. the same page exported
+    twice) are marked as duplicates as well.
+
+    Args:
+        file_paths: Files in upload order
+        file_hashes: Content hash of each file (None if unknown)
+        text_extract: Blocking text extraction; runs in threads
+        concurrency: Maximum files extracted at once
+
+    Returns:
+        FileText for every file, in upload order
+    """
+    files = [FileText(path, file_hash) for path, file_hash in zip(file_paths, file_hashes)]
+    first_by_hash: Dict[str, FileText] = {}
+    distinct = []
+    for file in files:
+        if file.file_hash and file.file_hash in first_by_hash:
+            file.duplicate_of = first_by_hash[file.file_hash].name
+            continue
+        if file.file_hash:
+            first_by_hash[file.file_hash] = file
+        distinct.append(file)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def extract(file: FileText):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                # OCR and PDF parsing block - keep them off the event loop
+                file.text = await asyncio.to_thread(text_extract, file.path, file.file_hash) or ""
+            except Exception as e:
+                logger.error(f"Failed to extract text from {file.path}: {e}")
+                file.error = str(e)
+            file.seconds = round(time.perf_counter() - started, 3)
+
+    await asyncio.gather(*(extract(file) for file in distinct))
+
+    first_by_text: Dict[str, FileText] = {}
+    for file in distinct:
+        key = normalize_whitespace(file.text)
+        if not key:
+            continue
+        if key in first_by_text:
+            file.duplicate_of = first_by_text[key].name
+        else:
+            first_by_text[key] = file
+    return files
+
+
+def _share_budget(lengths: List[int], total: int) -> List[int]:
+    """Equal shares of total; what shorter texts don't use goes to the longer ones"""
+    budgets = list(lengths)
+    remaining = total
+    pending = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    while pending:
+        share = remaining // len(pending)
+        if lengths[pending[0]] > share:
+            for i in pending:
+                budgets[i] = share
+            break
+        remaining -= lengths[pending.pop(0)]
+    return budgets
+
+
+def _cut_point(text: str, budget: int) -> int:
+    """Last line break within budget, else the last space, else budget (mid-word)"""
+    for separator in ("\n", " "):
+        # Only a separator in the second half - cutting earlier wastes the budget
+        cut = text.rfind(separator, 0, budget + 1)
+        if cut > budget // 2:
+            return cut
+    return budget
+
+
+def combine_file_texts(files: List[FileText], max_chars: int) -> str:
+    """
+    Join the distinct file texts in upload order under per-file headers.
+
+    When they exceed max_chars, every file keeps an equal share of the budget
+    (shorter files give what they don't need to longer ones) and is cut at a
+    line break - or between words when its text has no line breaks near the
+    cut - so each page stays represented instead of the last ones being
+    dropped. The characters cut are recorded on each FileText.
+
+    Args:
+        files: Output of extract_file_texts
+        max_chars: Budget for the file texts (headers not counted)
+
+    Returns:
+        Combined text ("" if no file had text)
+    """
+    parts = [file for file in files if file.text.strip() and not file.duplicate_of]
+    budgets = _share_budget([len(file.text) for file in parts], max_chars)
+
+    chunks = []
+    for file, budget in zip(parts, budgets):
+        text = file.text
+        if len(text) > budget:
+            text = text[:_cut_point(text, budget)]
+            file.truncated_chars = len(file.text) - len(text)
+            text += TRUNCATION_MARKER
+        chunks.append(f"\n\n--- File: {file.name} ---\n\n{text}")
+
+    truncated = [file.name for file in parts if file.truncated_chars]
+    if truncated:
+        logger.warning(f"Combined text over {max_chars} characters - truncated {truncated}")
+    return "".join(chunks)
+
+
+def summarize_file_texts(files: List[FileText]) -> Dict[str, Any]:
+    """Dedupe counts and per-file timings of a multi-file extraction"""
+    return {
+        "files_total": len(files),
+        "duplicates": sum(1 for file in files if file.duplicate_of),
+        "failed": sum(1 for file in files if file.error),
+        "truncated": sum(1 for file in files if file.truncated_chars),
+        "files": [file.report() for file in files]
+    }
@@ -0,0 +1,50 @@
+"""
+Parse Caches for CV Data Extraction
+Bounded LRU memoization for pure parsing helpers (locations, countries, dates),
+which see the same few strings ("Present", "Tel Aviv, Israel") within and
+across CVs. Hit/miss counters show whether each cache pays off.
+"""
+import functools
+from typing import Any, Callable, Dict, Optional
+
+from .extraction_config import extraction_config
+
+# Registered caches by name, for stats and clearing
+_parse_caches: Dict[str, Callable] = {}
+
+
+def parse_cache(name: str, maxsize: Optional[int] = None):
+    """
+    Memoize a pure function of hashable arguments with a bounded LRU cache.
+
+    Args:
+        name: Name the cache is reported under
+        maxsize: Maximum entries (defaults to extraction_config.PARSE_CACHE_SIZE)
+    """
+    def decorator(func: Callable) -> Callable:
+        cached = functools.lru_cache(maxsize=maxsize or extraction_config.PARSE_CACHE_SIZE)(func)
+        _parse_caches[name] = cached
+        return cached
+    return decorator
+
+
+def get_parse_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hits, misses, size and hit rate for every registered parse cache."""
+    stats = {}
+    for name, cached in _parse_caches.items():
+        info = cached.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+            "hit_rate": round(info.hits / lookups, 3) if lookups else 0.0
+        }
+    return stats
+
+
+def clear_parse_caches():
+    """Empty every registered parse cache and reset its counters."""
+    for cached in _parse_caches.values():
+        cached.cache_clear()
@@ -3,11 +3,11 @@ Post-Processing Service for CV Data
 Handles final processing, validation, and quality checks
 """
 import logging
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Union
 
 from .extraction_config import extraction_config
 from .date_validator import date_validator
-from .hallucination_validator import HallucinationValidator
+from .hallucination_validator import HallucinationValidator, SourceTextIndex
 
 # Import schemas
 from src.core.schemas.unified_nullable import CVData
@@ -132,13 +132,13 @@ class PostProcessor:
         return cv_data_dict, validation_issues
     
     @staticmethod
-    def calculate_extraction_confidence(cv_data: Any, raw_text: str) -> float:
+    def calculate_extraction_confidence(cv_data: Any, raw_text: Union[str, SourceTextIndex]) -> float:
         """
         Calculate confidence score for extraction quality (0.0-1.0).
         
         Args:
             cv_data: The extracted CV data
-            raw_text: The original CV text
+            raw_text: The original CV text or its SourceTextIndex
             
         Returns:
             Confidence score between 0.0 and 1.0
@@ -155,7 +155,11 @@ class PostProcessor:
             
             # 2. Text coverage (using config weight) - estimate how much of original text is represented
             extracted_text_length = PostProcessor._estimate_extracted_text_length(sections)
-            coverage_score = min(extracted_text_length / len(raw_text), 1.0) * extraction_config.CONFIDENCE_WEIGHTS['coverage']
+            if isinstance(raw_text, SourceTextIndex):
+                source_length = raw_text.source_length
+            else:
+                source_length = len(raw_text or "")
+            coverage_score = min(extracted_text_length / source_length, 1.0) * extraction_config.CONFIDENCE_WEIGHTS['coverage']
             
             # 3. Validation quality (using config weight) - using existing validation
             _, validation_issues = date_validator.validate_and_fix_cv_data(sections)
@@ -237,6 +241,9 @@ class PostProcessor:
         """
         all_issues = []
         
+        # Normalize the source text once for every validation pass below
+        source_index = SourceTextIndex.of(raw_text)
+        
         # 1. Deduplicate certifications and courses
         cv_data = PostProcessor.deduplicate_certifications_courses(cv_data)
         
@@ -247,7 +254,7 @@ class PostProcessor:
         cv_data_dict = cv_data.model_dump()
         
         # 4. CRITICAL: Validate against hallucinations
-        cv_data_dict, hallucination_issues = HallucinationValidator.validate_cv_data(cv_data_dict, raw_text)
+        cv_data_dict, hallucination_issues = HallucinationValidator.validate_cv_data(cv_data_dict, source_index)
         all_issues.extend(hallucination_issues)
         
         # 5. Validate and fix dates
@@ -266,7 +273,7 @@ class PostProcessor:
             pass
         
         # 7. Calculate confidence score
-        confidence = PostProcessor.calculate_extraction_confidence(cv_data, raw_text)
+        confidence = PostProcessor.calculate_extraction_confidence(cv_data, source_index)
         
         # Log issues if any
         if all_issues:
@@ -0,0 +1,146 @@
+"""
+Revision Diffing for Incremental CV Re-extraction
+Compares a revised CV's text with the text of its previous extraction and
+maps the changed lines to sections (via heading segmentation), so only the
+sections an edit touched are re-extracted
+"""
+import difflib
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set
+
+from .extraction_config import extraction_config
+from .text_parsing import normalize_whitespace
+
+logger = logging.getLogger(__name__)
+
+# Label of the lines above the first heading (name, title, contact details)
+HEADER = "header"
+
+# Longer lines are content, never headings
+MAX_HEADING_LENGTH = 50
+# Lines with more words than this are content, not an unknown heading
+MAX_HEADING_WORDS = 5
+
+_NON_LETTERS = re.compile(r'[^a-z]+')
+# Digits and sentence/list punctuation mark a line as content ("Acme (2019 - 2021)", "Chess, Hiking")
+_CONTENT_CHARS = re.compile(r'[0-9,.;@|()/]')
+
+
+@dataclass
+class RevisionDiff:
+    """Outcome of diffing a revised CV against the text of its previous extraction"""
+    changed_lines: int
+    total_lines: int
+    sections: Set[str] = field(default_factory=set)  # Sections to re-extract
+    full: bool = False  # The edit could not be localized - extract everything
+    # Added lines include a heading we don't recognize, so they may start a section the
+    # prior extraction did not find (e.g. "Awards Received") - re-extract those too
+    unlocated_additions: bool = False
+
+    @property
+    def changed_ratio(self) -> float:
+        return self.changed_lines / self.total_lines if self.total_lines else 1.0
+
+
+def normalize_lines(text: str) -> List[str]:
+    """Non-empty lines with whitespace collapsed, so layout-only changes don't count"""
+    return [normalize_whitespace(line) for line in (text or "").splitlines() if line.strip()]
+
+
+def _heading_key(line: str) -> str:
+    """'WORK EXPERIENCE:' -> 'work experience', 'Awards & Honors' -> 'awards and honors'"""
+    return _NON_LETTERS.sub(' ', line.lower().replace('&', ' and ')).strip()
+
+
+def _heading_lookup() -> Dict[str, str]:
+    return {
+        heading: section_name
+        for section_name, headings in extraction_config.SECTION_HEADINGS.items()
+        for heading in headings
+    }
+
+
+def looks_like_heading(line: str) -> bool:
+    """Short line of a few words without digits or list punctuation, e.g. 'Certifications & Training'"""
+    line = line.rstrip(':').strip()
+    return (bool(line) and len(line) <= MAX_HEADING_LENGTH and len(line.split()) <= MAX_HEADING_WORDS
+            and not _CONTENT_CHARS.search(line) and bool(_heading_key(line)))
+
+
+def segment_lines(lines: List[str]) -> List[str]:
+    """
+    Label every line with the section it belongs to.
+
+    A line is a heading when it is short and matches one of
+    extraction_config.SECTION_HEADINGS; the lines below it belong to that
+    section until the next heading. Lines above the first heading are HEADER.
+    """
+    lookup = _heading_lookup()
+    labels = []
+    current = HEADER
+    for line in lines:
+        if len(line) <= MAX_HEADING_LENGTH:
+            current = lookup.get(_heading_key(line), current)
+        labels.append(current)
+    return labels
+
+
+def _sections_of(labels: Iterable[str], dependents: bool = True) -> Set[str]:
+    """Section names for segment labels (optionally with the sections that depend on them)"""
+    sections = set()
+    for label in labels:
+        names = extraction_config.HEADER_SECTIONS if label == HEADER else [label]
+        for name in names:
+            sections.add(name)
+            if dependents:
+                sections.update(extraction_config.SECTION_DEPENDENTS.get(name, ()))
+    return sections
+
+
+def diff_revision(prior_text: str, new_text: str, prior_sections: Iterable[str] = ()) -> RevisionDiff:
+    """
+    Work out which sections of a revised CV need re-extracting.
+
+    Args:
+        prior_text: Text the previous extraction was made from
+        new_text: Text of the revised CV
+        prior_sections: Sections the previous extraction found. Those without a
+            heading in either text can't be located, so any edit re-extracts them.
+
+    Returns:
+        RevisionDiff; full is set when the texts differ in more than
+        INCREMENTAL_MAX_CHANGED_RATIO of their lines, unlocated_additions when
+        added lines (below the header) look like a heading we don't recognize
+    """
+    lookup = _heading_lookup()
+    old_lines, new_lines = normalize_lines(prior_text), normalize_lines(new_text)
+    old_labels, new_labels = segment_lines(old_lines), segment_lines(new_lines)
+
+    touched: Set[str] = set()
+    changed_lines = 0
+    unlocated_additions = False
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            continue
+        changed_lines += max(i2 - i1, j2 - j1)
+        # Removed lines count for the section they left, added lines for the one they joined
+        touched.update(old_labels[i1:i2])
+        touched.update(new_labels[j1:j2])
+        if any(label != HEADER and _heading_key(line) not in lookup and looks_like_heading(line)
+               for line, label in zip(new_lines[j1:j2], new_labels[j1:j2])):
+            unlocated_additions = True
+
+    diff = RevisionDiff(changed_lines, max(len(old_lines), len(new_lines)),
+                        unlocated_additions=unlocated_additions)
+    if not old_lines or diff.changed_ratio > extraction_config.INCREMENTAL_MAX_CHANGED_RATIO:
+        diff.full = True
+        return diff
+
+    diff.sections = _sections_of(touched)
+    if changed_lines:
+        located = _sections_of(set(old_labels) | set(new_labels), dependents=False)
+        diff.sections.update(name for name in prior_sections if name not in located)
+    return diff
@@ -15,6 +15,7 @@ from .location_processor import location_processor
 # from .role_inferencer import infer_project_role, infer_speaking_event_name, infer_field_of_study
 from .extraction_config import extraction_config
 from .text_parsing import safe_iter_dicts
+from .validated_sections import ValidatedSection
 
 # Import schemas
 from src.core.schemas.unified_nullable import HobbiesSection
@@ -67,7 +68,22 @@ class SectionExtractor:
             logger.error(f"Critical error during extraction of '{section_name}': {e}")
             return {section_name: None}
     
-    def parse_llm_response(self, model_used: str, response_text: str, 
+    @staticmethod
+    def is_empty_response(model_used: str, response_text: Optional[str], section_name: str) -> bool:
+        """
+        Check whether the LLM answered that the section is absent from the CV.
+        
+        The prompts ask for an empty JSON object when no relevant information is
+        found; extract() returns None for it just like for a failed parse, but it
+        is a valid answer and not worth retrying.
+        """
+        if not response_text:
+            return False
+        parsed = SectionExtractor.parse_llm_response(model_used, response_text, section_name)
+        return parsed is not None and not parsed
+    
+    @staticmethod
+    def parse_llm_response(model_used: str, response_text: str, 
                           section_name: str) -> Optional[Dict[str, Any]]:
         """
         Parse LLM response into JSON data.
@@ -222,14 +238,14 @@ class SectionExtractor:
         elif section_name == 'experience' and 'experienceItems' in data:
             for item in safe_iter_dicts(data['experienceItems']):
                 if 'responsibilitiesAndAchievements' in item and not item.get('technologiesUsed'):
-                    found_techs = set()
-                    for resp in item['responsibilitiesAndAchievements']:
-                        for compiled_pattern in extraction_config.get_compiled_tech_patterns():
-                            matches = compiled_pattern.findall(resp)
-                            found_techs.update(matches)
+                    # One pass over all responsibilities with the shared matcher
+                    responsibilities = [resp for resp in item['responsibilitiesAndAchievements'] if isinstance(resp, str)]
+                    found_techs = extraction_config.get_tech_matcher().names(
+                        '\n'.join(responsibilities), skip_categories=extraction_config.TECH_CONCEPT_CATEGORIES
+                    )
                     
                     if found_techs:
-                        item['technologiesUsed'] = list(found_techs)
+                        item['technologiesUsed'] = found_techs
                         logger.debug(f"Extracted technologies for {item.get('jobTitle', 'Unknown')}: {found_techs}")
         
         # Deduplicate skills (case-insensitive)
@@ -345,22 +361,23 @@ class SectionExtractor:
             section_schema: Pydantic schema for validation
             
         Returns:
-            Validated data or original data if no schema
+            Validated data (a ValidatedSection that keeps the model, so CVData
+            assembly can skip validating it again) or original data if no schema
         """
         # Special handling for hobbies section
         if section_name == 'hobbies':
             hobbies_list = data if isinstance(data, list) else data.get('hobbies', [])
-            return HobbiesSection(
+            return ValidatedSection(HobbiesSection(
                 sectionTitle="Hobbies",
                 hobbies=hobbies_list if isinstance(hobbies_list, list) else []
-            ).model_dump()
+            ))
         
         # Validate against schema if available
         if section_schema:
             try:
                 validated = section_schema(**data)
                 logger.info(f"Successfully extracted and validated section: {section_name}")
-                return validated.model_dump()
+                return ValidatedSection(validated)
             except ValidationError as e:
                 logger.error(f"Validation failed for section '{section_name}': {e}")
                 return None
@@ -0,0 +1,167 @@
+"""
+Incremental JSON Parser for Streamed LLM Responses
+Emits completed items of top-level arrays while the response is still streaming
+"""
+import json
+import logging
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Callback signature: (array_key, item) - array_key is None when the root is an array
+ItemCallback = Callable[[Optional[str], Any], None]
+
+
+class IncrementalJSONParser:
+    """
+    Parses an LLM JSON response chunk by chunk.
+
+    Every section prompt returns a single JSON object whose interesting content
+    lives in top-level arrays (experienceItems, skillCategories, hobbies, ...).
+    The parser scans each character exactly once and emits every element of
+    those arrays as soon as its closing bracket or quote arrives, so callers
+    can show partial results long before the full response is available.
+
+    Leading prose or markdown fences before the first brace are skipped, and
+    anything after the root value closes is ignored, mirroring
+    SectionExtractor.parse_llm_response.
+    """
+
+    def __init__(self, on_item: Optional[ItemCallback] = None,
+                 on_reset: Optional[Callable[[], None]] = None):
+        """
+        Initialize the parser.
+
+        Args:
+            on_item: Optional callback invoked with (array_key, item) for each completed item
+            on_reset: Optional callback invoked when a reset discards items already emitted
+        """
+        self.on_item = on_item
+        self.on_reset = on_reset
+        self.items: List[Tuple[Optional[str], Any]] = []
+        self.reset()
+
+    def reset(self):
+        """Discard all state (used when a streamed call is retried from scratch)."""
+        discarded = bool(self.items)
+        self._buffer = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape_next = False
+        self._string_start = -1
+        self._last_string: Optional[str] = None
+        self._current_key: Optional[str] = None
+        self._item_start = -1
+        self._done = False
+        self.items = []
+
+        if discarded and self.on_reset:
+            try:
+                self.on_reset()
+            except Exception as e:
+                logger.warning(f"Parser reset callback failed: {e}")
+
+    @property
+    def text(self) -> str:
+        """Full text received so far."""
+        return self._buffer
+
+    @property
+    def is_complete(self) -> bool:
+        """True once the root JSON value has been closed."""
+        return self._done
+
+    def _array_depth(self) -> int:
+        """Stack depth at which elements of a tracked top-level array live."""
+        return 1 if self._stack and self._stack[0] == '[' else 2
+
+    def _in_tracked_array(self) -> bool:
+        """Whether the parser is currently directly inside a top-level array."""
+        depth = self._array_depth()
+        return len(self._stack) == depth and self._stack[-1] == '['
+
+    def _emit(self, literal: str):
+        """Decode a completed item and hand it to the callback."""
+        try:
+            item = json.loads(literal)
+        except json.JSONDecodeError:
+            logger.debug(f"Skipping undecodable streamed item: {literal[:80]}")
+            return
+
+        key = self._current_key if self._stack and self._stack[0] == '{' else None
+        self.items.append((key, item))
+
+        if self.on_item:
+            try:
+                self.on_item(key, item)
+            except Exception as e:
+                # Never let a consumer failure break the stream
+                logger.warning(f"Streamed item callback failed: {e}")
+
+    def feed(self, chunk: str) -> List[Tuple[Optional[str], Any]]:
+        """
+        Consume the next chunk of streamed text.
+
+        Args:
+            chunk: Text delta from the LLM stream
+
+        Returns:
+            List of (array_key, item) tuples completed by this chunk
+        """
+        if not chunk:
+            return []
+
+        emitted_before = len(self.items)
+        self._buffer += chunk
+        text = self._buffer
+
+        for i in range(self._pos, len(text)):
+            if self._done:
+                break
+
+            char = text[i]
+
+            if self._in_string:
+                if self._escape_next:
+                    self._escape_next = False
+                elif char == '\\':
+                    self._escape_next = True
+                elif char == '"':
+                    self._in_string = False
+                    literal = text[self._string_start:i + 1]
+                    if len(self._stack) == 1 and self._stack[0] == '{':
+                        self._last_string = literal
+                    elif self._in_tracked_array():
+                        # String element of a top-level array (e.g. hobbies, skills)
+                        self._emit(literal)
+                continue
+
+            if not self._stack:
+                # Still looking for the root value
+                if char in '{[':
+                    self._stack.append(char)
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char == ':' and len(self._stack) == 1 and self._stack[0] == '{':
+                try:
+                    self._current_key = json.loads(self._last_string) if self._last_string else None
+                except json.JSONDecodeError:
+                    self._current_key = None
+            elif char in '{[':
+                if self._in_tracked_array():
+                    self._item_start = i
+                self._stack.append(char)
+            elif char in '}]':
+                self._stack.pop()
+                if self._item_start >= 0 and self._in_tracked_array():
+                    self._emit(text[self._item_start:i + 1])
+                    self._item_start = -1
+                if not self._stack:
+                    self._done = True
+
+        self._pos = len(text)
+        return self.items[emitted_before:]
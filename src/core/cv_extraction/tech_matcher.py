@@ -0,0 +1,99 @@
+"""
+Technology Matcher for CV Data Extraction
+Finds known technologies in text with a single compiled alternation built from
+the shared technology dictionary, returning canonical names and positions
+"""
+import re
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Pattern, Tuple
+
+
+class TechMatch(NamedTuple):
+    """One technology found in text."""
+    name: str       # Canonical name, e.g. "Node.js" for "nodejs"
+    category: str   # Dictionary category the technology belongs to
+    start: int
+    end: int
+
+
+class TechnologyMatcher:
+    """
+    Case-insensitive matcher over a dictionary of technologies.
+
+    Terms are matched as whole words - a term may not be preceded or followed by
+    a word character, which (unlike \\b) also works for terms such as "C++" or
+    "C#". Where terms overlap at the same position the longest one wins
+    ("GitLab CI" over "GitLab"). The pattern is compiled on first use and again
+    only after terms are added.
+    """
+
+    def __init__(self, terms: Optional[Mapping[str, Iterable[str]]] = None,
+                 aliases: Optional[Mapping[str, str]] = None):
+        """
+        Args:
+            terms: Canonical technology names keyed by category
+            aliases: Alternative spellings mapped to their canonical name
+        """
+        self._lookup: Dict[str, Tuple[str, str]] = {}  # lowercased term -> (canonical name, category)
+        self._pattern: Optional[Pattern] = None
+        if terms:
+            self.add_terms(terms)
+        if aliases:
+            self.add_aliases(aliases)
+
+    def add_terms(self, terms: Mapping[str, Iterable[str]]):
+        """Add canonical technology names keyed by category."""
+        for category, names in terms.items():
+            for name in names:
+                self._lookup[name.lower()] = (name, category)
+        self._pattern = None
+
+    def add_aliases(self, aliases: Mapping[str, str]):
+        """Add alternative spellings for technologies already in the dictionary."""
+        for alias, name in aliases.items():
+            target = self._lookup.get(name.lower())
+            if target is None:
+                raise ValueError(f"Alias '{alias}' refers to unknown technology '{name}'")
+            self._lookup[alias.lower()] = target
+        self._pattern = None
+
+    @property
+    def pattern(self) -> Optional[Pattern]:
+        """The compiled alternation of every term (None when the dictionary is empty)."""
+        if self._pattern is None and self._lookup:
+            # Longest first so the regex engine prefers the longer of overlapping terms
+            alternation = '|'.join(re.escape(term) for term in sorted(self._lookup, key=len, reverse=True))
+            self._pattern = re.compile(rf'(?<!\w)(?:{alternation})(?!\w)', re.IGNORECASE)
+        return self._pattern
+
+    def canonical(self, term: str) -> Optional[str]:
+        """Canonical name when the whole term is a known technology or alias."""
+        entry = self._lookup.get(term.strip().lower())
+        return entry[0] if entry else None
+
+    def find_all(self, text: str) -> List[TechMatch]:
+        """Every technology mentioned in text, in order of appearance."""
+        pattern = self.pattern
+        if not text or pattern is None:
+            return []
+        matches = []
+        for match in pattern.finditer(text):
+            entry = self._lookup.get(match.group().lower())
+            if entry:
+                matches.append(TechMatch(entry[0], entry[1], match.start(), match.end()))
+        return matches
+
+    def names(self, text: str, skip_categories: Iterable[str] = ()) -> List[str]:
+        """
+        Unique canonical names of the technologies in text, in order of first appearance.
+
+        Args:
+            text: Text to search
+            skip_categories: Categories to leave out of the result
+
+        Returns:
+            List of canonical technology names
+        """
+        skipped = set(skip_categories)
+        return list(dict.fromkeys(
+            match.name for match in self.find_all(text) if match.category not in skipped
+        ))
@@ -0,0 +1,64 @@
+"""
+Validated Section Tracking for CV Data
+Keeps the Pydantic model produced when a section is validated so CVData can be
+assembled without validating sections the enhancers never touch a second time
+"""
+import copy
+import logging
+from typing import Any, Collection, Dict
+
+from pydantic import BaseModel
+
+# Import schemas
+from src.core.schemas.unified_nullable import CVData
+
+logger = logging.getLogger(__name__)
+
+
+class ValidatedSection(dict):
+    """
+    Section data dict (model_dump() of a validated section) that remembers its model.
+
+    Behaves as a plain dict for enhancers, JSON and comparisons. Copies are
+    plain dicts, so a copied section is always validated again.
+    """
+
+    def __init__(self, model: BaseModel):
+        super().__init__(model.model_dump())
+        self.model = model
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self), memo)
+
+
+def assemble_cv_data(data: Dict[str, Any], touched_sections: Collection[str]) -> CVData:
+    """
+    Build CVData from section data, reusing the models of sections nothing modified.
+
+    Equivalent to CVData(**data): unknown keys are ignored and invalid sections
+    raise CVData's own ValidationError. Only sections outside touched_sections
+    (the enhancement engine's declared sections) are passed to CVData as model
+    instances, which Pydantic accepts without revalidating them.
+
+    Args:
+        data: Section data keyed by section name
+        touched_sections: Sections that may have been modified since validation
+
+    Returns:
+        Validated CVData object
+    """
+    fields = {}
+    reused = 0
+    for name, value in data.items():
+        if isinstance(value, ValidatedSection) and name not in touched_sections:
+            fields[name] = value.model
+            reused += 1
+        else:
+            fields[name] = value
+
+    if reused:
+        logger.debug(f"Assembling CVData - reusing {reused} validated sections")
+    return CVData(**fields)
@@ -0,0 +1,169 @@
+"""
+Image pre-processing before OCR
+Auto-orients, downsamples to an OCR-friendly resolution, converts to
+grayscale and recompresses CV images (often multi-megabyte phone photos), and
+splits very tall images into page-sized parts. Smaller uploads mean lower OCR
+latency and more files within AWS Textract's 5MB sync limit.
+"""
+import io
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+# Pillow is optional - without it images are sent to OCR as they are
+try:
+    from PIL import Image, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Shorter image side after downsampling (~200 DPI for an A4/Letter page)
+OCR_MAX_SHORT_SIDE = 1700
+# Images taller than this many widths are split into parts
+TALL_IMAGE_RATIO = 3.0
+# Height of each part, in widths
+SPLIT_PART_RATIO = 1.5
+# Cuts are moved to the brightest row within this fraction of a part's height
+SPLIT_SEARCH_FRACTION = 0.15
+JPEG_QUALITY = 85
+# Images smaller than this that need no rotating, resizing or splitting are
+# sent as they are - re-encoding costs more time than the upload saves
+MIN_PROCESS_BYTES = 512 * 1024
+# Formats kept lossless (screenshots and other flat images)
+LOSSLESS_FORMATS = {'PNG', 'GIF', 'BMP'}
+
+
+@dataclass
+class PreparedImage:
+    """Image bytes ready for OCR, one entry per part."""
+    parts: List[bytes] = field(default_factory=list)
+    original_bytes: int = 0
+    processed: bool = False
+    seconds: float = 0.0
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(len(part) for part in self.parts)
+
+    @property
+    def max_part_bytes(self) -> int:
+        return max((len(part) for part in self.parts), default=0)
+
+
+class ImagePreprocessor:
+    """Prepares CV images for OCR services."""
+
+    def __init__(self, max_short_side: int = OCR_MAX_SHORT_SIDE, tall_ratio: float = TALL_IMAGE_RATIO):
+        self.max_short_side = max_short_side
+        self.tall_ratio = tall_ratio
+
+    def prepare(self, content: bytes) -> PreparedImage:
+        """
+        Prepare image bytes for OCR
+
+        Args:
+            content: Encoded image (JPEG, PNG, WEBP, ...)
+
+        Returns:
+            PreparedImage with the processed parts, or the original bytes
+            as the only part when Pillow is missing, the image cannot be
+            decoded, or processing is not worth it
+        """
+        start = time.perf_counter()
+        prepared = PreparedImage(parts=[content], original_bytes=len(content))
+        if not PIL_AVAILABLE:
+            return prepared
+
+        try:
+            parts, reshaped = self._process(content)
+        except Exception as e:
+            logger.warning(f"Image pre-processing failed, sending original: {e}")
+            return prepared
+
+        # Re-encoding an already compact image can make it bigger
+        if parts and (reshaped or sum(len(part) for part in parts) < len(content)):
+            prepared.parts, prepared.processed = parts, True
+        prepared.seconds = time.perf_counter() - start
+        return prepared
+
+    def _process(self, content: bytes):
+        """Decode, orient, downsample, split and encode. Returns (parts, reshaped)."""
+        image = Image.open(io.BytesIO(content))
+        source_format = image.format
+        rotated = _exif_orientation(image) > 1
+        short_side = min(self.max_short_side, min(image.size))
+        tall = max(image.size) > min(image.size) * self.tall_ratio
+        if len(content) < MIN_PROCESS_BYTES and not (rotated or tall or short_side < min(image.size)):
+            return [], False
+
+        # JPEG can decode straight to grayscale at a reduced size
+        if source_format == 'JPEG':
+            scale = short_side / min(image.size)
+            image.draft('L', (math.ceil(image.width * scale), math.ceil(image.height * scale)))
+
+        image = _to_grayscale(ImageOps.exif_transpose(image))
+        if min(image.size) > short_side:
+            factor = short_side / min(image.size)
+            image = image.resize((round(image.width * factor), round(image.height * factor)), Image.LANCZOS)
+
+        segments = self._split_tall(image)
+        lossless = source_format in LOSSLESS_FORMATS
+        return [_encode(segment, lossless) for segment in segments], rotated or len(segments) > 1
+
+    def _split_tall(self, image) -> list:
+        """Split an image taller than tall_ratio widths at whitespace rows."""
+        width, height = image.size
+        if height <= width * self.tall_ratio:
+            return [image]
+
+        part_height = int(width * SPLIT_PART_RATIO)
+        search = int(part_height * SPLIT_SEARCH_FRACTION)
+        segments, top = [], 0
+        while height - top > part_height + search:
+            cut = _brightest_row(image, top + part_height - search, top + part_height + search)
+            segments.append(image.crop((0, top, width, cut)))
+            top = cut
+        segments.append(image.crop((0, top, width, height)))
+        return segments
+
+
+def _exif_orientation(image) -> int:
+    """EXIF orientation tag (1 = upright)."""
+    try:
+        return image.getexif().get(0x0112, 1)
+    except Exception:
+        return 1
+
+
+def _to_grayscale(image):
+    """Grayscale, with transparent areas flattened onto white."""
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        image = image.convert('RGBA')
+        background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+        image = Image.alpha_composite(background, image)
+    return image.convert('L') if image.mode != 'L' else image
+
+
+def _brightest_row(image, start: int, stop: int) -> int:
+    """Row in [start, stop) with the highest mean brightness (most likely blank)."""
+    band = image.crop((0, start, image.width, stop)).resize((1, stop - start), Image.BOX)
+    rows = list(band.getdata())
+    return start + max(range(len(rows)), key=rows.__getitem__)
+
+
+def _encode(image, lossless: bool) -> bytes:
+    """PNG for lossless sources, JPEG otherwise."""
+    buffer = io.BytesIO()
+    if lossless:
+        image.save(buffer, format='PNG', compress_level=6)
+    else:
+        image.save(buffer, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+    return buffer.getvalue()
+
+
+# Singleton instance
+image_preprocessor = ImagePreprocessor()
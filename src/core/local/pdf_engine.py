@@ -0,0 +1,198 @@
+"""
+Page-level PDF text extraction
+Pages are read with PyPDF2 (split across a process pool for longer documents),
+pages without a text layer are sent one by one to an OCR callback, and the
+results are merged back in page order with per-page timings
+"""
+import io
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import PyPDF2
+
+logger = logging.getLogger(__name__)
+
+# Documents with at least this many pages are extracted in worker processes
+PARALLEL_MIN_PAGES = 4
+MAX_PROCESS_WORKERS = min(4, os.cpu_count() or 1)
+# OCR calls are network-bound, so they run in threads
+MAX_OCR_WORKERS = 4
+# Pages with fewer non-whitespace characters are treated as scanned
+MIN_PAGE_TEXT_CHARS = 10
+
+# (text, seconds, error) for one page
+_RawPage = Tuple[str, float, Optional[str]]
+
+
+@dataclass
+class PageResult:
+    """Text and timing for one PDF page."""
+    number: int  # 1-based page number
+    text: str = ""
+    source: str = "text"  # "text", "ocr" or "empty"
+    extract_seconds: float = 0.0
+    ocr_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def seconds(self) -> float:
+        return self.extract_seconds + self.ocr_seconds
+
+
+@dataclass
+class PdfExtractionResult:
+    """Pages of one PDF in page order."""
+    pages: List[PageResult] = field(default_factory=list)
+    parallel: bool = False
+
+    @property
+    def text(self) -> str:
+        """Non-empty page texts joined in page order."""
+        return "\n\n".join(page.text for page in self.pages if page.text)
+
+    @property
+    def ocr_pages(self) -> List[int]:
+        """Numbers of the pages whose text came from OCR."""
+        return [page.number for page in self.pages if page.source == "ocr"]
+
+    def timings(self) -> Dict[int, float]:
+        """Seconds spent per page number (text extraction plus OCR)."""
+        return {page.number: round(page.seconds, 4) for page in self.pages}
+
+
+def needs_ocr(text: str) -> bool:
+    """True if a page's text layer is too thin to be the page's real content."""
+    return len("".join(text.split())) < MIN_PAGE_TEXT_CHARS
+
+
+def _extract_page(reader: PyPDF2.PdfReader, index: int) -> _RawPage:
+    """Extract one page's text layer, returning the error instead of raising."""
+    start = time.perf_counter()
+    try:
+        text, error = (reader.pages[index].extract_text() or "").strip(), None
+    except Exception as e:
+        text, error = "", str(e)
+    return text, time.perf_counter() - start, error
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> List[_RawPage]:
+    """Extract pages [start, stop) of a PDF. Runs in a worker process."""
+    reader = PyPDF2.PdfReader(path)
+    return [_extract_page(reader, index) for index in range(start, stop)]
+
+
+def _page_pdf_bytes(reader: PyPDF2.PdfReader, index: int) -> bytes:
+    """A single page as a standalone PDF document, for OCR services."""
+    writer = PyPDF2.PdfWriter()
+    writer.add_page(reader.pages[index])
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+class PdfEngine:
+    """Extracts PDF text page by page, OCR-ing only the pages that need it."""
+
+    def __init__(self, parallel_min_pages: int = PARALLEL_MIN_PAGES,
+                 max_workers: int = MAX_PROCESS_WORKERS,
+                 ocr_workers: int = MAX_OCR_WORKERS):
+        self.parallel_min_pages = parallel_min_pages
+        self.max_workers = max_workers
+        self.ocr_workers = ocr_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def extract(self, path: Path, ocr_page: Optional[Callable[[bytes], str]] = None) -> PdfExtractionResult:
+        """
+        Extract text from every page of a PDF
+
+        Args:
+            path: PDF file
+            ocr_page: Called with a single-page PDF for each page without a
+                text layer; returns the page's text. Pages are left empty
+                when it is None.
+
+        Returns:
+            PdfExtractionResult with one PageResult per page, in page order
+        """
+        reader = PyPDF2.PdfReader(str(path))
+        page_count = len(reader.pages)
+        parallel = self.max_workers > 1 and page_count >= self.parallel_min_pages
+
+        raw_pages = self._extract_parallel(path, page_count) if parallel else None
+        if raw_pages is None:
+            parallel = False
+            raw_pages = [_extract_page(reader, index) for index in range(page_count)]
+
+        result = PdfExtractionResult(parallel=parallel)
+        for number, (text, seconds, error) in enumerate(raw_pages, start=1):
+            if error:
+                logger.warning(f"Failed to extract page {number}: {error}")
+            result.pages.append(PageResult(number=number, text=text, extract_seconds=seconds, error=error))
+
+        scanned = [page for page in result.pages if needs_ocr(page.text)]
+        if scanned and ocr_page:
+            self._ocr_pages(reader, scanned, ocr_page)
+        for page in scanned:
+            if not page.text:
+                page.source = "empty"
+        return result
+
+    def _extract_parallel(self, path: Path, page_count: int) -> Optional[List[_RawPage]]:
+        """Split the pages into one contiguous range per worker; None if the pool fails."""
+        workers = min(self.max_workers, page_count)
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+        try:
+            executor = self._get_executor()
+            futures = [executor.submit(_extract_page_range, str(path), start, stop)
+                       for start, stop in zip(bounds, bounds[1:])]
+            return [page for future in futures for page in future.result()]
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"PDF worker pool failed, extracting serially: {e}")
+            self.shutdown()
+            return None
+
+    def _ocr_pages(self, reader: PyPDF2.PdfReader, pages: List[PageResult],
+                   ocr_page: Callable[[bytes], str]):
+        """OCR the given pages concurrently, replacing their text when OCR finds any."""
+        jobs = [(page, _page_pdf_bytes(reader, page.number - 1)) for page in pages]
+
+        def run(job: Tuple[PageResult, bytes]):
+            page, page_bytes = job
+            start = time.perf_counter()
+            try:
+                text = (ocr_page(page_bytes) or "").strip()
+            except Exception as e:
+                logger.error(f"OCR failed for page {page.number}: {e}")
+                text = ""
+            page.ocr_seconds = time.perf_counter() - start
+            if text:
+                page.text, page.source = text, "ocr"
+
+        with ThreadPoolExecutor(max_workers=min(self.ocr_workers, len(jobs))) as pool:
+            list(pool.map(run, jobs))
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Process pool shared by all extractions, created on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def shutdown(self):
+        """Stop the worker processes; the pool is recreated on next use."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+# Singleton instance
+pdf_engine = PdfEngine()
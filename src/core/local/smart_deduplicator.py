@@ -6,10 +6,76 @@ import logging
 from typing import List, Dict, Any, Tuple, Optional, Set
 from difflib import SequenceMatcher
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+from src.core.cv_extraction.extraction_config import extraction_config
 
 logger = logging.getLogger(__name__)
 
+# Normalize common variations (applied as whole words, in one pass)
+SYNONYM_REPLACEMENTS = {
+    'reduced': 'decrease',
+    'increased': 'increase',
+    'improved': 'improve',
+    'boosted': 'boost',
+    'enhanced': 'enhance',
+    'decreased': 'decrease',
+    'grew': 'grow',
+    'raised': 'raise',
+    'cut': 'reduce',
+    'lowered': 'reduce',
+    'shortened': 'reduce',
+    'minimized': 'reduce',
+    'maximized': 'increase',
+    'optimized': 'improve',
+    'streamlined': 'improve',
+    'automated': 'automate',
+    'implemented': 'implement',
+    'developed': 'develop',
+    'created': 'create',
+    'built': 'build',
+    'designed': 'design',
+    'led': 'lead',
+    'managed': 'manage',
+    'oversaw': 'oversee',
+    'directed': 'direct',
+    'coordinated': 'coordinate',
+    'team of': 'team',
+    'group of': 'team',
+    'engineers': 'developer',
+    'developers': 'developer',
+    'programmers': 'developer',
+    'coders': 'developer',
+}
+
+SYNONYM_PATTERN = re.compile(r'\b(?:' + '|'.join(re.escape(old) for old in SYNONYM_REPLACEMENTS) + r')\b')
+PERCENT_PATTERN = re.compile(r'(\d+)\s*%')
+DOLLAR_PATTERN = re.compile(r'\$\s*(\d+)')
+METRIC_PATTERN = re.compile(r'\d+[%$kKmM]?')
+
+
+class _ItemSignature:
+    """Per-item data computed once: normalized text, metrics, words and ratio bound inputs."""
+    
+    __slots__ = ('norm', 'metrics', 'words', 'length', 'chars', 'bigrams', '_matcher')
+    
+    def __init__(self, text: str, norm: str):
+        self.norm = norm
+        self.metrics = set(METRIC_PATTERN.findall(text))
+        self.words = set(norm.split())
+        self.length = len(norm)
+        self.chars = Counter(norm)
+        self.bigrams = Counter(norm[k:k + 2] for k in range(len(norm) - 1))
+        self._matcher = None
+    
+    def ratio_against(self, leader: '_ItemSignature') -> float:
+        """SequenceMatcher(None, leader.norm, self.norm).ratio(), reusing this item's b2j table."""
+        if self._matcher is None:
+            self._matcher = SequenceMatcher(None)
+            self._matcher.set_seq2(self.norm)
+        self._matcher.set_seq1(leader.norm)
+        return self._matcher.ratio()
+
 
 class SmartDeduplicator:
     """
@@ -30,79 +96,88 @@ class SmartDeduplicator:
         # Remove punctuation at the end
         text = text.rstrip('.,;:!?')
         # Normalize numbers with units
-        text = re.sub(r'(\d+)\s*%', r'\1%', text)
-        text = re.sub(r'\$\s*(\d+)', r'$\1', text)
+        text = PERCENT_PATTERN.sub(r'\1%', text)
+        text = DOLLAR_PATTERN.sub(r'$\1', text)
         # Normalize common variations
-        replacements = {
-            'reduced': 'decrease',
-            'increased': 'increase',
-            'improved': 'improve',
-            'boosted': 'boost',
-            'enhanced': 'enhance',
-            'decreased': 'decrease',
-            'grew': 'grow',
-            'raised': 'raise',
-            'cut': 'reduce',
-            'lowered': 'reduce',
-            'shortened': 'reduce',
-            'minimized': 'reduce',
-            'maximized': 'increase',
-            'optimized': 'improve',
-            'streamlined': 'improve',
-            'automated': 'automate',
-            'implemented': 'implement',
-            'developed': 'develop',
-            'created': 'create',
-            'built': 'build',
-            'designed': 'design',
-            'led': 'lead',
-            'managed': 'manage',
-            'oversaw': 'oversee',
-            'directed': 'direct',
-            'coordinated': 'coordinate',
-            'team of': 'team',
-            'group of': 'team',
-            'engineers': 'developer',
-            'developers': 'developer',
-            'programmers': 'developer',
-            'coders': 'developer',
-        }
-        
-        for old, new in replacements.items():
-            text = re.sub(r'\b' + old + r'\b', new, text)
-        
-        return text
+        return SYNONYM_PATTERN.sub(lambda match: SYNONYM_REPLACEMENTS[match.group(0)], text)
+    
+    def _signature(self, text: str) -> _ItemSignature:
+        return _ItemSignature(text, self.normalize_text(text))
     
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts"""
-        # Normalize both texts
-        norm1 = self.normalize_text(text1)
-        norm2 = self.normalize_text(text2)
+        item1, item2 = self._signature(text1), self._signature(text2)
         
         # Quick exact match check
-        if norm1 == norm2:
+        if item1.norm == item2.norm:
             return 1.0
         
         # Use SequenceMatcher for fuzzy matching
-        similarity = SequenceMatcher(None, norm1, norm2).ratio()
+        return self._score(item1, item2, item2.ratio_against(item1))
+    
+    @staticmethod
+    def _score(item1: _ItemSignature, item2: _ItemSignature, ratio: float) -> float:
+        """Final similarity given the SequenceMatcher ratio (or an upper bound on it)."""
+        similarity = ratio
         
         # Boost similarity if key metrics match
-        metrics1 = set(re.findall(r'\d+[%$kKmM]?', text1))
-        metrics2 = set(re.findall(r'\d+[%$kKmM]?', text2))
-        if metrics1 and metrics2 and metrics1 == metrics2:
+        same_metrics = item1.metrics == item2.metrics
+        if item1.metrics and same_metrics:
             similarity = min(1.0, similarity * 1.3)
         
-        # Check if the core action and metrics are the same
-        words1 = set(norm1.split())
-        words2 = set(norm2.split())
-        common_words = words1.intersection(words2)
-        
         # If they share significant words and metrics, likely duplicates
-        if len(common_words) >= min(3, len(words1) // 2, len(words2) // 2) and metrics1 == metrics2:
+        if same_metrics and SmartDeduplicator._shares_core_words(item1, item2):
             similarity = max(similarity, 0.85)
         
         return similarity
     
+    @staticmethod
+    def _shares_core_words(item1: _ItemSignature, item2: _ItemSignature) -> bool:
+        """Check if the core action words are the same"""
+        required = min(3, len(item1.words) // 2, len(item2.words) // 2)
+        return required == 0 or len(item1.words & item2.words) >= required
+    
+    @staticmethod
+    def _shared_count(counts1: Counter, counts2: Counter) -> int:
+        """Size of the multiset intersection of two counters."""
+        if len(counts1) > len(counts2):
+            counts1, counts2 = counts2, counts1
+        get = counts2.get
+        return sum([min(count, get(key, 0)) for key, count in counts1.items()])
+    
+    def _is_duplicate(self, leader: _ItemSignature, item: _ItemSignature) -> bool:
+        """
+        Same decision as calculate_similarity(leader, item) >= threshold, but skips
+        SequenceMatcher when an upper bound on its ratio already rules the pair out.
+        
+        Bounds (each >= ratio, so pruning never changes the outcome):
+        - length: 2 * min(la, lb) / (la + lb)
+        - characters: shared character multiset, as in SequenceMatcher.quick_ratio
+        - bigrams: matched blocks of size s contain s - 1 shared bigrams, and merged
+          blocks are separated by unmatched characters, so M <= (B2 + T + 1) / 3
+        """
+        if leader.norm == item.norm:
+            return 1.0 >= self.threshold
+        if self._score(leader, item, 0.0) >= self.threshold:
+            return True  # Shared metrics and core words decide it regardless of the ratio
+        
+        total = leader.length + item.length
+        bound = 2.0 * min(leader.length, item.length) / total
+        if self._score(leader, item, bound) < self.threshold:
+            return False
+        
+        shared_chars = self._shared_count(leader.chars, item.chars)
+        bound = min(bound, 2.0 * shared_chars / total)
+        if self._score(leader, item, bound) < self.threshold:
+            return False
+        
+        shared_bigrams = self._shared_count(leader.bigrams, item.bigrams)
+        bound = min(bound, 2.0 * ((shared_bigrams + total + 1) / 3) / total)
+        if self._score(leader, item, bound) < self.threshold:
+            return False
+        
+        return self._score(leader, item, item.ratio_against(leader)) >= self.threshold
+    
     def extract_key_info(self, text: str) -> Dict[str, Any]:
         """Extract key information from achievement text"""
         info = {
@@ -116,9 +191,8 @@ class SmartDeduplicator:
         if words:
             info['action'] = self.normalize_text(words[0])
         
-        # Extract technologies (common patterns)
-        tech_pattern = r'\b(?:Python|JavaScript|React|Node\.?js|Django|AWS|Docker|Kubernetes|SQL|MongoDB|Redis|GraphQL|REST(?:ful)?|API|ML|AI|cloud|microservices?)\b'
-        info['technologies'] = re.findall(tech_pattern, text, re.IGNORECASE)
+        # Extract technologies and concepts - the narrow key-info subset of the shared dictionary
+        info['technologies'] = extraction_config.get_key_info_tech_matcher().names(text)
         
         return info
     
@@ -135,6 +209,9 @@ class SmartDeduplicator:
         if not items_with_provenance:
             return []
         
+        # Normalize each item once
+        signatures = [self._signature(text) for text, _ in items_with_provenance]
+        
         # Group similar items
         groups = []
         processed = set()
@@ -153,8 +230,7 @@ class SmartDeduplicator:
                 if j in processed:
                     continue
                     
-                similarity = self.calculate_similarity(text1, text2)
-                if similarity >= self.threshold:
+                if self._is_duplicate(signatures[i], signatures[j]):
                     group['items'].append((text2, source2))
                     group['indices'].add(j)
             
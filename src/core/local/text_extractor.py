@@ -4,11 +4,13 @@ Smart extraction with local processing first, then Google Vision OCR, fallback t
 """
 import logging
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import os
-import unicodedata
 import re
 from src.core.local.keychain_manager import get_google_credentials_path, get_aws_credentials
+from src.core.local.text_normalizer import text_normalizer
+from src.core.local.pdf_engine import pdf_engine
+from src.core.local.image_preprocessor import image_preprocessor
 
 # Document processing libraries
 import PyPDF2
@@ -31,6 +33,8 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.heic', '.heif', '.tiff', '.tif', '.bmp'}
+
 
 class TextExtractor:
     """
@@ -73,72 +77,26 @@ class TextExtractor:
             except Exception as e:
                 logger.warning(f"Failed to initialize AWS Textract: {e}")
     
-    def _normalize_text(self, text: str) -> str:
+    def _normalize_text(self, text: str, preserve_line_breaks: bool = False) -> str:
         """
         Normalize Unicode text to fix common issues:
         - Replace ligatures (fi, fl, etc.) with regular characters
         - Replace curly quotes with straight quotes
         - Normalize spaces and special characters
         - Remove zero-width characters
-        """
-        if not text:
-            return text
-            
-        # First, handle ligatures explicitly before normalization
-        ligature_replacements = {
-            '\ufb00': 'ff',  # ff ligature
-            '\ufb01': 'fi',  # fi ligature
-            '\ufb02': 'fl',  # fl ligature
-            '\ufb03': 'ffi', # ffi ligature
-            '\ufb04': 'ffl', # ffl ligature
-            '\ufb05': 'st',  # st ligature
-            '\ufb06': 'st',  # st ligature (alternative)
-        }
-        
-        for ligature, replacement in ligature_replacements.items():
-            text = text.replace(ligature, replacement)
-            
-        # Now normalize using Unicode NFKC (compatibility composition)
-        # This handles other Unicode normalization
-        text = unicodedata.normalize('NFKC', text)
-        
-        # Replace common problematic characters
-        replacements = {
-            '\u2019': "'",  # Right single quotation mark → apostrophe
-            '\u2018': "'",  # Left single quotation mark → apostrophe
-            '\u201C': '"',  # Left double quotation mark
-            '\u201D': '"',  # Right double quotation mark
-            '\u2013': '-',  # En dash
-            '\u2014': '-',  # Em dash
-            '\u2026': '...',  # Horizontal ellipsis
-            '\u00A0': ' ',  # Non-breaking space
-            '\u200B': '',  # Zero-width space
-            '\u200C': '',  # Zero-width non-joiner
-            '\u200D': '',  # Zero-width joiner
-            '\uFEFF': '',  # Zero-width no-break space (BOM)
-        }
         
-        for old_char, new_char in replacements.items():
-            text = text.replace(old_char, new_char)
-        
-        # Fix spacing around percentages (e.g., "128 %" → "128%")
-        text = re.sub(r'(\d+)\s+%', r'\1%', text)
-        
-        # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Trim each line
-        lines = text.split('\n')
-        text = '\n'.join(line.strip() for line in lines if line.strip())
-        
-        return text
+        With preserve_line_breaks, non-blank lines are kept (trimmed) instead of
+        collapsing the whole text onto one line.
+        """
+        return text_normalizer.normalize(text, preserve_line_breaks)
     
-    def extract_text(self, file_path: str) -> str:
+    def extract_text(self, file_path: str, preserve_line_breaks: bool = False) -> str:
         """
         Main extraction method with smart routing
         
         Args:
             file_path: Path to the file to extract text from
+            preserve_line_breaks: Keep the text's line structure when normalizing
             
         Returns:
             Extracted text as string (never None)
@@ -158,14 +116,14 @@ class TextExtractor:
         
         if text and not needs_ocr:
             logger.info(f"Local extraction successful: {len(text)} characters")
-            return self._normalize_text(text)
+            return self._normalize_text(text, preserve_line_breaks)
             
         # Step 2: Use OCR if needed (images or failed extraction)
         if needs_ocr or not text:
             logger.info("Local extraction insufficient, attempting OCR...")
             text = self._extract_with_ocr(path)
             
-        return self._normalize_text(text) if text else ""
+        return self._normalize_text(text, preserve_line_breaks) if text else ""
     
     def _try_local_extraction(self, path: Path, file_ext: str) -> Tuple[str, bool]:
         """
@@ -175,8 +133,7 @@ class TextExtractor:
             (extracted_text, needs_ocr) tuple
         """
         # Image files always need OCR
-        image_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.heic', '.heif', '.tiff', '.tif', '.bmp'}
-        if file_ext in image_extensions:
+        if file_ext in IMAGE_EXTENSIONS:
             return "", True
             
         # Try document extraction
@@ -235,23 +192,21 @@ class TextExtractor:
     # === Local Extraction Methods ===
     
     def _extract_pdf(self, path: Path) -> str:
-        """Extract text from PDF using PyPDF2"""
-        text_parts = []
+        """
+        Extract text from PDF page by page. Pages without a text layer
+        (scanned pages in otherwise digital PDFs) are OCR'd individually.
+        """
+        ocr_page = self._ocr_pdf_page if (self.vision_client or self.textract_client) else None
+        result = pdf_engine.extract(path, ocr_page=ocr_page)
         
-        with open(path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            num_pages = len(pdf_reader.pages)
-            
-            for page_num in range(num_pages):
-                try:
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
-                    if page_text and page_text.strip():
-                        text_parts.append(page_text.strip())
-                except Exception as e:
-                    logger.warning(f"Failed to extract page {page_num + 1}: {e}")
-                    
-        text = "\n\n".join(text_parts)
+        for page in result.pages:
+            logger.debug(f"Page {page.number}: {page.source}, {len(page.text)} characters, "
+                         f"{page.extract_seconds * 1000:.0f}ms text + {page.ocr_seconds * 1000:.0f}ms OCR")
+        total_ms = sum(page.seconds for page in result.pages) * 1000
+        logger.info(f"PDF pages: {len(result.pages)} ({'parallel' if result.parallel else 'serial'}), "
+                    f"OCR pages: {result.ocr_pages or 'none'}, {total_ms:.0f}ms page time")
+        
+        text = result.text
         
         # If PDF has no extractable text, it's probably scanned
         if not text.strip():
@@ -338,8 +293,22 @@ class TextExtractor:
         Extract text using OCR with fallback chain:
         Google Vision -> AWS Textract -> Empty string
         """
+        with open(path, 'rb') as document_file:
+            content = document_file.read()
+            
+        # Images are oriented, downsampled, converted to grayscale and
+        # recompressed (very tall ones split into parts) before upload
+        parts = [content]
+        if path.suffix.lower() in IMAGE_EXTENSIONS:
+            prepared = image_preprocessor.prepare(content)
+            parts = prepared.parts
+            if prepared.processed:
+                logger.info(f"Image prepared for OCR: {prepared.original_bytes / 1024:.0f}KB -> "
+                            f"{prepared.size_bytes / 1024:.0f}KB in {len(parts)} part(s), "
+                            f"{prepared.seconds * 1000:.0f}ms")
+        
         # Check file size before OCR
-        file_size_mb = path.stat().st_size / (1024 * 1024)
+        file_size_mb = max(len(part) for part in parts) / (1024 * 1024)
         if file_size_mb > 20:  # Google Vision limit
             logger.error(f"File too large for OCR: {file_size_mb:.1f}MB (max 20MB)")
             return ""
@@ -347,7 +316,7 @@ class TextExtractor:
         # Try Google Vision first
         if self.vision_client:
             try:
-                text = self._extract_with_google_vision(path)
+                text = self._ocr_parts(self._extract_bytes_with_google_vision, parts)
                 if text:
                     logger.info(f"Google Vision OCR successful: {len(text)} characters")
                     return text
@@ -357,7 +326,7 @@ class TextExtractor:
         # Fallback to AWS Textract (max 5MB for sync API)
         if self.textract_client and file_size_mb <= 5:
             try:
-                text = self._extract_with_textract(path)
+                text = self._ocr_parts(self._extract_bytes_with_textract, parts)
                 if text:
                     logger.info(f"AWS Textract OCR successful: {len(text)} characters")
                     return text
@@ -369,11 +338,57 @@ class TextExtractor:
         logger.error("All OCR methods failed")
         return ""
     
+    def _ocr_parts(self, ocr, parts: List[bytes]) -> str:
+        """OCR each part of a document in order and join the texts"""
+        return "\n".join(text for text in map(ocr, parts) if text)
+    
+    def _ocr_pdf_page(self, page_bytes: bytes) -> str:
+        """
+        OCR a single-page PDF with the same fallback chain:
+        Google Vision -> AWS Textract -> Empty string
+        """
+        if self.vision_client:
+            try:
+                text = self._extract_pdf_page_with_google_vision(page_bytes)
+                if text:
+                    return text
+            except Exception as e:
+                logger.error(f"Google Vision failed: {e}")
+                
+        if self.textract_client and len(page_bytes) <= 5 * 1024 * 1024:
+            try:
+                return self._extract_bytes_with_textract(page_bytes)
+            except Exception as e:
+                logger.error(f"AWS Textract failed: {e}")
+                
+        return ""
+    
+    def _extract_pdf_page_with_google_vision(self, page_bytes: bytes) -> str:
+        """Extract text from a single-page PDF using Google Cloud Vision file annotation"""
+        request = vision.AnnotateFileRequest(
+            input_config=vision.InputConfig(content=page_bytes, mime_type="application/pdf"),
+            features=[vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)],
+            pages=[1]
+        )
+        response = self.vision_client.batch_annotate_files(requests=[request])
+        
+        text_parts = []
+        for page_response in response.responses[0].responses:
+            if page_response.error.message:
+                raise Exception(f"Google Vision API error: {page_response.error.message}")
+            text_parts.append(page_response.full_text_annotation.text)
+            
+        return "\n".join(text_parts)
+    
     def _extract_with_google_vision(self, path: Path) -> str:
         """Extract text using Google Cloud Vision API"""
         with open(path, 'rb') as image_file:
             content = image_file.read()
             
+        return self._extract_bytes_with_google_vision(content)
+    
+    def _extract_bytes_with_google_vision(self, content: bytes) -> str:
+        """Extract text from image bytes using Google Cloud Vision API"""
         image = vision.Image(content=content)
         response = self.vision_client.text_detection(image=image)
         
@@ -393,6 +408,10 @@ class TextExtractor:
             
         # For PDFs larger than 5MB, would need to use async operation
         # For MVP, we'll use sync operation
+        return self._extract_bytes_with_textract(document_bytes)
+    
+    def _extract_bytes_with_textract(self, document_bytes: bytes) -> str:
+        """Extract text from an image or single-page PDF using AWS Textract"""
         response = self.textract_client.detect_document_text(
             Document={'Bytes': document_bytes}
         )
@@ -411,14 +430,14 @@ text_extractor = TextExtractor()
 
 
 # === Convenience function for simple usage ===
-def extract_text(file_path: str) -> str:
+def extract_text(file_path: str, preserve_line_breaks: bool = False) -> str:
     """
     Simple function interface for text extraction
     
     Usage:
         text = extract_text("path/to/file.pdf")
     """
-    return text_extractor.extract_text(file_path)
+    return text_extractor.extract_text(file_path, preserve_line_breaks)
 
 
 # === For testing ===
@@ -0,0 +1,76 @@
+"""
+Unicode text normalization for extracted CV text
+One NFKC pass (skipped for ASCII), one pass per character replacement and a
+split/join whitespace collapse, optionally keeping line structure
+"""
+import re
+import unicodedata
+
+# Characters NFKC leaves alone that we still want to replace or drop.
+# Ligatures (fi, fl, ...) are already decomposed by NFKC.
+CHARACTER_REPLACEMENTS = {
+    '\u2019': "'",    # Right single quotation mark → apostrophe
+    '\u2018': "'",    # Left single quotation mark → apostrophe
+    '\u201C': '"',    # Left double quotation mark
+    '\u201D': '"',    # Right double quotation mark
+    '\u2013': '-',    # En dash
+    '\u2014': '-',    # Em dash
+    '\u2026': '...',  # Horizontal ellipsis
+    '\u00A0': ' ',    # Non-breaking space
+    '\u200B': '',     # Zero-width space
+    '\u200C': '',     # Zero-width non-joiner
+    '\u200D': '',     # Zero-width joiner
+    '\uFEFF': '',     # Zero-width no-break space (BOM)
+}
+
+# str.replace scans with memchr, so a dozen replace passes beat a single
+# str.translate, which looks every character up in the table
+_REPLACEMENT_PAIRS = tuple(CHARACTER_REPLACEMENTS.items())
+
+# "128 %" → "128%" once whitespace is collapsed. The literal " %" comes first so
+# the regex engine can search for it instead of testing every position.
+_PERCENT_SPACE_PATTERN = re.compile(r' %(?<=\d %)')
+
+
+class TextNormalizer:
+    """Normalizes Unicode and whitespace in extracted text."""
+
+    def normalize(self, text: str, preserve_line_breaks: bool = False) -> str:
+        """
+        Normalize Unicode text to fix common issues:
+        - Replace ligatures (fi, fl, etc.) with regular characters
+        - Replace curly quotes with straight quotes
+        - Normalize spaces and special characters
+        - Remove zero-width characters
+
+        Args:
+            text: Text to normalize
+            preserve_line_breaks: Keep one line per non-blank input line instead
+                of collapsing all whitespace (including newlines) to single spaces
+
+        Returns:
+            Normalized text
+        """
+        if not text:
+            return text
+
+        # ASCII text is unchanged by NFKC and the character replacements
+        if not text.isascii():
+            text = unicodedata.normalize('NFKC', text)
+            for old_char, new_char in _REPLACEMENT_PAIRS:
+                text = text.replace(old_char, new_char)
+
+        # str.split() and regex \s agree on what counts as whitespace
+        if preserve_line_breaks:
+            lines = (' '.join(line.split()) for line in text.splitlines())
+            text = '\n'.join(line for line in lines if line)
+        else:
+            text = ' '.join(text.split())
+
+        if ' %' in text:
+            text = _PERCENT_SPACE_PATTERN.sub('%', text)
+        return text
+
+
+# Singleton instance
+text_normalizer = TextNormalizer()
@@ -5,7 +5,7 @@ This module defines comprehensive Pydantic models for representing CV/resume dat
 in a structured format where ALL fields are nullable (can be null in JSON).
 """
 from typing import List, Optional, Dict, Union, Any, Literal
-from pydantic import BaseModel, Field, HttpUrl, EmailStr, ConfigDict
+from pydantic import BaseModel, Field, HttpUrl, EmailStr, ConfigDict, PrivateAttr
 
 
 # Base Schema with Pydantic v2 configuration
@@ -310,6 +310,23 @@ class CVData(BaseSchema):
     # Catch-all for unstructured content
     unclassified_text: Optional[str] = None
     
+    # Sections cut off by an extraction deadline or cancellation (not serialized)
+    _missing_sections: List[str] = PrivateAttr(default_factory=list)
+    
+    @property
+    def missing_sections(self) -> List[str]:
+        """Sections that were not extracted because extraction was cut short."""
+        return list(self._missing_sections)
+    
+    @property
+    def is_partial(self) -> bool:
+        """True when some sections were cut off by a deadline or cancellation."""
+        return bool(self._missing_sections)
+    
+    def flag_missing_sections(self, sections: List[str]):
+        """Record sections that were cut off before extraction finished."""
+        self._missing_sections = sorted(set(self._missing_sections) | set(sections))
+    
     def model_dump_nullable(self, exclude_none: bool = False) -> Dict[str, Any]:
         """
         Custom serialization that ensures all fields are nullable in JSON.
@@ -98,7 +98,7 @@ async def generate_portfolio_with_template(
             raise HTTPException(status_code=500, detail=f"Template not found: {request.template}")
         
         # === 1. VERIFY CV OWNERSHIP ===
-        uploads = get_user_cv_uploads(current_user_id)
+        uploads = get_user_cv_uploads(current_user_id, include_cv_data=True)
         cv_upload = None
         
         for upload in uploads:
@@ -0,0 +1,235 @@
+"""
+Admission Control for Extraction and Portfolio Generation
+Sheds load once work starts queueing for too long, so that under a spike most
+users are served quickly instead of everyone slowly until they all time out.
+
+Overload is detected CoDel-style: the queueing delay of admitted work is
+sampled, and if even the shortest delay seen over an interval was above the
+target, the queue is standing rather than absorbing a burst. While that holds,
+new work is rejected with 503 and a Retry-After header as long as anything is
+still waiting. The queue is also bounded outright.
+"""
+
+import asyncio
+import math
+import time
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Dict, Optional
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AdmissionConfig:
+    """Configuration for an admission controller"""
+    max_concurrent: int = 4        # Work items running at once (admit() only)
+    max_queue: int = 50            # Waiting work items before new ones are rejected
+    target_delay: float = 10.0     # Acceptable queueing delay in seconds
+    interval: float = 30.0         # Seconds over which the minimum delay is judged
+
+
+@dataclass
+class AdmissionStats:
+    """Statistics for admission monitoring"""
+    admitted: int = 0
+    rejected_queue_full: int = 0
+    rejected_overloaded: int = 0
+    timed_out: int = 0
+    overload_episodes: int = 0
+    last_rejection_time: Optional[datetime] = None
+
+
+class AdmissionRejected(HTTPException):
+    """503 raised when work is shed; routes let it propagate like any HTTPException"""
+
+    def __init__(self, name: str, reason: str, queue_length: int, retry_after: int):
+        super().__init__(
+            status_code=503,
+            detail={
+                "error": "Server is busy, please try again shortly",
+                "reason": reason,
+                "queue_length": queue_length,
+                "retry_after": retry_after
+            },
+            headers={"Retry-After": str(retry_after)}
+        )
+        self.name = name
+        self.reason = reason
+
+
+class AdmissionController:
+    """
+    Bounded, delay-targeting admission queue
+
+    Usage (work run inline, e.g. in a request):
+        async with controller.admit():
+            await generate(...)
+
+    Usage (work handed to a queue drained elsewhere, e.g. the job queue):
+        controller.check(queue_length)      # before enqueueing, raises AdmissionRejected
+        controller.record_delay(seconds)    # when a worker picks the work up
+    """
+
+    def __init__(self, name: str, config: Optional[AdmissionConfig] = None):
+        self.name = name
+        self.config = config or AdmissionConfig()
+        self.stats = AdmissionStats()
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._overloaded = False
+        self._interval_min = math.inf
+        self._interval_end = time.monotonic() + self.config.interval
+        self._last_interval_min: Optional[float] = None
+
+    @property
+    def overloaded(self) -> bool:
+        """True while the last full interval never got below the target delay"""
+        return self._overloaded
+
+    def record_delay(self, delay: float) -> None:
+        """Record how long a work item waited before it started"""
+        self._roll_interval(time.monotonic())
+        self._interval_min = min(self._interval_min, delay)
+
+    def check(self, queue_length: int) -> None:
+        """
+        Decide whether one more work item may join a queue
+
+        Args:
+            queue_length: Work items currently waiting
+
+        Raises:
+            AdmissionRejected: The queue is full, or overloaded with work still waiting
+        """
+        self._roll_interval(time.monotonic(), queue_length)
+        if queue_length >= self.config.max_queue:
+            self.stats.rejected_queue_full += 1
+            self._reject("queue_full", queue_length)
+        if self._overloaded and queue_length > 0:
+            self.stats.rejected_overloaded += 1
+            self._reject("overloaded", queue_length)
+
+    @asynccontextmanager
+    async def admit(self):
+        """
+        Run a work item in one of max_concurrent slots, waiting for a slot if needed
+
+        Raises:
+            AdmissionRejected: Rejected on arrival, or no slot freed up within
+                one interval
+        """
+        if self._active < self.config.max_concurrent and not self._waiters:
+            self._active += 1
+            self.record_delay(0.0)
+        else:
+            await self._wait_for_slot()
+        self.stats.admitted += 1
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _wait_for_slot(self):
+        self.check(len(self._waiters))
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started = time.monotonic()
+        try:
+            # A slot is handed over by _release (the count stays with it)
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.config.interval)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()  # Slot granted just as we were cancelled - pass it on
+            raise
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+        if waiter.cancelled():
+            self.stats.timed_out += 1
+            self._reject("timed_out", len(self._waiters))
+        self.record_delay(time.monotonic() - started)
+
+    def _release(self):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def _roll_interval(self, now: float, queue_length: int = 0):
+        """Start a new interval when the current one is over, judging the old one"""
+        if now < self._interval_end:
+            return
+        if self._interval_min == math.inf:
+            # Nothing started all interval: overloaded only if work was waiting
+            overloaded = queue_length > 0 or bool(self._waiters)
+        else:
+            overloaded = self._interval_min > self.config.target_delay
+        if overloaded and not self._overloaded:
+            self.stats.overload_episodes += 1
+            logger.warning(f"⚠️ {self.name}: queueing delay above {self.config.target_delay:.0f}s target, shedding load")
+        elif self._overloaded and not overloaded:
+            logger.info(f"✅ {self.name}: queueing delay back under target, admitting all work")
+        self._overloaded = overloaded
+        self._last_interval_min = None if self._interval_min == math.inf else self._interval_min
+        self._interval_min = math.inf
+        self._interval_end = now + self.config.interval
+
+    def _reject(self, reason: str, queue_length: int):
+        self.stats.last_rejection_time = datetime.now()
+        retry_after = math.ceil(self.config.interval)
+        logger.warning(f"🚫 {self.name}: rejected work ({reason}, {queue_length} waiting)")
+        raise AdmissionRejected(self.name, reason, queue_length, retry_after)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get current admission status"""
+        self._roll_interval(time.monotonic())
+        rejected = self.stats.rejected_queue_full + self.stats.rejected_overloaded + self.stats.timed_out
+        total = self.stats.admitted + rejected
+        return {
+            "name": self.name,
+            "overloaded": self._overloaded,
+            "active": self._active,
+            "waiting": len(self._waiters),
+            "last_interval_min_delay": self._last_interval_min,
+            "stats": {
+                "admitted": self.stats.admitted,
+                "rejected_queue_full": self.stats.rejected_queue_full,
+                "rejected_overloaded": self.stats.rejected_overloaded,
+                "timed_out": self.stats.timed_out,
+                "rejection_rate": rejected / total * 100 if total > 0 else 0,
+                "overload_episodes": self.stats.overload_episodes,
+                "last_rejection": self.stats.last_rejection_time.isoformat() if self.stats.last_rejection_time else None
+            },
+            "config": {
+                "max_concurrent": self.config.max_concurrent,
+                "max_queue": self.config.max_queue,
+                "target_delay": self.config.target_delay,
+                "interval": self.config.interval
+            }
+        }
+
+
+# Global admission controllers
+# CV extraction: queued uploads (job queue backlog) and inline /extract calls
+extraction_admission = AdmissionController(
+    "cv_extraction",
+    AdmissionConfig(max_concurrent=4, max_queue=50, target_delay=15.0, interval=30.0)
+)
+# Portfolio generation (npm install/build per portfolio)
+portfolio_admission = AdmissionController(
+    "portfolio_generation",
+    AdmissionConfig(max_concurrent=2, max_queue=10, target_delay=20.0, interval=60.0)
+)
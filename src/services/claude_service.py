@@ -10,12 +10,13 @@ from pathlib import Path
 from typing import Optional, Dict, Any, AsyncGenerator
 from datetime import datetime, timedelta
 import anthropic
-from anthropic import AsyncAnthropic, APIError, RateLimitError
+from anthropic import APIError, RateLimitError
 import logging
 from functools import wraps
 import hashlib
 
 from src.utils.live_logger import LiveLogger
+from src.core.cv_extraction.client_registry import get_anthropic_client
 
 # Initialize logger
 logger = LiveLogger(__name__)
@@ -35,7 +36,8 @@ class ClaudeService:
         if not self.api_key:
             raise ValueError("Anthropic API key not found")
         
-        self.client = AsyncAnthropic(api_key=self.api_key)
+        # Shared, connection-pooled client (one per API key for the whole process)
+        self.client = get_anthropic_client(self.api_key)
         self.model = model
         self.max_retries = max_retries
         self.retry_delay = retry_delay
@@ -0,0 +1,480 @@
+"""
+Durable Job Queue for Background CV Processing
+Uploads enqueue a job and return their job_id straight away; a pool of worker
+tasks claims jobs from the backend and runs them outside the HTTP request.
+
+Claimed jobs are leased. A worker renews its lease while a job runs, so a job
+whose worker crashed or hung becomes visible again once the lease expires and
+is picked up by another worker (or process). Failed jobs are retried with
+exponential backoff until MAX_ATTEMPTS is reached.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import time
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Worker tasks per process
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+# Attempts before a job is marked failed
+MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+# Seconds a claimed job stays invisible to other workers without a lease renewal
+VISIBILITY_TIMEOUT = float(os.getenv("JOB_VISIBILITY_TIMEOUT", "120"))
+# Seconds a single attempt may run before it is cancelled and retried
+JOB_TIMEOUT = float(os.getenv("JOB_TIMEOUT", "600"))
+RETRY_BACKOFF_SECONDS = 5.0
+# Idle workers check for jobs enqueued by other processes this often
+POLL_INTERVAL = 1.0
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class JobFailed(Exception):
+    """Raised by a handler for failures retrying cannot fix (the job fails at once)"""
+
+
+@dataclass
+class QueuedJob:
+    """A job as stored in the queue backend"""
+    job_id: str
+    kind: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    status: str = QUEUED
+    attempts: int = 0
+    max_attempts: int = MAX_ATTEMPTS
+    last_error: Optional[str] = None
+    available_at: float = 0.0  # Epoch seconds the job became runnable
+    queued_at: float = 0.0  # Epoch seconds the current attempt became runnable (enqueue, retry or lease expiry)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+    @property
+    def waited_seconds(self) -> float:
+        """Time spent queued before the current attempt (meaningful once claimed)"""
+        return max(0.0, time.time() - self.queued_at)
+
+
+class JobBackend(ABC):
+    """Storage for queued jobs. Claims must be atomic across processes."""
+
+    @abstractmethod
+    def enqueue(self, job: QueuedJob) -> None:
+        """Add a job, or requeue an existing job with the same id"""
+
+    @abstractmethod
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[QueuedJob]:
+        """Lease the next runnable job (queued and due, or with an expired lease)"""
+
+    @abstractmethod
+    def extend_lease(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """Renew a lease; False if the worker no longer holds it"""
+
+    @abstractmethod
+    def complete(self, job_id: str, worker_id: str) -> bool:
+        """Mark a leased job done"""
+
+    @abstractmethod
+    def retry(self, job_id: str, worker_id: str, error: Optional[str], delay: float, count_attempt: bool = True) -> bool:
+        """Put a leased job back in the queue, runnable after delay seconds"""
+
+    @abstractmethod
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """Mark a leased job failed for good"""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[QueuedJob]:
+        """Look up a job"""
+
+    @abstractmethod
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status"""
+
+    @abstractmethod
+    def runnable(self) -> int:
+        """Number of jobs a worker could claim now (retry-delayed jobs excluded)"""
+
+    @abstractmethod
+    def position(self, job_id: str) -> Optional[int]:
+        """1-based place of a queued job among runnable jobs, None if not queued"""
+
+
+class SQLiteJobBackend(JobBackend):
+    """Job backend on the application's SQLite database (job_queue table)"""
+
+    def _connect(self):
+        # Resolved per call so the database path can change (tests, config)
+        from src.api.db import get_db_connection
+        return get_db_connection()
+
+    def enqueue(self, job: QueuedJob) -> None:
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                """INSERT OR REPLACE INTO job_queue
+                (job_id, kind, payload, status, attempts, max_attempts, available_at, created_at)
+                VALUES (?, ?, ?, ?, 0, ?, ?, ?)""",
+                (job.job_id, job.kind, json.dumps(job.payload), QUEUED, job.max_attempts,
+                 now, datetime.utcnow().isoformat())
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[QueuedJob]:
+        now = time.time()
+        conn = self._connect()
+        conn.isolation_level = None  # Explicit transaction below
+        try:
+            # IMMEDIATE takes the write lock up front, so two processes never
+            # select the same job
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                """SELECT * FROM job_queue
+                WHERE (status = ? AND available_at <= ?) OR (status = ? AND lease_expires_at <= ?)
+                ORDER BY available_at LIMIT 1""",
+                (QUEUED, now, RUNNING, now)
+            ).fetchone()
+            if not row:
+                conn.execute("COMMIT")
+                return None
+
+            if row['status'] == RUNNING:
+                logger.warning(f"Lease on job {row['job_id']} held by {row['lease_owner']} expired, reclaiming")
+            conn.execute(
+                """UPDATE job_queue
+                SET status = ?, attempts = attempts + 1, lease_owner = ?, lease_expires_at = ?
+                WHERE job_id = ?""",
+                (RUNNING, worker_id, now + lease_seconds, row['job_id'])
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        job = self._to_job(row)
+        if row['status'] == RUNNING:
+            # Queued since the stale lease ran out, not since it was first claimed
+            job.queued_at = row['lease_expires_at']
+        job.status, job.attempts = RUNNING, job.attempts + 1
+        return job
+
+    def extend_lease(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        return self._update_leased(
+            job_id, worker_id, "lease_expires_at = ?", (time.time() + lease_seconds,)
+        )
+
+    def complete(self, job_id: str, worker_id: str) -> bool:
+        return self._update_leased(
+            job_id, worker_id, "status = ?, lease_owner = NULL, lease_expires_at = NULL", (DONE,)
+        )
+
+    def retry(self, job_id: str, worker_id: str, error: Optional[str], delay: float, count_attempt: bool = True) -> bool:
+        attempts = "attempts" if count_attempt else "attempts - 1"
+        return self._update_leased(
+            job_id, worker_id,
+            f"status = ?, attempts = {attempts}, available_at = ?, last_error = ?, "
+            "lease_owner = NULL, lease_expires_at = NULL",
+            (QUEUED, time.time() + delay, error)
+        )
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        return self._update_leased(
+            job_id, worker_id,
+            "status = ?, last_error = ?, lease_owner = NULL, lease_expires_at = NULL",
+            (FAILED, error)
+        )
+
+    def get(self, job_id: str) -> Optional[QueuedJob]:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM job_queue WHERE job_id = ?", (job_id,)).fetchone()
+            return self._to_job(row) if row else None
+        finally:
+            conn.close()
+
+    def counts(self) -> Dict[str, int]:
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT status, COUNT(*) AS count FROM job_queue GROUP BY status").fetchall()
+            return {row['status']: row['count'] for row in rows}
+        finally:
+            conn.close()
+
+    def runnable(self) -> int:
+        now = time.time()
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                """SELECT COUNT(*) AS count FROM job_queue
+                WHERE (status = ? AND available_at <= ?) OR (status = ? AND lease_expires_at <= ?)""",
+                (QUEUED, now, RUNNING, now)
+            ).fetchone()
+            return row['count']
+        finally:
+            conn.close()
+
+    def position(self, job_id: str) -> Optional[int]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                """SELECT COUNT(*) AS ahead FROM job_queue AS other, job_queue AS job
+                WHERE job.job_id = ? AND job.status = ?
+                AND other.status = ? AND other.available_at <= job.available_at""",
+                (job_id, QUEUED, QUEUED)
+            ).fetchone()
+            return row['ahead'] or None
+        finally:
+            conn.close()
+
+    def _update_leased(self, job_id: str, worker_id: str, assignments: str, params: tuple) -> bool:
+        """Update a job only while worker_id still holds its lease"""
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                f"UPDATE job_queue SET {assignments} WHERE job_id = ? AND lease_owner = ? AND status = ?",
+                (*params, job_id, worker_id, RUNNING)
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _to_job(row) -> QueuedJob:
+        return QueuedJob(
+            job_id=row['job_id'],
+            kind=row['kind'],
+            payload=json.loads(row['payload']) if row['payload'] else {},
+            status=row['status'],
+            attempts=row['attempts'],
+            max_attempts=row['max_attempts'],
+            last_error=row['last_error'],
+            available_at=row['available_at'],
+            queued_at=row['available_at']
+        )
+
+
+JobHandler = Callable[[QueuedJob], Awaitable[None]]
+FailureHandler = Callable[[QueuedJob, str], None]
+
+
+class JobQueue:
+    """Pool of worker tasks running jobs from a JobBackend"""
+
+    def __init__(
+        self,
+        backend: Optional[JobBackend] = None,
+        workers: int = JOB_WORKERS,
+        max_attempts: int = MAX_ATTEMPTS,
+        visibility_timeout: float = VISIBILITY_TIMEOUT,
+        job_timeout: float = JOB_TIMEOUT,
+        poll_interval: float = POLL_INTERVAL
+    ):
+        self.backend = backend or SQLiteJobBackend()
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.visibility_timeout = visibility_timeout
+        self.job_timeout = job_timeout
+        self.poll_interval = poll_interval
+        self._handlers: Dict[str, JobHandler] = {}
+        self._failure_handlers: Dict[str, FailureHandler] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        # Lease owner ids are unique across processes and hosts
+        self._worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+    def register(self, kind: str, handler: JobHandler, on_failure: Optional[FailureHandler] = None):
+        """
+        Register the coroutine that runs jobs of a kind.
+
+        Args:
+            kind: Job kind passed to enqueue
+            handler: Coroutine called with the QueuedJob; raising retries the
+                job, raising JobFailed fails it without retrying
+            on_failure: Called with the job and error once it has run out of attempts
+        """
+        self._handlers[kind] = handler
+        if on_failure:
+            self._failure_handlers[kind] = on_failure
+
+    def enqueue(self, kind: str, job_id: str, payload: Optional[Dict[str, Any]] = None) -> QueuedJob:
+        """
+        Queue a job and make sure this process has workers running.
+
+        Returns immediately; the job runs in a worker task.
+        """
+        job = QueuedJob(job_id=job_id, kind=kind, payload=payload or {}, max_attempts=self.max_attempts)
+        self.backend.enqueue(job)
+        logger.info(f"Queued {kind} job {job_id}")
+        try:
+            self.start()
+        except RuntimeError:
+            # No event loop here - a worker in another process will claim it
+            logger.info(f"No running event loop, job {job_id} left for another worker")
+        return job
+
+    def get(self, job_id: str) -> Optional[QueuedJob]:
+        """Current state of a job, or None if it was never queued"""
+        return self.backend.get(job_id)
+
+    def position(self, job_id: str) -> Optional[int]:
+        """Place of a queued job in line (1 = next), None once it has started"""
+        return self.backend.position(job_id)
+
+    async def wait(self, job_id: str, timeout: float,
+                   cancel_check: Optional[Callable[[], Awaitable[bool]]] = None) -> Optional[QueuedJob]:
+        """
+        Wait for a job to finish (done or failed).
+
+        Args:
+            job_id: Job to wait for
+            timeout: Seconds to wait at most
+            cancel_check: Coroutine returning True to stop waiting (e.g. client disconnected)
+
+        Returns:
+            Latest state of the job (still active on timeout or cancel), None if never queued
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or not job.is_active or time.monotonic() >= deadline:
+                return job
+            if cancel_check is not None and await cancel_check():
+                return job
+            await asyncio.sleep(min(self.poll_interval, max(0.0, deadline - time.monotonic())))
+
+    def backlog(self) -> int:
+        """Number of runnable jobs waiting for a worker (not those waiting out a retry delay)"""
+        return self.backend.runnable()
+
+    def start(self):
+        """
+        Start the worker tasks on the running event loop (no-op if running).
+
+        Jobs left behind by a crashed process are recovered as soon as their
+        lease expires.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and any(not task.done() for task in self._tasks):
+            self._wakeup.set()
+            return
+
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            loop.create_task(self._worker(f"{self._worker_prefix}:{number}"))
+            for number in range(self.workers)
+        ]
+        logger.info(f"Started {self.workers} job workers")
+
+    async def stop(self):
+        """Cancel the worker tasks. Jobs they were running go back to the queue."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run_next(self, worker_id: Optional[str] = None) -> bool:
+        """
+        Claim and run a single job.
+
+        Returns:
+            True if a job was run, False if none was runnable
+        """
+        worker_id = worker_id or f"{self._worker_prefix}:inline"
+        job = self.backend.claim(worker_id, self.visibility_timeout)
+        if not job:
+            return False
+        await self._run(job, worker_id)
+        return True
+
+    async def _worker(self, worker_id: str):
+        while True:
+            try:
+                if await self.run_next(worker_id):
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job worker {worker_id} error: {e}")
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run(self, job: QueuedJob, worker_id: str):
+        """Run a claimed job, then complete, retry or fail it"""
+        handler = self._handlers.get(job.kind)
+        if handler is None:
+            self._give_up(job, worker_id, f"No handler registered for job kind '{job.kind}'")
+            return
+        if job.attempts > job.max_attempts:
+            # Only reachable through expired leases: the job kept killing its worker
+            self._give_up(job, worker_id, job.last_error or "Worker lost the job on every attempt")
+            return
+
+        logger.info(f"Worker {worker_id} running {job.kind} job {job.job_id} (attempt {job.attempts}/{job.max_attempts})")
+        heartbeat = asyncio.create_task(self._renew_lease(job, worker_id))
+        try:
+            await asyncio.wait_for(handler(job), timeout=self.job_timeout)
+        except asyncio.CancelledError:
+            # Shutting down - hand the job back without using up an attempt
+            self.backend.retry(job.job_id, worker_id, job.last_error, delay=0, count_attempt=False)
+            raise
+        except JobFailed as e:
+            self._give_up(job, worker_id, str(e))
+        except Exception as e:
+            error = f"Timed out after {self.job_timeout:.0f}s" if isinstance(e, asyncio.TimeoutError) else str(e)
+            if job.attempts < job.max_attempts:
+                delay = RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1)
+                logger.warning(f"Job {job.job_id} attempt {job.attempts} failed: {error} - retrying in {delay:.0f}s")
+                self.backend.retry(job.job_id, worker_id, error, delay)
+            else:
+                self._give_up(job, worker_id, error)
+        else:
+            self.backend.complete(job.job_id, worker_id)
+            logger.info(f"Job {job.job_id} completed")
+        finally:
+            heartbeat.cancel()
+
+    async def _renew_lease(self, job: QueuedJob, worker_id: str):
+        while True:
+            await asyncio.sleep(self.visibility_timeout / 3)
+            if not self.backend.extend_lease(job.job_id, worker_id, self.visibility_timeout):
+                logger.warning(f"Worker {worker_id} lost the lease on job {job.job_id}")
+                return
+
+    def _give_up(self, job: QueuedJob, worker_id: str, error: str):
+        logger.error(f"Job {job.job_id} failed after {job.attempts} attempts: {error}")
+        self.backend.fail(job.job_id, worker_id, error)
+        on_failure = self._failure_handlers.get(job.kind)
+        if on_failure:
+            try:
+                on_failure(job, error)
+            except Exception as e:
+                logger.error(f"Failure handler for job {job.job_id} raised: {e}")
+
+
+# Global job queue instance
+job_queue = JobQueue()
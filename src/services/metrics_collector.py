@@ -15,6 +15,8 @@ from enum import Enum
 import logging
 import json
 
+from src.services.shared_state import SharedStateBackend, shared_state
+
 logger = logging.getLogger(__name__)
 
 
@@ -150,9 +152,15 @@ class MetricBuffer:
 
 
 class MetricsCollector:
-    """Main metrics collection and aggregation system"""
+    """
+    Main metrics collection and aggregation system
+    
+    Value buffers are per process; counter totals are also kept in the shared
+    state backend so they add up across worker processes.
+    """
     
-    def __init__(self, enable_background_processing: bool = True):
+    def __init__(self, enable_background_processing: bool = True, state: Optional[SharedStateBackend] = None):
+        self.state = state or shared_state
         self.metrics: Dict[str, MetricBuffer] = defaultdict(lambda: MetricBuffer())
         self.metric_types: Dict[str, MetricType] = {}
         self.metric_metadata: Dict[str, Dict[str, Any]] = {}
@@ -229,8 +237,15 @@ class MetricsCollector:
     
     def increment_counter(self, metric_name: str, value: int = 1, tags: Optional[Dict[str, str]] = None):
         """Increment a counter metric"""
+        self.state.incr(f"metrics:{metric_name}", value)
         self.record_value(metric_name, value, tags)
     
+    def get_counter_totals(self) -> Dict[str, float]:
+        """Get counter totals across all worker processes"""
+        return {
+            key[len("metrics:"):]: value for key, value in self.state.counters("metrics:").items()
+        }
+    
     def set_gauge(self, metric_name: str, value: Union[float, int], tags: Optional[Dict[str, str]] = None):
         """Set a gauge metric value"""
         self.record_value(metric_name, value, tags)
@@ -411,7 +426,8 @@ class MetricsCollector:
                 "registered_types": len(self.metric_types),
                 "alert_thresholds": len(self.alert_thresholds),
                 "alert_handlers": len(self.alert_handlers),
-                "background_processing": self.enable_background_processing
+                "background_processing": self.enable_background_processing,
+                "counter_totals": self.get_counter_totals()
             }
     
     def shutdown(self):
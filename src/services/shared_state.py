@@ -0,0 +1,478 @@
+"""
+Shared State for Rate Limiters, SSE Fan-out and Counters
+State that must be the same in every worker process (uvicorn --workers N):
+counters, sliding-window rate limits, token buckets, small values and
+pub/sub messages. Kept in a per-process global, a limit of 10 becomes 10 per
+worker and an SSE event published in one worker never reaches a client
+connected to another.
+
+Backends (SHARED_STATE_BACKEND):
+    memory - in-process, for a single worker (default)
+    sqlite - tables in the application's SQLite database, shared by every
+             worker on the host
+
+Another store (e.g. Redis) plugs in by implementing SharedStateBackend.
+"""
+
+import os
+import json
+import time
+import threading
+import logging
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SHARED_STATE_BACKEND = os.getenv('SHARED_STATE_BACKEND', 'memory').lower()
+# Seconds published messages are kept for workers that have not read them yet
+MESSAGE_TTL = 60.0
+# Seconds between purges of expired rows (SQLite backend)
+PURGE_INTERVAL = 60.0
+# Longest sliding window in use (daily upload limit); older hits are purged
+MAX_WINDOW = 86400.0
+# Token buckets untouched for this long are dropped (they would be full again)
+BUCKET_IDLE_SECONDS = 86400.0
+
+Message = Tuple[int, str, Dict[str, Any]]  # (message_id, channel, message)
+
+
+class SharedStateBackend(ABC):
+    """Storage for state shared across worker processes"""
+
+    # True when other processes see this state (pub/sub needs a relay)
+    shared = False
+
+    # Counters
+    @abstractmethod
+    def incr(self, key: str, amount: float = 1) -> float:
+        """Add amount to a counter (created at 0) and return the new value"""
+
+    @abstractmethod
+    def get_counter(self, key: str) -> float:
+        """Get a counter's value (0 if it does not exist)"""
+
+    @abstractmethod
+    def counters(self, prefix: str = "") -> Dict[str, float]:
+        """Get all counters whose key starts with prefix"""
+
+    @abstractmethod
+    def reset_counter(self, key: str) -> None:
+        """Delete a counter"""
+
+    # Sliding windows
+    @abstractmethod
+    def hit(self, key: str, window: float, limit: Optional[int] = None) -> Tuple[bool, int]:
+        """
+        Record a hit in a sliding window unless it already holds limit hits
+
+        Returns:
+            (recorded, hits in the window afterwards)
+        """
+
+    @abstractmethod
+    def count(self, key: str, window: float) -> int:
+        """Get the number of hits in a sliding window"""
+
+    @abstractmethod
+    def reset_window(self, key: str) -> None:
+        """Delete all hits of a sliding window"""
+
+    # Token buckets
+    @abstractmethod
+    def take_tokens(self, key: str, capacity: float, refill_rate: float, amount: float = 1) -> Tuple[bool, float]:
+        """
+        Take tokens from a bucket (created full) refilled at refill_rate per second
+
+        Returns:
+            (taken, tokens left)
+        """
+
+    @abstractmethod
+    def peek_tokens(self, key: str, capacity: float, refill_rate: float) -> float:
+        """Get the tokens in a bucket without taking any"""
+
+    # Values
+    @abstractmethod
+    def set_value(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a JSON-serializable value, optionally expiring after ttl seconds"""
+
+    @abstractmethod
+    def add_value(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """Store a value unless an unexpired one exists (e.g. to take a lease); True if stored"""
+
+    @abstractmethod
+    def get_value(self, key: str) -> Any:
+        """Get a stored value (None if missing or expired)"""
+
+    @abstractmethod
+    def delete_value(self, key: str) -> None:
+        """Delete a stored value"""
+
+    @abstractmethod
+    def values(self, prefix: str = "") -> Dict[str, Any]:
+        """Get all unexpired values whose key starts with prefix"""
+
+    # Pub/sub
+    @abstractmethod
+    def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        """Publish a JSON-serializable message and return its id"""
+
+    @abstractmethod
+    def messages_after(self, message_id: int, limit: int = 500) -> List[Message]:
+        """Get messages published after message_id, oldest first"""
+
+    @abstractmethod
+    def last_message_id(self) -> int:
+        """Get the id of the latest message (0 if none)"""
+
+    def purge_expired(self) -> None:
+        """Drop zeroed counters, expired values, window hits, idle buckets and old messages"""
+
+
+class InMemoryStateBackend(SharedStateBackend):
+    """State in this process only - correct for a single worker"""
+
+    def __init__(self, message_ttl: float = MESSAGE_TTL):
+        self.message_ttl = message_ttl
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._windows: Dict[str, List[float]] = {}
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # key -> (tokens, updated_at)
+        self._values: Dict[str, Tuple[Any, Optional[float]]] = {}  # key -> (value, expires_at)
+        self._messages: Deque[Tuple[int, str, Dict[str, Any], float]] = deque()
+        self._message_id = 0
+
+    def incr(self, key: str, amount: float = 1) -> float:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+            return self._counters[key]
+
+    def get_counter(self, key: str) -> float:
+        return self._counters.get(key, 0)
+
+    def counters(self, prefix: str = "") -> Dict[str, float]:
+        with self._lock:
+            return {key: value for key, value in self._counters.items() if key.startswith(prefix)}
+
+    def reset_counter(self, key: str) -> None:
+        with self._lock:
+            self._counters.pop(key, None)
+
+    def _window(self, key: str, window: float, now: float) -> List[float]:
+        hits = [hit_at for hit_at in self._windows.get(key, ()) if hit_at > now - window]
+        self._windows[key] = hits
+        return hits
+
+    def hit(self, key: str, window: float, limit: Optional[int] = None) -> Tuple[bool, int]:
+        now = time.time()
+        with self._lock:
+            hits = self._window(key, window, now)
+            if limit is not None and len(hits) >= limit:
+                return False, len(hits)
+            hits.append(now)
+            return True, len(hits)
+
+    def count(self, key: str, window: float) -> int:
+        with self._lock:
+            return len(self._window(key, window, time.time()))
+
+    def reset_window(self, key: str) -> None:
+        with self._lock:
+            self._windows.pop(key, None)
+
+    def _refilled(self, key: str, capacity: float, refill_rate: float, now: float) -> float:
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        return min(capacity, tokens + (now - updated_at) * refill_rate)
+
+    def take_tokens(self, key: str, capacity: float, refill_rate: float, amount: float = 1) -> Tuple[bool, float]:
+        now = time.time()
+        with self._lock:
+            tokens = self._refilled(key, capacity, refill_rate, now)
+            taken = tokens >= amount
+            if taken:
+                tokens -= amount
+            self._buckets[key] = (tokens, now)
+            return taken, tokens
+
+    def peek_tokens(self, key: str, capacity: float, refill_rate: float) -> float:
+        with self._lock:
+            return self._refilled(key, capacity, refill_rate, time.time())
+
+    def set_value(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._values[key] = (value, time.time() + ttl if ttl is not None else None)
+
+    def add_value(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        now = time.time()
+        with self._lock:
+            existing = self._values.get(key)
+            if existing is not None and (existing[1] is None or existing[1] > now):
+                return False
+            self._values[key] = (value, now + ttl if ttl is not None else None)
+            return True
+
+    def get_value(self, key: str) -> Any:
+        value, expires_at = self._values.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return value
+
+    def delete_value(self, key: str) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+
+    def values(self, prefix: str = "") -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            return {
+                key: value for key, (value, expires_at) in self._values.items()
+                if key.startswith(prefix) and (expires_at is None or expires_at > now)
+            }
+
+    def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        now = time.time()
+        with self._lock:
+            while self._messages and self._messages[0][3] <= now - self.message_ttl:
+                self._messages.popleft()
+            self._message_id += 1
+            self._messages.append((self._message_id, channel, message, now))
+            return self._message_id
+
+    def messages_after(self, message_id: int, limit: int = 500) -> List[Message]:
+        with self._lock:
+            newer = [(mid, channel, message) for mid, channel, message, _ in self._messages if mid > message_id]
+        return newer[:limit]
+
+    def last_message_id(self) -> int:
+        return self._message_id
+
+    def purge_expired(self) -> None:
+        now = time.time()
+        with self._lock:
+            self._counters = {key: value for key, value in self._counters.items() if value != 0}
+            self._values = {
+                key: entry for key, entry in self._values.items()
+                if entry[1] is None or entry[1] > now
+            }
+            self._windows = {
+                key: [hit_at for hit_at in hits if hit_at > now - MAX_WINDOW]
+                for key, hits in self._windows.items() if hits and hits[-1] > now - MAX_WINDOW
+            }
+            self._buckets = {
+                key: bucket for key, bucket in self._buckets.items()
+                if bucket[1] > now - BUCKET_IDLE_SECONDS
+            }
+
+
+class SQLiteStateBackend(SharedStateBackend):
+    """State in the application's SQLite database, shared by every worker on the host"""
+
+    shared = True
+
+    def __init__(self, message_ttl: float = MESSAGE_TTL):
+        self.message_ttl = message_ttl
+        self._last_purge = 0.0
+
+    def _connect(self):
+        # Resolved per call so the database path can change (tests, config)
+        from src.api.db import get_db_connection
+        return get_db_connection()
+
+    def _write(self, statements):
+        """Run (sql, params) statements in one IMMEDIATE transaction, returning the last cursor"""
+        conn = self._connect()
+        conn.isolation_level = None  # Explicit transaction below
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = None
+            for sql, params in statements:
+                cursor = conn.execute(sql, params)
+            rows = cursor.fetchall() if cursor is not None else []
+            conn.execute("COMMIT")
+            return rows
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _read(self, sql, params=()):
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def _maybe_purge(self):
+        if time.time() - self._last_purge >= PURGE_INTERVAL:
+            self.purge_expired()
+
+    def incr(self, key: str, amount: float = 1) -> float:
+        rows = self._write([(
+            """INSERT INTO shared_counters (key, value) VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = value + excluded.value
+            RETURNING value""",
+            (key, amount)
+        )])
+        return rows[0]['value']
+
+    def get_counter(self, key: str) -> float:
+        rows = self._read("SELECT value FROM shared_counters WHERE key = ?", (key,))
+        return rows[0]['value'] if rows else 0
+
+    def counters(self, prefix: str = "") -> Dict[str, float]:
+        rows = self._read(
+            "SELECT key, value FROM shared_counters WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+        )
+        return {row['key']: row['value'] for row in rows}
+
+    def reset_counter(self, key: str) -> None:
+        self._write([("DELETE FROM shared_counters WHERE key = ?", (key,))])
+
+    def hit(self, key: str, window: float, limit: Optional[int] = None) -> Tuple[bool, int]:
+        self._maybe_purge()
+        now = time.time()
+        conn = self._connect()
+        conn.isolation_level = None  # Explicit transaction below
+        try:
+            # IMMEDIATE so two workers cannot both see room for the last hit
+            conn.execute("BEGIN IMMEDIATE")
+            hits = conn.execute(
+                "SELECT COUNT(*) FROM shared_window_hits WHERE key = ? AND hit_at > ?", (key, now - window)
+            ).fetchone()[0]
+            recorded = limit is None or hits < limit
+            if recorded:
+                conn.execute("INSERT INTO shared_window_hits (key, hit_at) VALUES (?, ?)", (key, now))
+                hits += 1
+            conn.execute("COMMIT")
+            return recorded, hits
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def count(self, key: str, window: float) -> int:
+        rows = self._read(
+            "SELECT COUNT(*) FROM shared_window_hits WHERE key = ? AND hit_at > ?", (key, time.time() - window)
+        )
+        return rows[0][0]
+
+    def reset_window(self, key: str) -> None:
+        self._write([("DELETE FROM shared_window_hits WHERE key = ?", (key,))])
+
+    def take_tokens(self, key: str, capacity: float, refill_rate: float, amount: float = 1) -> Tuple[bool, float]:
+        now = time.time()
+        conn = self._connect()
+        conn.isolation_level = None  # Explicit transaction below
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM shared_token_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens = capacity if row is None else min(capacity, row['tokens'] + (now - row['updated_at']) * refill_rate)
+            taken = tokens >= amount
+            if taken:
+                tokens -= amount
+            conn.execute(
+                "INSERT OR REPLACE INTO shared_token_buckets (key, tokens, updated_at) VALUES (?, ?, ?)",
+                (key, tokens, now)
+            )
+            conn.execute("COMMIT")
+            return taken, tokens
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def peek_tokens(self, key: str, capacity: float, refill_rate: float) -> float:
+        rows = self._read("SELECT tokens, updated_at FROM shared_token_buckets WHERE key = ?", (key,))
+        if not rows:
+            return capacity
+        return min(capacity, rows[0]['tokens'] + (time.time() - rows[0]['updated_at']) * refill_rate)
+
+    def set_value(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._write([(
+            "INSERT OR REPLACE INTO shared_values (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value), expires_at)
+        )])
+
+    def add_value(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        now = time.time()
+        rows = self._write([
+            ("DELETE FROM shared_values WHERE key = ? AND expires_at <= ?", (key, now)),
+            (
+                """INSERT INTO shared_values (key, value, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO NOTHING RETURNING key""",
+                (key, json.dumps(value), now + ttl if ttl is not None else None)
+            ),
+        ])
+        return bool(rows)
+
+    def get_value(self, key: str) -> Any:
+        rows = self._read(
+            "SELECT value FROM shared_values WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time())
+        )
+        return json.loads(rows[0]['value']) if rows else None
+
+    def delete_value(self, key: str) -> None:
+        self._write([("DELETE FROM shared_values WHERE key = ?", (key,))])
+
+    def values(self, prefix: str = "") -> Dict[str, Any]:
+        rows = self._read(
+            """SELECT key, value FROM shared_values
+            WHERE substr(key, 1, ?) = ? AND (expires_at IS NULL OR expires_at > ?)""",
+            (len(prefix), prefix, time.time())
+        )
+        return {row['key']: json.loads(row['value']) for row in rows}
+
+    def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        self._maybe_purge()
+        rows = self._write([(
+            "INSERT INTO shared_messages (channel, message, created_at) VALUES (?, ?, ?) RETURNING id",
+            (channel, json.dumps(message), time.time())
+        )])
+        return rows[0]['id']
+
+    def messages_after(self, message_id: int, limit: int = 500) -> List[Message]:
+        rows = self._read(
+            "SELECT id, channel, message FROM shared_messages WHERE id > ? ORDER BY id LIMIT ?",
+            (message_id, limit)
+        )
+        return [(row['id'], row['channel'], json.loads(row['message'])) for row in rows]
+
+    def last_message_id(self) -> int:
+        rows = self._read("SELECT MAX(id) FROM shared_messages")
+        return rows[0][0] or 0
+
+    def purge_expired(self) -> None:
+        now = time.time()
+        self._last_purge = now
+        self._write([
+            ("DELETE FROM shared_counters WHERE value = 0", ()),
+            ("DELETE FROM shared_values WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)),
+            ("DELETE FROM shared_window_hits WHERE hit_at <= ?", (now - MAX_WINDOW,)),
+            ("DELETE FROM shared_token_buckets WHERE updated_at <= ?", (now - BUCKET_IDLE_SECONDS,)),
+            ("DELETE FROM shared_messages WHERE created_at <= ?", (now - self.message_ttl,)),
+        ])
+
+
+def create_shared_state(backend: str = SHARED_STATE_BACKEND) -> SharedStateBackend:
+    """Create the shared state backend named by SHARED_STATE_BACKEND"""
+    if backend == 'memory':
+        return InMemoryStateBackend()
+    if backend == 'sqlite':
+        return SQLiteStateBackend()
+    raise ValueError(f"Unknown SHARED_STATE_BACKEND '{backend}' (expected 'memory' or 'sqlite')")
+
+
+# Global shared state instance
+shared_state = create_shared_state()
@@ -0,0 +1,177 @@
+"""
+Single-flight CV Extraction
+Extractions of the same file (same SHA-256) that overlap in time are
+coalesced: one caller - the leader - runs the extraction and the others await
+its result, then store it under their own job_id. This covers double-clicks,
+client retries and the same file arriving through the anonymous and claim
+flows before the first extraction has finished (and so before it is cached).
+
+Within a process followers await the leader's future. Across processes a lease
+row in SQLite (extraction_leases) marks the leader; the finished result is kept
+on the row for RESULT_TTL seconds and followers poll for it.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import logging
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Optional
+
+from src.api.db import (
+    acquire_extraction_lease,
+    finish_extraction_lease,
+    get_extraction_lease,
+    release_extraction_lease,
+    renew_extraction_lease
+)
+
+if TYPE_CHECKING:
+    from src.core.cv_extraction.extraction_result import ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+# Seconds a leader's lease lasts without renewal (a crashed leader's lease
+# expires and a waiting process takes over)
+LEASE_SECONDS = 60.0
+# Seconds a finished result stays on the lease for processes still waiting
+RESULT_TTL = 120.0
+# How often followers in other processes check the lease
+POLL_INTERVAL = 0.5
+
+Extraction = Callable[[], Awaitable[Optional["ExtractionResult"]]]
+
+
+class ExtractionSingleFlight:
+    """Coalesces concurrent extractions by file hash"""
+
+    def __init__(self, lease_seconds: float = LEASE_SECONDS, result_ttl: float = RESULT_TTL,
+                 poll_interval: float = POLL_INTERVAL):
+        self.lease_seconds = lease_seconds
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        self._flights: Dict[str, asyncio.Future] = {}
+        self._followers: Dict[str, int] = {}
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self.stats = {"extractions": 0, "coalesced": 0, "coalesced_remote": 0}
+
+    async def run(self, file_hash: Optional[str], extract: Extraction) -> Optional["ExtractionResult"]:
+        """
+        Run extract() unless an extraction of the same file is in flight, in
+        which case wait for that one's result instead.
+
+        Results that aren't shareable (partial, or built on the leader's previous
+        extraction) are not shared: a follower whose leader returned one runs its
+        own extraction.
+
+        Args:
+            file_hash: SHA-256 of the file; None disables coalescing
+            extract: Coroutine function doing the text and data extraction
+
+        Returns:
+            The ExtractionResult (shared by every caller of the flight)
+
+        Raises:
+            Whatever the leader's extraction raised
+        """
+        if not file_hash:
+            return await extract()
+
+        while file_hash in self._flights:
+            flight = self._flights[file_hash]
+            self._followers[file_hash] = self._followers.get(file_hash, 0) + 1
+            try:
+                # Shielded so a follower going away does not cancel the leader
+                result = await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if flight.cancelled():
+                    continue  # The leader was cancelled - take over
+                raise
+            finally:
+                self._followers[file_hash] -= 1
+                if not self._followers[file_hash]:
+                    del self._followers[file_hash]
+            if result is not None and result.is_shareable:
+                self.stats["coalesced"] += 1
+                logger.info(f"🔁 Reusing in-flight extraction for file hash {file_hash[:8]}")
+                return result
+            # Not shareable - lead our own once the flight has cleared
+
+        flight = asyncio.get_running_loop().create_future()
+        # Mark exceptions as retrieved when nobody was following
+        flight.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._flights[file_hash] = flight
+        try:
+            result = await self._lead(file_hash, extract)
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            del self._flights[file_hash]
+
+    def has_followers(self, file_hash: Optional[str]) -> bool:
+        """
+        Whether other callers in this process are waiting on the flight for file_hash.
+
+        A leader whose client goes away should only stop the extraction while
+        this is False, since followers would otherwise get a partial result and
+        each run the extraction again.
+        """
+        return bool(file_hash) and self._followers.get(file_hash, 0) > 0
+
+    async def _lead(self, file_hash: str, extract: Extraction) -> Optional["ExtractionResult"]:
+        """Extract under the cross-process lease, or take another process's result"""
+        while not acquire_extraction_lease(file_hash, self.owner, self.lease_seconds):
+            lease = get_extraction_lease(file_hash)
+            if lease and lease['status'] == 'done':
+                self.stats["coalesced_remote"] += 1
+                logger.info(f"🔁 Reusing extraction finished by {lease['owner']} for file hash {file_hash[:8]}")
+                return _result_from_lease(lease)
+            await asyncio.sleep(self.poll_interval)
+
+        renewal = asyncio.create_task(self._renew(file_hash))
+        try:
+            self.stats["extractions"] += 1
+            result = await extract()
+        except BaseException:
+            release_extraction_lease(file_hash, self.owner)
+            raise
+        finally:
+            renewal.cancel()
+
+        if result is not None and result.is_shareable:
+            finish_extraction_lease(
+                file_hash, self.owner, result.cv_data_json, result.confidence, self.result_ttl,
+                dict(result.section_models)
+            )
+        else:
+            release_extraction_lease(file_hash, self.owner)
+        return result
+
+    async def _renew(self, file_hash: str):
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            if not renew_extraction_lease(file_hash, self.owner, self.lease_seconds):
+                logger.warning(f"Lost extraction lease for file hash {file_hash[:8]}")
+                return
+
+
+def _result_from_lease(lease: dict) -> "ExtractionResult":
+    """Rebuild the ExtractionResult another process published on its lease"""
+    from src.core.cv_extraction.extraction_result import ExtractionResult
+    from src.core.schemas.unified_nullable import CVData
+
+    return ExtractionResult.build(
+        CVData(**json.loads(lease['cv_data'])), lease['confidence_score'],
+        section_models=json.loads(lease['section_models'] or '{}')
+    )
+
+
+# Global single-flight instance
+extraction_single_flight = ExtractionSingleFlight()
@@ -7,16 +7,22 @@ import json
 import asyncio
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional, AsyncGenerator, List, Literal
+from typing import Dict, Any, Optional, AsyncGenerator, List, Literal, Set, Callable
 from dataclasses import dataclass, asdict
-from queue import Queue
+from queue import Queue, Empty
 import logging
 from contextlib import asynccontextmanager
 
+from src.services.shared_state import SharedStateBackend, shared_state
+
 logger = logging.getLogger(__name__)
 
+# Shared state channel for a job's messages (followed by the job_id)
+JOB_CHANNEL_PREFIX = "sse:job:"
+
 # Message Types
-MessageType = Literal["progress", "step", "complete", "error", "warning", "heartbeat", "sentinel"]
+MessageType = Literal["progress", "step", "complete", "error", "warning", "heartbeat", "sentinel", "partial", "section",
+                      "section_reset"]
 SentinelType = Literal["CLOSED", "TIMEOUT", "ERROR", "COMPLETE"]
 
 @dataclass
@@ -39,11 +45,21 @@ class SSEMessage:
 
 
 class ConnectionManager:
-    """Manages active SSE connections"""
+    """
+    Manages active SSE connections
     
-    def __init__(self):
+    With a shared state backend, job messages are published there and relayed
+    by every worker to its own subscribed connections, so an extraction running
+    in one worker reaches a client connected to another.
+    """
+    
+    def __init__(self, state: Optional[SharedStateBackend] = None):
         self.connections: Dict[str, Queue] = {}
+        self.job_subscribers: Dict[str, Set[str]] = {}  # job_id -> connection_ids
         self.heartbeat_interval = 30  # seconds
+        self.state = state or shared_state
+        self.relay_task: Optional[asyncio.Task] = None
+        self.relay_interval = 0.1  # seconds
         
     def add_connection(self, connection_id: str) -> Queue:
         """Add new SSE connection"""
@@ -57,6 +73,68 @@ class ConnectionManager:
         if connection_id in self.connections:
             del self.connections[connection_id]
             logger.info(f"SSE connection removed: {connection_id}")
+        
+        for job_id in list(self.job_subscribers):
+            subscribers = self.job_subscribers[job_id]
+            subscribers.discard(connection_id)
+            if not subscribers:
+                del self.job_subscribers[job_id]
+    
+    def subscribe_to_job(self, job_id: str, connection_id: str):
+        """Route messages published for a job to this connection"""
+        self.job_subscribers.setdefault(job_id, set()).add(connection_id)
+        logger.info(f"SSE connection {connection_id} subscribed to job {job_id}")
+    
+    def send_to_job(self, job_id: str, message: SSEMessage):
+        """Send message to every connection subscribed to a job, in any worker"""
+        if self.state.shared:
+            self.state.publish(f"{JOB_CHANNEL_PREFIX}{job_id}", asdict(message))
+        else:
+            self._deliver_to_job(job_id, message)
+    
+    def _deliver_to_job(self, job_id: str, message: SSEMessage):
+        """Send message to this worker's connections subscribed to a job"""
+        for connection_id in list(self.job_subscribers.get(job_id, ())):
+            self.send_to_connection(connection_id, message)
+    
+    async def start_relay(self):
+        """Start relaying job messages published by any worker (shared backends only)"""
+        if not self.state.shared or (self.relay_task and not self.relay_task.done()):
+            return
+        
+        async def relay_loop():
+            last_id = self.state.last_message_id()
+            while True:
+                await asyncio.sleep(self.relay_interval)
+                try:
+                    last_id = self.relay_messages(last_id)
+                except Exception as e:
+                    logger.warning(f"SSE relay failed to read messages: {e}")
+        
+        self.relay_task = asyncio.create_task(relay_loop())
+        logger.info("SSE relay task started")
+    
+    async def stop_relay(self):
+        """Stop relay task"""
+        if self.relay_task and not self.relay_task.done():
+            self.relay_task.cancel()
+            try:
+                await self.relay_task
+            except asyncio.CancelledError:
+                pass
+            logger.info("SSE relay task stopped")
+    
+    def relay_messages(self, last_id: int) -> int:
+        """Deliver job messages published after last_id to local subscribers, returning the new last id"""
+        for message_id, channel, data in self.state.messages_after(last_id):
+            last_id = message_id
+            if channel.startswith(JOB_CHANNEL_PREFIX):
+                self._deliver_to_job(channel[len(JOB_CHANNEL_PREFIX):], SSEMessage(**data))
+        return last_id
+    
+    def get_job_subscriber_count(self, job_id: str) -> int:
+        """Get number of connections subscribed to a job"""
+        return len(self.job_subscribers.get(job_id, ()))
     
     def broadcast_message(self, message: SSEMessage):
         """Broadcast message to all connections"""
@@ -194,6 +272,42 @@ class SSEService:
         
         return self.create_message("error", data)
     
+    def create_partial_message(
+        self,
+        section: str,
+        field: Optional[str],
+        item: Any
+    ) -> SSEMessage:
+        """Create message carrying one item streamed from a section before it is finalized"""
+        return self.create_message("partial", {
+            "section": section,
+            "field": field,
+            "item": item
+        })
+    
+    def create_section_reset_message(self, section: str, reason: str) -> SSEMessage:
+        """Create message retracting the partial items sent so far for a section (it is being re-extracted)"""
+        return self.create_message("section_reset", {
+            "section": section,
+            "reason": reason
+        })
+    
+    def create_section_message(
+        self,
+        section: str,
+        data: Optional[Dict[str, Any]],
+        completed: int,
+        total: int
+    ) -> SSEMessage:
+        """Create message for a validated section (data is None if extraction failed)"""
+        return self.create_message("section", {
+            "section": section,
+            "data": data,
+            "success": data is not None,
+            "completed": completed,
+            "total": total
+        })
+    
     def create_warning_message(self, message: str, details: Optional[Dict] = None) -> SSEMessage:
         """Create warning message"""
         return self.create_message("warning", {
@@ -251,12 +365,15 @@ class SSEService:
         connection_id: str,
         initial_messages: Optional[List[SSEMessage]] = None,
         max_duration: Optional[int] = None,
-        enable_timeout_protection: bool = True
+        enable_timeout_protection: bool = True,
+        job_id: Optional[str] = None
     ) -> AsyncGenerator[str, None]:
         """Generate SSE stream for a connection with enhanced error handling"""
         
         start_time = datetime.now()
         message_queue = self.connection_manager.add_connection(connection_id)
+        if job_id:
+            self.connection_manager.subscribe_to_job(job_id, connection_id)
         connection_active = True
         
         try:
@@ -265,8 +382,9 @@ class SSEService:
                 for msg in initial_messages:
                     yield msg.to_sse_format()
             
-            # Start heartbeat if not already running
+            # Start heartbeat (and relay of other workers' job messages) if not already running
             await self.start_heartbeat()
+            await self.connection_manager.start_relay()
             
             # Stream messages from queue
             while connection_active:
@@ -282,9 +400,9 @@ class SSEService:
                     # Check for new messages with timeout
                     message = None
                     try:
-                        # Use a small timeout to avoid blocking
-                        message = message_queue.get(timeout=1.0)
-                    except:
+                        # Non-blocking get so producers on the event loop keep running
+                        message = message_queue.get_nowait()
+                    except Empty:
                         # No message available, continue loop
                         await asyncio.sleep(0.1)
                         continue
@@ -393,4 +511,41 @@ def send_error(error_message: str, connection_id: Optional[str] = None):
     if connection_id:
         sse_service.connection_manager.send_to_connection(connection_id, msg)
     else:
-        sse_service.connection_manager.broadcast_message(msg)
\ No newline at end of file
+        sse_service.connection_manager.broadcast_message(msg)
+
+def send_to_job(job_id: str, msg: SSEMessage):
+    """Send a message to all SSE connections subscribed to a job"""
+    sse_service.connection_manager.send_to_job(job_id, msg)
+
+def create_extraction_progress_callback(job_id: str) -> Callable[[Dict[str, Any]], None]:
+    """
+    Build a DataExtractor progress callback that streams section events to a job's SSE channel.
+    
+    Completed and failed sections produce a "progress" message (understood by the
+    existing upload page) plus a "section" message with the validated data.
+    Streamed array items produce "partial" messages. They are provisional: a
+    "section_reset" message retracts them when the section is retried or escalated,
+    and the section's "section" message replaces them.
+    """
+    def callback(event: Dict[str, Any]):
+        event_type = event.get("event")
+        section = event.get("section")
+        
+        if event_type == "partial_item":
+            send_to_job(job_id, sse_service.create_partial_message(section, event.get("key"), event.get("item")))
+        elif event_type == "section_reset":
+            send_to_job(job_id, sse_service.create_section_reset_message(section, event.get("reason")))
+        elif event_type in ("section_completed", "section_failed"):
+            completed = event.get("completed", 0)
+            total = event.get("total") or 1
+            status = "Extracted" if event_type == "section_completed" else "Could not extract"
+            # Leave headroom for post-processing after the last section
+            progress = int(completed / total * 90)
+            send_to_job(job_id, sse_service.create_progress_message(
+                f"section_{section}", progress, f"{status} {section} ({completed}/{total})"
+            ))
+            send_to_job(job_id, sse_service.create_section_message(
+                section, event.get("data"), completed, total
+            ))
+    
+    return callback
@@ -0,0 +1,118 @@
+"""
+Streaming upload ingestion
+Reads an UploadFile in chunks straight to its final location, updating the
+SHA-256 as it goes, sniffing the MIME type from the first few KB and stopping
+as soon as the size limit is passed. Memory per upload is one chunk, whatever
+the file size.
+"""
+import hashlib
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import aiofiles
+from fastapi import UploadFile
+
+from src.utils.file_validator import (
+    ALLOWED_EXTENSIONS,
+    MAX_FILE_SIZE,
+    validate_file_content,
+    validate_file_extension,
+)
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 256 * 1024
+# libmagic identifies every allowed type from the file's first bytes
+SNIFF_SIZE = 8 * 1024
+
+
+class UploadRejected(Exception):
+    """An upload failed validation. The detail is safe to return to the client."""
+
+    def __init__(self, detail: str, status_code: int = 400):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+class UploadTooLarge(UploadRejected):
+    """An upload passed its size limit."""
+
+
+@dataclass
+class IngestedUpload:
+    """An upload written to disk, with what was learned while streaming it."""
+    path: Path
+    size: int
+    file_hash: str
+    mime_type: str
+
+
+def _sniff(head: bytes) -> str:
+    """MIME type from the first bytes of a file, rejecting disallowed types."""
+    is_valid, mime_type = validate_file_content(head)
+    if not is_valid:
+        raise UploadRejected("File content does not match allowed types")
+    return mime_type
+
+
+async def ingest_upload(
+    file: UploadFile,
+    destination: Path,
+    max_size: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE
+) -> IngestedUpload:
+    """
+    Stream an upload to its destination, validating it on the way.
+
+    Args:
+        file: The uploaded file
+        destination: Final path of the file (parent directories are created)
+        max_size: Maximum allowed size in bytes (uses MAX_FILE_SIZE if not provided)
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        IngestedUpload with the path, size, SHA-256 hex digest and MIME type
+
+    Raises:
+        UploadRejected: Disallowed extension or content, or an empty file
+        UploadTooLarge: The file is larger than max_size
+        Nothing is left at destination when an exception (including
+        cancellation) is raised.
+    """
+    if not validate_file_extension(file.filename or ""):
+        raise UploadRejected(f"File type not allowed. Supported types: {', '.join(ALLOWED_EXTENSIONS)}")
+
+    max_allowed = MAX_FILE_SIZE if max_size is None else max_size
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+
+    sha256 = hashlib.sha256()
+    head = b""
+    mime_type = None
+    size = 0
+    try:
+        async with aiofiles.open(destination, "wb") as out:
+            while chunk := await file.read(chunk_size):
+                size += len(chunk)
+                if size > max_allowed:
+                    logger.warning(f"Rejected upload over {max_allowed} bytes after reading {size} bytes")
+                    raise UploadTooLarge(f"File too large. Maximum size: {max_allowed / (1024 * 1024):.1f} MB")
+                if mime_type is None:
+                    head += chunk
+                    if len(head) >= SNIFF_SIZE:
+                        mime_type, head = _sniff(head[:SNIFF_SIZE]), b""
+                sha256.update(chunk)
+                await out.write(chunk)
+
+        if not size:
+            raise UploadRejected("File is empty")
+        if mime_type is None:
+            mime_type = _sniff(head)
+    except BaseException:
+        destination.unlink(missing_ok=True)
+        raise
+
+    return IngestedUpload(path=destination, size=size, file_hash=sha256.hexdigest(), mime_type=mime_type)
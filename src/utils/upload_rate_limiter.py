@@ -3,12 +3,12 @@ Simple rate limiter for anonymous file uploads
 Uses IP-based tracking with sliding window
 """
 
-import time
-from typing import Dict, Tuple
-from dataclasses import dataclass, field
-from datetime import datetime
+from typing import Dict, Optional, Tuple
+from dataclasses import dataclass
 import logging
 
+from src.services.shared_state import SharedStateBackend, shared_state
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,110 +21,63 @@ class UploadRateLimitConfig:
     cleanup_interval: int = 3600     # Cleanup old records every hour
 
 
-@dataclass 
-class IPUploadState:
-    """Track upload state for an IP address"""
-    ip_address: str
-    uploads_hour: list = field(default_factory=list)  # Timestamps within hour
-    uploads_day: list = field(default_factory=list)   # Timestamps within day
-    last_activity: float = field(default_factory=time.time)
-    
-    def cleanup_old(self):
-        """Remove old timestamps outside windows"""
-        now = time.time()
-        hour_cutoff = now - 3600  # 1 hour ago
-        day_cutoff = now - 86400  # 24 hours ago
-        
-        self.uploads_hour = [t for t in self.uploads_hour if t > hour_cutoff]
-        self.uploads_day = [t for t in self.uploads_day if t > day_cutoff]
-    
-    def can_upload(self, config: UploadRateLimitConfig) -> Tuple[bool, str]:
-        """Check if IP can upload"""
-        self.cleanup_old()
-        
-        # Check hourly limit
-        if len(self.uploads_hour) >= config.max_uploads_per_hour:
-            return False, f"Upload limit exceeded: {config.max_uploads_per_hour} files per hour"
-        
-        # Check daily limit  
-        if len(self.uploads_day) >= config.max_uploads_per_day:
-            return False, f"Upload limit exceeded: {config.max_uploads_per_day} files per day"
-            
-        return True, "Upload allowed"
-    
-    def record_upload(self):
-        """Record a successful upload"""
-        now = time.time()
-        self.uploads_hour.append(now)
-        self.uploads_day.append(now)
-        self.last_activity = now
+HOUR = 3600
+DAY = 86400
 
 
 class UploadRateLimiter:
-    """Rate limiter for anonymous uploads"""
+    """
+    Rate limiter for anonymous uploads
+    
+    Upload timestamps live in the shared state backend, so the limits hold
+    across all worker processes rather than per worker.
+    """
     
-    def __init__(self, config: UploadRateLimitConfig = None):
+    def __init__(self, config: UploadRateLimitConfig = None, state: Optional[SharedStateBackend] = None):
         self.config = config or UploadRateLimitConfig()
-        self.ip_states: Dict[str, IPUploadState] = {}
-        self.last_cleanup = time.time()
+        self.state = state or shared_state
     
-    def _cleanup_if_needed(self):
-        """Cleanup old IP states periodically"""
-        now = time.time()
-        if now - self.last_cleanup > self.config.cleanup_interval:
-            cutoff = now - 86400  # Remove IPs inactive for 24 hours
-            old_ips = [
-                ip for ip, state in self.ip_states.items()
-                if state.last_activity < cutoff
-            ]
-            for ip in old_ips:
-                del self.ip_states[ip]
-            
-            if old_ips:
-                logger.info(f"Cleaned up {len(old_ips)} old IP states")
-            
-            self.last_cleanup = now
+    def _keys(self, ip_address: str) -> Tuple[str, str]:
+        return f"uploads:hour:{ip_address}", f"uploads:day:{ip_address}"
+    
+    def _counts(self, ip_address: str) -> Tuple[int, int]:
+        hour_key, day_key = self._keys(ip_address)
+        return self.state.count(hour_key, HOUR), self.state.count(day_key, DAY)
     
     def check_upload_allowed(self, ip_address: str) -> Tuple[bool, str]:
         """Check if IP can upload a file"""
-        self._cleanup_if_needed()
+        uploads_hour, uploads_day = self._counts(ip_address)
         
-        # Get or create IP state
-        if ip_address not in self.ip_states:
-            self.ip_states[ip_address] = IPUploadState(ip_address)
+        # Check hourly limit
+        if uploads_hour >= self.config.max_uploads_per_hour:
+            return False, f"Upload limit exceeded: {self.config.max_uploads_per_hour} files per hour"
         
-        state = self.ip_states[ip_address]
-        return state.can_upload(self.config)
+        # Check daily limit  
+        if uploads_day >= self.config.max_uploads_per_day:
+            return False, f"Upload limit exceeded: {self.config.max_uploads_per_day} files per day"
+            
+        return True, "Upload allowed"
     
     def record_upload(self, ip_address: str):
         """Record successful upload for IP"""
-        if ip_address in self.ip_states:
-            self.ip_states[ip_address].record_upload()
-            logger.info(f"Upload recorded for IP {ip_address}")
+        hour_key, day_key = self._keys(ip_address)
+        self.state.hit(hour_key, HOUR)
+        self.state.hit(day_key, DAY)
+        logger.info(f"Upload recorded for IP {ip_address}")
     
     def get_ip_status(self, ip_address: str) -> Dict:
         """Get current rate limit status for IP"""
-        if ip_address not in self.ip_states:
-            return {
-                "ip": ip_address,
-                "uploads_this_hour": 0,
-                "uploads_today": 0,
-                "max_per_hour": self.config.max_uploads_per_hour,
-                "max_per_day": self.config.max_uploads_per_day
-            }
-        
-        state = self.ip_states[ip_address]
-        state.cleanup_old()
+        uploads_hour, uploads_day = self._counts(ip_address)
         
         return {
             "ip": ip_address,
-            "uploads_this_hour": len(state.uploads_hour),
-            "uploads_today": len(state.uploads_day),
+            "uploads_this_hour": uploads_hour,
+            "uploads_today": uploads_day,
             "max_per_hour": self.config.max_uploads_per_hour,
             "max_per_day": self.config.max_uploads_per_day,
-            "can_upload": state.can_upload(self.config)[0]
+            "can_upload": self.check_upload_allowed(ip_address)[0]
         }
 
 
 # Global instance
-upload_rate_limiter = UploadRateLimiter()
\ No newline at end of file
+upload_rate_limiter = UploadRateLimiter()
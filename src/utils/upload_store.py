@@ -0,0 +1,143 @@
+"""
+Content-addressed upload storage
+Each distinct upload is stored once, under data/uploads/.blobs/<ab>/<sha256>.
+Job paths (data/uploads/<job_id><ext>, per-user and multi-file directories)
+are hardlinks to their blob, so lookups by job_id keep working while identical
+uploads share one copy on disk. A blob is deleted once no cv_uploads row
+references its hash and no job path links to it.
+"""
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).parent.parent.parent
+UPLOAD_ROOT = BASE_DIR / "data" / "uploads"
+# Hidden, so recursive globs for job files never see blobs
+BLOB_DIR_NAME = ".blobs"
+
+
+class UploadStore:
+    """Deduplicated storage for uploaded files, keyed by SHA-256."""
+
+    def __init__(self, root: Path = UPLOAD_ROOT):
+        self.root = Path(root)
+        self.blob_dir = self.root / BLOB_DIR_NAME
+
+    def blob_path(self, file_hash: str) -> Path:
+        return self.blob_dir / file_hash[:2] / file_hash
+
+    def adopt(self, job_path: Path, file_hash: str) -> bool:
+        """
+        Put a freshly written job file into the store.
+
+        The first upload of some content becomes its blob (a second link to
+        the same inode, no copy). For later uploads the job file is swapped
+        for a link to the existing blob, freeing the duplicate's space.
+
+        Args:
+            job_path: The saved upload
+            file_hash: SHA-256 hex digest of its content
+
+        Returns:
+            True if the job path now shares the blob's storage; False if
+            linking is not possible here (the file is kept as it is)
+        """
+        job_path = Path(job_path)
+        blob = self.blob_path(file_hash)
+        try:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(job_path, blob)
+                return True
+            except FileExistsError:
+                pass
+
+            if os.path.samefile(blob, job_path):
+                return True
+
+            # Duplicate content: atomically replace the job file with a link
+            link_path = job_path.with_name(f"{job_path.name}.link")
+            os.link(blob, link_path)
+            os.replace(link_path, job_path)
+            logger.info(f"Deduplicated upload {job_path.name} against blob {file_hash[:8]}")
+            return True
+        except OSError as e:
+            logger.warning(f"Could not link {job_path} into the upload store: {e}")
+            return False
+
+    def release(self, file_hash: Optional[str]) -> bool:
+        """
+        Delete a blob that no job path links to any more.
+
+        Callers check that no cv_uploads row references the hash first.
+
+        Returns:
+            True if the blob was deleted
+        """
+        if not file_hash:
+            return False
+        blob = self.blob_path(file_hash)
+        try:
+            if blob.stat().st_nlink > 1:
+                return False
+            blob.unlink()
+            logger.info(f"Deleted unreferenced upload blob {file_hash[:8]}")
+            return True
+        except FileNotFoundError:
+            return False
+
+    def remove_job_files(self, job_id: str, file_ext: str = '') -> List[Path]:
+        """
+        Delete the files saved for a job: the single-file path, the
+        per-user path of anonymous uploads and the multi-file directory.
+
+        Returns:
+            The paths that were deleted
+        """
+        candidates = [self.root / f"{job_id}{file_ext}", self.root / job_id]
+        candidates += sorted(self.root.glob(f"*/{job_id}{file_ext}"))
+
+        removed = []
+        for path in candidates:
+            try:
+                if path.is_dir():
+                    # Multi-file upload - delete entire directory
+                    shutil.rmtree(path)
+                elif path.exists():
+                    path.unlink()
+                else:
+                    continue
+                removed.append(path)
+            except OSError as e:
+                logger.warning(f"Failed to delete {path}: {e}")
+        return removed
+
+    def collect_garbage(self, is_referenced: Callable[[str], bool]) -> int:
+        """
+        Delete blobs with no job path linking to them and no reference.
+
+        Args:
+            is_referenced: Whether a cv_uploads row still references a hash
+
+        Returns:
+            Number of blobs deleted
+        """
+        deleted = 0
+        if not self.blob_dir.exists():
+            return deleted
+        for blob in self.blob_dir.glob("*/*"):
+            try:
+                if blob.stat().st_nlink == 1 and not is_referenced(blob.name):
+                    blob.unlink()
+                    deleted += 1
+            except FileNotFoundError:
+                continue
+        return deleted
+
+
+# Singleton instance
+upload_store = UploadStore()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for BatchExtractor
+Tests batch submission, escalation rounds and checkpoint resume with a local batch stub
+"""
+
+import unittest
+import asyncio
+import json
+import tempfile
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.cv_extraction.batch_extractor import BatchClient, BatchExtractor, BatchCheckpoint, LocalBatchStub
+from src.core.cv_extraction.extraction_config import extraction_config
+
+
+RAW_TEXT = "Jane Doe\nSoftware Engineer\nHobbies: Chess, Hiking"
+
+
+def hobbies_only_responder(custom_id, params):
+    """Answer the hobbies prompt and return unparseable output for every other section."""
+    _, section_name = BatchExtractor.parse_custom_id(custom_id)
+    if section_name == "hobbies":
+        return json.dumps({"hobbies": ["Chess", "Hiking"]})
+    return "I could not produce JSON for this section."
+
+
+class TestBatchExtractor(unittest.TestCase):
+    """Test BatchExtractor against LocalBatchStub."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint_path = str(Path(self.tmp_dir.name) / "checkpoint.json")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _extractor(self, stub):
+        return BatchExtractor(stub, self.checkpoint_path, poll_interval=0, store_results=False)
+
+    def test_custom_id_round_trip(self):
+        """Test that custom ids split back into job id and section."""
+        custom_id = BatchExtractor.make_custom_id("1b4e28ba-2fa1-11d2-883f-0016", "hobbies")
+        self.assertRegex(custom_id, r'^[a-zA-Z0-9_-]{1,64}$')
+        self.assertEqual(BatchExtractor.parse_custom_id(custom_id), ("1b4e28ba-2fa1-11d2-883f-0016", "hobbies"))
+
+    def test_jobs_complete_with_escalation_round(self):
+        """Test that failed cheap-tier sections are resubmitted on the escalation tier."""
+        stub = LocalBatchStub(hobbies_only_responder)
+        extractor = self._extractor(stub)
+        extractor.add_jobs([("job-1", RAW_TEXT, None), ("job-2", RAW_TEXT, None)])
+
+        summary = asyncio.run(extractor.run())
+
+        self.assertEqual(sorted(summary["completed"]), ["job-1", "job-2"])
+        self.assertEqual(summary["batches"], 2)
+
+        first, second = stub.batches.values()
+        self.assertEqual(len(first), 2 * len(extractor.checkpoint.jobs["job-1"]["sections"]))
+
+        # Only non-premium sections (except the valid hobbies) are escalated
+        escalation_model = extraction_config.get_tier_model(extraction_config.ESCALATION_TIER)
+        escalated = {BatchExtractor.parse_custom_id(r["custom_id"])[1] for r in second}
+        self.assertNotIn("hobbies", escalated)
+        self.assertNotIn("experience", escalated)
+        self.assertIn("languages", escalated)
+        self.assertTrue(all(r["params"]["model"] == escalation_model for r in second))
+
+    def test_results_record_producing_models(self):
+        """Test that stored results name the model each section came from, not the escalation model."""
+        stored = []
+        extractor = BatchExtractor(LocalBatchStub(hobbies_only_responder), self.checkpoint_path, poll_interval=0)
+        extractor._store_result = lambda job_id, file_hash, result: stored.append(result)
+        extractor.add_jobs([("job-1", RAW_TEXT, "hash-1")])
+
+        asyncio.run(extractor.run())
+
+        hobbies_model = extraction_config.get_tier_model(extraction_config.get_model_tier("hobbies"))
+        self.assertEqual(dict(stored[0].section_models), {"hobbies": hobbies_model})
+        self.assertEqual(stored[0].extraction_model, hobbies_model)
+
+    def test_batch_client_is_abstract(self):
+        """Test that BatchClient cannot be used without implementing its interface."""
+        with self.assertRaises(TypeError):
+            BatchClient()
+
+    def test_errored_requests_are_retried(self):
+        """Test that errored requests are resubmitted up to max_request_retries."""
+        seen = {}
+
+        def flaky_responder(custom_id, params):
+            seen[custom_id] = seen.get(custom_id, 0) + 1
+            if custom_id.endswith("hobbies") and seen[custom_id] == 1:
+                return None
+            return hobbies_only_responder(custom_id, params)
+
+        extractor = self._extractor(LocalBatchStub(flaky_responder))
+        extractor.add_jobs([("job-1", RAW_TEXT, None)])
+        summary = asyncio.run(extractor.run())
+
+        self.assertEqual(summary["completed"], ["job-1"])
+        self.assertEqual(seen[BatchExtractor.make_custom_id("job-1", "hobbies")], 2)
+
+    def test_escalated_requests_are_retried(self):
+        """Test that an escalated request gets its own retries for errored requests."""
+        escalation_model = extraction_config.get_tier_model(extraction_config.ESCALATION_TIER)
+        seen = {}
+
+        def flaky_escalation_responder(custom_id, params):
+            if custom_id.endswith("languages") and params["model"] == escalation_model:
+                seen[custom_id] = seen.get(custom_id, 0) + 1
+                if seen[custom_id] == 1:
+                    return None
+                return json.dumps({"languageItems": [{"language": "English"}]})
+            return hobbies_only_responder(custom_id, params)
+
+        stored = []
+        extractor = BatchExtractor(LocalBatchStub(flaky_escalation_responder), self.checkpoint_path, poll_interval=0)
+        extractor._store_result = lambda job_id, file_hash, result: stored.append(result)
+        extractor.add_jobs([("job-1", RAW_TEXT, None)])
+        summary = asyncio.run(extractor.run())
+
+        self.assertEqual(summary["completed"], ["job-1"])
+        self.assertEqual(seen[BatchExtractor.make_custom_id("job-1", "languages")], 2)
+        self.assertEqual(stored[0].section_models["languages"], escalation_model)
+
+    def test_resume_does_not_resubmit(self):
+        """Test that a restarted run polls existing batches instead of resubmitting."""
+        stub = LocalBatchStub(hobbies_only_responder, polls_until_ended=1)
+        extractor = self._extractor(stub)
+        extractor.add_jobs([("job-1", RAW_TEXT, None)])
+        asyncio.run(extractor._submit(extractor._pending_requests()))
+        self.assertEqual(len(stub.batches), 1)
+
+        # Simulate a crash and restart from the checkpoint
+        resumed = self._extractor(stub)
+        self.assertEqual(resumed.add_jobs([("job-1", RAW_TEXT, None)]), 0)
+        summary = asyncio.run(resumed.run())
+
+        self.assertEqual(summary["completed"], ["job-1"])
+        hobbies_id = BatchExtractor.make_custom_id("job-1", "hobbies")
+        submitted_in = [batch_id for batch_id, batch in stub.batches.items()
+                        if any(r["custom_id"] == hobbies_id for r in batch)]
+        self.assertEqual(submitted_in, ["stub_batch_1"])
+
+        # Finished jobs drop their raw text from the checkpoint
+        saved = BatchCheckpoint(self.checkpoint_path)
+        self.assertEqual(saved.jobs["job-1"]["status"], "completed")
+        self.assertNotIn("raw_text", saved.jobs["job-1"])
+
+    def test_empty_text_skipped(self):
+        """Test that jobs without text are not queued."""
+        extractor = self._extractor(LocalBatchStub(hobbies_only_responder))
+        self.assertEqual(extractor.add_jobs([("job-1", "   ", None)]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for BulkExtractor
+Tests item listing, JSONL records, resume from the output file and duplicate files
+with a fake text extractor and data extractor
+"""
+
+import unittest
+import asyncio
+import json
+import tempfile
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import src.api.db as db
+from src.core.cv_extraction.bulk_extractor import BulkExtractor, iter_bulk_items
+from src.core.cv_extraction.extraction_result import ExtractionResult
+from src.core.schemas.unified_nullable import CVData
+from src.services.admission_control import AdmissionConfig, AdmissionController
+
+
+CV_TEXT = "Jane Doe\nSoftware Engineer\nHobbies: Chess, Hiking"
+
+
+class FakeDataExtractor:
+    """Returns an empty CV and counts the texts it was asked to extract."""
+
+    def __init__(self, calls, missing_sections=()):
+        self.calls = calls
+        self.missing_sections = list(missing_sections)
+
+    async def extract_cv_result(self, text):
+        self.calls.append(text)
+        await asyncio.sleep(0.01)
+        cv_data = CVData()
+        cv_data.flag_missing_sections(self.missing_sections)
+        return ExtractionResult.build(cv_data, confidence=0.9)
+
+
+class TestBulkExtractor(unittest.TestCase):
+    """Test BulkExtractor with fake extraction stages."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.original_db_path = db.DB_PATH
+        db.DB_PATH = str(self.root / "test.db")
+        db.init_db()
+
+        self.cv_dir = self.root / "cvs"
+        self.cv_dir.mkdir()
+        for name in ("a.pdf", "b.docx", "notes.xyz"):
+            (self.cv_dir / name).write_text(f"{CV_TEXT}\n{name}")
+        self.output_path = str(self.root / "out.jsonl")
+        self.llm_calls = []
+
+    def tearDown(self):
+        db.DB_PATH = self.original_db_path
+        self.tmp_dir.cleanup()
+
+    def _text_extract(self, path):
+        return Path(path).read_text()
+
+    def _run(self, items, missing_sections=(), **kwargs):
+        extractor = BulkExtractor(
+            self.output_path,
+            extractor_factory=lambda: FakeDataExtractor(self.llm_calls, missing_sections),
+            text_extract=self._text_extract,
+            **kwargs
+        )
+        return asyncio.run(extractor.run(items))
+
+    def _records(self):
+        records = []
+        with open(self.output_path) as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # Truncated by a simulated crash
+        return records
+
+    def test_items_from_directory_and_manifest(self):
+        """Test that directories list supported files and manifests accept paths and JSON."""
+        self.assertEqual([item.item_id for item in iter_bulk_items(str(self.cv_dir))], ["a.pdf", "b.docx"])
+
+        manifest = self.root / "manifest.txt"
+        manifest.write_text('# partner batch\ncvs/a.pdf\n\n{"path": "cvs/b.docx", "id": "cand-2"}\n')
+        items = list(iter_bulk_items(str(manifest)))
+        self.assertEqual([item.item_id for item in items], ["cvs/a.pdf", "cand-2"])
+        self.assertEqual(items[1].path, str(self.cv_dir / "b.docx"))
+
+        manifest.write_text('{"id": "cand-3"}\n')
+        with self.assertRaises(ValueError):
+            list(iter_bulk_items(str(manifest)))
+
+    def test_records_written_with_timings(self):
+        """Test that every file gets a JSONL record with its data and stage timings."""
+        missing = self.cv_dir / "missing.pdf"
+        items = list(iter_bulk_items(str(self.cv_dir)))
+        items.append(type(items[0])("missing.pdf", str(missing)))
+
+        summary = self._run(items, concurrency=2)
+
+        self.assertEqual((summary["completed"], summary["failed"]), (2, 1))
+        records = {record["id"]: record for record in self._records()}
+        self.assertEqual(records["a.pdf"]["status"], "completed")
+        self.assertEqual(records["a.pdf"]["source"], "extraction")
+        self.assertEqual(set(records["a.pdf"]["timings"]), {"hash", "text", "llm", "total"})
+        self.assertEqual(records["missing.pdf"]["status"], "failed")
+        self.assertIn("error", records["missing.pdf"])
+
+    def test_partial_results_counted_separately(self):
+        """Test that partial extractions are counted as partial, not as failed."""
+        items = list(iter_bulk_items(str(self.cv_dir)))
+
+        summary = self._run(items, missing_sections=["skills"])
+
+        self.assertEqual((summary["partial"], summary["completed"], summary["failed"]), (2, 0, 0))
+        self.assertEqual({record["status"] for record in self._records()}, {"partial"})
+
+    def test_extractions_go_through_admission(self):
+        """Test that LLM extractions take slots of the admission controller."""
+        admission = AdmissionController("test", AdmissionConfig(max_concurrent=1))
+        items = list(iter_bulk_items(str(self.cv_dir)))
+
+        summary = self._run(items, concurrency=2, admission=admission)
+
+        self.assertEqual(summary["completed"], 2)
+        self.assertEqual(admission.stats.admitted, 2)
+        self.assertEqual(admission.get_status()["active"], 0)
+
+    def test_resume_skips_recorded_files(self):
+        """Test that a re-run skips recorded files and retry_failed redoes failed ones."""
+        items = list(iter_bulk_items(str(self.cv_dir)))
+        self._run(items[:1])
+        with open(self.output_path, "a") as f:
+            f.write(json.dumps({"id": "b.docx", "status": "failed"}) + "\n")
+
+        summary = self._run(items)
+        self.assertEqual((summary["skipped"], summary["completed"]), (2, 0))
+
+        summary = self._run(items, retry_failed=True)
+        self.assertEqual((summary["skipped"], summary["completed"]), (1, 1))
+        self.assertEqual(len(self.llm_calls), 2)
+
+    def test_truncated_record_is_redone(self):
+        """Test that a record cut off by a crash is ignored and the file re-extracted."""
+        items = list(iter_bulk_items(str(self.cv_dir)))
+        self._run(items[:1])
+        with open(self.output_path, "a") as f:
+            f.write('{"id": "b.docx", "stat')
+
+        summary = self._run(items)
+
+        self.assertEqual((summary["skipped"], summary["completed"]), (1, 1))
+        self.assertEqual([record["id"] for record in self._records()], ["a.pdf", "b.docx"])
+
+    def test_duplicates_and_reruns_use_caches(self):
+        """Test that identical files are extracted once and a fresh run reads the caches."""
+        (self.cv_dir / "copy.pdf").write_text((self.cv_dir / "a.pdf").read_text())
+        items = list(iter_bulk_items(str(self.cv_dir)))
+
+        self._run(items, concurrency=4)
+        self.assertEqual(len(self.llm_calls), 2)
+
+        self.output_path = str(self.root / "second.jsonl")
+        summary = self._run(items)
+        self.assertEqual((summary["completed"], summary["cached"]), (3, 3))
+        self.assertEqual(len(self.llm_calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
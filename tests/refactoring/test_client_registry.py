@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for AnthropicClientRegistry
+Tests client sharing per API key, event loop binding and reuse statistics
+"""
+
+import unittest
+import asyncio
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import httpx
+
+from src.core.cv_extraction.client_registry import (
+    AnthropicClientRegistry, ClientPoolConfig, ClientPoolStats
+)
+
+
+class TestAnthropicClientRegistry(unittest.TestCase):
+    """Test AnthropicClientRegistry functionality."""
+
+    def setUp(self):
+        self.registry = AnthropicClientRegistry(ClientPoolConfig(max_connections=7, http2=False))
+
+    def test_same_key_shares_client(self):
+        """Test that handles for one key share a single client."""
+        first = self.registry.get_client("sk-test-a")
+        second = self.registry.get_client("sk-test-a")
+        other = self.registry.get_client("sk-test-b")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+        clients = self.registry.get_stats()["clients"]
+        self.assertEqual(len(clients), 2)
+        self.assertEqual(sorted(c["handles_issued"] for c in clients.values()), [1, 2])
+
+    def test_pool_limits_applied(self):
+        """Test that the configured connection limits reach the httpx pool."""
+        client = self.registry.get_client("sk-test-a")
+        pool = client._client._transport._pool
+        self.assertEqual(pool._max_connections, 7)
+
+    def test_api_key_not_exposed(self):
+        """Test that stats are keyed by a hash, not the key itself."""
+        self.registry.get_client("sk-secret-key")
+        self.assertNotIn("sk-secret-key", str(self.registry.get_stats()))
+
+    def test_new_event_loop_gets_new_client(self):
+        """Test that a client is not reused across event loops."""
+        async def get():
+            return self.registry.get_client("sk-test-a")
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+
+        self.assertIsNot(first, second)
+        stats = list(self.registry.get_stats()["clients"].values())[0]
+        self.assertEqual(stats["clients_created"], 2)
+
+    def test_replaced_client_closed(self):
+        """Test that the client of a previous event loop is closed when replaced."""
+        async def get():
+            return self.registry.get_client("sk-test-a")
+
+        first = asyncio.run(get())
+
+        async def replace():
+            second = self.registry.get_client("sk-test-a")
+            await asyncio.gather(*self.registry._closing)
+            return second
+
+        second = asyncio.run(replace())
+        self.assertTrue(first.is_closed())
+        self.assertFalse(second.is_closed())
+
+    def test_aclose_closes_clients(self):
+        """Test that aclose closes every shared client and forgets it."""
+        client = self.registry.get_client("sk-test-a")
+        asyncio.run(self.registry.aclose())
+
+        self.assertTrue(client.is_closed())
+        self.assertEqual(self.registry.get_stats()["clients"], {})
+
+    def test_requests_counted_by_event_hook(self):
+        """Test that requests made through the shared client are counted."""
+        client = self.registry.get_client("sk-test-a")
+        http_client = client._client
+        http_client._transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+
+        async def call():
+            await http_client.get("https://api.anthropic.com/v1/ping")
+            await http_client.get("https://api.anthropic.com/v1/ping")
+
+        asyncio.run(call())
+        stats = list(self.registry.get_stats()["clients"].values())[0]
+        self.assertEqual(stats["requests"], 2)
+
+    def test_reuse_rate(self):
+        """Test reuse calculation from request and connection counters."""
+        stats = ClientPoolStats(requests=10, new_connections=2, tls_handshakes=2)
+        data = stats.to_dict()
+        self.assertEqual(data["reused_requests"], 8)
+        self.assertEqual(data["connection_reuse_rate"], 0.8)
+        self.assertEqual(ClientPoolStats().to_dict()["connection_reuse_rate"], 0.0)
+
+    def test_empty_key_rejected(self):
+        """Test that an empty API key raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.registry.get_client("")
+
+
+if __name__ == "__main__":
+    unittest.main()
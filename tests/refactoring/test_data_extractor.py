@@ -12,6 +12,10 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.core.cv_extraction.data_extractor import DataExtractor
+from src.core.cv_extraction.extraction_config import extraction_config
+from src.core.cv_extraction.metrics import ExtractionMetrics
+from src.core.cv_extraction.deadline import ExtractionDeadline
+from src.core.cv_extraction.hallucination_validator import SourceTextIndex
 
 
 class TestDataExtractor(unittest.TestCase):
@@ -146,7 +150,7 @@ class TestDataExtractor(unittest.TestCase):
         result = extractor._apply_enhancements(data, raw_text)
         
         # Should call enhancement processor
-        mock_enhancement.enhance_all.assert_called_once_with(data, raw_text)
+        mock_enhancement.enhance_all.assert_called_once_with(data, raw_text, None)
         
         # Should return enhanced data
         self.assertTrue(result['hero']['enhanced'])
@@ -193,24 +197,23 @@ class TestDataExtractor(unittest.TestCase):
         self.assertEqual(result, mock_cv)
     
     @patch('src.core.cv_extraction.data_extractor.post_processor')
+    @patch('src.core.cv_extraction.data_extractor.assemble_cv_data')
     @patch('src.core.cv_extraction.data_extractor.CVData')
-    def test_validation_error_handling(self, mock_cv_class, mock_post):
+    def test_validation_error_handling(self, mock_cv_class, mock_assemble, mock_post):
         """Test handling of validation errors."""
         from pydantic import ValidationError
         
-        # Make CVData raise validation error
-        mock_cv_class.side_effect = ValidationError.from_exception_data(
+        # Make CVData assembly raise validation error
+        mock_assemble.side_effect = ValidationError.from_exception_data(
             "test", [{'type': 'missing', 'loc': ('field',), 'msg': 'Field required'}]
         )
         
-        # Second call should work (partial data)
-        mock_cv_partial = Mock()
-        mock_cv_class.side_effect = [
-            ValidationError.from_exception_data(
-                "test", [{'type': 'missing', 'loc': ('field',), 'msg': 'Field required'}]
-            ),
-            mock_cv_partial
-        ]
+        # Fallback should work (partial data)
+        mock_cv_partial = Mock(missing_sections=[])
+        mock_cv_partial.model_dump_nullable.return_value = {'hero': {'fullName': 'Test'}}
+        mock_post.calculate_extraction_confidence.return_value = 0.5
+        mock_cv_class.model_fields = {'hero': None}
+        mock_cv_class.return_value = mock_cv_partial
         
         extractor = DataExtractor.__new__(DataExtractor)
         
@@ -219,7 +222,10 @@ class TestDataExtractor(unittest.TestCase):
         result = extractor._create_and_process_cv_data(data, "text")
         
         # Should create partial CV with valid fields only
-        self.assertEqual(mock_cv_class.call_count, 2)
+        mock_assemble.assert_called_once()
+        self.assertIs(mock_assemble.call_args.args[0], data)
+        mock_cv_class.assert_called_once_with(hero={'fullName': 'Test'})
+        self.assertIs(result.cv_data, mock_cv_partial)
         
     async def test_full_pipeline_integration(self):
         """Test complete extraction pipeline."""
@@ -349,6 +355,112 @@ class TestDataExtractorEdgeCases(unittest.TestCase):
             self.assertEqual(confidence, 0.82)
 
 
+class TestTieredRouting(unittest.TestCase):
+    """Test model tier routing and escalation."""
+    
+    def setUp(self):
+        # Bypass __init__ so no API client is created
+        self.extractor = DataExtractor.__new__(DataExtractor)
+        self.extractor.llm_service = Mock()
+        self.extractor.section_extractor = Mock()
+        self.metrics = ExtractionMetrics()
+        self.raw_text = "Hobbies: Chess, Hiking"
+    
+    def _run(self, section_name, results, response='{"hobbies": ["Chess"]}'):
+        """Run a tiered extraction where each attempt returns the next result."""
+        models = []
+        
+        async def mock_extract(section_name, raw_text, llm_caller):
+            await llm_caller("prompt", section_name)
+            return results[len(models) - 1]
+        
+        async def mock_call_llm(prompt, name, model=None, deadline=None):
+            models.append(model)
+            return model, response
+        
+        self.extractor.llm_service.call_llm = mock_call_llm
+        self.extractor.section_extractor.extract = mock_extract
+        result = asyncio.run(self.extractor._extract_section_tiered(
+            section_name, self.raw_text, self.metrics
+        ))
+        return result, models
+    
+    def test_cheap_tier_success_is_not_escalated(self):
+        """Test that a valid cheap result is kept."""
+        good = {'hobbies': {'sectionTitle': 'Hobbies', 'hobbies': ['Chess', 'Hiking']}}
+        result, models = self._run('hobbies', [good])
+        
+        self.assertEqual(result, good)
+        self.assertEqual(models, [extraction_config.get_tier_model('fast')])
+        self.assertEqual(self.metrics.llm_calls_by_tier, {'fast': 1})
+        self.assertEqual(self.metrics.escalated_sections, [])
+        self.assertEqual(self.metrics.section_models, {'hobbies': models[0]})
+    
+    def test_validation_failure_escalates(self):
+        """Test that a failed cheap result is retried on the escalation tier."""
+        good = {'hobbies': {'sectionTitle': 'Hobbies', 'hobbies': ['Chess']}}
+        result, models = self._run('hobbies', [{'hobbies': None}, good])
+        
+        self.assertEqual(result, good)
+        self.assertEqual(models[-1], extraction_config.get_tier_model(extraction_config.ESCALATION_TIER))
+        self.assertEqual(self.metrics.escalated_sections, ['hobbies'])
+        self.assertEqual(self.metrics.tier_summary()['fast']['escalation_rate'], 1.0)
+        self.assertEqual(self.metrics.section_models, {'hobbies': models[-1]})
+    
+    def test_escalation_retracts_partial_items(self):
+        """Test that items streamed by the cheap tier are reset before escalating."""
+        invented = {'hobbies': {'sectionTitle': 'Hobbies', 'hobbies': ['Skydiving']}}
+        good = {'hobbies': {'sectionTitle': 'Hobbies', 'hobbies': ['Chess']}}
+        responses = ['{"hobbies": ["Skydiving"]}', '{"hobbies": ["Chess"]}']
+        results = []
+        events = []
+        
+        async def mock_extract(section_name, raw_text, llm_caller):
+            await llm_caller("prompt", section_name)
+            return [invented, good][len(results) - 1]
+        
+        async def mock_call_llm_streaming(prompt, name, parser=None, model=None, deadline=None):
+            parser.reset()
+            parser.feed(responses[len(results)])
+            results.append(model)
+            return model, parser.text
+        
+        self.extractor.llm_service.call_llm_streaming = mock_call_llm_streaming
+        self.extractor.section_extractor.extract = mock_extract
+        result = asyncio.run(self.extractor._extract_section_tiered(
+            'hobbies', self.raw_text, self.metrics, progress_callback=events.append
+        ))
+        
+        self.assertEqual(result, good)
+        self.assertEqual([(e['event'], e.get('item', e.get('reason'))) for e in events], [
+            ('partial_item', 'Skydiving'), ('section_reset', 'escalation'), ('partial_item', 'Chess')
+        ])
+    
+    def test_absent_section_is_not_escalated(self):
+        """Test that a section the model reports as absent ({}) is not retried."""
+        result, models = self._run('hobbies', [{'hobbies': None}], response="```json\n{}\n```")
+        
+        self.assertEqual(result, {'hobbies': None})
+        self.assertEqual(len(models), 1)
+        self.assertEqual(self.metrics.escalated_sections, [])
+    
+    def test_hallucination_escalates(self):
+        """Test that items missing from the source text trigger escalation."""
+        invented = {'hobbies': {'sectionTitle': 'Hobbies', 'hobbies': ['Skydiving']}}
+        good = {'hobbies': {'sectionTitle': 'Hobbies', 'hobbies': ['Chess']}}
+        result, models = self._run('hobbies', [invented, good])
+        
+        self.assertEqual(len(models), 2)
+        self.assertEqual(result, good)
+    
+    def test_premium_section_never_escalates(self):
+        """Test that sections already on the escalation tier are not retried."""
+        result, models = self._run('experience', [{'experience': None}])
+        
+        self.assertEqual(len(models), 1)
+        self.assertEqual(self.metrics.escalated_sections, [])
+
+
 class TestDataExtractorSingleton(unittest.TestCase):
     """Test singleton instance creation."""
     
@@ -366,5 +478,138 @@ class TestDataExtractorSingleton(unittest.TestCase):
         self.assertIsInstance(data_extractor, DataExtractor)
 
 
+class TestExtractionDeadline(unittest.TestCase):
+    """Test that a deadline cancels slow sections and flags them as missing."""
+    
+    def setUp(self):
+        # Bypass __init__ so no API client is created
+        self.extractor = DataExtractor.__new__(DataExtractor)
+        self.metrics = ExtractionMetrics()
+        self.slow_sections = {'experience', 'projects'}
+        
+        async def mock_tiered(section_name, raw_text, metrics, progress_callback=None, deadline=None,
+                              source_index=None):
+            if section_name in self.slow_sections:
+                await asyncio.sleep(30)
+            return {section_name: {'sectionTitle': section_name}}
+        
+        self.extractor._extract_section_tiered = mock_tiered
+    
+    def _run(self, deadline, progress_callback=None):
+        return asyncio.run(self.extractor._extract_all_sections_with_metrics(
+            "Hobbies: Chess", self.metrics, progress_callback, deadline
+        ))
+    
+    def test_deadline_cancels_stragglers(self):
+        """Test that unfinished sections are cancelled at the deadline and reported."""
+        events = []
+        result = self._run(ExtractionDeadline(0.2), events.append)
+        
+        self.assertEqual(set(result), set(DataExtractor.SECTION_SCHEMAS) - self.slow_sections)
+        self.assertEqual(set(self.metrics.missing_sections), self.slow_sections)
+        self.assertEqual(self.metrics.sections_failed, len(self.slow_sections))
+        self.assertFalse(self.metrics.cancelled)
+        
+        failed = [e for e in events if e['event'] == 'section_failed']
+        self.assertTrue(all(e['reason'] == 'deadline' for e in failed))
+        self.assertEqual(len(failed), len(self.slow_sections))
+    
+    def test_disconnect_cancels_stragglers(self):
+        """Test that a cancel check returning True stops extraction."""
+        async def disconnected():
+            return True
+        
+        result = self._run(ExtractionDeadline(cancel_check=disconnected))
+        
+        self.assertTrue(self.metrics.cancelled)
+        self.assertNotIn('experience', result)
+        self.assertIn('experience', self.metrics.missing_sections)
+
+
+class TestIncrementalExtraction(unittest.TestCase):
+    """Test that a revised CV only re-extracts the sections its edit touched."""
+
+    PRIOR_TEXT = "Jane Doe\nSoftware Engineer\n\nHobbies\nChess, Hiking\n\nLanguages\nEnglish, Portuguese\n"
+    PRIOR_CV_DATA = {
+        'hobbies': {'sectionTitle': 'Hobbies', 'hobbies': ['Chess', 'Hiking']},
+        'languages': {'sectionTitle': 'Languages', 'languageItems': [{'language': 'English'}]}
+    }
+
+    def setUp(self):
+        # Bypass __init__ so no API client is created
+        self.extractor = DataExtractor.__new__(DataExtractor)
+        self.extractor.llm_service = Mock(api_key=None)
+        self.extracted = []
+        self.indexes = []
+
+        async def mock_tiered(section_name, raw_text, metrics, progress_callback=None, deadline=None,
+                              source_index=None):
+            self.extracted.append(section_name)
+            self.indexes.append(source_index)
+            if section_name == 'hobbies':
+                return {'hobbies': {'sectionTitle': 'Hobbies', 'hobbies': ['Chess', 'Sailing']}}
+            return {section_name: None}
+
+        self.extractor._extract_section_tiered = mock_tiered
+
+    def _run(self, raw_text, **kwargs):
+        def enhance(data, text, metrics):
+            self.enhanced = set(data)
+            return data
+
+        with patch.object(DataExtractor, '_apply_enhancements', side_effect=enhance):
+            return asyncio.run(self.extractor.extract_cv_result(raw_text, **kwargs))
+
+    def test_only_changed_sections_are_extracted(self):
+        """Test that unchanged sections come from the prior extraction."""
+        result = self._run(
+            self.PRIOR_TEXT.replace("Chess, Hiking", "Chess, Sailing"),
+            prior_cv_data=self.PRIOR_CV_DATA, prior_text=self.PRIOR_TEXT
+        )
+
+        self.assertEqual(self.extracted, ['hobbies'])
+        self.assertEqual(result.cv_data.hobbies.hobbies, ['Chess', 'Sailing'])
+        self.assertEqual(result.cv_data.languages.languageItems[0].language, 'English')
+        self.assertEqual(result.metrics.sections_reused, len(DataExtractor.SECTION_SCHEMAS) - 1)
+
+    def test_reused_sections_are_not_reprocessed_or_shared(self):
+        """Test that reused sections skip enhancement and the result is never cached or shared."""
+        result = self._run(
+            self.PRIOR_TEXT.replace("Chess, Hiking", "Chess, Sailing"),
+            prior_cv_data=self.PRIOR_CV_DATA, prior_text=self.PRIOR_TEXT
+        )
+
+        self.assertEqual(self.enhanced, {'hobbies'})
+        self.assertIn('languages', result.reused_sections)
+        self.assertFalse(result.is_shareable)
+
+    def test_unknown_heading_redoes_absent_sections(self):
+        """Test that an added section we can't locate re-extracts every section the prior lacked."""
+        self._run(
+            self.PRIOR_TEXT + "\nCertifications & Training\nAWS Solutions Architect\n",
+            prior_cv_data=self.PRIOR_CV_DATA, prior_text=self.PRIOR_TEXT
+        )
+
+        absent = {name for name in DataExtractor.SECTION_SCHEMAS if name not in self.PRIOR_CV_DATA}
+        self.assertIn('certifications', absent)
+        self.assertTrue(absent <= set(self.extracted))
+        self.assertNotIn('hobbies', self.extracted)
+
+    def test_without_prior_everything_is_extracted(self):
+        """Test that extraction is unchanged when no prior extraction is given."""
+        result = self._run(self.PRIOR_TEXT)
+
+        self.assertEqual(sorted(self.extracted), sorted(DataExtractor.SECTION_SCHEMAS))
+        self.assertTrue(result.is_shareable)
+
+    def test_source_indexed_once_per_extraction(self):
+        """Test that every section's escalation check shares one index of the source text."""
+        self._run(self.PRIOR_TEXT)
+
+        self.assertIsInstance(self.indexes[0], SourceTextIndex)
+        self.assertTrue(all(index is self.indexes[0] for index in self.indexes))
+        self.assertEqual(len(self.indexes), len(DataExtractor.SECTION_SCHEMAS))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
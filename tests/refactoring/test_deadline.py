@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for ExtractionDeadline
+Tests time budgeting, cancellation and the tenacity retry helpers
+"""
+
+import unittest
+import asyncio
+import time
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from tenacity import retry, stop_after_attempt, wait_fixed
+
+from src.core.cv_extraction.deadline import (
+    ExtractionDeadline, DeadlineExceededError, retry_unless_deadline_exceeded,
+    stop_when_deadline_exhausted, wait_within_deadline
+)
+
+
+class TestExtractionDeadline(unittest.TestCase):
+    """Test ExtractionDeadline functionality."""
+
+    def test_unbounded_deadline(self):
+        """Test that a deadline without timeout never expires on its own."""
+        deadline = ExtractionDeadline()
+        self.assertIsNone(deadline.remaining())
+        self.assertFalse(deadline.expired)
+        self.assertTrue(deadline.can_afford(1e9))
+
+    def test_remaining_and_expiry(self):
+        """Test remaining time and expiry of a bounded deadline."""
+        deadline = ExtractionDeadline(10)
+        self.assertGreater(deadline.remaining(), 9)
+        self.assertFalse(deadline.can_afford(11))
+
+        expired = ExtractionDeadline(0)
+        self.assertEqual(expired.remaining(), 0.0)
+        self.assertTrue(expired.expired)
+        with self.assertRaises(DeadlineExceededError):
+            expired.check("section call")
+
+    def test_run_times_out(self):
+        """Test that run() converts a timeout into DeadlineExceededError."""
+        deadline = ExtractionDeadline(0.05)
+
+        async def slow():
+            await asyncio.sleep(5)
+
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            asyncio.run(deadline.run(slow(), "slow call"))
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_cancel_check_latches(self):
+        """Test that a disconnect is remembered once seen."""
+        answers = [True, False]
+
+        async def disconnected():
+            return answers.pop(0)
+
+        deadline = ExtractionDeadline(cancel_check=disconnected)
+        self.assertTrue(asyncio.run(deadline.is_cancelled()))
+        self.assertTrue(asyncio.run(deadline.is_cancelled()))
+        self.assertTrue(deadline.expired)
+        self.assertEqual(answers, [False])
+
+    def test_failing_cancel_check_ignored(self):
+        """Test that an erroring cancel check does not cancel extraction."""
+        async def broken():
+            raise RuntimeError("connection state unknown")
+
+        deadline = ExtractionDeadline(cancel_check=broken)
+        self.assertFalse(asyncio.run(deadline.is_cancelled()))
+
+
+class TestDeadlineRetries(unittest.TestCase):
+    """Test that tenacity retries are budgeted against the deadline."""
+
+    def _flaky(self, calls):
+        @retry(stop=(stop_after_attempt(5) | stop_when_deadline_exhausted(0.2)),
+               wait=wait_within_deadline(wait_fixed(0.2)),
+               retry=retry_unless_deadline_exceeded(),
+               reraise=True)
+        def call(deadline=None):
+            calls.append(time.monotonic())
+            raise ValueError("transient")
+        return call
+
+    def test_retries_without_deadline(self):
+        """Test that all attempts are used when no deadline is given."""
+        calls = []
+        with self.assertRaises(ValueError):
+            self._flaky(calls)()
+        self.assertEqual(len(calls), 5)
+
+    def test_retries_stop_at_deadline(self):
+        """Test that retries stop once the next wait no longer fits."""
+        calls = []
+        start = time.monotonic()
+        with self.assertRaises(ValueError):
+            self._flaky(calls)(deadline=ExtractionDeadline(0.3))
+        self.assertEqual(len(calls), 2)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_deadline_error_not_retried(self):
+        """Test that DeadlineExceededError is raised without retrying."""
+        calls = []
+
+        @retry(stop=stop_after_attempt(3), retry=retry_unless_deadline_exceeded())
+        def call(deadline=None):
+            calls.append(1)
+            deadline.check()
+
+        with self.assertRaises(DeadlineExceededError):
+            call(deadline=ExtractionDeadline(0))
+        self.assertEqual(len(calls), 1)
+
+    def test_cancelled_call_not_retried(self):
+        """Test that cancelling a task during a retried call stops it instead of starting another attempt."""
+        calls = []
+
+        @retry(stop=stop_after_attempt(5), wait=wait_fixed(0), retry=retry_unless_deadline_exceeded())
+        async def call(deadline=None):
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError("transient")
+            await asyncio.sleep(60)
+
+        async def scenario():
+            task = asyncio.create_task(call())
+            while len(calls) < 2:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return task
+
+        task = asyncio.run(scenario())
+        self.assertTrue(task.cancelled())
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for EnhancementEngine
+Golden tests comparing the enhancement pipeline with checked-in outputs for
+the example CVs, plus engine planning and timing
+"""
+
+import unittest
+import copy
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.cv_extraction.enhancement_engine import (
+    DocumentEnhancer, EnhancementEngine, NodeEnhancer
+)
+from src.core.cv_extraction.enhancement_processor import (
+    ENHANCERS, EnhancementProcessor, demographic_extractor, enhancement_engine, enhancement_processor
+)
+from src.core.cv_extraction.metrics import ExtractionMetrics
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+EXAMPLES_DIR = REPO_ROOT / "data" / "cv_examples"
+RESULTS_DIRS = [Path(__file__).parent / "baseline_results", Path(__file__).parent / "png_test_results"]
+DEFAULT_RAW_TEXT = EXAMPLES_DIR / "text_examples" / "comprehensive_all_components_cv.txt"
+# Expected enhance_all output per input, produced by the sequential per-enhancer
+# passes before the enhancers were fused. Regenerate only for an intended change.
+GOLDEN_DIR = Path(__file__).parent / "enhancement_golden"
+GOLDEN_NOW = datetime(2025, 6, 1)
+
+# Sections as they come from extraction, before the reorganize step has moved fields
+RAW_SECTIONS = {
+    'summary': {'summaryText': 'Engineer with 8 years of experience', 'keySpecializations': ['x']},
+    'experience': {'experienceItems': [
+        {'companyName': 'Acme', 'teamSize': 5, 'technologiesUsed': ['Python', 'team', 'python', 'Data Science'],
+         'dateRange': {'startDate': 'Jan 2018', 'endDate': 'Mar 2020'},
+         'description': 'See https://github.com/acme/tool'},
+        'not a dict'
+    ]},
+    'projects': {'projectItems': [{'title': 'Tool', 'role': 'Lead', 'videoUrl': 'https://youtu.be/abc'}]},
+    'education': {'educationItems': [{'degree': 'BSc', 'description': 'BSc', 'gpa': '3.9',
+                                      'location': {'city': 'Boston'}}]},
+    'achievements': ['Won award', 'Shipped product'],
+    'hobbies': {'hobbyItems': [{'name': 'Chess'}]}
+}
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() is GOLDEN_NOW"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(GOLDEN_NOW.year, GOLDEN_NOW.month, GOLDEN_NOW.day, tzinfo=tz)
+
+
+def load_golden_inputs():
+    """(name, cv data, raw text) for every extracted CV kept alongside the examples"""
+    inputs = []
+    lior = json.loads((EXAMPLES_DIR / "cv_tests" / "lior_extracted_data.json").read_text())
+    inputs.append(("lior", lior["cv_data"], (EXAMPLES_DIR / "cv_tests" / "Lior_Naaman_text.txt").read_text()))
+
+    default_text = DEFAULT_RAW_TEXT.read_text()
+    for results_dir in RESULTS_DIRS:
+        for path in sorted(results_dir.glob("*_data.json")):
+            inputs.append((path.stem, json.loads(path.read_text()), default_text))
+    return inputs
+
+
+def golden_enhance_all(data, raw_text):
+    """
+    enhance_all as the golden outputs were produced: clock frozen at GOLDEN_NOW
+    (durations of current roles) and the demographic stages passing data through
+    """
+    passthrough = lambda section, text: section
+    with patch('datetime.datetime', FrozenDatetime), \
+            patch('src.core.cv_extraction.enhancement_processor.datetime', FrozenDatetime), \
+            patch.object(demographic_extractor, 'enhance_contact_with_demographics', side_effect=passthrough), \
+            patch.object(demographic_extractor, 'merge_externships_to_experience', side_effect=passthrough), \
+            patch.object(demographic_extractor, 'enhance_volunteer_with_activities', side_effect=passthrough):
+        enhanced = enhancement_processor.enhance_all(copy.deepcopy(data), raw_text)
+    return json.loads(json.dumps(enhanced))
+
+
+def load_golden(name):
+    return json.loads((GOLDEN_DIR / f"{name}.json").read_text())
+
+
+class TestEnhancementGolden(unittest.TestCase):
+    """Pipeline output must match the checked-in outputs of the sequential passes."""
+
+    def setUp(self):
+        self.inputs = load_golden_inputs()
+
+    def test_examples_present(self):
+        """Test that the golden inputs and their expected outputs were found."""
+        self.assertGreaterEqual(len(self.inputs), 3)
+        for name, _, _ in self.inputs:
+            self.assertTrue((GOLDEN_DIR / f"{name}.json").exists(), name)
+
+    def test_matches_golden_outputs(self):
+        """Test the engine against the golden output of every example CV."""
+        for name, data, raw_text in self.inputs:
+            with self.subTest(cv=name):
+                self.assertEqual(golden_enhance_all(data, raw_text), load_golden(name))
+
+    def test_raw_sections_match_golden_output(self):
+        """Test fields the reorganize step moves are handled as before when it has not run yet."""
+        self.assertEqual(golden_enhance_all(RAW_SECTIONS, "Extra activities"), load_golden("raw_sections"))
+
+
+class TestEnhancementEngine(unittest.TestCase):
+    """Test EnhancementEngine planning and timing."""
+
+    def test_node_enhancers_fused(self):
+        """Test that consecutive node enhancers share one walk."""
+        self.assertLess(enhancement_engine.pass_count, len(ENHANCERS))
+
+        node_enhancers = [e for e in ENHANCERS if isinstance(e, NodeEnhancer)]
+        document_enhancers = [e for e in ENHANCERS if isinstance(e, DocumentEnhancer)]
+        self.assertEqual(enhancement_engine.pass_count, len(document_enhancers) + 1)
+        self.assertGreater(len(node_enhancers), 1)
+
+    def test_visit_order_per_node(self):
+        """Test that each node sees every enhancer in order before the next node."""
+        calls = []
+        engine = EnhancementEngine([
+            NodeEnhancer('first', (('experience', 'experienceItems'),), lambda item, s: calls.append(('first', item['id']))),
+            NodeEnhancer('second', (('experience', 'experienceItems'),), lambda item, s: calls.append(('second', item['id']))),
+            DocumentEnhancer('barrier', ('experience',), lambda data, ctx: calls.append(('barrier', None)) or data),
+            NodeEnhancer('third', (('experience', 'experienceItems'),), lambda item, s: calls.append(('third', item['id']))),
+        ])
+        engine.run({'experience': {'experienceItems': [{'id': 1}, {'id': 2}]}}, "")
+
+        self.assertEqual(engine.pass_count, 3)
+        self.assertEqual(calls, [
+            ('first', 1), ('second', 1), ('first', 2), ('second', 2),
+            ('barrier', None),
+            ('third', 1), ('third', 2)
+        ])
+
+    def test_malformed_sections_skipped(self):
+        """Test that non-dict sections and non-list items are not visited."""
+        visited = []
+        engine = EnhancementEngine([
+            NodeEnhancer('visit', (('experience', 'experienceItems'), ('summary', None)),
+                         lambda node, s: visited.append(node))
+        ])
+        engine.run({'experience': {'experienceItems': 'text'}, 'summary': 'text'}, "")
+        self.assertEqual(visited, [])
+
+    def test_raw_text_lowered_once(self):
+        """Test that enhancers share the lowercased raw text."""
+        seen = []
+        engine = EnhancementEngine([
+            DocumentEnhancer('a', (), lambda data, ctx: seen.append(ctx.lower) or data),
+            DocumentEnhancer('b', (), lambda data, ctx: seen.append(ctx.lower) or data),
+        ])
+        engine.run({}, "Extra ACTIVITIES")
+        self.assertEqual(seen[0], "extra activities")
+        self.assertIs(seen[0], seen[1])
+
+    def test_timings_recorded_in_metrics(self):
+        """Test that per-enhancer timings reach ExtractionMetrics."""
+        metrics = ExtractionMetrics()
+        _, data, raw_text = load_golden_inputs()[0]
+        enhancement_processor.enhance_all(copy.deepcopy(data), raw_text, metrics)
+
+        self.assertEqual(set(metrics.enhancer_times), {e.name for e in ENHANCERS})
+        self.assertTrue(all(t >= 0 for t in metrics.enhancer_times.values()))
+        self.assertEqual(set(metrics.to_dict()["timing"]["enhancers"]), set(metrics.enhancer_times))
+
+    def test_enhancer_failure_propagates(self):
+        """Test that an enhancer error surfaces to the caller (which falls back to raw data)."""
+        with patch.object(EnhancementProcessor, 'calculate_item_duration', side_effect=ValueError("boom")):
+            with self.assertRaises(ValueError):
+                enhancement_processor.enhance_all(
+                    {'experience': {'experienceItems': [{'dateRange': {'startDate': '2020'}}]}}, ""
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ Tests configuration values and singleton pattern
 
 import unittest
 import sys
+from unittest.mock import patch
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
@@ -130,5 +131,44 @@ class TestExtractionConfig(unittest.TestCase):
         self.assertEqual(new_config.MAX_RETRIES, original_retries)
 
 
+class TestModelTierRouting(unittest.TestCase):
+    """Test section to model tier routing."""
+    
+    def test_every_tier_has_model_and_pricing(self):
+        """Test that each tier used by the routing table is fully configured."""
+        for section, tier in extraction_config.SECTION_MODEL_TIERS.items():
+            self.assertIn(tier, extraction_config.MODEL_TIERS, f"{section} routes to unknown tier")
+            self.assertIn(tier, extraction_config.MODEL_TIER_PRICING)
+        self.assertIn(extraction_config.ESCALATION_TIER, extraction_config.MODEL_TIERS)
+    
+    def test_section_routing(self):
+        """Test that simple sections use cheaper tiers and core sections use premium."""
+        self.assertEqual(extraction_config.get_model_tier('hobbies'), 'fast')
+        self.assertEqual(extraction_config.get_model_tier('experience'), 'premium')
+        self.assertEqual(extraction_config.get_model_tier('unknown_section'),
+                         extraction_config.DEFAULT_MODEL_TIER)
+    
+    def test_premium_tier_is_primary_model(self):
+        """Test that the premium tier follows config.PRIMARY_MODEL."""
+        import config
+        self.assertEqual(extraction_config.get_tier_model('premium'), config.PRIMARY_MODEL)
+        with patch.object(config, 'PRIMARY_MODEL', 'claude-test-model'):
+            untiered = ExtractionConfig(ENABLE_TIERED_ROUTING=False)
+            self.assertEqual(untiered.get_tier_model(untiered.get_model_tier('hobbies')), 'claude-test-model')
+    
+    def test_routing_disabled(self):
+        """Test that disabling routing sends every section to the escalation tier."""
+        config = ExtractionConfig(ENABLE_TIERED_ROUTING=False)
+        self.assertEqual(config.get_model_tier('hobbies'), config.ESCALATION_TIER)
+    
+    def test_cost_estimate(self):
+        """Test per-tier cost estimates."""
+        fast = extraction_config.estimate_tier_cost('fast', 1000, 500)
+        premium = extraction_config.estimate_tier_cost('premium', 1000, 500)
+        self.assertGreater(fast, 0)
+        self.assertGreater(premium, fast)
+        self.assertEqual(extraction_config.estimate_tier_cost('missing', 1000, 500), 0.0)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for ExtractionResult
+Tests that the extraction report is built once and reused by its consumers
+"""
+
+import unittest
+from unittest.mock import patch
+import dataclasses
+import json
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.cv_extraction.data_extractor import DataExtractor
+from src.core.cv_extraction.extraction_result import ExtractionResult
+from src.core.cv_extraction.metrics import ExtractionMetrics
+from src.core.schemas.unified_nullable import CVData
+
+
+SECTIONS = {
+    'hero': {'fullName': 'Jane Doe', 'professionalTitle': 'Engineer'},
+    'hobbies': {'sectionTitle': 'Hobbies', 'hobbies': ['Chess']},
+}
+
+
+class TestExtractionResult(unittest.TestCase):
+    """Test ExtractionResult functionality."""
+
+    def test_build_serializes_once(self):
+        """Test that the nullable dump is taken once and reused."""
+        cv_data = CVData(**SECTIONS)
+        with patch.object(CVData, 'model_dump_nullable', autospec=True,
+                          side_effect=CVData.model_dump_nullable) as dump:
+            result = ExtractionResult.build(cv_data, 0.8, ['issue'])
+            self.assertEqual(result.sections_count, 2)
+            self.assertEqual(json.loads(result.cv_data_json)['hero']['fullName'], 'Jane Doe')
+            self.assertEqual(result.to_response()['hobbies']['hobbies'], ['Chess'])
+            self.assertEqual(dump.call_count, 1)
+        self.assertEqual(result.validation_issues, ('issue',))
+
+    def test_result_is_immutable(self):
+        """Test that fields and the serialized dict cannot be changed."""
+        result = ExtractionResult.build(CVData(**SECTIONS), 0.8)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            result.confidence = 1.0
+        with self.assertRaises(TypeError):
+            result.cv_data_dict['hero'] = None
+
+    def test_partial_result(self):
+        """Test that missing sections flagged on CVData carry into the result."""
+        cv_data = CVData(**SECTIONS)
+        cv_data.flag_missing_sections(['experience'])
+        result = ExtractionResult.build(cv_data, 0.4)
+        self.assertTrue(result.is_partial)
+        self.assertEqual(result.missing_sections, ('experience',))
+
+    def test_pipeline_scores_once(self):
+        """Test that the pipeline reuses the post-processor's confidence."""
+        metrics = ExtractionMetrics()
+        metrics.missing_sections.append('projects')
+        with patch('src.core.cv_extraction.data_extractor.post_processor') as post_processor:
+            post_processor.process_all.side_effect = lambda cv_data, raw_text: (cv_data, 0.9, ['warn'])
+            result = DataExtractor._create_and_process_cv_data(dict(SECTIONS), "Jane Doe", metrics)
+
+        post_processor.calculate_extraction_confidence.assert_not_called()
+        self.assertEqual(result.confidence, 0.9)
+        self.assertEqual(result.validation_issues, ('warn',))
+        self.assertEqual(result.missing_sections, ('projects',))
+        self.assertIs(result.metrics, metrics)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for HallucinationValidator and SourceTextIndex
+Tests that indexed source-text queries match the original per-field checks
+"""
+
+import unittest
+import re
+import sys
+from difflib import SequenceMatcher
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.cv_extraction.hallucination_validator import HallucinationValidator, SourceTextIndex
+
+
+ORIGINAL_TEXT = """Jane Doe - Senior Software Engineer
+Experience: Acme Corp (2019-2023). Led migration of billing services to Kubernetes,
+cutting deployment time by 40%. Recognized for mentoring five junior engineers.
+Education: B.Sc. Computer Science, Tel Aviv University, GPA 3.8
+Skills: Python, Go, PostgreSQL, Terraform. Hobbies: chess, trail running."""
+
+
+def legacy_text_exists(extracted_text, original_text, threshold=0.7):
+    """Reference implementation: re-normalize the whole CV for every field."""
+    if not extracted_text:
+        return True
+
+    def normalize(text):
+        text = re.sub(r'\s+', ' ', text.lower().strip())
+        return re.sub(r'[^\w\s]', '', text)
+
+    extracted_norm = normalize(extracted_text)
+    original_norm = normalize(original_text)
+    if len(extracted_norm) < 10:
+        return extracted_norm in original_norm
+    extracted_words = extracted_norm.split()
+    if len(extracted_words) <= 3:
+        return ' '.join(extracted_words) in original_norm
+    match = SequenceMatcher(None, extracted_norm, original_norm).find_longest_match(
+        0, len(extracted_norm), 0, len(original_norm))
+    if match.size >= len(extracted_norm) * threshold:
+        return True
+    words_found = sum(1 for word in extracted_words if word in original_norm)
+    return words_found / len(extracted_words) >= threshold
+
+
+class TestSourceTextIndex(unittest.TestCase):
+    """Test SourceTextIndex queries."""
+
+    SAMPLES = [
+        "", "Python", "Pyth", "Rust", "Kotlin", "chess", "Acme Corp", "Acme Inc",
+        "Tel Aviv University", "Senior Software Engineer",
+        "Led migration of billing services to Kubernetes",
+        "Led the migration of all billing services to Kubernetes in record time",
+        "Spearheaded a revolutionary transformation of the company culture",
+        "Recognized for mentoring five junior engineers",
+        "cutting deployment time by 40%",
+    ]
+
+    def test_matches_legacy_checks(self):
+        """Test that indexed checks give the same answers as the unindexed ones."""
+        index = SourceTextIndex(ORIGINAL_TEXT)
+        for sample in self.SAMPLES:
+            for threshold in (0.5, 0.7):
+                with self.subTest(sample=sample, threshold=threshold):
+                    self.assertEqual(index.text_exists(sample, threshold),
+                                     legacy_text_exists(sample, ORIGINAL_TEXT, threshold))
+
+    def test_static_api_accepts_text_or_index(self):
+        """Test that text_exists_in_original works with raw text and an index."""
+        index = SourceTextIndex(ORIGINAL_TEXT)
+        for sample in self.SAMPLES:
+            self.assertEqual(HallucinationValidator.text_exists_in_original(sample, ORIGINAL_TEXT),
+                             HallucinationValidator.text_exists_in_original(sample, index))
+
+    def test_index_scoped_to_caller(self):
+        """Test that an index is passed through but raw text is never served from a shared cache."""
+        self.assertIsNot(SourceTextIndex.of(ORIGINAL_TEXT), SourceTextIndex.of(ORIGINAL_TEXT))
+        index = SourceTextIndex(ORIGINAL_TEXT)
+        self.assertIs(SourceTextIndex.of(index), index)
+
+    def test_substring_not_only_whole_words(self):
+        """Test that contains() keeps substring semantics beyond the word set."""
+        index = SourceTextIndex(ORIGINAL_TEXT)
+        self.assertTrue(index.contains("python"))
+        self.assertTrue(index.contains("postgres"))
+        self.assertFalse(index.contains("mysql"))
+
+    def test_validate_section_uses_index(self):
+        """Test that list validation flags invented items against the index."""
+        index = SourceTextIndex(ORIGINAL_TEXT)
+        cleaned, issues = HallucinationValidator.validate_section(["chess", "Skydiving"], index, "hobbies")
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(cleaned, ["chess", "Skydiving"])
+
+    def test_indicator_elaboration_replaced_with_index(self):
+        """Test that achievement elaboration is replaced when validating against an index."""
+        achievements = {'achievementItems': [
+            {'value': 'Mentoring', 'contextOrDetail': 'Recognized for mentoring five junior engineers'},
+            {'value': 'Award', 'contextOrDetail': 'Recognized for exceptional performance across teams'},
+        ]}
+        result = HallucinationValidator._deduplicate_achievements(
+            achievements, {}, {}, SourceTextIndex(ORIGINAL_TEXT)
+        )
+        details = [item['contextOrDetail'] for item in result['achievementItems']]
+        self.assertEqual(details, ['Mentoring', 'Award'])
+
+if __name__ == "__main__":
+    unittest.main()
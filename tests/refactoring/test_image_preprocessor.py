@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for ImagePreprocessor
+Tests orientation, downsampling, grayscale recompression, tall image splitting
+and passing small or unreadable images through unchanged
+"""
+
+import io
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.local.image_preprocessor import PIL_AVAILABLE, ImagePreprocessor
+from src.core.local.text_extractor import text_extractor
+
+if PIL_AVAILABLE:
+    from PIL import Image, ImageDraw
+
+
+def page_image(width, height, lines_every=40, mode='RGB'):
+    """A white page with dark text-like bars, leaving a blank band every 10 lines."""
+    image = Image.new(mode, (width, height), 'white')
+    draw = ImageDraw.Draw(image)
+    for number, y in enumerate(range(20, height - 20, lines_every)):
+        if number % 10 != 9:
+            draw.rectangle((40, y, width - 40, y + lines_every // 3), fill='black')
+    return image
+
+
+def encode(image, format, **kwargs):
+    buffer = io.BytesIO()
+    image.save(buffer, format=format, **kwargs)
+    return buffer.getvalue()
+
+
+@unittest.skipUnless(PIL_AVAILABLE, "Pillow not installed")
+class TestImagePreprocessor(unittest.TestCase):
+    """Test ImagePreprocessor.prepare."""
+
+    def setUp(self):
+        self.preprocessor = ImagePreprocessor()
+
+    def test_phone_photo_downsampled_to_grayscale(self):
+        """Test that a large color JPEG becomes a smaller grayscale JPEG at OCR resolution."""
+        content = encode(page_image(3000, 4000), 'JPEG', quality=95)
+        prepared = self.preprocessor.prepare(content)
+
+        self.assertTrue(prepared.processed)
+        self.assertEqual(len(prepared.parts), 1)
+        self.assertLess(prepared.size_bytes, len(content))
+        result = Image.open(io.BytesIO(prepared.parts[0]))
+        self.assertEqual((result.format, result.mode, result.size), ('JPEG', 'L', (1700, 2267)))
+
+    def test_exif_orientation_applied(self):
+        """Test that a sideways photo with an EXIF rotation comes out upright."""
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Rotate 90 degrees clockwise to display
+        content = encode(page_image(800, 600), 'JPEG', exif=exif)
+        prepared = self.preprocessor.prepare(content)
+
+        self.assertTrue(prepared.processed)
+        self.assertEqual(Image.open(io.BytesIO(prepared.parts[0])).size, (600, 800))
+
+    def test_tall_image_split_at_blank_rows(self):
+        """Test that a long screenshot is split into parts cut between text lines."""
+        image = page_image(600, 4000, mode='L')
+        prepared = self.preprocessor.prepare(encode(image, 'PNG'))
+
+        parts = [Image.open(io.BytesIO(part)) for part in prepared.parts]
+        self.assertGreater(len(parts), 1)
+        self.assertEqual({part.format for part in parts}, {'PNG'})
+        self.assertEqual(sum(part.height for part in parts), 4000)
+        top = 0
+        for part in parts[:-1]:
+            top += part.height
+            self.assertEqual(image.getpixel((300, top)), 255)
+
+    def test_transparent_background_is_white(self):
+        """Test that transparent screenshot areas do not turn black."""
+        image = Image.new('RGBA', (2400, 3000), (0, 0, 0, 0))
+        prepared = self.preprocessor.prepare(encode(image, 'PNG'))
+        self.assertEqual(Image.open(io.BytesIO(prepared.parts[0])).getpixel((0, 0)), 255)
+
+    def test_small_image_sent_unchanged(self):
+        """Test that a compact, upright, OCR-sized image is not re-encoded."""
+        content = encode(page_image(900, 1200), 'PNG')
+        prepared = self.preprocessor.prepare(content)
+        self.assertFalse(prepared.processed)
+        self.assertIs(prepared.parts[0], content)
+
+    def test_unreadable_image_sent_unchanged(self):
+        """Test that bytes Pillow cannot decode (e.g. HEIC) are passed through."""
+        prepared = self.preprocessor.prepare(b"not an image")
+        self.assertEqual(prepared.parts, [b"not an image"])
+        self.assertFalse(prepared.processed)
+
+    def test_text_extractor_sends_prepared_parts(self):
+        """Test that OCR receives each prepared part and the texts are joined in order."""
+        textract = MagicMock()
+        textract.detect_document_text.side_effect = [
+            {"Blocks": [{"BlockType": "LINE", "Text": f"Part {number}"}]} for number in (1, 2, 3, 4, 5)
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "long_screenshot.png"
+            path.write_bytes(encode(page_image(600, 4000), 'PNG'))
+            with patch.object(text_extractor, "vision_client", None), \
+                    patch.object(text_extractor, "textract_client", textract):
+                text = text_extractor.extract_text(str(path), preserve_line_breaks=True)
+
+        calls = textract.detect_document_text.call_count
+        self.assertGreater(calls, 1)
+        self.assertEqual(text, "\n".join(f"Part {number}" for number in range(1, calls + 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
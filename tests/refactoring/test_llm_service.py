@@ -18,12 +18,12 @@ class TestLLMService(unittest.TestCase):
     """Test LLMService functionality."""
     
     @patch('src.core.cv_extraction.llm_service.Anthropic')
-    @patch('src.core.cv_extraction.llm_service.AsyncAnthropic')
-    def test_singleton_pattern(self, mock_async_anthropic, mock_anthropic):
+    @patch('src.core.cv_extraction.llm_service.get_anthropic_client')
+    def test_singleton_pattern(self, mock_get_client, mock_anthropic):
         """Test that LLMService follows singleton pattern."""
         # Mock the clients
         mock_anthropic.return_value = Mock()
-        mock_async_anthropic.return_value = Mock()
+        mock_get_client.return_value = Mock()
         
         service1 = get_llm_service("test_key_1")
         service2 = get_llm_service("test_key_1")
@@ -36,32 +36,32 @@ class TestLLMService(unittest.TestCase):
         self.assertIsNot(service1, service3)
     
     @patch('src.core.cv_extraction.llm_service.Anthropic')
-    @patch('src.core.cv_extraction.llm_service.AsyncAnthropic')
-    def test_initialization_with_api_key(self, mock_async_anthropic, mock_anthropic):
+    @patch('src.core.cv_extraction.llm_service.get_anthropic_client')
+    def test_initialization_with_api_key(self, mock_get_client, mock_anthropic):
         """Test service initialization with API key."""
         mock_client = Mock()
         mock_async_client = Mock()
         mock_anthropic.return_value = mock_client
-        mock_async_anthropic.return_value = mock_async_client
+        mock_get_client.return_value = mock_async_client
         
         service = LLMService(api_key="test_api_key")
         
         # Should initialize clients with API key
         mock_anthropic.assert_called_once_with(api_key="test_api_key")
-        mock_async_anthropic.assert_called_once_with(api_key="test_api_key")
+        mock_get_client.assert_called_once_with("test_api_key")
         
         self.assertEqual(service.claude_client, mock_async_client)
         self.assertEqual(service.claude_sync_client, mock_client)
     
     @patch('src.core.cv_extraction.llm_service.keyring')
     @patch('src.core.cv_extraction.llm_service.Anthropic')
-    @patch('src.core.cv_extraction.llm_service.AsyncAnthropic')
-    def test_initialization_from_keychain(self, mock_async_anthropic, mock_anthropic, mock_keyring):
+    @patch('src.core.cv_extraction.llm_service.get_anthropic_client')
+    def test_initialization_from_keychain(self, mock_get_client, mock_anthropic, mock_keyring):
         """Test service initialization from keychain."""
         mock_keyring.get_password.return_value = "keychain_api_key"
         
         mock_anthropic.return_value = Mock()
-        mock_async_anthropic.return_value = Mock()
+        mock_get_client.return_value = Mock()
         
         service = LLMService()
         
@@ -74,13 +74,13 @@ class TestLLMService(unittest.TestCase):
     @patch.dict('os.environ', {'CLAUDE_API_KEY': 'env_api_key'})
     @patch('src.core.cv_extraction.llm_service.keyring')
     @patch('src.core.cv_extraction.llm_service.Anthropic')
-    @patch('src.core.cv_extraction.llm_service.AsyncAnthropic')
-    def test_initialization_from_env(self, mock_async_anthropic, mock_anthropic, mock_keyring):
+    @patch('src.core.cv_extraction.llm_service.get_anthropic_client')
+    def test_initialization_from_env(self, mock_get_client, mock_anthropic, mock_keyring):
         """Test service initialization from environment variable."""
         mock_keyring.get_password.return_value = None  # No keychain key
         
         mock_anthropic.return_value = Mock()
-        mock_async_anthropic.return_value = Mock()
+        mock_get_client.return_value = Mock()
         
         service = LLMService()
         
@@ -103,8 +103,8 @@ class TestLLMService(unittest.TestCase):
         self.assertEqual(info['max_tokens'], 4096)
         self.assertTrue(info['deterministic'])
     
-    @patch('src.core.cv_extraction.llm_service.AsyncAnthropic')
-    async def test_call_llm_success(self, mock_async_anthropic):
+    @patch('src.core.cv_extraction.llm_service.get_anthropic_client')
+    async def test_call_llm_success(self, mock_get_client):
         """Test successful LLM API call."""
         # Setup mock response
         mock_response = Mock()
@@ -112,7 +112,7 @@ class TestLLMService(unittest.TestCase):
         
         mock_client = AsyncMock()
         mock_client.messages.create = AsyncMock(return_value=mock_response)
-        mock_async_anthropic.return_value = mock_client
+        mock_get_client.return_value = mock_client
         
         service = LLMService(api_key="test_key")
         
@@ -129,8 +129,8 @@ class TestLLMService(unittest.TestCase):
         self.assertEqual(call_args.kwargs['temperature'], 0.0)
         self.assertEqual(call_args.kwargs['messages'][0]['content'], "test prompt")
     
-    @patch('src.core.cv_extraction.llm_service.AsyncAnthropic')
-    async def test_call_llm_with_retry(self, mock_async_anthropic):
+    @patch('src.core.cv_extraction.llm_service.get_anthropic_client')
+    async def test_call_llm_with_retry(self, mock_get_client):
         """Test LLM call with retry on failure."""
         # Setup mock that fails once then succeeds
         mock_response = Mock()
@@ -140,7 +140,7 @@ class TestLLMService(unittest.TestCase):
         mock_client.messages.create = AsyncMock(
             side_effect=[Exception("API Error"), mock_response]
         )
-        mock_async_anthropic.return_value = mock_client
+        mock_get_client.return_value = mock_client
         
         service = LLMService(api_key="test_key")
         
@@ -183,15 +183,15 @@ class TestLLMService(unittest.TestCase):
 class TestLLMServiceEdgeCases(unittest.TestCase):
     """Test edge cases and error scenarios."""
     
-    @patch('src.core.cv_extraction.llm_service.AsyncAnthropic')
-    async def test_empty_response_handling(self, mock_async_anthropic):
+    @patch('src.core.cv_extraction.llm_service.get_anthropic_client')
+    async def test_empty_response_handling(self, mock_get_client):
         """Test handling of empty API responses."""
         mock_response = Mock()
         mock_response.content = []  # Empty content
         
         mock_client = AsyncMock()
         mock_client.messages.create = AsyncMock(return_value=mock_response)
-        mock_async_anthropic.return_value = mock_client
+        mock_get_client.return_value = mock_client
         
         service = LLMService(api_key="test_key")
         
@@ -200,15 +200,15 @@ class TestLLMServiceEdgeCases(unittest.TestCase):
         # Should handle empty response gracefully
         self.assertEqual(response, "")
     
-    @patch('src.core.cv_extraction.llm_service.AsyncAnthropic')
-    async def test_malformed_response_handling(self, mock_async_anthropic):
+    @patch('src.core.cv_extraction.llm_service.get_anthropic_client')
+    async def test_malformed_response_handling(self, mock_get_client):
         """Test handling of malformed API responses."""
         mock_response = Mock()
         mock_response.content = None  # None content
         
         mock_client = AsyncMock()
         mock_client.messages.create = AsyncMock(return_value=mock_response)
-        mock_async_anthropic.return_value = mock_client
+        mock_get_client.return_value = mock_client
         
         service = LLMService(api_key="test_key")
         
@@ -220,14 +220,14 @@ class TestLLMServiceEdgeCases(unittest.TestCase):
         except Exception:
             pass  # Also acceptable
     
-    @patch('src.core.cv_extraction.llm_service.AsyncAnthropic')
-    async def test_max_retries_exceeded(self, mock_async_anthropic):
+    @patch('src.core.cv_extraction.llm_service.get_anthropic_client')
+    async def test_max_retries_exceeded(self, mock_get_client):
         """Test behavior when max retries are exceeded."""
         mock_client = AsyncMock()
         mock_client.messages.create = AsyncMock(
             side_effect=Exception("Persistent API Error")
         )
-        mock_async_anthropic.return_value = mock_client
+        mock_get_client.return_value = mock_client
         
         service = LLMService(api_key="test_key")
         
@@ -254,13 +254,13 @@ class TestLLMServiceIntegration(unittest.TestCase):
     """Test integration aspects of LLMService."""
     
     @patch('src.core.cv_extraction.llm_service.extraction_config')
-    @patch('src.core.cv_extraction.llm_service.AsyncAnthropic')
-    def test_uses_extraction_config(self, mock_async_anthropic, mock_config):
+    @patch('src.core.cv_extraction.llm_service.get_anthropic_client')
+    def test_uses_extraction_config(self, mock_get_client, mock_config):
         """Test that LLMService uses extraction config."""
         mock_config.MAX_RETRIES = 5
         mock_config.RETRY_MULTIPLIER = 2
         
-        mock_async_anthropic.return_value = AsyncMock()
+        mock_get_client.return_value = AsyncMock()
         
         service = LLMService(api_key="test_key")
         
@@ -268,8 +268,8 @@ class TestLLMServiceIntegration(unittest.TestCase):
         # (Would need to inspect retry decorator, simplified here)
         self.assertIsNotNone(service)
     
-    @patch('src.core.cv_extraction.llm_service.AsyncAnthropic')
-    async def test_concurrent_calls(self, mock_async_anthropic):
+    @patch('src.core.cv_extraction.llm_service.get_anthropic_client')
+    async def test_concurrent_calls(self, mock_get_client):
         """Test that service handles concurrent API calls."""
         mock_response = Mock()
         mock_response.content = [Mock(text="response")]
@@ -284,7 +284,7 @@ class TestLLMServiceIntegration(unittest.TestCase):
             return mock_response
         
         mock_client.messages.create = mock_create
-        mock_async_anthropic.return_value = mock_client
+        mock_get_client.return_value = mock_client
         
         service = LLMService(api_key="test_key")
         
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Multi-File CV Text
+Tests concurrent extraction, duplicate detection and the combined text budget
+"""
+
+import unittest
+import asyncio
+import threading
+import time
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.cv_extraction.multi_file_text import (
+    FileText, TRUNCATION_MARKER, extract_file_texts, combine_file_texts, summarize_file_texts
+)
+
+
+class TestExtractFileTexts(unittest.TestCase):
+    """Test extracting the files of one upload."""
+
+    def setUp(self):
+        self.texts = {
+            "01_a.png": "Jane Doe\nSoftware Engineer",
+            "02_b.png": "Experience\nAcme Corp",
+            "03_c.pdf": "Jane Doe\n Software   Engineer",  # Same page, different file
+            "04_d.png": ""
+        }
+        self.calls = []
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def _text_extract(self, path, file_hash):
+        with self.lock:
+            self.calls.append(path)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        if path == "05_e.png":
+            raise ValueError("Unreadable image")
+        return self.texts[path]
+
+    def _run(self, paths, hashes, concurrency=4):
+        return asyncio.run(extract_file_texts(paths, hashes, self._text_extract, concurrency))
+
+    def test_duplicates_are_detected(self):
+        """Test that same-hash files are not extracted and same-text files are flagged."""
+        paths = ["01_a.png", "02_b.png", "01_a.png", "03_c.pdf", "04_d.png"]
+        files = self._run(paths, ["h1", "h2", "h1", "h3", "h4"])
+
+        self.assertEqual(sorted(self.calls), ["01_a.png", "02_b.png", "03_c.pdf", "04_d.png"])
+        self.assertEqual([file.duplicate_of for file in files], [None, None, "01_a.png", "01_a.png", None])
+        self.assertEqual(files[2].seconds, 0.0)
+        self.assertEqual(summarize_file_texts(files)["duplicates"], 2)
+
+    def test_files_extracted_concurrently(self):
+        """Test that extraction runs in parallel up to the concurrency limit."""
+        paths = ["01_a.png", "02_b.png", "03_c.pdf", "04_d.png"]
+        self._run(paths, [None] * 4, concurrency=2)
+
+        self.assertEqual(self.max_running, 2)
+
+    def test_failed_file_is_reported(self):
+        """Test that a file that fails does not stop the others."""
+        files = self._run(["01_a.png", "05_e.png"], [None, None])
+
+        self.assertEqual(files[0].text, self.texts["01_a.png"])
+        self.assertEqual(files[1].error, "Unreadable image")
+        self.assertEqual(summarize_file_texts(files)["failed"], 1)
+
+
+class TestCombineFileTexts(unittest.TestCase):
+    """Test joining file texts within the size budget."""
+
+    def test_texts_joined_in_order(self):
+        """Test that distinct texts are joined under file headers, duplicates left out."""
+        files = [FileText("01_a.png", text="Page one"), FileText("02_b.png", text="Page two"),
+                 FileText("03_c.png", text="Page one", duplicate_of="01_a.png")]
+        combined = combine_file_texts(files, 1000)
+
+        self.assertLess(combined.index("--- File: 01_a.png ---"), combined.index("--- File: 02_b.png ---"))
+        self.assertNotIn("03_c.png", combined)
+        self.assertNotIn(TRUNCATION_MARKER, combined)
+
+    def test_budget_shared_between_files(self):
+        """Test that over budget, short files stay whole and long ones are cut at a line break."""
+        short = FileText("01_a.png", text="Jane Doe\nEngineer")
+        long_1 = FileText("02_b.png", text="\n".join(f"Experience line {i}" for i in range(100)))
+        long_2 = FileText("03_c.png", text="\n".join(f"Education line {i}" for i in range(100)))
+        combined = combine_file_texts([short, long_1, long_2], 417)
+
+        self.assertEqual(short.truncated_chars, 0)
+        self.assertIn("Jane Doe\nEngineer", combined)
+        for file in (long_1, long_2):
+            kept = len(file.text) - file.truncated_chars
+            self.assertLessEqual(kept, 200)
+            self.assertGreater(kept, 100)
+            self.assertTrue(file.text[kept:].startswith("\n"))
+        self.assertEqual(combined.count(TRUNCATION_MARKER), 2)
+        self.assertEqual(summarize_file_texts([short, long_1, long_2])["truncated"], 2)
+
+    def test_single_line_text_cut_between_words(self):
+        """Test that text without line breaks is not cut mid-word."""
+        words = [f"word{i}" for i in range(100)]
+        file = FileText("01_a.png", text=" ".join(words))
+        combined = combine_file_texts([file], 100)
+
+        kept = file.text[:len(file.text) - file.truncated_chars]
+        self.assertGreater(len(kept), 50)
+        self.assertEqual(kept.split(), words[:len(kept.split())])
+        self.assertTrue(file.text[len(kept):].startswith(" "))
+        self.assertIn(kept + TRUNCATION_MARKER, combined)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the parse caches
+Tests memoized location/date parsing, hit counters and parsing each distinct
+string once per CV
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.cv_extraction.date_validator import DateValidator
+from src.core.cv_extraction.location_parser import (
+    _parse_location, normalize_country, parse_location_fields, parse_location_string
+)
+from src.core.cv_extraction.location_processor import location_processor
+from src.core.cv_extraction.parse_cache import clear_parse_caches, get_parse_cache_stats, parse_cache
+
+LOCATIONS = [
+    "Tel Aviv, Israel", "Los Angeles, CA", "Seattle, WA, USA", "London, United Kingdom",
+    "1515 PACIFIC AVE, LOS ANGELES, CA 90291, UNITED STATES", "Milan", "Remote", "Boston, MA, 02134, USA"
+]
+
+
+class TestParseCache(unittest.TestCase):
+    """Test the parse_cache decorator and its stats."""
+
+    def setUp(self):
+        clear_parse_caches()
+
+    def test_hit_counters(self):
+        """Test that repeated strings are counted as hits."""
+        for _ in range(3):
+            normalize_country("usa")
+        stats = get_parse_cache_stats()["country"]
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (2, 1, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 0.667)
+
+    def test_bounded(self):
+        """Test that a cache never holds more than maxsize entries."""
+        square = parse_cache("test_square", maxsize=2)(lambda x: x * x)
+        for x in range(5):
+            square(x)
+        self.assertEqual(get_parse_cache_stats()["test_square"]["size"], 2)
+
+    def test_clear(self):
+        """Test that clearing resets entries and counters."""
+        parse_location_fields("Tel Aviv, Israel")
+        clear_parse_caches()
+        self.assertEqual(get_parse_cache_stats()["location"]["misses"], 0)
+        self.assertEqual(get_parse_cache_stats()["location"]["size"], 0)
+
+
+class TestMemoizedLocations(unittest.TestCase):
+    """Test memoized location parsing."""
+
+    def test_matches_uncached_parser(self):
+        """Test that cached results match parsing from scratch."""
+        for location in LOCATIONS:
+            with self.subTest(location=location):
+                expected = _parse_location(location)
+                parse_location_fields(location)
+                self.assertEqual(parse_location_string(location), expected)
+
+    def test_returned_location_is_fresh(self):
+        """Test that modifying a returned Location does not affect later results."""
+        location = parse_location_string("Tel Aviv, Israel")
+        location.city = "Haifa"
+        self.assertEqual(parse_location_string("Tel Aviv, Israel").city, "Tel Aviv")
+
+    def test_items_parse_distinct_strings_once(self):
+        """Test that a list of items parses each distinct location once."""
+        items = [
+            {'jobTitle': 'A', 'location': "Tel Aviv, Israel"},
+            {'jobTitle': 'B', 'location': "Tel Aviv, Israel"},
+            {'jobTitle': 'C', 'location': {'city': 'Tel Aviv', 'country': 'Israel'}},
+            {'jobTitle': 'D', 'location': None},
+            {'jobTitle': 'E'},
+        ]
+        with patch('src.core.cv_extraction.location_processor.parse_location_fields',
+                   wraps=parse_location_fields) as parse:
+            location_processor.process_items_with_location(items, "experience")
+
+        self.assertEqual(parse.call_count, 1)
+        expected = {'city': 'Tel Aviv', 'state': None, 'country': 'Israel'}
+        self.assertEqual([item.get('location') for item in items],
+                         [expected, expected, expected, {'city': None, 'state': None, 'country': None}, None])
+
+    def test_empty_dict_location_kept(self):
+        """Test that a dict without location parts is returned unchanged."""
+        location = {'city': None, 'note': 'n/a'}
+        self.assertIs(location_processor.process_location_field(location), location)
+
+
+class TestMemoizedDates(unittest.TestCase):
+    """Test memoized date parsing."""
+
+    def setUp(self):
+        self.validator = DateValidator()
+
+    def test_current_date_not_cached(self):
+        """Test that "Present" follows the validator's current date."""
+        self.validator.current_year, self.validator.current_month = 2030, 6
+        self.assertEqual(self.validator.parse_date("Present"), (2030, 6))
+        other = DateValidator()
+        self.assertEqual(other.parse_date("Present"), (other.current_year, other.current_month))
+
+    def test_explicit_dates(self):
+        """Test explicit dates through the cache."""
+        for _ in range(2):
+            self.assertEqual(self.validator.parse_date("Sept. 2019"), (2019, 9))
+            self.assertEqual(self.validator.parse_date("2019"), (2019, 1))
+            self.assertIsNone(self.validator.parse_date("sometime"))
+
+    def test_experience_dates_parsed_once_per_item(self):
+        """Test that overlap checks parse each item's dates once, not once per pair."""
+        experience = [
+            {'jobTitle': str(i), 'dateRange': {'startDate': f"Jan {2010 + i}", 'endDate': f"Mar {2012 + i}"}}
+            for i in range(5)
+        ]
+        with patch.object(DateValidator, 'parse_date', autospec=True, side_effect=DateValidator.parse_date) as parse:
+            issues = self.validator.validate_experience_dates({'experience': {'experienceItems': experience}})
+
+        self.assertEqual(parse.call_count, 2 * len(experience))
+        self.assertEqual(len(issues), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for PdfEngine
+Tests page-order merging, parallel extraction and per-page OCR of pages
+without a text layer
+"""
+
+import io
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import PyPDF2
+
+from src.core.local.pdf_engine import PdfEngine
+from src.core.local.text_extractor import text_extractor
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+MULTI_PAGE_PDF = REPO_ROOT / "data/cv_examples/pdf_examples/pdf/Cape-Town-Resume-Template-Retro-Creative.pdf"
+
+
+def legacy_extract_pdf(path):
+    """TextExtractor._extract_pdf before PdfEngine."""
+    reader = PyPDF2.PdfReader(str(path))
+    parts = [(page.extract_text() or "").strip() for page in reader.pages]
+    return "\n\n".join(part for part in parts if part)
+
+
+class TestPdfEngine(unittest.TestCase):
+    """Test PdfEngine.extract."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Text pages with a blank "scanned" page in the middle
+        writer = PyPDF2.PdfWriter()
+        reader = PyPDF2.PdfReader(str(MULTI_PAGE_PDF))
+        writer.add_page(reader.pages[0])
+        writer.add_blank_page(width=612, height=792)
+        writer.add_page(reader.pages[1])
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.mixed_pdf = Path(cls.tmp_dir.name) / "mixed.pdf"
+        with open(cls.mixed_pdf, "wb") as f:
+            writer.write(f)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def test_serial_matches_legacy(self):
+        """Test that serial extraction gives the same text as before."""
+        result = PdfEngine(max_workers=1).extract(MULTI_PAGE_PDF)
+        self.assertFalse(result.parallel)
+        self.assertEqual(result.text, legacy_extract_pdf(MULTI_PAGE_PDF))
+
+    def test_parallel_keeps_page_order(self):
+        """Test that pages extracted in worker processes are merged in page order."""
+        engine = PdfEngine(parallel_min_pages=2, max_workers=2)
+        try:
+            result = engine.extract(MULTI_PAGE_PDF)
+        finally:
+            engine.shutdown()
+        self.assertTrue(result.parallel)
+        self.assertEqual([page.number for page in result.pages], [1, 2, 3])
+        self.assertEqual(result.text, legacy_extract_pdf(MULTI_PAGE_PDF))
+
+    def test_only_blank_pages_are_ocred(self):
+        """Test that OCR gets just the page without text, as a one-page PDF."""
+        calls = []
+
+        def ocr_page(page_bytes):
+            calls.append(len(PyPDF2.PdfReader(io.BytesIO(page_bytes)).pages))
+            return "Certificate of Completion"
+
+        result = PdfEngine(max_workers=1).extract(self.mixed_pdf, ocr_page=ocr_page)
+        self.assertEqual(calls, [1])
+        self.assertEqual(result.ocr_pages, [2])
+        self.assertEqual([page.source for page in result.pages], ["text", "ocr", "text"])
+        first, _, last = legacy_extract_pdf(self.mixed_pdf).partition("\n\n")
+        self.assertEqual(result.text, f"{first}\n\nCertificate of Completion\n\n{last}")
+
+    def test_blank_page_without_ocr(self):
+        """Test that a blank page is left empty when no OCR is available."""
+        result = PdfEngine(max_workers=1).extract(self.mixed_pdf)
+        self.assertEqual([page.source for page in result.pages], ["text", "empty", "text"])
+        self.assertEqual(result.text, legacy_extract_pdf(self.mixed_pdf))
+
+    def test_ocr_failure_leaves_page_empty(self):
+        """Test that an OCR error only affects its own page."""
+        def ocr_page(page_bytes):
+            raise RuntimeError("quota exceeded")
+
+        result = PdfEngine(max_workers=1).extract(self.mixed_pdf, ocr_page=ocr_page)
+        self.assertEqual(result.pages[1].source, "empty")
+        self.assertEqual(result.text, legacy_extract_pdf(self.mixed_pdf))
+
+    def test_page_timings(self):
+        """Test that every page has a timing, including OCR time."""
+        result = PdfEngine(max_workers=1).extract(self.mixed_pdf, ocr_page=lambda page_bytes: "text")
+        self.assertEqual(sorted(result.timings()), [1, 2, 3])
+        self.assertTrue(all(page.extract_seconds > 0 for page in result.pages))
+        self.assertGreater(result.pages[1].ocr_seconds, 0)
+        self.assertEqual(result.pages[0].ocr_seconds, 0)
+
+    def test_text_extractor_ocrs_scanned_page(self):
+        """Test that TextExtractor keeps the text pages and OCRs only the scanned one."""
+        textract = MagicMock()
+        textract.detect_document_text.return_value = {"Blocks": [{"BlockType": "LINE", "Text": "AWS Certified"}]}
+        with patch.object(text_extractor, "vision_client", None), \
+                patch.object(text_extractor, "textract_client", textract):
+            text = text_extractor.extract_text(str(self.mixed_pdf), preserve_line_breaks=True)
+
+        textract.detect_document_text.assert_called_once()
+        self.assertIn("AWS Certified", text)
+        self.assertEqual(text.replace("AWS Certified\n", ""),
+                         text_extractor._normalize_text(legacy_extract_pdf(self.mixed_pdf), True))
+
+
+if __name__ == "__main__":
+    unittest.main()
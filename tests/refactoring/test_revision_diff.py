@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Revision Diffing
+Tests heading segmentation and the mapping of edits to the sections to re-extract
+"""
+
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.cv_extraction.revision_diff import HEADER, diff_revision, segment_lines, normalize_lines
+
+
+CV_TEXT = """Jane Doe
+Senior Software Engineer
+jane@example.com | Lisbon
+
+WORK EXPERIENCE
+Acme Corp - Software Engineer (2019 - Present)
+Built the billing platform in Python
+Globex - Junior Developer (2016 - 2019)
+Maintained internal tools
+
+Education
+MSc Computer Science, University of Lisbon (2016)
+
+Skills & Competencies:
+Python, PostgreSQL, Kubernetes
+
+Hobbies
+Chess, Hiking
+"""
+
+
+class TestSegmentation(unittest.TestCase):
+    """Test that lines are labelled with the section of the heading above them."""
+
+    def test_headings_label_following_lines(self):
+        """Test heading variants (case, punctuation, ampersand) and the header block."""
+        lines = normalize_lines(CV_TEXT)
+        labels = dict(zip(lines, segment_lines(lines)))
+
+        self.assertEqual(labels["Jane Doe"], HEADER)
+        self.assertEqual(labels["Maintained internal tools"], "experience")
+        self.assertEqual(labels["MSc Computer Science, University of Lisbon (2016)"], "education")
+        self.assertEqual(labels["Python, PostgreSQL, Kubernetes"], "skills")
+        self.assertEqual(labels["Chess, Hiking"], "hobbies")
+
+    def test_long_lines_are_not_headings(self):
+        """Test that content lines starting like a heading don't open a section."""
+        lines = ["Jane Doe", "Skills", "Skills in Python, Go and distributed systems design patterns"]
+        self.assertEqual(segment_lines(lines), [HEADER, "skills", "skills"])
+
+
+class TestDiffRevision(unittest.TestCase):
+    """Test which sections an edit to a CV re-extracts."""
+
+    def _diff(self, new_text, prior_sections=()):
+        return diff_revision(CV_TEXT, new_text, prior_sections)
+
+    def test_identical_text_changes_nothing(self):
+        """Test that whitespace-only differences re-extract no section."""
+        diff = self._diff(CV_TEXT.replace("Chess, Hiking", "Chess,   Hiking") + "\n\n")
+
+        self.assertFalse(diff.full)
+        self.assertEqual(diff.sections, set())
+
+    def test_edit_maps_to_its_section(self):
+        """Test that a changed line only re-extracts the section it is in."""
+        diff = self._diff(CV_TEXT.replace("Chess, Hiking", "Chess, Hiking, Sailing"))
+
+        self.assertEqual(diff.sections, {"hobbies"})
+        self.assertEqual(diff.changed_lines, 1)
+
+    def test_experience_edit_includes_dependents(self):
+        """Test that an added job also re-extracts the sections derived from experience."""
+        diff = self._diff(CV_TEXT.replace(
+            "Maintained internal tools", "Maintained internal tools\nInitech - Intern (2015)"
+        ))
+
+        self.assertEqual(diff.sections, {"experience", "hero", "summary"})
+
+    def test_new_section_and_header_edit(self):
+        """Test that a new headed section and a header edit are both picked up."""
+        diff = self._diff(
+            CV_TEXT.replace("Lisbon\n", "Porto\n") + "\nLanguages\nPortuguese, English\n"
+        )
+
+        self.assertEqual(diff.sections, {"hero", "contact", "summary", "languages"})
+
+    def test_unlocated_prior_sections_are_redone(self):
+        """Test that sections with no heading are re-extracted whenever the text changes."""
+        new_text = CV_TEXT.replace("Chess, Hiking", "Chess")
+
+        self.assertEqual(self._diff(new_text, ["hobbies", "achievements"]).sections, {"hobbies", "achievements"})
+        self.assertEqual(self._diff(CV_TEXT, ["achievements"]).sections, set())
+
+    def test_unknown_heading_marks_additions_unlocated(self):
+        """Test that lines added under a heading we don't recognize are flagged."""
+        for added in ("Certifications & Training\nAWS Solutions Architect (2023)",
+                      "Awards Received\nEmployee of the Year 2022"):
+            diff = self._diff(CV_TEXT + "\n" + added + "\n", ["skills"])
+            self.assertTrue(diff.unlocated_additions, added)
+
+    def test_content_edits_are_located(self):
+        """Test that ordinary content lines and known headings are not flagged."""
+        edits = [
+            CV_TEXT.replace("Chess, Hiking", "Chess, Hiking, Sailing"),
+            CV_TEXT.replace("Maintained internal tools", "Maintained internal tools\nInitech - Intern (2015)"),
+            CV_TEXT + "\nLanguages\nPortuguese, English\n",
+            CV_TEXT.replace("Jane Doe", "Jane Smith")
+        ]
+        for new_text in edits:
+            self.assertFalse(self._diff(new_text).unlocated_additions)
+
+    def test_large_rewrite_is_full(self):
+        """Test that rewriting most of the CV falls back to a full extraction."""
+        diff = self._diff("John Smith\nChef\n\nExperience\nRestaurant - Head Chef (2010 - 2020)\n")
+
+        self.assertTrue(diff.full)
+        self.assertGreater(diff.changed_ratio, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -228,6 +228,14 @@ class TestSectionExtractorEdgeCases(unittest.TestCase):
         result = self.extractor.parse_llm_response("claude", None, "test")
         self.assertIn(result, [{}, None])
     
+    def test_is_empty_response(self):
+        """Test that only a parsed empty answer counts as an absent section."""
+        self.assertTrue(SectionExtractor.is_empty_response("claude", "{}", "hobbies"))
+        self.assertTrue(SectionExtractor.is_empty_response("claude", "```json\n{}\n```", "hobbies"))
+        self.assertFalse(SectionExtractor.is_empty_response("claude", "", "hobbies"))
+        self.assertFalse(SectionExtractor.is_empty_response("claude", "not json", "hobbies"))
+        self.assertFalse(SectionExtractor.is_empty_response("claude", '{"hobbies": ["Chess"]}', "hobbies"))
+    
     def test_nested_json_extraction(self):
         """Test extraction of nested JSON structures."""
         response = '''
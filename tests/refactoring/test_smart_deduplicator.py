@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for SmartDeduplicator
+Tests single-pass normalization and that pruned grouping matches pairwise comparison
+"""
+
+import unittest
+import random
+import re
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.local.smart_deduplicator import SmartDeduplicator, SYNONYM_REPLACEMENTS
+
+
+def sequential_normalize(text):
+    """Reference: one re.sub per synonym, as the deduplicator used to do."""
+    text = ' '.join(text.split()).lower().rstrip('.,;:!?')
+    text = re.sub(r'(\d+)\s*%', r'\1%', text)
+    text = re.sub(r'\$\s*(\d+)', r'$\1', text)
+    for old, new in SYNONYM_REPLACEMENTS.items():
+        text = re.sub(r'\b' + old + r'\b', new, text)
+    return text
+
+
+def pairwise_groups(deduplicator, items):
+    """Reference grouping: score every remaining pair with calculate_similarity."""
+    groups, processed = [], set()
+    for i, (text1, _) in enumerate(items):
+        if i in processed:
+            continue
+        group = [i] + [j for j in range(i + 1, len(items)) if j not in processed
+                       and deduplicator.calculate_similarity(text1, items[j][0]) >= deduplicator.threshold]
+        groups.append(group)
+        processed.update(group)
+    return groups
+
+
+def synthetic_bullets(count, seed=7):
+    rng = random.Random(seed)
+    verbs = ["Led", "Managed", "Reduced", "Increased", "Built", "Designed", "Automated", "Optimized", "Oversaw"]
+    objects = ["cloud migration", "billing platform", "team of 12 engineers", "group of developers",
+               "hiring process", "incident response", "analytics dashboard"]
+    tails = ["", " by 40%", " by 25 %", ", saving $ 2M annually", " across 8 regions", " ahead of schedule"]
+    bullets = []
+    for i in range(count):
+        if i % 6 == 5 and bullets:
+            bullets.append(rng.choice(bullets).replace("Led", "Directed") + " .")
+        else:
+            bullets.append(f"{rng.choice(verbs)} {rng.choice(objects)}{rng.choice(tails)}.")
+    return [(text, f"source{i % 4}") for i, text in enumerate(bullets)]
+
+
+class TestSmartDeduplicator(unittest.TestCase):
+    """Test SmartDeduplicator functionality."""
+
+    def test_normalize_matches_sequential_replacements(self):
+        """Test that the single alternation regex equals applying synonyms one by one."""
+        deduplicator = SmartDeduplicator()
+        samples = [text for text, _ in synthetic_bullets(60)] + [
+            "Cut costs, lowered churn and  GREW revenue!", "Led a group of of coders",
+            "team of engineers led by me", "Cutting-edge; cutter; cut.", "",
+        ]
+        for sample in samples:
+            self.assertEqual(deduplicator.normalize_text(sample), sequential_normalize(sample))
+
+    def test_grouping_matches_pairwise_comparison(self):
+        """Test that pruned grouping gives the same groups as scoring every pair."""
+        items = synthetic_bullets(80)
+        for threshold in (0.6, 0.85, 0.95):
+            deduplicator = SmartDeduplicator(threshold)
+            expected = pairwise_groups(deduplicator, items)
+            results = deduplicator.deduplicate_achievements(items)
+            self.assertEqual([r['similar_count'] for r in results], [len(g) for g in expected])
+            for result, group in zip(results, expected):
+                self.assertEqual(result['text'], max((items[i][0] for i in group), key=len))
+                self.assertEqual(set(result['sources']), {items[i][1] for i in group})
+
+    def test_similarity_rules(self):
+        """Test exact, metric-boosted and core-word matches."""
+        deduplicator = SmartDeduplicator()
+        self.assertEqual(deduplicator.calculate_similarity("Reduced costs by 20%.", "reduced costs by 20 %"), 1.0)
+        self.assertGreaterEqual(
+            deduplicator.calculate_similarity("Cut cloud costs by 30% in 2022", "Lowered AWS cloud costs 30% in 2022"),
+            0.85)
+        self.assertLess(deduplicator.calculate_similarity("Built the hiring pipeline", "Designed a mobile banking app"),
+                        0.85)
+
+    def test_key_info_technologies(self):
+        """Test that key info finds technologies in any case, but not common prose words."""
+        deduplicator = SmartDeduplicator()
+        info = deduplicator.extract_key_info(
+            "Deployed docker containers on aws and the Cloud with Python and microservices"
+        )
+        self.assertEqual(info['technologies'], ['Docker', 'AWS', 'Cloud', 'Python', 'Microservices'])
+        self.assertEqual(
+            deduplicator.extract_key_info("Go to the Office to Word the Teams update")['technologies'], []
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
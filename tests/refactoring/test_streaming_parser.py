@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for IncrementalJSONParser
+Tests early emission of array items from streamed LLM responses
+"""
+
+import unittest
+import json
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.cv_extraction.streaming_parser import IncrementalJSONParser
+
+
+def feed_in_chunks(parser, text, size):
+    """Feed text to the parser in fixed-size chunks, collecting emitted items."""
+    emitted = []
+    for i in range(0, len(text), size):
+        emitted.extend(parser.feed(text[i:i + size]))
+    return emitted
+
+
+class TestIncrementalJSONParser(unittest.TestCase):
+    """Test IncrementalJSONParser functionality."""
+
+    def setUp(self):
+        self.response = json.dumps({
+            "sectionTitle": "Experience",
+            "experienceItems": [
+                {"jobTitle": "Engineer", "responsibilitiesAndAchievements": ["Built {things}", "Led \"team\""]},
+                {"jobTitle": "Manager", "companyName": "Acme [Corp]"}
+            ]
+        })
+
+    def test_items_emitted_in_order(self):
+        """Each completed array item is emitted once with its key."""
+        parser = IncrementalJSONParser()
+        emitted = feed_in_chunks(parser, self.response, 7)
+
+        self.assertEqual([key for key, _ in emitted], ["experienceItems", "experienceItems"])
+        self.assertEqual(emitted[0][1]["jobTitle"], "Engineer")
+        self.assertEqual(emitted[1][1]["companyName"], "Acme [Corp]")
+        self.assertTrue(parser.is_complete)
+
+    def test_item_emitted_before_stream_ends(self):
+        """The first item is available before the rest of the response arrives."""
+        parser = IncrementalJSONParser()
+        cut = self.response.index('{"jobTitle": "Manager"')
+
+        emitted = parser.feed(self.response[:cut])
+
+        self.assertEqual(len(emitted), 1)
+        self.assertFalse(parser.is_complete)
+
+    def test_string_items_and_markdown_prefix(self):
+        """String arrays are emitted and leading prose is skipped."""
+        seen = []
+        parser = IncrementalJSONParser(on_item=lambda key, item: seen.append((key, item)))
+        text = 'Here is the JSON:\n```json\n{"hobbies": ["Chess", "Hiking \\"trails\\""]}\n```'
+
+        feed_in_chunks(parser, text, 3)
+
+        self.assertEqual(seen, [("hobbies", "Chess"), ("hobbies", 'Hiking "trails"')])
+
+    def test_root_array(self):
+        """A bare array response emits items with no key."""
+        parser = IncrementalJSONParser()
+        emitted = feed_in_chunks(parser, '[{"a": 1}, {"b": [2, 3]}]', 4)
+
+        self.assertEqual(emitted, [(None, {"a": 1}), (None, {"b": [2, 3]})])
+
+    def test_reset_discards_state(self):
+        """Reset allows a retried stream to start from scratch."""
+        parser = IncrementalJSONParser()
+        parser.feed(self.response[:40])
+        parser.reset()
+
+        emitted = feed_in_chunks(parser, self.response, 11)
+
+        self.assertEqual(len(emitted), 2)
+        self.assertEqual(parser.text, self.response)
+
+    def test_reset_reports_discarded_items(self):
+        """Reset calls on_reset only when items already emitted are discarded."""
+        resets = []
+        parser = IncrementalJSONParser(on_reset=lambda: resets.append(len(parser.items)))
+        parser.reset()
+        parser.feed(self.response[:40])
+        parser.reset()
+        self.assertEqual(resets, [])
+
+        feed_in_chunks(parser, self.response, 11)
+        parser.reset()
+        self.assertEqual(resets, [0])
+
+    def test_callback_failure_does_not_break_parsing(self):
+        """Exceptions from the consumer are swallowed."""
+        def failing_callback(key, item):
+            raise RuntimeError("consumer failed")
+
+        parser = IncrementalJSONParser(on_item=failing_callback)
+        emitted = feed_in_chunks(parser, self.response, 5)
+
+        self.assertEqual(len(emitted), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for TechnologyMatcher
+Tests whole-word matching, canonical names, positions and extending the
+shared technology dictionary
+"""
+
+import unittest
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.cv_extraction.extraction_config import ExtractionConfig, extraction_config
+from src.core.cv_extraction.tech_matcher import TechMatch, TechnologyMatcher
+
+
+class TestTechnologyMatcher(unittest.TestCase):
+    """Test TechnologyMatcher."""
+
+    def setUp(self):
+        self.matcher = TechnologyMatcher(
+            {'languages': ['Python', 'C++', 'C#', 'Go'], 'tools': ['GitLab', 'GitLab CI'], 'concepts': ['API']},
+            {'golang': 'Go'}
+        )
+
+    def test_canonical_names_and_positions(self):
+        """Test that matches carry canonical names, categories and positions."""
+        text = "Built python and GOLANG services"
+        self.assertEqual(self.matcher.find_all(text), [
+            TechMatch('Python', 'languages', 6, 12),
+            TechMatch('Go', 'languages', 17, 23),
+        ])
+
+    def test_whole_words_only(self):
+        """Test that terms inside longer words are not matched."""
+        self.assertEqual(self.matcher.names("Pythonic code, going forward, cargo"), [])
+
+    def test_symbol_terms(self):
+        """Test terms ending in symbols, which \\b cannot bound."""
+        self.assertEqual(self.matcher.names("Wrote C++, C# and C code."), ['C++', 'C#'])
+
+    def test_longest_term_wins(self):
+        """Test that overlapping terms resolve to the longest one."""
+        self.assertEqual(self.matcher.names("Set up GitLab CI pipelines on GitLab"), ['GitLab CI', 'GitLab'])
+
+    def test_names_unique_and_skip_categories(self):
+        """Test that names are unique in order of appearance and categories can be skipped."""
+        text = "Python API, Go API, python again"
+        self.assertEqual(self.matcher.names(text), ['Python', 'API', 'Go'])
+        self.assertEqual(self.matcher.names(text, skip_categories=('concepts',)), ['Python', 'Go'])
+
+    def test_canonical_lookup(self):
+        """Test lookup of whole terms and aliases."""
+        self.assertEqual(self.matcher.canonical(' GoLang '), 'Go')
+        self.assertIsNone(self.matcher.canonical('Python 3'))
+
+    def test_add_terms_recompiles_once(self):
+        """Test that the pattern is reused until terms are added."""
+        pattern = self.matcher.pattern
+        self.matcher.names("Python")
+        self.assertIs(self.matcher.pattern, pattern)
+
+        self.matcher.add_terms({'languages': ['Elixir']})
+        self.assertIsNot(self.matcher.pattern, pattern)
+        self.assertEqual(self.matcher.names("Elixir and Python"), ['Elixir', 'Python'])
+
+    def test_unknown_alias_rejected(self):
+        """Test that aliases must point at a known technology."""
+        with self.assertRaises(ValueError):
+            self.matcher.add_aliases({'js': 'JavaScript'})
+
+    def test_empty_dictionary(self):
+        """Test that an empty matcher finds nothing."""
+        self.assertEqual(TechnologyMatcher().find_all("Python"), [])
+
+
+class TestSharedTechMatcher(unittest.TestCase):
+    """Test the matcher built from ExtractionConfig."""
+
+    def test_matcher_cached(self):
+        """Test that the config builds the matcher once."""
+        self.assertIs(extraction_config.get_tech_matcher(), extraction_config.get_tech_matcher())
+
+    def test_config_dictionary(self):
+        """Test matching against the configured dictionary and aliases."""
+        matcher = extraction_config.get_tech_matcher()
+        self.assertEqual(
+            matcher.names("Deployed NodeJS microservices to AWS with Docker and GitHub Actions"),
+            ['Node.js', 'Microservices', 'AWS', 'Docker', 'GitHub Actions']
+        )
+
+    def test_compiled_tech_patterns(self):
+        """Test that the compiled patterns wrap the shared matcher's alternation."""
+        patterns = extraction_config.get_compiled_tech_patterns()
+        self.assertEqual(patterns, [extraction_config.get_tech_matcher().pattern])
+        self.assertEqual(patterns[0].findall("Used docker and C++"), ['docker', 'C++'])
+
+    def test_key_info_matcher(self):
+        """Test that free-text key info ignores prose words the full dictionary would report."""
+        text = "Go to Office to Word the Teams update on Cloud AI via RESTful API in Python and nodejs"
+        matcher = extraction_config.get_key_info_tech_matcher()
+        self.assertIs(matcher, extraction_config.get_key_info_tech_matcher())
+        self.assertEqual(matcher.names(text), ['Cloud', 'AI', 'REST', 'API', 'Python', 'Node.js'])
+
+    def test_key_info_matcher_ignores_case(self):
+        """Test that lowercase mentions are found, as by the previous key-info pattern."""
+        text = "Deployed docker containers on aws and the Cloud with Python and microservices"
+        self.assertEqual(
+            extraction_config.get_key_info_tech_matcher().names(text),
+            ['Docker', 'AWS', 'Cloud', 'Python', 'Microservices']
+        )
+
+    def test_add_tech_terms(self):
+        """Test extending the dictionary from config updates the built matcher."""
+        config = ExtractionConfig()
+        matcher = config.get_tech_matcher()
+        config.add_tech_terms('languages', ['Elixir'], {'ex': 'Elixir'})
+
+        self.assertIn('Elixir', config.TECH_PATTERNS['languages'])
+        self.assertEqual(matcher.names("Wrote ex and Elixir"), ['Elixir'])
+        self.assertNotIn('Elixir', extraction_config.TECH_PATTERNS['languages'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for TextNormalizer
+Tests equivalence with the previous replace/regex normalization and the
+line-preserving mode
+"""
+
+import unittest
+import random
+import re
+import sys
+import unicodedata
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from src.core.local.text_normalizer import text_normalizer
+
+# Characters the normalizer treats specially, plus Unicode whitespace and digits
+ALPHABET = ("ab fi 12%.\t\n\r\x0b\x0c\x85\u2028\u3000\xa0\u200b\u200c\u200d\ufeff"
+            "\ufb00\ufb01\ufb02\ufb03\ufb04\ufb05\ufb06\u2018\u2019\u201c\u201d\u2013\u2014\u2026"
+            "\u0301\u0663\uff05\ufe58")
+
+
+def legacy_normalize_text(text):
+    """TextExtractor._normalize_text before TextNormalizer."""
+    if not text:
+        return text
+    for ligature, replacement in {'\ufb00': 'ff', '\ufb01': 'fi', '\ufb02': 'fl', '\ufb03': 'ffi',
+                                  '\ufb04': 'ffl', '\ufb05': 'st', '\ufb06': 'st'}.items():
+        text = text.replace(ligature, replacement)
+    text = unicodedata.normalize('NFKC', text)
+    for old_char, new_char in {'\u2019': "'", '\u2018': "'", '\u201c': '"', '\u201d': '"',
+                               '\u2013': '-', '\u2014': '-', '\u2026': '...', '\xa0': ' ',
+                               '\u200b': '', '\u200c': '', '\u200d': '', '\ufeff': ''}.items():
+        text = text.replace(old_char, new_char)
+    text = re.sub(r'(\d+)\s+%', r'\1%', text)
+    text = re.sub(r'\s+', ' ', text)
+    lines = text.split('\n')
+    return '\n'.join(line.strip() for line in lines if line.strip())
+
+
+class TestTextNormalizer(unittest.TestCase):
+    """Test TextNormalizer.normalize."""
+
+    def test_matches_legacy_normalization(self):
+        """Test random text against the previous implementation."""
+        rng = random.Random(7)
+        for _ in range(2000):
+            text = ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40)))
+            with self.subTest(text=text):
+                self.assertEqual(text_normalizer.normalize(text), legacy_normalize_text(text))
+
+    def test_common_fixes(self):
+        """Test ligatures, quotes, dashes, zero-width characters and percentages."""
+        text = "E\ufb03cient  \u201cwork\u201d \u2014 it\u2019s   12 %\u200b\n\nnext"
+        self.assertEqual(text_normalizer.normalize(text), 'Efficient "work" - it\'s 12% next')
+
+    def test_empty(self):
+        """Test that empty input is returned as is."""
+        self.assertEqual(text_normalizer.normalize(""), "")
+        self.assertIsNone(text_normalizer.normalize(None))
+
+    def test_preserve_line_breaks(self):
+        """Test that line structure is kept, trimmed and without blank lines."""
+        text = "  Jane  Doe \r\n\n Senior\tEngineer\u2028Tel Aviv \u2014 95 %\n   \n"
+        self.assertEqual(
+            text_normalizer.normalize(text, preserve_line_breaks=True),
+            "Jane Doe\nSenior Engineer\nTel Aviv - 95%"
+        )
+
+    def test_percent_not_joined_across_lines(self):
+        """Test that the percentage fix stays within a line when lines are kept."""
+        self.assertEqual(text_normalizer.normalize("Grew 40\n% of", preserve_line_breaks=True), "Grew 40\n% of")
+        self.assertEqual(text_normalizer.normalize("Grew 40\n% of"), "Grew 40% of")
+
+
+if __name__ == "__main__":
+    unittest.main()
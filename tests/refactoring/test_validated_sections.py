@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for validated section tracking
+Tests that only sections no enhancer declares are reused, that enhancers leave
+every other section alone, and that assemble_cv_data matches CVData(**data)
+"""
+
+import unittest
+import copy
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import patch
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from pydantic import ValidationError
+
+from src.core.cv_extraction.data_extractor import DataExtractor
+from src.core.cv_extraction.enhancement_engine import EnhancementEngine
+from src.core.cv_extraction.enhancement_processor import (
+    ENHANCERS, demographic_extractor, enhancement_engine, enhancement_processor
+)
+from src.core.cv_extraction.section_extractor import SectionExtractor
+from src.core.cv_extraction.validated_sections import ValidatedSection, assemble_cv_data
+from src.core.schemas.unified_nullable import CVData, HeroSection
+
+from tests.refactoring.test_enhancement_engine import load_golden_inputs
+
+
+def validate_sections(data):
+    """Run each known section through SectionExtractor.validate_section"""
+    extractor = SectionExtractor(DataExtractor.SECTION_SCHEMAS)
+    return {
+        name: extractor.validate_section(name, value, DataExtractor.SECTION_SCHEMAS[name])
+        for name, value in data.items()
+        if name in DataExtractor.SECTION_SCHEMAS and isinstance(value, dict)
+    }
+
+
+@contextmanager
+def passthrough_demographics():
+    """The demographic stages only see their own section; pass it through unchanged"""
+    passthrough = lambda section, text: section
+    with patch.object(demographic_extractor, 'enhance_contact_with_demographics', side_effect=passthrough), \
+            patch.object(demographic_extractor, 'merge_externships_to_experience', side_effect=passthrough), \
+            patch.object(demographic_extractor, 'enhance_volunteer_with_activities', side_effect=passthrough):
+        yield
+
+
+class TestValidatedSection(unittest.TestCase):
+    """Test the ValidatedSection dict."""
+
+    def setUp(self):
+        self.model = HeroSection(fullName="Jane Doe", professionalTitle="Engineer")
+
+    def test_behaves_as_dump(self):
+        """Test that the section equals the model dump and keeps the model."""
+        section = ValidatedSection(self.model)
+        self.assertEqual(section, self.model.model_dump())
+        self.assertIs(section.model, self.model)
+
+    def test_copies_are_plain_dicts(self):
+        """Test that copies drop the model."""
+        for copied in (copy.copy(ValidatedSection(self.model)), copy.deepcopy(ValidatedSection(self.model))):
+            self.assertIs(type(copied), dict)
+            self.assertEqual(copied, self.model.model_dump())
+
+
+class TestAssembleCVData(unittest.TestCase):
+    """Test assemble_cv_data."""
+
+    def test_reuses_untouched_model(self):
+        """Test that a section outside the touched sections ends up in CVData as is."""
+        hero = HeroSection(fullName="Jane Doe")
+        cv_data = assemble_cv_data({'hero': ValidatedSection(hero)}, frozenset())
+        self.assertIs(cv_data.hero, hero)
+        self.assertEqual(cv_data, CVData(hero=hero.model_dump()))
+
+    def test_touched_section_revalidated(self):
+        """Test that a touched section is validated from its dict."""
+        section = ValidatedSection(HeroSection(fullName="Jane Doe"))
+        section['fullName'] = "John Doe"
+        self.assertEqual(assemble_cv_data({'hero': section}, {'hero'}).hero.fullName, "John Doe")
+
+    def test_invalid_section_raises(self):
+        """Test that invalid section data raises CVData's ValidationError."""
+        with self.assertRaises(ValidationError):
+            assemble_cv_data({'hero': ValidatedSection(HeroSection()),
+                              'summary': {'summaryText': ['not', 'text']}}, frozenset())
+
+    def test_unknown_keys_ignored(self):
+        """Test that keys CVData does not know are ignored like CVData(**data)."""
+        cv_data = assemble_cv_data({'hero': ValidatedSection(HeroSection(fullName="Jane")), 'extra': {'a': 1}},
+                                   frozenset())
+        self.assertEqual(cv_data.hero.fullName, "Jane")
+
+
+class TestUntouchedSections(unittest.TestCase):
+    """Reuse is only safe if enhancers never modify sections they do not declare."""
+
+    def setUp(self):
+        self.inputs = load_golden_inputs()
+
+    def test_reused_sections(self):
+        """Test that hero, skills and languages are the sections no enhancer declares."""
+        untouched = set(DataExtractor.SECTION_SCHEMAS) - enhancement_engine.touched_sections
+        self.assertEqual(untouched, {'hero', 'skills', 'languages'})
+
+    def test_enhancers_keep_to_declared_sections(self):
+        """Test that each enhancer leaves every section it does not declare unchanged."""
+        for enhancer in ENHANCERS:
+            declared = EnhancementEngine([enhancer]).touched_sections
+            for name, data, raw_text in self.inputs:
+                with self.subTest(enhancer=enhancer.name, cv=name):
+                    sections = validate_sections(copy.deepcopy(data))
+                    before = copy.deepcopy(sections)
+                    with passthrough_demographics():
+                        enhanced = EnhancementEngine([enhancer]).run(sections, raw_text)
+                    for section_name in set(before) | set(enhanced):
+                        if section_name not in declared:
+                            self.assertEqual(enhanced.get(section_name), before.get(section_name), section_name)
+
+    def test_matches_cv_data_on_examples(self):
+        """Test assembly after enhancement against CVData(**data) on the example CVs."""
+        for name, data, raw_text in self.inputs:
+            with self.subTest(cv=name):
+                sections = validate_sections(copy.deepcopy(data))
+                with passthrough_demographics():
+                    enhanced = enhancement_processor.enhance_all(sections, raw_text)
+                for section_name in set(enhanced) - enhancement_engine.touched_sections:
+                    self.assertEqual(enhanced[section_name], enhanced[section_name].model.model_dump())
+                expected = CVData(**copy.deepcopy(enhanced))
+                self.assertEqual(assemble_cv_data(enhanced, enhancement_engine.touched_sections), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -163,6 +163,27 @@ def test_metrics_summary_logging():
     print("✅ Metrics summary logging works")
 
 
+def test_tier_metrics():
+    """Test per-tier latency, cost and escalation tracking"""
+    metrics = ExtractionMetrics()
+    
+    metrics.record_llm_call("fast", 0.5, 0.001)
+    metrics.record_llm_call("fast", 1.5, 0.003)
+    metrics.record_llm_call("premium", 4.0, 0.05)
+    metrics.record_escalation("hobbies", "fast")
+    
+    tiers = metrics.to_dict()["tiers"]
+    
+    assert tiers["fast"]["calls"] == 2
+    assert tiers["fast"]["average_seconds"] == 1.0
+    assert tiers["fast"]["escalation_rate"] == 0.5
+    assert tiers["premium"]["escalations"] == 0
+    assert abs(metrics.estimated_cost - 0.054) < 1e-9
+    assert metrics.escalated_sections == ["hobbies"]
+    
+    print("✅ Tier metrics work")
+
+
 def run_all_tests():
     """Run all metrics tests"""
     print("\n" + "="*60)
@@ -175,6 +196,7 @@ def run_all_tests():
     test_section_timer()
     test_token_estimation()
     test_metrics_summary_logging()
+    test_tier_metrics()
     
     # Run async test
     asyncio.run(test_concurrent_metrics())
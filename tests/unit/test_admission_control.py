@@ -0,0 +1,147 @@
+"""
+Unit tests for admission control
+Tests bounded concurrency, the bounded wait queue, CoDel-style overload
+detection and 503 responses with Retry-After
+"""
+import asyncio
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.admission_control import AdmissionConfig, AdmissionController, AdmissionRejected
+
+
+def controller(**overrides):
+    config = dict(max_concurrent=2, max_queue=2, target_delay=0.05, interval=0.2)
+    config.update(overrides)
+    return AdmissionController("test", AdmissionConfig(**config))
+
+
+async def hold(admission, seconds, log, name):
+    async with admission.admit():
+        log.append(name)
+        await asyncio.sleep(seconds)
+
+
+class TestAdmit:
+    """Test AdmissionController.admit"""
+
+    def test_runs_up_to_max_concurrent(self):
+        """Test that work beyond max_concurrent waits for a slot, in arrival order"""
+        admission = controller()
+        started = []
+
+        async def scenario():
+            tasks = [asyncio.create_task(hold(admission, 0.05, started, n)) for n in range(4)]
+            await asyncio.sleep(0.01)
+            assert started == [0, 1]
+            assert admission.get_status()["waiting"] == 2
+            await asyncio.gather(*tasks)
+
+        asyncio.run(scenario())
+        assert started == [0, 1, 2, 3]
+        assert admission.get_status()["active"] == 0
+        assert admission.stats.admitted == 4
+
+    def test_full_queue_rejected(self):
+        """Test that arrivals beyond max_queue get 503 with Retry-After"""
+        admission = controller()
+
+        async def scenario():
+            tasks = [asyncio.create_task(hold(admission, 0.05, [], n)) for n in range(4)]
+            await asyncio.sleep(0)
+            with pytest.raises(AdmissionRejected) as rejected:
+                async with admission.admit():
+                    pass
+            await asyncio.gather(*tasks)
+            return rejected.value
+
+        rejected = asyncio.run(scenario())
+        assert rejected.status_code == 503
+        assert rejected.headers == {"Retry-After": "1"}
+        assert rejected.detail["reason"] == "queue_full"
+        assert admission.stats.rejected_queue_full == 1
+
+    def test_wait_times_out(self):
+        """Test that waiting longer than one interval is rejected rather than served late"""
+        admission = controller(max_concurrent=1, interval=0.05)
+
+        async def scenario():
+            blocker = asyncio.create_task(hold(admission, 0.2, [], "blocker"))
+            await asyncio.sleep(0)
+            with pytest.raises(AdmissionRejected) as rejected:
+                async with admission.admit():
+                    pass
+            await blocker
+            return rejected.value
+
+        assert asyncio.run(scenario()).detail["reason"] == "timed_out"
+        assert admission.get_status()["active"] == 0
+
+    def test_cancelled_waiter_keeps_slot_count(self):
+        """Test that a request cancelled while waiting leaves the slot count intact"""
+        admission = controller(max_concurrent=1)
+        started = []
+
+        async def scenario():
+            first = asyncio.create_task(hold(admission, 0.05, started, "first"))
+            cancelled = asyncio.create_task(hold(admission, 0, started, "cancelled"))
+            last = asyncio.create_task(hold(admission, 0, started, "last"))
+            await asyncio.sleep(0.01)
+            cancelled.cancel()
+            await asyncio.gather(first, last)
+
+        asyncio.run(scenario())
+        assert started == ["first", "last"]
+        assert admission.get_status()["active"] == 0
+
+
+class TestOverload:
+    """Test CoDel-style overload detection"""
+
+    def test_standing_queue_sheds_load(self):
+        """Test that delays above target for a whole interval reject new queued work"""
+        admission = controller(max_queue=100)
+        admission.record_delay(0.5)
+        admission.record_delay(0.2)
+        time.sleep(0.21)
+
+        admission.check(0)  # Nothing waiting - still admitted
+        assert admission.overloaded
+        with pytest.raises(AdmissionRejected) as rejected:
+            admission.check(3)
+        assert rejected.value.detail["reason"] == "overloaded"
+        assert admission.stats.overload_episodes == 1
+
+    def test_burst_absorbed(self):
+        """Test that one short delay in the interval keeps admitting (the queue drained)"""
+        admission = controller(max_queue=100)
+        admission.record_delay(0.5)
+        admission.record_delay(0.01)
+        time.sleep(0.21)
+
+        admission.check(10)
+        assert not admission.overloaded
+
+    def test_recovers_when_delay_drops(self):
+        """Test that load shedding stops after an interval under the target"""
+        admission = controller(max_queue=100)
+        admission.record_delay(0.5)
+        time.sleep(0.21)
+        admission.record_delay(0.01)
+        assert admission.overloaded
+        time.sleep(0.21)
+
+        admission.check(3)
+        assert not admission.overloaded
+
+    def test_nothing_started_while_work_waits(self):
+        """Test that an interval with waiting work but no started work counts as overload"""
+        admission = controller(max_queue=100)
+        time.sleep(0.21)
+        with pytest.raises(AdmissionRejected):
+            admission.check(5)
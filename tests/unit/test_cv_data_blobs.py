@@ -0,0 +1,128 @@
+"""
+Unit tests for compressed CV JSON storage
+Tests that uploads and cache entries share content-addressed blobs, metadata-only
+queries, migration of inline CV JSON and garbage collection of blobs
+"""
+import json
+import sqlite3
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import src.api.db as db
+
+CV_JSON = json.dumps({"hero": {"fullName": "Jane Doe"}, "summary": {"summaryText": "Engineer " * 50}})
+
+
+@pytest.fixture(autouse=True)
+def database(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "test.db"))
+    db.init_db()
+
+
+def blob_count():
+    conn = db.get_db_connection()
+    try:
+        return conn.execute("SELECT COUNT(*) FROM cv_data_blobs").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def completed_upload(job_id, user_id="user_1", cv_json=CV_JSON):
+    db.create_cv_upload(user_id, job_id, f"{job_id}.pdf", "pdf", file_hash=f"hash_{job_id}")
+    db.update_cv_upload_status(job_id, "completed", cv_json)
+
+
+class TestCVDataBlobs:
+    """Test CV JSON blob storage"""
+
+    def test_round_trip(self):
+        """Test that CV JSON is stored compressed and read back unchanged"""
+        completed_upload("job1")
+        upload = db.get_cv_upload("job1", include_cv_data=True)
+
+        assert upload["cv_data"] == CV_JSON
+        conn = db.get_db_connection()
+        try:
+            row = conn.execute("SELECT codec, data, raw_size FROM cv_data_blobs").fetchone()
+        finally:
+            conn.close()
+        assert row["codec"] == db.CV_DATA_CODEC
+        assert row["raw_size"] == len(CV_JSON)
+        assert len(row["data"]) < len(CV_JSON)
+
+    def test_upload_and_cache_share_blob(self):
+        """Test that identical CV JSON is stored once for uploads and cache entries"""
+        completed_upload("job1")
+        completed_upload("job2", user_id="user_2")
+        db.cache_extraction_result("hash_job1", CV_JSON, "model", 0.0, 0.9)
+
+        assert blob_count() == 1
+        assert db.get_cached_extraction("hash_job1")["cv_data"] == CV_JSON
+
+    def test_metadata_only_by_default(self):
+        """Test that listings and lookups leave out the CV JSON unless asked"""
+        completed_upload("job1")
+        db.create_cv_upload("user_1", "job2", "job2.pdf", "pdf")
+
+        uploads = db.get_user_cv_uploads("user_1")
+        assert [upload["job_id"] for upload in uploads] == ["job2", "job1"]
+        assert all("cv_data" not in upload for upload in uploads)
+        assert "cv_data" not in db.get_cv_upload("job1")
+
+        with_data = {upload["job_id"]: upload["cv_data"] for upload in db.get_user_cv_uploads("user_1", include_cv_data=True)}
+        assert with_data == {"job1": CV_JSON, "job2": None}
+
+    def test_cv_upload_ownership(self):
+        """Test that get_cv_upload only returns uploads of the given user"""
+        completed_upload("job1")
+
+        assert db.get_cv_upload("job1", user_id="user_1")["job_id"] == "job1"
+        assert db.get_cv_upload("job1", user_id="user_2") is None
+
+    def test_inline_cv_data_migrated(self):
+        """Test that CV JSON stored inline by older versions moves to blobs"""
+        conn = sqlite3.connect(db.DB_PATH)
+        conn.execute("DROP TABLE cv_extraction_cache")
+        conn.execute("""CREATE TABLE cv_extraction_cache (
+            file_hash TEXT PRIMARY KEY, cv_data TEXT NOT NULL, extraction_model TEXT NOT NULL,
+            temperature REAL NOT NULL, created_at TEXT NOT NULL, confidence_score REAL,
+            access_count INTEGER DEFAULT 1, last_accessed TEXT NOT NULL)""")
+        conn.execute("INSERT INTO cv_extraction_cache VALUES ('hash_1', ?, 'model', 0.0, 'now', 0.9, 1, 'now')", (CV_JSON,))
+        conn.execute("""INSERT INTO cv_uploads (upload_id, user_id, job_id, filename, file_type, upload_date, cv_data, status)
+            VALUES ('u1', 'user_1', 'job1', 'cv.pdf', 'pdf', 'now', ?, 'completed')""", (CV_JSON,))
+        conn.commit()
+        conn.close()
+
+        db.init_db()
+
+        assert blob_count() == 1
+        assert db.get_cv_upload("job1", include_cv_data=True)["cv_data"] == CV_JSON
+        assert db.get_cached_extraction("hash_1")["cv_data"] == CV_JSON
+        conn = db.get_db_connection()
+        try:
+            inline = conn.execute(
+                "SELECT COUNT(*) FROM cv_uploads WHERE cv_data IS NOT NULL UNION ALL "
+                "SELECT COUNT(*) FROM cv_extraction_cache WHERE cv_data IS NOT NULL"
+            ).fetchall()
+        finally:
+            conn.close()
+        assert [row[0] for row in inline] == [0, 0]
+
+    def test_cleanup_cv_data_blobs(self):
+        """Test that only blobs nothing refers to are deleted"""
+        completed_upload("job1")
+        db.update_cv_upload_status("job1", "completed", json.dumps({"hero": {"fullName": "Edited"}}))
+        db.cache_extraction_result("hash_job1", CV_JSON, "model", 0.0, 0.9)
+
+        assert db.cleanup_cv_data_blobs() == 0
+        conn = db.get_db_connection()
+        conn.execute("DELETE FROM cv_extraction_cache")
+        conn.commit()
+        conn.close()
+        assert db.cleanup_cv_data_blobs() == 1
+        assert blob_count() == 1
+        assert json.loads(db.get_cv_upload("job1", include_cv_data=True)["cv_data"])["hero"]["fullName"] == "Edited"
@@ -1,16 +1,31 @@
 #!/usr/bin/env python3
 """
 Unit tests for CV helper functions
-Tests validate_filename, get_file_extension, get_mime_type
+Tests validate_filename, get_file_extension, get_mime_type, get_cv_text and
+the upload status kept by the extract endpoint
 """
 import sys
 import os
+import json
+import asyncio
 from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.api.routes.cv import validate_filename, get_file_extension, get_mime_type
+import src.api.db as db
+from src.api.routes.cv import (
+    validate_filename, get_file_extension, get_mime_type, get_cv_text, extract_cv_data_endpoint
+)
+from src.core.cv_extraction.data_extractor import DataExtractor
+from src.services.admission_control import extraction_admission, AdmissionRejected
+from src.services.single_flight import extraction_single_flight
+
+CV_TESTS_DIR = Path(__file__).parent.parent.parent / "data" / "cv_examples" / "cv_tests"
 
 
 class TestValidateFilename:
@@ -225,4 +240,87 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
-    run_all_tests()
\ No newline at end of file
+    run_all_tests()
+
+
+class TestGetCVText:
+    """Test CV text extraction for incremental re-extraction"""
+    
+    @pytest.fixture(autouse=True)
+    def database(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "test.db"))
+        db.init_db()
+    
+    def test_text_keeps_lines_and_is_cached(self):
+        """Test that the extracted and cached text keeps the CV's line structure"""
+        text = get_cv_text(str(CV_TESTS_DIR / "Lior_Naaman.pdf"), "hash_lior")
+        
+        assert text.count("\n") > 20
+        assert db.get_cached_text("hash_lior") == text
+    
+    def test_revision_of_real_upload_is_incremental(self):
+        """Test that a one-word edit of a real upload re-extracts only the sections it touches"""
+        prior_text = get_cv_text(str(CV_TESTS_DIR / "Lior_Naaman.pdf"), None)
+        prior_cv_data = json.loads((CV_TESTS_DIR / "lior_extracted_data.json").read_text())["cv_data"]
+        prompts = {}
+        
+        async def mock_tiered(section_name, raw_text, metrics, progress_callback=None, deadline=None,
+                              source_index=None):
+            prompts[section_name] = raw_text
+            return {section_name: prior_cv_data.get(section_name)}
+        
+        extractor = DataExtractor.__new__(DataExtractor)
+        extractor.llm_service = Mock(api_key=None)
+        extractor._extract_section_tiered = mock_tiered
+        with patch.object(DataExtractor, "_apply_enhancements", side_effect=lambda data, text, metrics: data):
+            result = asyncio.run(extractor.extract_cv_result(
+                prior_text.replace("Proven track record", "Strong track record"),
+                prior_cv_data=prior_cv_data, prior_text=prior_text
+            ))
+        
+        assert "summary" in prompts
+        assert "experience" not in prompts
+        assert result.metrics.sections_reused >= len(DataExtractor.SECTION_SCHEMAS) - len(prompts)
+        assert all("\n" not in text and "Strong track record" in text for text in prompts.values())
+
+
+class TestExtractEndpoint:
+    """Test the upload status the extract endpoint leaves behind"""
+    
+    @pytest.fixture(autouse=True)
+    def upload(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "test.db"))
+        db.init_db()
+        self.cv_file = tmp_path / "job_1_resume.pdf"
+        self.cv_file.write_bytes(b"%PDF")
+        db.create_cv_upload("user_1", "job_1", "resume.pdf", ".pdf", "hash_1")
+        db.update_cv_upload_status("job_1", "uploaded")
+    
+    def _extract(self, extractor=None, request=None):
+        with patch("glob.glob", return_value=[str(self.cv_file)]), \
+                patch("src.api.routes.cv.get_cv_text", return_value="Jane Doe, Software Engineer"), \
+                patch("src.api.routes.cv.create_data_extractor", return_value=extractor or Mock()):
+            return asyncio.run(extract_cv_data_endpoint("job_1", current_user_id="user_1", request=request))
+    
+    def test_rejected_extraction_restores_status(self):
+        """Test that an extraction shed by admission control does not leave the upload processing"""
+        rejected = AdmissionRejected("extraction", "queue_full", 10, 5)
+        with patch.object(extraction_admission, "admit", side_effect=rejected):
+            with pytest.raises(AdmissionRejected):
+                self._extract()
+        
+        assert db.get_cv_upload("job_1")["status"] == "uploaded"
+    
+    def test_disconnect_only_cancels_unshared_extraction(self):
+        """Test that the caller going away does not cut short an extraction others are waiting for"""
+        extractor = Mock()
+        extractor.extract_cv_result = AsyncMock(return_value=None)
+        request = Mock(is_disconnected=AsyncMock(return_value=True))
+        with pytest.raises(HTTPException):
+            self._extract(extractor, request)
+        cancel_check = extractor.extract_cv_result.call_args.kwargs["cancel_check"]
+        
+        assert asyncio.run(cancel_check()) is True
+        with patch.object(extraction_single_flight, "has_followers", return_value=True):
+            assert asyncio.run(cancel_check()) is False
+
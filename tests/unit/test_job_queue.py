@@ -0,0 +1,237 @@
+"""
+Unit tests for the durable job queue
+Tests atomic claims, retries with backoff, permanent failures, lease expiry
+(crash recovery) and the background worker pool on the SQLite backend
+"""
+import asyncio
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import src.api.db as db
+import src.services.job_queue as job_queue_module
+from src.services.job_queue import JobFailed, JobQueue, SQLiteJobBackend
+
+
+@pytest.fixture(autouse=True)
+def database(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "test.db"))
+    monkeypatch.setattr(job_queue_module, "RETRY_BACKOFF_SECONDS", 0)
+    db.init_db()
+
+
+@pytest.fixture
+def queue():
+    return JobQueue(backend=SQLiteJobBackend(), workers=2, max_attempts=3, poll_interval=0.05)
+
+
+class Recorder:
+    """Job handler that records calls and fails a set number of times"""
+
+    def __init__(self, failures=0, error=RuntimeError):
+        self.calls = []
+        self.failures = failures
+        self.error = error
+        self.given_up = []
+
+    async def __call__(self, job):
+        self.calls.append((job.job_id, job.attempts, job.payload))
+        if len(self.calls) <= self.failures:
+            raise self.error("LLM unavailable")
+
+    def on_failure(self, job, error):
+        self.given_up.append((job.job_id, error))
+
+
+class TestJobQueue:
+    """Test JobQueue with the SQLite backend"""
+
+    def test_enqueue_and_run(self, queue):
+        """Test that a queued job runs once with its payload and is marked done"""
+        handler = Recorder()
+        queue.register("extract_cv", handler)
+        queue.enqueue("extract_cv", "job1", {"file_path": "/tmp/cv.pdf"})
+
+        assert queue.get("job1").status == "queued"
+        assert asyncio.run(queue.run_next())
+        assert not asyncio.run(queue.run_next())
+        assert handler.calls == [("job1", 1, {"file_path": "/tmp/cv.pdf"})]
+        assert queue.get("job1").status == "done"
+
+    def test_claim_is_exclusive(self, queue):
+        """Test that a leased job is not handed to a second worker"""
+        queue.enqueue("extract_cv", "job1")
+        assert queue.backend.claim("worker-a", 60).job_id == "job1"
+        assert queue.backend.claim("worker-b", 60) is None
+
+    def test_failed_job_retried(self, queue):
+        """Test that a handler error requeues the job until an attempt succeeds"""
+        handler = Recorder(failures=2)
+        queue.register("extract_cv", handler, on_failure=handler.on_failure)
+        queue.enqueue("extract_cv", "job1")
+
+        while asyncio.run(queue.run_next()):
+            pass
+
+        assert [attempt for _, attempt, _ in handler.calls] == [1, 2, 3]
+        assert queue.get("job1").status == "done"
+        assert handler.given_up == []
+
+    def test_retry_waits_for_backoff(self, queue, monkeypatch):
+        """Test that a retried job is not runnable before its backoff delay"""
+        monkeypatch.setattr(job_queue_module, "RETRY_BACKOFF_SECONDS", 60)
+        queue.register("extract_cv", Recorder(failures=1))
+        queue.enqueue("extract_cv", "job1")
+
+        assert asyncio.run(queue.run_next())
+        job = queue.get("job1")
+        assert (job.status, job.last_error) == ("queued", "LLM unavailable")
+        assert not asyncio.run(queue.run_next())
+        assert queue.backlog() == 0
+
+    def test_reclaimed_job_waits_from_lease_expiry(self, queue, monkeypatch):
+        """Test that a reclaimed job's queueing delay leaves out the stale lease"""
+        clock = [1000.0]
+        monkeypatch.setattr(job_queue_module.time, "time", lambda: clock[0])
+        queue.enqueue("extract_cv", "job1")
+        clock[0] += 2
+        assert queue.backend.claim("crashed-worker", lease_seconds=60).waited_seconds == 2
+
+        clock[0] += 65
+        job = queue.backend.claim("new-worker", lease_seconds=60)
+        assert job.attempts == 2
+        assert job.waited_seconds == 5
+
+    def test_gives_up_after_max_attempts(self, queue):
+        """Test that a job failing every attempt is marked failed and reported"""
+        handler = Recorder(failures=10)
+        queue.register("extract_cv", handler, on_failure=handler.on_failure)
+        queue.enqueue("extract_cv", "job1")
+
+        while asyncio.run(queue.run_next()):
+            pass
+
+        assert len(handler.calls) == 3
+        assert queue.get("job1").status == "failed"
+        assert handler.given_up == [("job1", "LLM unavailable")]
+
+    def test_job_failed_not_retried(self, queue):
+        """Test that JobFailed fails the job on the first attempt"""
+        handler = Recorder(failures=1, error=JobFailed)
+        queue.register("extract_cv", handler, on_failure=handler.on_failure)
+        queue.enqueue("extract_cv", "job1")
+
+        asyncio.run(queue.run_next())
+        assert len(handler.calls) == 1
+        assert queue.get("job1").status == "failed"
+        assert handler.given_up == [("job1", "LLM unavailable")]
+
+    def test_expired_lease_recovered(self, queue):
+        """Test that a job whose worker died is picked up once its lease expires"""
+        handler = Recorder()
+        queue.register("extract_cv", handler)
+        queue.enqueue("extract_cv", "job1")
+        queue.backend.claim("crashed-worker", lease_seconds=0)
+
+        assert asyncio.run(queue.run_next())
+        assert handler.calls == [("job1", 2, {})]
+        assert queue.get("job1").status == "done"
+
+    def test_job_killing_every_worker_fails(self, queue):
+        """Test that a job whose lease expired on every attempt is not run again"""
+        handler = Recorder()
+        queue.register("extract_cv", handler, on_failure=handler.on_failure)
+        queue.enqueue("extract_cv", "job1")
+        for _ in range(3):
+            queue.backend.claim("crashed-worker", lease_seconds=0)
+
+        assert asyncio.run(queue.run_next())
+        assert handler.calls == []
+        assert queue.get("job1").status == "failed"
+        assert len(handler.given_up) == 1
+
+    def test_stale_worker_cannot_complete(self, queue):
+        """Test that a worker that lost its lease cannot overwrite the new owner's state"""
+        queue.enqueue("extract_cv", "job1")
+        queue.backend.claim("slow-worker", lease_seconds=0)
+        queue.backend.claim("new-worker", lease_seconds=60)
+
+        assert not queue.backend.complete("job1", "slow-worker")
+        assert queue.backend.complete("job1", "new-worker")
+
+    def test_workers_run_jobs_in_background(self, queue):
+        """Test that enqueue returns at once and started workers run the jobs"""
+        finished = []
+
+        async def handler(job):
+            await asyncio.sleep(0.01)
+            finished.append(job.job_id)
+
+        queue.register("extract_cv", handler)
+
+        async def scenario():
+            for number in range(4):
+                queue.enqueue("extract_cv", f"job{number}")
+            assert finished == []
+            for _ in range(100):
+                if len(finished) == 4:
+                    break
+                await asyncio.sleep(0.02)
+            await queue.stop()
+
+        asyncio.run(scenario())
+        assert sorted(finished) == ["job0", "job1", "job2", "job3"]
+        assert queue.backend.counts() == {"done": 4}
+
+    def test_stop_returns_running_job(self, queue):
+        """Test that shutting down hands a running job back without using an attempt"""
+        started = []
+
+        async def handler(job):
+            started.append(job.job_id)
+            await asyncio.sleep(60)
+
+        queue.register("extract_cv", handler)
+
+        async def scenario():
+            queue.enqueue("extract_cv", "job1")
+            while not started:
+                await asyncio.sleep(0.01)
+            await queue.stop()
+
+        asyncio.run(scenario())
+        job = queue.get("job1")
+        assert (job.status, job.attempts) == ("queued", 0)
+
+    def test_queue_position(self, queue):
+        """Test that queued jobs report their place in line and running jobs none"""
+        for number in range(3):
+            queue.enqueue("extract_cv", f"job{number}")
+        queue.backend.claim("worker-a", 60)
+
+        assert queue.position("job0") is None
+        assert [queue.position(f"job{number}") for number in (1, 2)] == [1, 2]
+        assert queue.backlog() == 2
+
+    def test_wait_for_job(self, queue):
+        """Test that wait returns once a worker finishes the job, or on timeout"""
+        async def handler(job):
+            await asyncio.sleep(job.payload["seconds"])
+
+        queue.register("extract_cv", handler)
+
+        async def scenario():
+            queue.enqueue("extract_cv", "job1", {"seconds": 0.05})
+            finished = await queue.wait("job1", timeout=5)
+            queue.enqueue("extract_cv", "job2", {"seconds": 60})
+            pending = await queue.wait("job2", timeout=0.1)
+            await queue.stop()
+            return finished, pending
+
+        finished, pending = asyncio.run(scenario())
+        assert finished.status == "done"
+        assert pending.is_active
+        assert asyncio.run(queue.wait("unknown", timeout=1)) is None
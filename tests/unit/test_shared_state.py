@@ -0,0 +1,225 @@
+"""
+Unit tests for shared cross-worker state
+Tests both backends, and that the rate limiters and SSE job messages hold
+across worker processes when they share the SQLite backend
+"""
+import asyncio
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import src.api.db as db
+from src.services.shared_state import InMemoryStateBackend, SQLiteStateBackend, create_shared_state
+import src.services.rate_limiter as rate_limiter_module
+from src.services.rate_limiter import RateLimitConfig, SSERateLimiter
+from src.services.sse_service import ConnectionManager, SSEService
+from src.utils.upload_rate_limiter import UploadRateLimitConfig, UploadRateLimiter
+
+
+@pytest.fixture(autouse=True)
+def database(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "test.db"))
+    db.init_db()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def state(request):
+    return create_shared_state(request.param)
+
+
+class TestBackends:
+    """Test the operations every backend provides"""
+
+    def test_counters(self, state):
+        """Test that counters add up, list by prefix and reset"""
+        state.incr("sse:connections:alice")
+        state.incr("sse:connections:alice", 2)
+        state.incr("sse:connections:bob", -1)
+
+        assert state.get_counter("sse:connections:alice") == 3
+        assert state.counters("sse:connections:") == {"sse:connections:alice": 3, "sse:connections:bob": -1}
+        state.reset_counter("sse:connections:alice")
+        assert state.get_counter("sse:connections:alice") == 0
+
+    def test_zeroed_counters_purged(self, state):
+        """Test that purging drops counters that are back at zero"""
+        state.incr("metrics:a")
+        state.incr("metrics:b")
+        state.incr("metrics:b", -1)
+
+        state.purge_expired()
+        assert state.counters("metrics:") == {"metrics:a": 1}
+
+    def test_sliding_window_limit(self, state):
+        """Test that a window refuses hits over its limit until old hits expire"""
+        assert [state.hit("requests", 0.1, limit=2)[0] for _ in range(3)] == [True, True, False]
+        assert state.count("requests", 0.1) == 2
+        time.sleep(0.11)
+        assert state.hit("requests", 0.1, limit=2) == (True, 1)
+        state.reset_window("requests")
+        assert state.count("requests", 0.1) == 0
+
+    def test_token_bucket(self, state):
+        """Test that a bucket starts full, empties and refills over time"""
+        assert state.take_tokens("events", capacity=2, refill_rate=20, amount=2) == (True, 0)
+        assert not state.take_tokens("events", capacity=2, refill_rate=20)[0]
+        time.sleep(0.06)
+        assert state.peek_tokens("events", capacity=2, refill_rate=20) >= 1
+
+    def test_values_expire(self, state):
+        """Test that values are listed by prefix and expire after their ttl"""
+        state.set_value("portfolio:p1", {"status": "preview"})
+        state.set_value("portfolio:p2", {"status": "deployed"}, ttl=0.05)
+
+        assert state.get_value("portfolio:p1") == {"status": "preview"}
+        assert set(state.values("portfolio:")) == {"portfolio:p1", "portfolio:p2"}
+        time.sleep(0.06)
+        assert state.get_value("portfolio:p2") is None
+        state.delete_value("portfolio:p1")
+        assert state.values("portfolio:") == {}
+
+    def test_add_value_only_when_absent(self, state):
+        """Test that add_value stores nothing over a live value but replaces an expired one"""
+        assert state.add_value("lease:run1", "worker_a", ttl=0.05)
+        assert not state.add_value("lease:run1", "worker_b", ttl=0.05)
+        assert state.get_value("lease:run1") == "worker_a"
+        time.sleep(0.06)
+        assert state.add_value("lease:run1", "worker_b", ttl=0.05)
+        assert state.get_value("lease:run1") == "worker_b"
+
+    def test_publish_and_read(self, state):
+        """Test that messages are read back in order after a given id"""
+        first = state.publish("sse:job:job1", {"n": 1})
+        state.publish("sse:job:job2", {"n": 2})
+
+        assert state.last_message_id() == first + 1
+        assert state.messages_after(first) == [(first + 1, "sse:job:job2", {"n": 2})]
+
+    def test_unknown_backend(self):
+        """Test that an unknown SHARED_STATE_BACKEND is rejected"""
+        with pytest.raises(ValueError):
+            create_shared_state("etcd")
+
+
+class TestAcrossWorkers:
+    """Test limits and SSE messages with two workers sharing the SQLite backend"""
+
+    def test_upload_limit_shared(self):
+        """Test that uploads recorded by one worker count against the other's limit"""
+        config = UploadRateLimitConfig(max_uploads_per_hour=2)
+        worker_a = UploadRateLimiter(config, SQLiteStateBackend())
+        worker_b = UploadRateLimiter(config, SQLiteStateBackend())
+
+        worker_a.record_upload("1.2.3.4")
+        worker_b.record_upload("1.2.3.4")
+
+        allowed, reason = worker_a.check_upload_allowed("1.2.3.4")
+        assert not allowed and "per hour" in reason
+        assert worker_b.get_ip_status("1.2.3.4")["uploads_this_hour"] == 2
+        assert worker_b.check_upload_allowed("5.6.7.8")[0]
+
+    def test_sse_connection_limit_shared(self):
+        """Test that the global SSE connection limit counts every worker's connections"""
+        config = RateLimitConfig(max_connections_global=2)
+        worker_a = SSERateLimiter(config, SQLiteStateBackend())
+        worker_b = SSERateLimiter(config, SQLiteStateBackend())
+
+        assert worker_a.add_connection("alice", "c1")
+        assert worker_b.add_connection("bob", "c2")
+        assert not worker_a.add_connection("carol", "c3")
+
+        worker_b.remove_connection("bob", "c2")
+        worker_b.remove_connection("bob", "c2")
+        assert worker_a.global_connections == 1
+        assert worker_a.get_tracked_users() == ["alice"]
+
+    def test_dead_worker_connections_expire(self):
+        """Test that connections a worker stops renewing stop counting against the limits"""
+        config = RateLimitConfig(max_connections_per_user=1, connection_ttl=0.1)
+        crashed = SSERateLimiter(config, SQLiteStateBackend())
+        worker = SSERateLimiter(config, SQLiteStateBackend())
+
+        assert crashed.add_connection("alice", "c1")
+        assert "User connection limit" in worker.check_connection_limit("alice")[1]
+        time.sleep(0.11)
+        assert worker.global_connections == 0
+        assert worker.get_global_stats()["active_users"] == 0
+        assert worker.get_user_limits_info("alice")["active_connections"] == 0
+
+    def test_violations_expire(self, monkeypatch):
+        """Test that rate limit violations only count within the violation window"""
+        monkeypatch.setattr(rate_limiter_module, "VIOLATION_WINDOW", 0.1)
+        limiter = SSERateLimiter(RateLimitConfig(requests_per_minute=1), SQLiteStateBackend())
+
+        limiter.check_request_limit("alice")
+        limiter.check_request_limit("alice")
+        assert limiter.get_user_limits_info("alice")["violation_count"] == 1
+        time.sleep(0.11)
+        assert limiter.get_user_limits_info("alice")["violation_count"] == 0
+
+    def test_sse_block_shared(self):
+        """Test that a user blocked by one worker is blocked in the other"""
+        config = RateLimitConfig(requests_per_minute=1)
+        worker_a = SSERateLimiter(config, SQLiteStateBackend())
+        worker_b = SSERateLimiter(config, SQLiteStateBackend())
+
+        assert worker_a.check_request_limit("alice")[0]
+        for _ in range(3):
+            worker_b.check_request_limit("alice")
+
+        allowed, reason = worker_a.check_connection_limit("alice")
+        assert not allowed and "blocked" in reason
+        assert worker_b.get_global_stats()["blocked_users"] == 1
+
+    def test_job_message_reaches_other_worker(self):
+        """Test that a job message published in one worker reaches a connection in another"""
+        service = SSEService()
+        publisher = ConnectionManager(SQLiteStateBackend())
+        subscriber = ConnectionManager(SQLiteStateBackend())
+        queue = subscriber.add_connection("conn1")
+        subscriber.subscribe_to_job("job1", "conn1")
+        last_id = subscriber.state.last_message_id()
+
+        publisher.send_to_job("job1", service.create_progress_message("upload", 50, "Halfway"))
+        publisher.send_to_job("job2", service.create_progress_message("upload", 10, "Other job"))
+        assert queue.empty()  # Not delivered until relayed
+
+        subscriber.relay_messages(last_id)
+        message = queue.get_nowait()
+        assert (message.type, message.data["progress"]) == ("progress", 50)
+        assert queue.empty()
+
+    def test_relay_task_delivers(self):
+        """Test that the relay task started for a stream delivers published messages"""
+        service = SSEService()
+        manager = ConnectionManager(SQLiteStateBackend())
+        manager.relay_interval = 0.01
+        queue = manager.add_connection("conn1")
+        manager.subscribe_to_job("job1", "conn1")
+
+        async def scenario():
+            await manager.start_relay()
+            await asyncio.sleep(0.02)
+            manager.send_to_job("job1", service.create_complete_message({"job_id": "job1"}))
+            for _ in range(50):
+                if not queue.empty():
+                    break
+                await asyncio.sleep(0.01)
+            await manager.stop_relay()
+
+        asyncio.run(scenario())
+        assert queue.get_nowait().type == "complete"
+
+    def test_memory_backend_delivers_directly(self):
+        """Test that a single worker delivers job messages without the relay"""
+        manager = ConnectionManager(InMemoryStateBackend())
+        queue = manager.add_connection("conn1")
+        manager.subscribe_to_job("job1", "conn1")
+
+        manager.send_to_job("job1", SSEService().create_progress_message("upload", 50, "Halfway"))
+        assert not queue.empty()
+        assert manager.state.last_message_id() == 0
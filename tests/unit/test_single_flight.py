@@ -0,0 +1,199 @@
+"""
+Unit tests for single-flight CV extraction
+Tests that concurrent extractions of the same file run once in-process and
+across processes (SQLite lease), and that failures and partial results are
+not shared
+"""
+import asyncio
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import src.api.db as db
+from src.services.single_flight import ExtractionSingleFlight
+
+
+@pytest.fixture(autouse=True)
+def database(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "test.db"))
+    db.init_db()
+
+
+@pytest.fixture
+def flights():
+    return ExtractionSingleFlight(poll_interval=0.01)
+
+
+def fake_result(partial=False, reused=False):
+    return SimpleNamespace(
+        is_partial=partial,
+        is_shareable=not partial and not reused,
+        cv_data_json='{"hero": null}',
+        confidence=0.9,
+        section_models={}
+    )
+
+
+class CountingExtraction:
+    """Slow extraction that counts how often it actually runs"""
+
+    def __init__(self, results=None, error=None, delay=0.05):
+        self.calls = 0
+        self.results = results or [fake_result()]
+        self.error = error
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.results[min(self.calls, len(self.results)) - 1]
+
+
+async def run_many(flights, file_hash, extract, count):
+    return await asyncio.gather(
+        *(flights.run(file_hash, extract) for _ in range(count)), return_exceptions=True
+    )
+
+
+class TestExtractionSingleFlight:
+    """Test ExtractionSingleFlight"""
+
+    def test_concurrent_extractions_coalesced(self, flights):
+        """Test that simultaneous extractions of one file run once and share the result"""
+        extract = CountingExtraction()
+        results = asyncio.run(run_many(flights, "hash1", extract, 5))
+
+        assert extract.calls == 1
+        assert all(result is results[0] for result in results)
+        assert flights.stats["coalesced"] == 4
+
+    def test_different_files_not_coalesced(self, flights):
+        """Test that different file hashes extract independently"""
+        extract = CountingExtraction()
+
+        async def scenario():
+            return await asyncio.gather(flights.run("hash1", extract), flights.run("hash2", extract))
+
+        asyncio.run(scenario())
+        assert extract.calls == 2
+
+    def test_no_hash_not_coalesced(self, flights):
+        """Test that extractions without a file hash always run"""
+        extract = CountingExtraction()
+        asyncio.run(run_many(flights, None, extract, 3))
+        assert extract.calls == 3
+
+    def test_failure_shared_then_retried(self, flights):
+        """Test that followers see the leader's error and a later call extracts again"""
+        failing = CountingExtraction(error=RuntimeError("LLM unavailable"))
+        results = asyncio.run(run_many(flights, "hash1", failing, 3))
+
+        assert failing.calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert db.get_extraction_lease("hash1") is None
+
+        retry = CountingExtraction()
+        asyncio.run(flights.run("hash1", retry))
+        assert retry.calls == 1
+
+    def test_partial_result_not_shared(self, flights):
+        """Test that a follower runs its own extraction when the leader was cut short"""
+        extract = CountingExtraction(results=[fake_result(partial=True), fake_result()])
+        first, second = asyncio.run(run_many(flights, "hash1", extract, 2))
+
+        assert extract.calls == 2
+        assert first.is_partial and not second.is_partial
+
+    def test_result_built_on_prior_not_shared(self, flights):
+        """Test that a result reusing the leader's previous extraction is not handed to followers"""
+        extract = CountingExtraction(results=[fake_result(reused=True), fake_result()])
+        first, second = asyncio.run(run_many(flights, "hash1", extract, 2))
+
+        assert extract.calls == 2
+        assert not first.is_shareable and second.is_shareable
+        assert db.get_extraction_lease("hash1")["status"] == "done"
+
+    def test_follower_cancel_keeps_leader(self, flights):
+        """Test that a follower going away does not cancel the shared extraction"""
+        extract = CountingExtraction(delay=0.1)
+
+        async def scenario():
+            leader = asyncio.create_task(flights.run("hash1", extract))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(flights.run("hash1", extract))
+            await asyncio.sleep(0.02)
+            follower.cancel()
+            return await leader
+
+        assert asyncio.run(scenario()).confidence == 0.9
+        assert extract.calls == 1
+
+    def test_followers_tracked_while_waiting(self, flights):
+        """Test that has_followers reports callers waiting on the flight, and only while they wait"""
+        seen = []
+
+        async def extract():
+            await asyncio.sleep(0.02)
+            seen.append(flights.has_followers("hash1"))
+            return fake_result()
+
+        async def scenario():
+            leader = asyncio.create_task(flights.run("hash1", extract))
+            await asyncio.sleep(0)
+            seen.append(flights.has_followers("hash1"))
+            follower = asyncio.create_task(flights.run("hash1", extract))
+            await asyncio.gather(leader, follower)
+
+        asyncio.run(scenario())
+        assert seen == [False, True]
+        assert not flights.has_followers("hash1")
+        assert not flights.has_followers(None)
+
+    def test_recent_result_reused(self, flights):
+        """Test that a retry shortly after the extraction finished reuses its result"""
+        pytest.importorskip("src.core.cv_extraction.extraction_result")
+        from src.core.cv_extraction.extraction_result import ExtractionResult
+        from src.core.schemas.unified_nullable import CVData
+
+        result = ExtractionResult.build(CVData(), 0.6, section_models={"hero": "model-a"})
+        first = CountingExtraction(results=[result])
+        asyncio.run(flights.run("hash1", first))
+
+        retry = CountingExtraction()
+        reused = asyncio.run(flights.run("hash1", retry))
+        assert retry.calls == 0
+        assert (reused.cv_data_json, reused.confidence) == (result.cv_data_json, 0.6)
+        assert reused.extraction_model == "model-a"
+        assert flights.stats["coalesced_remote"] == 1
+
+    def test_other_process_waits_for_leader(self, flights):
+        """Test that another process waits on the lease instead of extracting"""
+        other_process = ExtractionSingleFlight(poll_interval=0.01)
+        other_process.owner = "other-host:1234"
+        db.acquire_extraction_lease("hash1", flights.owner, lease_seconds=60)
+        extract = CountingExtraction()
+
+        async def scenario():
+            waiting = asyncio.create_task(other_process.run("hash1", extract))
+            await asyncio.sleep(0.05)
+            assert not waiting.done()
+            db.release_extraction_lease("hash1", flights.owner)  # Leader failed
+            return await waiting
+
+        asyncio.run(scenario())
+        assert extract.calls == 1
+
+    def test_expired_lease_taken_over(self, flights):
+        """Test that the lease of a crashed process does not block extraction"""
+        db.acquire_extraction_lease("hash1", "crashed-host:1", lease_seconds=0)
+        extract = CountingExtraction()
+
+        asyncio.run(flights.run("hash1", extract))
+        assert extract.calls == 1
+        assert db.get_extraction_lease("hash1")["owner"] == flights.owner
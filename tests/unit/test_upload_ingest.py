@@ -0,0 +1,131 @@
+"""
+Unit tests for streaming upload ingestion
+Tests incremental hashing, MIME sniffing, early size rejection, cleanup of
+partial files and constant memory use
+"""
+import asyncio
+import hashlib
+import io
+import tempfile
+import tracemalloc
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from fastapi import UploadFile
+
+from src.utils.upload_ingest import CHUNK_SIZE, UploadRejected, UploadTooLarge, ingest_upload
+
+SAMPLE_PDF = Path(__file__).parent.parent.parent / "data/cv_examples/pdf_examples/simple_pdf/sample-resume-2022.pdf"
+
+
+class CountingUploadFile(UploadFile):
+    """UploadFile that records how many bytes were read"""
+
+    bytes_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        data = await super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def upload_file(content, filename: str) -> CountingUploadFile:
+    source = content if hasattr(content, "read") else io.BytesIO(content)
+    return CountingUploadFile(file=source, filename=filename)
+
+
+@pytest.fixture
+def destination(tmp_path):
+    return tmp_path / "uploads" / "job.pdf"
+
+
+def ingest(file, destination, **kwargs):
+    return asyncio.run(ingest_upload(file, destination, **kwargs))
+
+
+class TestIngestUpload:
+    """Test streaming ingestion"""
+
+    def test_pdf_streamed_to_destination(self, destination):
+        """Test that the saved file, hash and MIME type match the uploaded bytes"""
+        content = SAMPLE_PDF.read_bytes()
+        upload = ingest(upload_file(content, "cv.pdf"), destination, chunk_size=4096)
+
+        assert destination.read_bytes() == content
+        assert upload.size == len(content)
+        assert upload.file_hash == hashlib.sha256(content).hexdigest()
+        assert upload.mime_type == "application/pdf"
+
+    def test_small_text_file(self, destination):
+        """Test a file shorter than the sniffing window"""
+        upload = ingest(upload_file(b"Jane Doe\nSoftware Engineer\n", "cv.txt"), destination)
+        assert upload.mime_type == "text/plain"
+
+    def test_oversized_upload_stops_early(self, destination):
+        """Test that reading stops at the first chunk past the limit and nothing is kept"""
+        file = upload_file(b"%PDF-1.4\n" + b"0" * (50 * CHUNK_SIZE), "cv.pdf")
+        with pytest.raises(UploadTooLarge) as caught:
+            ingest(file, destination, max_size=2 * CHUNK_SIZE)
+
+        assert caught.value.detail == "File too large. Maximum size: 0.5 MB"
+        assert file.bytes_read == 3 * CHUNK_SIZE
+        assert not destination.exists()
+
+    def test_zero_budget(self, destination):
+        """Test that a zero size limit rejects any content"""
+        with pytest.raises(UploadTooLarge):
+            ingest(upload_file(b"Jane Doe", "cv.txt"), destination, max_size=0)
+
+    def test_empty_file(self, destination):
+        """Test that an empty upload is rejected and removed"""
+        with pytest.raises(UploadRejected) as caught:
+            ingest(upload_file(b"", "cv.pdf"), destination)
+        assert caught.value.detail == "File is empty"
+        assert not destination.exists()
+
+    def test_content_mismatch(self, destination):
+        """Test that content not matching an allowed type is rejected"""
+        with pytest.raises(UploadRejected) as caught:
+            ingest(upload_file(b"MZ\x90\x00" + bytes(range(256)) * 64, "cv.pdf"), destination)
+        assert caught.value.detail == "File content does not match allowed types"
+        assert not destination.exists()
+
+    def test_extension_checked_before_reading(self, destination):
+        """Test that a disallowed extension is rejected without reading the body"""
+        file = upload_file(b"#!/bin/sh\n", "cv.sh")
+        with pytest.raises(UploadRejected):
+            ingest(file, destination)
+        assert file.bytes_read == 0
+        assert not destination.parent.exists()
+
+    def test_cancelled_upload_removed(self, destination):
+        """Test that a timed-out upload leaves no partial file behind"""
+        class SlowUploadFile(CountingUploadFile):
+            async def read(self, size: int = -1) -> bytes:
+                await asyncio.sleep(0.01)
+                return await super().read(size)
+
+        file = SlowUploadFile(file=io.BytesIO(SAMPLE_PDF.read_bytes()), filename="cv.pdf")
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(ingest_upload(file, destination, chunk_size=1024), timeout=0.05))
+        assert file.bytes_read > 0
+        assert not destination.exists()
+
+    def test_memory_independent_of_file_size(self, destination):
+        """Test that peak memory stays near one chunk for a 20MB upload"""
+        with tempfile.TemporaryFile() as source:
+            source.write(b"%PDF-1.4\n" + b"0" * (20 * 1024 * 1024))
+            source.seek(0)
+            tracemalloc.start()
+            try:
+                upload = ingest(upload_file(source, "cv.pdf"), destination, max_size=30 * 1024 * 1024)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        assert upload.size > 20 * 1024 * 1024
+        assert peak < 4 * CHUNK_SIZE
@@ -0,0 +1,140 @@
+"""
+Unit tests for content-addressed upload storage
+Tests deduplication through hardlinks, reference-aware deletion and garbage
+collection of unreferenced blobs
+"""
+import hashlib
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import src.api.db as db
+import src.utils.upload_store as upload_store_module
+from src.utils.upload_store import UploadStore
+
+CONTENT = b"%PDF-1.4\nJane Doe - Software Engineer\n"
+FILE_HASH = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return UploadStore(tmp_path / "uploads")
+
+
+def save(store, name, content=CONTENT):
+    """Write an upload the way ingestion does, then adopt it"""
+    path = store.root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    store.adopt(path, hashlib.sha256(content).hexdigest())
+    return path
+
+
+class TestUploadStore:
+    """Test UploadStore"""
+
+    def test_first_upload_becomes_blob(self, store):
+        """Test that the first copy is linked into the store without copying"""
+        job = save(store, "job1.pdf")
+        blob = store.blob_path(FILE_HASH)
+
+        assert blob.read_bytes() == CONTENT
+        assert job.samefile(blob)
+        assert blob.stat().st_nlink == 2
+
+    def test_duplicate_shares_storage(self, store):
+        """Test that identical uploads end up as links to one inode"""
+        first = save(store, "job1.pdf")
+        second = save(store, "anonymous_1/job2.pdf")
+
+        assert second.samefile(first)
+        assert store.blob_path(FILE_HASH).stat().st_nlink == 3
+        assert not list(store.root.rglob("*.link"))
+
+    def test_adopt_is_idempotent(self, store):
+        """Test that adopting an already linked file changes nothing"""
+        job = save(store, "job1.pdf")
+        assert store.adopt(job, FILE_HASH)
+        assert store.blob_path(FILE_HASH).stat().st_nlink == 2
+
+    def test_release_keeps_linked_blob(self, store):
+        """Test that a blob still linked from a job path is not deleted"""
+        save(store, "job1.pdf")
+        assert not store.release(FILE_HASH)
+        assert store.blob_path(FILE_HASH).exists()
+
+    def test_remove_job_files(self, store):
+        """Test that single-file, per-user and multi-file job paths are found"""
+        save(store, "job1.pdf")
+        save(store, "anonymous_1/job2.pdf")
+        save(store, "job3/00_cv.pdf")
+
+        assert store.remove_job_files("job1", ".pdf") == [store.root / "job1.pdf"]
+        assert store.remove_job_files("job2", ".pdf") == [store.root / "anonymous_1" / "job2.pdf"]
+        assert store.remove_job_files("job3", ".pdf") == [store.root / "job3"]
+        assert store.remove_job_files("job4", ".pdf") == []
+
+    def test_collect_garbage(self, store):
+        """Test that only unlinked, unreferenced blobs are collected"""
+        save(store, "job1.pdf")
+        save(store, "job2.txt", b"Referenced text CV")
+        save(store, "job3.txt", b"Orphaned text CV")
+        for name in ("job2.txt", "job3.txt"):
+            (store.root / name).unlink()
+        referenced = {hashlib.sha256(b"Referenced text CV").hexdigest()}
+
+        assert store.collect_garbage(referenced.__contains__) == 1
+        assert sorted(path.name for path in store.blob_dir.glob("*/*")) == sorted([FILE_HASH, *referenced])
+
+
+class TestReferenceAwareDeletion:
+    """Test deleting CVs whose files are shared"""
+
+    @pytest.fixture(autouse=True)
+    def database(self, tmp_path, monkeypatch, store):
+        monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "test.db"))
+        monkeypatch.setattr(upload_store_module, "upload_store", store)
+        db.init_db()
+
+    def upload(self, store, job_id, user_id="user_1"):
+        save(store, f"{job_id}.pdf")
+        db.create_cv_upload(user_id, job_id, "cv.pdf", ".pdf", FILE_HASH)
+
+    def test_blob_kept_until_last_reference(self, store):
+        """Test that the blob survives until the last upload of the content is deleted"""
+        self.upload(store, "job1")
+        self.upload(store, "job2", user_id="user_2")
+        blob = store.blob_path(FILE_HASH)
+
+        deleted = db.delete_oldest_cv("user_1")
+        assert deleted["file_deleted"] is True
+        assert "file_hash" not in deleted
+        assert not (store.root / "job1.pdf").exists()
+        assert (store.root / "job2.pdf").read_bytes() == CONTENT
+        assert blob.exists()
+
+        db.delete_oldest_cv("user_2")
+        assert not blob.exists()
+
+    def test_enforce_cv_limit(self, store):
+        """Test that enforcing the limit deletes old job files but keeps shared content"""
+        for job_id in ("job1", "job2", "job3"):
+            self.upload(store, job_id)
+
+        deleted = db.enforce_cv_limit("user_1", max_cvs=1)
+        assert [cv["job_id"] for cv in deleted] == ["job1", "job2"]
+        assert [path.name for path in store.root.glob("*.pdf")] == ["job3.pdf"]
+        assert store.blob_path(FILE_HASH).stat().st_nlink == 2
+
+    def test_cleanup_upload_blobs(self, store):
+        """Test that garbage collection keeps blobs referenced by cv_uploads"""
+        self.upload(store, "job1")
+        (store.root / "job1.pdf").unlink()
+        assert db.cleanup_upload_blobs() == 0
+
+        save(store, "job2.txt", b"Never recorded")
+        (store.root / "job2.txt").unlink()
+        assert db.cleanup_upload_blobs() == 1